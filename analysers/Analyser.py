@@ -178,6 +178,12 @@ class TestAnalyser(unittest.TestCase):
             plugin = None
             verbose = False
             change = False
+            sax_workers = 1
+            db_itersize = 2000
+            mapcss_cache_size = 100000
+            sax_tags_cache_size = 100000
+            sax_node_locations = False
+            sax_interest_keys = True
 
         analyser_conf = osmose_run.analyser_config(conf, options(), None)
         analyser_conf.error_file = IssuesFileOsmose.IssuesFileOsmose(dst)
@@ -76,7 +76,8 @@ CREATE TEMP TABLE {official}_temp (
     tags jsonb,
     tags1 jsonb,
     fields jsonb,
-    geom geometry(geometry, {proj})
+    geom geometry(geometry, {proj}),
+    geom_raw geometry
 )
 """
 
@@ -106,17 +107,18 @@ WHERE
 """
 
 sql02 = """
-INSERT INTO
+COPY
+    {official}_temp (ref, tags, tags1, fields, geom_raw)
+FROM STDIN
+"""
+
+sql02a = """
+UPDATE
     {official}_temp
-VALUES (
-    %(ref)s,
-    %(tags)s::jsonb,
-    %(tags1)s::jsonb,
-    %(fields)s::jsonb,
-    CASE WHEN {geom} IS NOT NULL THEN
-        ST_Transform(ST_Force2D({geom}), {proj})
-    ELSE NULL END
-)
+SET
+    geom = ST_Transform(ST_Force2D(geom_raw), {proj})
+WHERE
+    geom_raw IS NOT NULL
 """
 
 sql02b = """
@@ -981,7 +983,44 @@ SHP = GDAL
 GPKG = GDAL
 
 
+copy_escape = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_json(d):
+    """
+    Converts a dict into JSON text, values as strings, to be loaded with COPY
+    @param d: source dict
+    @return JSON text
+    """
+    return json.dumps(
+        {k: None if v is None else "{0}".format(v) for k, v in d.items()},
+        ensure_ascii=False,
+    )
+
+
+def copy_row(values):
+    """
+    Formats a row for COPY in text format
+    @param values: column values, None for NULL
+    @return line of the COPY stream
+    """
+    return (
+        "\t".join(
+            map(
+                lambda v: (
+                    "\\N" if v is None else "{0}".format(v).translate(copy_escape)
+                ),
+                values,
+            )
+        )
+        + "\n"
+    )
+
+
 class Load(object):
+    # Number of rows of official data sent to the database by COPY at once
+    copy_rows = 10000
+
     def __init__(
         self,
         geom=("NULL",),
@@ -1018,9 +1057,9 @@ class Load(object):
 
     def spatialGeom(self, geom):
         """
-        SQL to get the geometry
+        EWKT of the geometry, or None if there is no geometry
         """
-        return f"ST_GeomFromEWKT('{geom}')"
+        return geom
 
     def run(self, osmosis, conflate, db_schema, default_table_base_name, version):
         """
@@ -1103,6 +1142,15 @@ class Load(object):
             osmosis.run(sql00.format(official=tableOfficial, proj=self.proj))
             giscurs = osmosis.gisconn.cursor(cursor_factory=psycopg2.extras.DictCursor)
             mult_space = re.compile(r"\s+")
+            copy_buffer = []
+
+            def flushOfficial():
+                if copy_buffer:
+                    giscurs.copy_expert(
+                        sql02.format(official=tableOfficial),
+                        io.StringIO("".join(copy_buffer)),
+                    )
+                    del copy_buffer[:]
 
             def insertOfficial(res):
                 if not self.where(res):
@@ -1124,32 +1172,28 @@ class Load(object):
                             pass
                     tags = conflate.mapping.tagFactory(res)
                     tags[1].update(tags[0])
-                    giscurs.execute(
-                        sql02.format(
-                            official=tableOfficial,
-                            proj=self.proj,
-                            geom=self.spatialGeom(geom),
-                        ),
-                        {
-                            "ref": (
-                                tags[1].get(conflate.osmRef)
-                                if conflate.osmRef != "NULL"
-                                else None
-                            ),
-                            "tags": tags[1],
-                            "tags1": tags[0],
-                            "fields": dict(
-                                zip(
-                                    dict(res).keys(),
-                                    map(
-                                        lambda s: (s is None and None)
-                                        or "{0}".format(s),
-                                        dict(res).values(),
-                                    ),
-                                )
-                            ),
-                        },
+                    copy_buffer.append(
+                        copy_row(
+                            (
+                                (
+                                    tags[1].get(conflate.osmRef)
+                                    if conflate.osmRef != "NULL"
+                                    else None
+                                ),
+                                copy_json(tags[1]),
+                                copy_json(tags[0]),
+                                copy_json(
+                                    {
+                                        k: (v is None and None) or "{0}".format(v)
+                                        for k, v in res.items()
+                                    }
+                                ),
+                                self.spatialGeom(geom),
+                            )
+                        )
                     )
+                    if len(copy_buffer) >= self.copy_rows:
+                        flushOfficial()
 
             if isinstance(self.geom, tuple):
                 self.geom = self.geom[0]
@@ -1172,6 +1216,8 @@ class Load(object):
                 ),
                 insertOfficial,
             )
+            flushOfficial()
+            osmosis.run(sql02a.format(official=tableOfficial, proj=self.proj))
             osmosis.run(sql02b.format(official=tableOfficial))
             if self.parser.imported_srid():
                 giscurs.execute(
@@ -1293,9 +1339,9 @@ class Load_XY(Load):
 
     def spatialGeom(self, geom):
         return (
-            f"ST_Transform(ST_GeomFromEWKT('SRID={self.parser.imported_srid()};POINT({geom[0]} {geom[1]})'), {self.proj})"
+            f"SRID={self.parser.imported_srid()};POINT({geom[0]} {geom[1]})"
             if self.parser.imported_srid()
-            else "NULL::geometry"
+            else None
         )
 
     def run(self, osmosis, conflate, db_schema, default_table_base_name, version):
@@ -2178,6 +2224,14 @@ class Test(TestAnalyserOsmosis):
         self.assertEqual(Mapping.date_format("04/27/1990", "%m/%d/%Y"), "1990-04-27")
         self.assertEqual(Mapping.date_format("31/04/1990"), None)
 
+    def test_copy_row(self):
+        self.assertEqual(copy_row(("a", None, 1)), "a\t\\N\t1\n")
+        self.assertEqual(copy_row(("a\tb\nc\\d\re",)), "a\\tb\\nc\\\\d\\re\n")
+        self.assertEqual(
+            copy_json({"a": "é\\", "b": None, "c": 1}),
+            """{"a": "é\\\\", "b": null, "c": "1"}""",
+        )
+
     def test_where_formatter(self):
         self.assertEqual(Select.where_attributes({}), """((1=1))""")
         self.assertEqual(
@@ -19,21 +19,25 @@
 #                                                                       #
 #########################################################################
 
+import itertools
 import os
 import re
+import time
 from collections import defaultdict
 from inspect import getframeinfo, stack
 
 import psycopg2
 import psycopg2.extensions
 
-from modules import DictCursorUnicode
+from modules import DictCursorUnicode, SqlProfile
 
 from .Analyser import Analyser
 
 
 class Analyser_Osmosis(Analyser):
 
+    cursor_numbers = itertools.count()
+
     sql_create_highways = """
 CREATE UNLOGGED TABLE {0}.highways AS
 SELECT
@@ -244,18 +248,28 @@ ANALYZE {0}.buildings;
         self.classs = {}
         self.classs_change = {}
         self.explain_sql = False
+        # Rows fetched by round trip from the server side cursors
+        self.itersize = getattr(config, "db_itersize", None) or 2000
         self.typeMapping = {
             "N": self.node_full,
             "W": self.way_full,
             "R": self.relation_full,
         }
         self.typeMapping_id_only = {"N": self.node, "W": self.way, "R": self.relation}
+        # Objects fetched in advance for the current batch of results
+        self.prefetched = {"node": {}, "way": {}, "relation": {}}
         self.resume_from_timestamp = None
         self.already_issued_objects = None
 
         if hasattr(config, "verbose") and config.verbose:
             self.explain_sql = True
 
+        self.sql_profile = None
+        if getattr(config, "sql_profile", None):
+            self.sql_profile = SqlProfile.SqlProfile(
+                config.sql_profile, self.__class__.__name__
+            )
+
     def __enter__(self):
         Analyser.__enter__(self)
         psycopg2.extensions.register_type(psycopg2.extensions.UNICODE)
@@ -271,6 +285,8 @@ ANALYZE {0}.buildings;
     def __exit__(self, exc_type, exc_value, traceback):
         # close database connections + output file
         self.config.osmosis_manager.osmosis_close()
+        if self.sql_profile:
+            self.sql_profile.write()
         Analyser.__exit__(self, exc_type, exc_value, traceback)
 
     def timestamp(self):
@@ -359,11 +375,12 @@ ANALYZE {0}.buildings;
             if not self.giscurs.fetchone():
                 self.logger.log("requires table {0}".format(table))
                 if table == "highways":
-                    self.giscurs.execute(
+                    self._execute(
+                        "requires table {0}".format(table),
                         self.sql_create_highways.format(
                             self.config.db_schema.split(",")[0],
                             self.config.options.get("proj"),
-                        )
+                        ),
                     )
                 elif table == "touched_highways":
                     self.requires_tables_build(["highways"])
@@ -373,30 +390,33 @@ ANALYZE {0}.buildings;
                     self.create_view_not_touched("highways", "W")
                 elif table == "highway_ends":
                     self.requires_tables_build(["highways"])
-                    self.giscurs.execute(
+                    self._execute(
+                        "requires table {0}".format(table),
                         self.sql_create_highway_ends.format(
                             self.config.db_schema.split(",")[0]
-                        )
+                        ),
                     )
                 elif table == "touched_highway_ends":
                     self.requires_tables_build(["highway_ends"])
                     self.create_view_touched("highway_ends", "W")
                 elif table == "multipolygons":
-                    self.giscurs.execute(
+                    self._execute(
+                        "requires table {0}".format(table),
                         self.sql_create_multipolygons.format(
                             self.config.db_schema.split(",")[0],
                             self.config.options.get("proj"),
-                        )
+                        ),
                     )
                 elif table == "touched_multipolygons":
                     self.requires_tables_build(["multipolygons"])
                     self.create_view_touched("multipolygons", "R")
                 elif table == "buildings":
-                    self.giscurs.execute(
+                    self._execute(
+                        "requires table {0}".format(table),
                         self.sql_create_buildings.format(
                             self.config.db_schema.split(",")[0],
                             self.config.options.get("proj"),
-                        )
+                        ),
                     )
                 elif table == "touched_buildings":
                     self.requires_tables_build(["buildings"])
@@ -543,7 +563,7 @@ FROM
         transitive_touched.data_type = '{1}' AND
         {0}.{2} = transitive_touched.id
 """
-        self.giscurs.execute(sql.format(table, type, id))
+        self._execute("touched view {0}".format(table), sql.format(table, type, id))
 
     def create_view_not_touched(self, table, type, id="id"):
         """
@@ -561,9 +581,15 @@ FROM
 WHERE
     transitive_touched.id IS NULL
 """
-        self.giscurs.execute(sql.format(table, type, id))
+        self._execute("not touched view {0}".format(table), sql.format(table, type, id))
+
+    def _execute(self, location, sql):
+        if self.sql_profile:
+            self.sql_profile.execute(self.giscurs, sql, location)
+        else:
+            self.giscurs.execute(sql)
 
-    def run00(self, sql, callback=None):
+    def run00(self, sql, callback=None, batch=False, location=None):
         if self.explain_sql:
             self.logger.log(sql.strip())
         if (
@@ -580,71 +606,183 @@ WHERE
             for res in self.giscurs.fetchall():
                 self.logger.log(res[0])
 
+        # Stream the results of the callback queries from a server side
+        # cursor, instead of loading the whole result in client memory. Only
+        # possible on a single SELECT statement.
+        query = sql.strip().rstrip(";")
+        if (
+            callback
+            and ";" not in query
+            and query.split(None, 1)[0].upper() in ("SELECT", "WITH")
+        ):
+            # Unique name, callbacks may run queries of their own
+            curs = self.gisconn.cursor(
+                "run00_{0}".format(next(self.cursor_numbers)),
+                cursor_factory=DictCursorUnicode.DictCursorUnicode63,
+            )
+            curs.itersize = self.itersize
+        else:
+            curs = self.giscurs
+
+        rss = self.explain_sql and _rss()
         try:
-            self.giscurs.execute(sql)
+            if self.sql_profile and curs is self.giscurs:
+                self.sql_profile.execute(curs, sql, location)
+            elif self.sql_profile:
+                plan = self.sql_profile.explain(self.giscurs, sql)
+                start = time.time()
+                curs.execute(sql)
+            else:
+                curs.execute(sql)
         except:
             self.logger.err("sql={0}".format(sql))
             raise
 
-        if callback:
-            while True:
-                many = self.giscurs.fetchmany(1000)
-                if not many:
-                    break
-                for res in many:
-                    ret = None
-                    try:
-                        ret = callback(res)
-                    except:
-                        self.logger.err("res={0}".format(res))
-                        self.logger.err("ret={0}".format(ret))
-                        raise
+        rows = 0
+        try:
+            if callback:
+                while True:
+                    many = curs.fetchmany(self.itersize)
+                    if not many:
+                        break
+                    rows += len(many)
+                    if batch:
+                        # The callback handles the rows and logs its own errors
+                        callback(many)
+                        continue
+                    for res in many:
+                        self._run_row(callback, res)
+        finally:
+            if curs is not self.giscurs:
+                # Do not leave the portal open on the shared connection
+                curs.close()
+
+        if curs is not self.giscurs and self.sql_profile:
+            # Time of the query and of the callbacks on its results
+            self.sql_profile.record(location, sql, time.time() - start, plan, rows)
+
+        if rss:
+            # Current RSS of the process, its change by the query and the
+            # callbacks. Includes the concurrent analysers with --db-slots.
+            after = _rss()
+            self.logger.log(
+                "RSS {0:.0f} MB ({1:+.1f} MB)".format(
+                    after / 1024, (after - rss) / 1024
+                )
+            )
+
+    def _run_row(self, callback, res):
+        ret = None
+        try:
+            ret = callback(res)
+        except:
+            self.logger.err("res={0}".format(res))
+            self.logger.err("ret={0}".format(ret))
+            raise
+        return ret
 
     def run0(self, sql, callback=None):
         caller = getframeinfo(stack()[1][0])
-        self.logger.log(
-            "{0}:{1} sql".format(os.path.basename(caller.filename), caller.lineno)
-        )
-        self.run00(sql, callback)
+        location = "{0}:{1}".format(os.path.basename(caller.filename), caller.lineno)
+        self.logger.log("{0} sql".format(location))
+        self.run00(sql, callback, location=location)
 
     def run(self, sql, callback=None):
-        def callback_package(res):
-            ret = callback(res)
-            if ret and ret.__class__ == dict:
-                if "self" in ret:
-                    res = ret["self"](res)
-                if "data" in ret:
-                    self.geom = defaultdict(list)
-                    ret["fixType"] = []
-                    for i, d in enumerate(ret["data"]):
-                        if d is not None:
-                            d(res[i])
-                            ret["fixType"].append(self._typeFromCallback(d, res[i]))
-                            if d in (self.any_full, self.any_id):
-                                res[i] = int(res[i][1:])
-                self.error_file.error(
-                    ret["class"],
-                    ret.get("subclass"),
-                    ret.get("text"),
-                    res,
-                    ret.get("fixType"),
-                    ret.get("fix"),
-                    self.geom,
-                )
+        def callback_package(many):
+            # First pass: get the issues from the callback and collect the
+            # objects to load, to fetch them with one query by type
+            issues = []
+            ids = {"node": set(), "way": set(), "relation": set()}
+
+            def collect(res):
+                ret = callback(res)
+                if ret and ret.__class__ == dict:
+                    if "self" in ret:
+                        res = ret["self"](res)
+                    if "data" in ret:
+                        for i, d in enumerate(ret["data"]):
+                            if d is not None:
+                                self._prefetch_ids(d, res[i], ids)
+                    issues.append((res, ret))
+
+            for res in many:
+                self._run_row(collect, res)
+            self._prefetch(ids)
+
+            # Second pass: build and write the issues
+            for res, ret in issues:
+                self._run_row(lambda res: package(res, ret), res)
+
+        def package(res, ret):
+            if "data" in ret:
+                self.geom = defaultdict(list)
+                ret["fixType"] = []
+                for i, d in enumerate(ret["data"]):
+                    if d is not None:
+                        d(res[i])
+                        ret["fixType"].append(self._typeFromCallback(d, res[i]))
+                        if d in (self.any_full, self.any_id):
+                            res[i] = int(res[i][1:])
+            self.error_file.error(
+                ret["class"],
+                ret.get("subclass"),
+                ret.get("text"),
+                res,
+                ret.get("fixType"),
+                ret.get("fix"),
+                self.geom,
+            )
 
         caller = getframeinfo(stack()[1][0])
+        location = "{0}:{1}".format(os.path.basename(caller.filename), caller.lineno)
         if callback:
-            self.logger.log(
-                "{0}:{1} xml generation".format(
-                    os.path.basename(caller.filename), caller.lineno
-                )
-            )
-            self.run00(sql, callback_package)
+            self.logger.log("{0} xml generation".format(location))
+            try:
+                self.run00(sql, callback_package, batch=True, location=location)
+            finally:
+                self._prefetch({})
         else:
-            self.logger.log(
-                "{0}:{1} sql".format(os.path.basename(caller.filename), caller.lineno)
-            )
-            self.run00(sql)
+            self.logger.log("{0} sql".format(location))
+            self.run00(sql, location=location)
+
+    def _prefetch_ids(self, fn, input, ids):
+        if input is None:
+            return
+        if fn in (self.node_full, self.node_position):
+            ids["node"].add(input)
+        elif fn == self.way_full:
+            ids["way"].add(input)
+        elif fn == self.relation_full:
+            ids["relation"].add(input)
+        elif fn == self.any_full:
+            self._prefetch_ids(self.typeMapping[input[0]], int(input[1:]), ids)
+        elif fn == self.array_full:
+            for r in input:
+                self._prefetch_ids(self.typeMapping[r[0]], int(r[1:]), ids)
+
+    def _prefetch(self, ids):
+        self.prefetched = {"node": {}, "way": {}, "relation": {}}
+        gets = {
+            "node": self.apiconn.NodesGet,
+            "way": self.apiconn.WaysGet,
+            "relation": self.apiconn.RelationsGet,
+        }
+        for type, type_ids in ids.items():
+            if type_ids:
+                objects = gets[type](type_ids)
+                # Also record the missing objects, as the single object
+                # getters return None for them
+                self.prefetched[type] = {id: objects.get(id) for id in type_ids}
+
+    def _objectGet(self, type, id):
+        prefetched = self.prefetched[type]
+        if id in prefetched:
+            return prefetched[id]
+        return {
+            "node": self.apiconn.NodeGet,
+            "way": self.apiconn.WayGet,
+            "relation": self.apiconn.RelationGet,
+        }[type](id)
 
     def _typeFromCallback(self, fn, input=None):
         if fn in (self.node, self.node_full, self.node_new, self.node_position):
@@ -662,10 +800,10 @@ WHERE
         self.geom["node"].append({"id": res, "tag": {}})
 
     def node_full(self, res):
-        self.geom["node"].append(self.apiconn.NodeGet(res))
+        self.geom["node"].append(self._objectGet("node", res))
 
     def node_position(self, res):
-        node = self.apiconn.NodeGet(res)
+        node = self._objectGet("node", res)
         if node:
             self.geom["position"].append(
                 {"lat": str(node["lat"]), "lon": str(node["lon"])}
@@ -678,13 +816,13 @@ WHERE
         self.geom["way"].append({"id": res, "nd": [], "tag": {}})
 
     def way_full(self, res):
-        self.geom["way"].append(self.apiconn.WayGet(res))
+        self.geom["way"].append(self._objectGet("way", res))
 
     def relation(self, res):
         self.geom["relation"].append({"id": res, "member": [], "tag": {}})
 
     def relation_full(self, res):
-        self.geom["relation"].append(self.apiconn.RelationGet(res))
+        self.geom["relation"].append(self._objectGet("relation", res))
 
     def any_full(self, res):
         self.typeMapping[res[0]](int(res[1:]))
@@ -724,6 +862,21 @@ WHERE
 #        self.geom["position"].append()
 
 
+def _rss():
+    """
+    Current resident memory of the process in kilobytes, None when not
+    available.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
 from modules import IssuesFileOsmose
 
 ###########################################################################
@@ -20,12 +20,18 @@
 #                                                                       #
 #########################################################################
 
+import datetime
 import importlib
+import multiprocessing
 import os
 import sys
+import traceback
+from collections import OrderedDict
+from queue import Empty
 
 import modules.config
-from modules import OsmoseLog, OsmReader, SourceVersion
+import modules.mapcss_lib
+from modules import OsmoseLog, OsmReader, PluginManifest, SourceVersion
 
 from .Analyser import Analyser
 
@@ -34,6 +40,14 @@ class Analyser_Sax(Analyser):
 
     def __init__(self, config, logger=OsmoseLog.logger()):
         Analyser.__init__(self, config, logger)
+        # Ask the reader for an index of the node locations, it gives ways
+        # their coordinates
+        self.node_locations = bool(getattr(self.config, "sax_node_locations", False))
+        # Fresh caches and counters for each run
+        modules.mapcss_lib.cache_resize(
+            getattr(self.config, "mapcss_cache_size", None)
+            or modules.mapcss_lib.cache_size
+        )
         if self.config.plugins:
             plugins = map(
                 lambda plugin: (
@@ -77,17 +91,62 @@ class Analyser_Sax(Analyser):
 
         self._load_output(change=self.parser.is_change())
         try:
-            self._run_analyse()
+            workers = getattr(self.config, "sax_workers", None) or 1
+            if workers > 1 and self.parser.can_shard():
+                self._run_analyse_sharded(workers)
+            else:
+                self._run_analyse()
+        finally:
+            self._close_output()
+
+    def analyser_change(self):
+        self.logger.log("run sax touched")
+
+        if not self.parser.is_change():
+            return self.analyser()
+
+        # Objects of the change file, with their dependants when the reader
+        # tracks them
+        objects = _TouchedObjects()
+        self.parser.CopyTo(objects)
+        touched = objects.touched
+        reader_touched = self._reader_touched()
+        if reader_touched:
+            for t in touched.keys():
+                for id in reader_touched[t] - objects.deleted[t]:
+                    touched[t].setdefault(id, None)
+
+        self._load_output(change=True)
+        try:
+            self._run_touched(touched, objects.deleted)
         finally:
             self._close_output()
 
     def analyser_resume(self, timestamp, already_issued_objects):
         self.logger.log("run sax changed")
 
-        self.parser.set_filter_since_timestamp(timestamp)
         self.already_issued_objects = already_issued_objects
-
         self.config.timestamp = self.timestamp()
+
+        reader_touched = timestamp and self._reader_touched(timestamp)
+        if reader_touched:
+            # Only analyse the touched objects, the issues of the other
+            # already issued objects stay, unless they are deleted
+            self._load_output(change=True)
+            try:
+                deleted = {}
+                for t in reader_touched.keys():
+                    issued = set(self.already_issued_objects[t]) - reader_touched[t]
+                    deleted[t] = issued - self._existing(t, issued)
+                self._run_touched(
+                    dict(map(lambda t: (t, dict.fromkeys(reader_touched[t])), "NWR")),
+                    deleted,
+                )
+            finally:
+                self._close_output()
+            return
+
+        self.parser.set_filter_since_timestamp(timestamp)
         self._load_output(change=True)
 
         try:
@@ -154,6 +213,14 @@ class Analyser_Sax(Analyser):
     def WayGet(self, WayId):
         return self._reader.WayGet(WayId, dump_sub_elements=True)
 
+    def NodeLocation(self, NodeId):
+        # From the node locations index of the parser when available
+        if self.node_locations and hasattr(self.parser, "location"):
+            location = self.parser.location(NodeId)
+            if location:
+                return {"lat": location[1], "lon": location[0]}
+        return self.NodeGet(NodeId)
+
     def RelationGet(self, RelationId):
         return self._reader.RelationGet(RelationId, dump_sub_elements=True)
 
@@ -191,9 +258,17 @@ class Analyser_Sax(Analyser):
             return
 
         # Running jobs
-        for meth in self.pluginsNodeMethodes:
+        key = None
+        for meth, memo, interest in self.pluginsNodeMethodes:
+            if interest is not None and interest.isdisjoint(tags):
+                continue
             try:
-                res = meth(data, tags)
+                if memo is None:
+                    res = meth(data, tags)
+                else:
+                    if key is None:
+                        key = frozenset(tags.items())
+                    res = memo(key, data, tags)
             except:
                 self._err("Fail on {0} with {1}, {2}".format(meth, data, tags))
                 raise
@@ -247,9 +322,17 @@ class Analyser_Sax(Analyser):
         nds = data["nd"]
 
         # Run jobs
-        for meth in self.pluginsWayMethodes:
+        key = None
+        for meth, memo, interest in self.pluginsWayMethodes:
+            if interest is not None and interest.isdisjoint(tags):
+                continue
             try:
-                res = meth(data, tags, nds)
+                if memo is None:
+                    res = meth(data, tags, nds)
+                else:
+                    if key is None:
+                        key = frozenset(tags.items())
+                    res = memo(key, data, tags, nds)
             except:
                 self._err(
                     "Fail on {0} with {1}, {2}, {3}".format(meth, data, tags, nds)
@@ -269,7 +352,12 @@ class Analyser_Sax(Analyser):
                 if tmp_data:
                     # way from reader can be None if there is only one node on it
                     data = tmp_data
-            node = self.NodeGet(nds[len(nds) // 2])
+            coords = getattr(nds, "coords", None)
+            if coords and coords[len(nds) // 2]:
+                lon, lat = coords[len(nds) // 2]
+                node = {"lat": lat, "lon": lon}
+            else:
+                node = self.NodeGet(nds[len(nds) // 2])
             if not node:
                 node = {"lat": 0, "lon": 0}
             data = self.ExtendData(data)
@@ -309,11 +397,11 @@ class Analyser_Sax(Analyser):
         node = None
         for memb in data["member"]:
             if memb["type"] == "node":
-                node = self.NodeGet(memb["ref"])
+                node = self.NodeLocation(memb["ref"])
             elif memb["type"] == "way":
                 way = self.WayGet(memb["ref"])
                 if way:
-                    node = self.NodeGet(way["nd"][0])
+                    node = self.NodeLocation(way["nd"][0])
             if node:
                 break
         if not node:
@@ -339,9 +427,17 @@ class Analyser_Sax(Analyser):
         members = data["member"]
 
         # Run jobs
-        for meth in self.pluginsRelationMethodes:
+        key = None
+        for meth, memo, interest in self.pluginsRelationMethodes:
+            if interest is not None and interest.isdisjoint(tags):
+                continue
             try:
-                res = meth(data, tags, members)
+                if memo is None:
+                    res = meth(data, tags, members)
+                else:
+                    if key is None:
+                        key = frozenset(tags.items())
+                    res = memo(key, data, tags, members)
             except:
                 self._err(
                     "Fail on {0} with {1}, {2}, {3}".format(meth, data, tags, members)
@@ -405,9 +501,15 @@ class Analyser_Sax(Analyser):
         except IOError:
             pass
 
-        if hasattr(self.config, "reader"):
+        if getattr(self.config, "reader", None) is not None:
             self._reader = self.config.reader
 
+        elif (getattr(self.config, "src", None) or "").endswith(".pbf"):
+            # Get the objects by id from the PBF file, with its block index
+            from modules import OsmPbfAlea
+
+            self._reader = OsmPbfAlea.OsmPbfReader(self.config.src)
+
         else:
             # from modules import OsmSaxAlea
             # self._reader = OsmSaxAlea.OsmSaxReader(self.config.src, self.config.src_state)
@@ -425,50 +527,59 @@ class Analyser_Sax(Analyser):
     def _load_all_plugins(self):
         self._log("Loading plugins")
 
+        # Skip the plugins of other countries before importing them
+        manifest = PluginManifest.load(
+            self.ToolsGetFilePath("plugins"), PluginManifest.cache
+        )
+        conf_limit = self._conf_limit()
         available_plugins = []
-        for plugin in sorted(self.ToolsListDir("plugins")):
-            if not plugin.endswith(".py") or plugin in ("__init__.py", "Plugin.py"):
+        for pluginName in sorted(manifest.keys()):
+            entry = manifest[pluginName]
+            if not entry["class"]:
+                continue
+            if not PluginManifest.selected(
+                entry["only_for"], entry["not_for"], conf_limit
+            ):
+                self._sublog("skip " + entry["class"])
                 continue
-            pluginName = plugin[:-3]
             clazz = self._load_plugin(pluginName)
             if clazz:
                 available_plugins.append(clazz)
 
         return available_plugins
 
+    def _conf_limit(self):
+        conf_limit = set()
+        for i in ("country", "language"):
+            if i in self.config.options:
+                if isinstance(self.config.options[i], str):
+                    conf_limit.add(self.config.options[i])
+        return conf_limit
+
     def _init_plugins(self, available_plugin_classes):
         self._Err = {}
         self.plugins = {}
         self.pluginsNodeMethodes = []
         self.pluginsWayMethodes = []
         self.pluginsRelationMethodes = []
+        self._tags_memos = {}
+        # Union of the tag keys the plugins react to, by type, None for all
+        self.interest_keys = {"node": set(), "way": set(), "relation": set()}
+        use_interest_keys = getattr(self.config, "sax_interest_keys", True)
+        tags_cache_size = getattr(self.config, "sax_tags_cache_size", None)
+        if tags_cache_size is None:
+            tags_cache_size = _TagsMemo.maxsize
 
-        conf_limit = set()
-        for i in ("country", "language"):
-            if i in self.config.options:
-                if isinstance(self.config.options[i], str):
-                    conf_limit.add(self.config.options[i])
+        conf_limit = self._conf_limit()
 
         for pluginClazz in available_plugin_classes:
-            if "only_for" in dir(pluginClazz):
-                if not any(
-                    map(
-                        lambda of: any(map(lambda co: co.startswith(of), conf_limit)),
-                        pluginClazz.only_for,
-                    )
-                ):
-                    self._sublog("skip " + pluginClazz.__name__)
-                    continue
-
-            if "not_for" in dir(pluginClazz):
-                if any(
-                    map(
-                        lambda of: any(map(lambda co: co.startswith(of), conf_limit)),
-                        pluginClazz.not_for,
-                    )
-                ):
-                    self._sublog("skip " + pluginClazz.__name__)
-                    continue
+            if not PluginManifest.selected(
+                getattr(pluginClazz, "only_for", None),
+                getattr(pluginClazz, "not_for", None),
+                conf_limit,
+            ):
+                self._sublog("skip " + pluginClazz.__name__)
+                continue
 
             # Plugin Initialisation
             pluginInstance = pluginClazz(self)
@@ -487,13 +598,32 @@ class Analyser_Sax(Analyser):
                 pluginAvailableMethodes = pluginInstance.availableMethodes()
                 self.plugins[pluginClazz.__name__] = pluginInstance
 
-                # Fetch functions to call
-                if "node" in pluginAvailableMethodes:
-                    self.pluginsNodeMethodes.append(pluginInstance.node)
-                if "way" in pluginAvailableMethodes:
-                    self.pluginsWayMethodes.append(pluginInstance.way)
-                if "relation" in pluginAvailableMethodes:
-                    self.pluginsRelationMethodes.append(pluginInstance.relation)
+                # Fetch functions to call, with a cache of the results by tag
+                # set for the ones only depending on the tags
+                tags_only = (
+                    pluginInstance.tagsOnlyMethodes() if tags_cache_size > 0 else []
+                )
+                # Only give the objects with one of the declared tag keys
+                interest_keys = (
+                    pluginInstance.interestKeys() if use_interest_keys else {}
+                )
+                for t, methodes in (
+                    ("node", self.pluginsNodeMethodes),
+                    ("way", self.pluginsWayMethodes),
+                    ("relation", self.pluginsRelationMethodes),
+                ):
+                    if t in pluginAvailableMethodes:
+                        meth = getattr(pluginInstance, t)
+                        memo = None
+                        if t in tags_only:
+                            memo = _TagsMemo(meth, tags_cache_size)
+                            self._tags_memos[pluginClazz.__name__ + "." + t] = memo
+                        interest = interest_keys.get(t)
+                        if interest is None:
+                            self.interest_keys[t] = None
+                        elif self.interest_keys[t] is not None:
+                            self.interest_keys[t] |= interest
+                        methodes.append((meth, memo, interest))
 
                 # Liste generated issues
                 for cl, v in self.plugins[pluginClazz.__name__].errors.items():
@@ -505,6 +635,14 @@ class Analyser_Sax(Analyser):
                         )
                     self._Err[cl] = v
 
+        for t in ("node", "way", "relation"):
+            if self.interest_keys[t] is not None:
+                self._sublog(
+                    "only {0}s with one of {1} tag keys".format(
+                        t, len(self.interest_keys[t])
+                    )
+                )
+
     ################################################################################
 
     def _load_output(self, change):
@@ -534,6 +672,181 @@ class Analyser_Sax(Analyser):
         self._log("Analysing file " + self.config.src)
         self.parser.CopyTo(self)
         self._log("Analyse finished")
+        self._log_cache_stats()
+
+    def _reader_touched(self, timestamp=None):
+        """
+        Ids of the objects touched by the last change, or since timestamp, and
+        of their dependants, as sets by type. None when the reader does not
+        track them, or is not at the same state as the parser.
+        """
+        if not hasattr(self._reader, "TouchedGet"):
+            return None
+        if self.timestamp() and _utc(self._reader.timestamp()) != _utc(
+            self.timestamp()
+        ):
+            self._sublog("Reader not at the parser timestamp, no touched objects")
+            return None
+        return self._reader.TouchedGet(_utc(timestamp))
+
+    def _existing(self, t, ids):
+        if not ids:
+            return set()
+        if hasattr(self._reader, "ExistingIds"):
+            return self._reader.ExistingIds(t, ids)
+        get = {"N": self.NodeGet, "W": self.WayGet, "R": self.RelationGet}[t]
+        return set(filter(lambda id: get(id), ids))
+
+    def _run_touched(self, touched, deleted):
+        """
+        Run the plugins on the touched objects only, as dicts by type of their
+        data by id. None data are fetched from the reader. Previous issues of
+        the touched and deleted objects are removed.
+        """
+        self._log(
+            "Analysing {0} nodes, {1} ways and {2} relations touched".format(
+                len(touched["N"]), len(touched["W"]), len(touched["R"])
+            )
+        )
+        for t, type, get, create in (
+            ("N", "node", self.NodeGet, self.NodeCreate),
+            ("W", "way", self.WayGet, self.WayCreate),
+            ("R", "relation", self.RelationGet, self.RelationCreate),
+        ):
+            for id in sorted(deleted[t]):
+                self.error_file.delete(type, id)
+            for id in sorted(touched[t].keys()):
+                self.error_file.delete(type, id)
+                data = touched[t][id] or get(id)
+                if data:
+                    create(data)
+        self._log("Analyse finished")
+        self._log_cache_stats()
+
+    def _run_analyse_sharded(self, nb_shards):
+        """
+        Split the data blocks of the source over nb_shards forked workers. Each
+        worker runs its own copy of the plugins and records the issues by block.
+        Issues are then written in the block order, the output is the same as
+        a serial run.
+        """
+        self._log(
+            "Analysing file {0} with {1} workers".format(self.config.src, nb_shards)
+        )
+        context = multiprocessing.get_context("fork")
+        queues = [context.Queue(maxsize=64) for _ in range(nb_shards)]
+        workers = [
+            context.Process(
+                target=self._run_analyse_shard, args=(shard, nb_shards, queues[shard])
+            )
+            for shard in range(nb_shards)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            # Blocks are numbered in file order, block n is analysed by worker
+            # n % nb_shards. The first worker without a next block means the
+            # end of the file.
+            block = 0
+            while True:
+                shard = block % nb_shards
+                res = self._shard_get(queues[shard], workers[shard])
+                if res is None:
+                    break
+                for method, args, kwargs in res:
+                    getattr(self.error_file, method)(*args, **kwargs)
+                block += 1
+            for shard in range(nb_shards):
+                if shard != block % nb_shards:
+                    self._shard_get(queues[shard], workers[shard])
+        except:
+            for worker in workers:
+                worker.terminate()
+            raise
+        finally:
+            for worker in workers:
+                worker.join()
+        self._log("Analyse finished")
+
+    def _shard_get(self, queue, worker):
+        while True:
+            try:
+                res = queue.get(timeout=10)
+                break
+            except Empty:
+                if not worker.is_alive():
+                    raise RuntimeError(
+                        "SAX worker exited with code {0}".format(worker.exitcode)
+                    )
+        if isinstance(res, str):
+            raise RuntimeError("SAX worker failed:\n" + res)
+        return res
+
+    def _run_analyse_shard(self, shard, nb_shards, queue):
+        try:
+            # Do not share the reader file descriptors nor database connection
+            # with the parent process
+            self._load_reader()
+            modules.mapcss_lib.cache_resize(modules.mapcss_lib.cache_size)
+            self.error_file = _IssuesRecorder()
+            self._shard_queue = queue
+            self._shard_in_block = False
+            self.parser.CopyTo(self, shard, nb_shards)
+            if self._shard_in_block:
+                self._shard_flush()
+            self._log_cache_stats("worker {0}: ".format(shard))
+            queue.put(None)
+        except:
+            queue.put(traceback.format_exc())
+        finally:
+            queue.close()
+            queue.join_thread()
+
+    def BlockStart(self, index):
+        # Only used to split the issues by block when running sharded
+        if hasattr(self, "_shard_queue"):
+            if self._shard_in_block:
+                self._shard_flush()
+            self._shard_in_block = True
+
+    def _shard_flush(self):
+        self._shard_queue.put(self.error_file.calls)
+        self.error_file.calls = []
+
+    def _log_cache_stats(self, prefix=""):
+        for name, stats in modules.mapcss_lib.cache_stats().items():
+            self._sublog(
+                "{0}mapcss cache {1}: {2} hits, {3} misses, {4} evictions, {5}/{6} entries".format(
+                    prefix,
+                    name,
+                    stats["hits"],
+                    stats["misses"],
+                    stats["evictions"],
+                    stats["size"],
+                    stats["maxsize"],
+                )
+            )
+        for name, stats in self.tags_cache_stats().items():
+            self._sublog(
+                "{0}tags cache {1}: {2:.0%} hit rate, {3} hits, {4} misses, {5} evictions, {6}/{7} entries".format(
+                    prefix,
+                    name,
+                    stats["hit_rate"],
+                    stats["hits"],
+                    stats["misses"],
+                    stats["evictions"],
+                    stats["size"],
+                    stats["maxsize"],
+                )
+            )
+
+    def tags_cache_stats(self):
+        """
+        Counters of the caches of the tags only plugin methods, by
+        plugin.method.
+        """
+        return dict(map(lambda i: (i[0], i[1].stats()), self._tags_memos.items()))
 
     ################################################################################
 
@@ -541,7 +854,117 @@ class Analyser_Sax(Analyser):
         self.error_file.analyser_end()
 
 
-import datetime
+class _TagsMemo:
+    """
+    Bounded cache of the results of a plugin method only depending on the
+    tags, by tag set, least recently used entries dropped first.
+    """
+
+    # Default number of entries
+    maxsize = 100000
+
+    def __init__(self, meth, maxsize):
+        self.meth = meth
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, key, *args):
+        res = self.results.get(key, self)
+        if res is not self:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return res
+
+        self.misses += 1
+        res = self.meth(*args)
+        self.results[key] = res
+        if len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+            self.evictions += 1
+        return res
+
+    def stats(self):
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / calls if calls else 0,
+            "evictions": self.evictions,
+            "size": len(self.results),
+            "maxsize": self.maxsize,
+        }
+
+
+class _TouchedObjects:
+    """
+    Collect the objects of a change file: the last data of the created and
+    modified ones, and the ids of the deleted ones, by type.
+    """
+
+    def __init__(self):
+        self.touched = {"N": {}, "W": {}, "R": {}}
+        self.deleted = {"N": set(), "W": set(), "R": set()}
+
+    def _touch(self, t, data):
+        self.deleted[t].discard(data["id"])
+        self.touched[t][data["id"]] = data
+
+    def _delete(self, t, data):
+        self.touched[t].pop(data["id"], None)
+        self.deleted[t].add(data["id"])
+
+    def NodeCreate(self, data):
+        self._touch("N", data)
+
+    def NodeUpdate(self, data):
+        self._touch("N", data)
+
+    def NodeDelete(self, data):
+        self._delete("N", data)
+
+    def WayCreate(self, data):
+        self._touch("W", data)
+
+    def WayUpdate(self, data):
+        self._touch("W", data)
+
+    def WayDelete(self, data):
+        self._delete("W", data)
+
+    def RelationCreate(self, data):
+        self._touch("R", data)
+
+    def RelationUpdate(self, data):
+        self._touch("R", data)
+
+    def RelationDelete(self, data):
+        self._delete("R", data)
+
+
+def _utc(timestamp):
+    # Naive UTC, as in the database
+    if timestamp and timestamp.tzinfo:
+        return timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+class _IssuesRecorder:
+    """
+    Record the issues of a SAX worker, to be replayed on the real issues file.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def error(self, *args, **kwargs):
+        self.calls.append(("error", args, kwargs))
+
+    def delete(self, *args, **kwargs):
+        self.calls.append(("delete", args, kwargs))
+
 
 import dateutil
 
@@ -569,6 +992,22 @@ class TestAnalyserOsmosis(TestAnalyser):
         def timestamp(self):
             return datetime.datetime.now()
 
+    class MockupTouchedReader(MockupReader):
+        def __init__(self, timestamp):
+            self._timestamp = timestamp
+            self.since_timestamp = None
+
+        def TouchedGet(self, since_timestamp=None):
+            self.since_timestamp = since_timestamp
+            return {"N": set([1759873129]), "W": set([24552698]), "R": set()}
+
+        def ExistingIds(self, type, ids):
+            # Only node 1 was deleted
+            return set(ids) - set([1]) if type == "N" else set(ids)
+
+        def timestamp(self):
+            return self._timestamp
+
     def setUp(self):
 
         class config:
@@ -608,6 +1047,198 @@ class TestAnalyserOsmosis(TestAnalyser):
         self.root_err = self.load_errors()
         self.check_num_err(min=33)
 
+    def test_sax_workers(self):
+        # Sharded run must write exactly the same file as the serial one
+        import filecmp
+
+        self.config.options = {"country": "FR", "project": "openstreetmap"}
+        self.config.plugins = [
+            "Josm_deprecated",
+            "TagFix_BadKey",
+            "Highway_Lanes",
+            "Structural_Useless_Relation",
+        ]
+        for src in ["tests/saint_barthelemy.osm.pbf", "tests/gibraltar.osm.pbf"]:
+            self.config.src = src
+            results = []
+            for workers in (1, 3):
+                self.xml_res_file = os.path.join(
+                    self.dirname, "sax.test_workers_{0}.xml".format(workers)
+                )
+                results.append(self.xml_res_file)
+                self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(
+                    self.xml_res_file
+                )
+                self.config.sax_workers = workers
+                with Analyser_Sax(self.config) as analyser_obj:
+                    analyser_obj.analyser()
+
+            self.assertTrue(filecmp.cmp(results[0], results[1], shallow=False), src)
+            self.root_err = self.load_errors()
+            self.check_num_err(min=1)
+
+    def test_tags_cache(self):
+        # Results reused by tag set must write exactly the same file
+        import filecmp
+
+        self.config.options = {"country": "FR", "project": "openstreetmap"}
+        self.config.plugins = [
+            "Josm_deprecated",
+            "TagFix_BadKey",
+            "Colour",
+            "Highway_Lanes",
+        ]
+        self.config.src = "tests/saint_barthelemy.osm.pbf"
+        # All the objects through the caches
+        self.config.sax_interest_keys = False
+        results = []
+        for size in (0, 2, 100000):
+            self.xml_res_file = os.path.join(
+                self.dirname, "sax.test_tags_cache_{0}.xml".format(size)
+            )
+            results.append(self.xml_res_file)
+            self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(
+                self.xml_res_file
+            )
+            self.config.sax_tags_cache_size = size
+            with Analyser_Sax(self.config) as analyser_obj:
+                analyser_obj.analyser()
+                stats = analyser_obj.tags_cache_stats()
+
+            if size == 0:
+                self.assertEqual(stats, {})
+            else:
+                self.assertNotIn("Highway_Lanes.way", stats)
+                self.assertLessEqual(stats["Josm_deprecated.node"]["size"], size)
+                self.assertGreater(stats["TagFix_BadKey.way"]["hits"], 0)
+                self.assertGreater(stats["Colour.node"]["hit_rate"], 0)
+
+        self.assertTrue(filecmp.cmp(results[0], results[1], shallow=False))
+        self.assertTrue(filecmp.cmp(results[0], results[2], shallow=False))
+        self.root_err = self.load_errors()
+        self.check_num_err(min=1)
+
+    def test_interest_keys(self):
+        # Objects without the declared tag keys skipped, by the reader and
+        # for each plugin, must write exactly the same file
+        import filecmp
+
+        self.config.options = {"country": "FR", "project": "openstreetmap"}
+        self.config.plugins = [
+            "Power",
+            "Highway_Lanes",
+            "Name_Spaces",
+            "Source_FR",
+            "Structural_Multipolygon",
+        ]
+        self.config.src = "tests/saint_barthelemy.osm.pbf"
+        results = []
+        for interest_keys in (False, True):
+            self.xml_res_file = os.path.join(
+                self.dirname, "sax.test_interest_keys_{0}.xml".format(interest_keys)
+            )
+            results.append(self.xml_res_file)
+            self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(
+                self.xml_res_file
+            )
+            self.config.sax_interest_keys = interest_keys
+            with Analyser_Sax(self.config) as analyser_obj:
+                analyser_obj.analyser()
+                if interest_keys:
+                    self.assertEqual(
+                        analyser_obj.interest_keys["relation"],
+                        set(["name", "power", "source", "type"]),
+                    )
+                    self.assertIn("highway", analyser_obj.interest_keys["way"])
+                else:
+                    self.assertIsNone(analyser_obj.interest_keys["node"])
+
+        self.assertTrue(filecmp.cmp(results[0], results[1], shallow=False))
+        self.root_err = self.load_errors()
+        self.check_num_err(min=1)
+
+        # No object for the types without methods, all of them for the types
+        # with a method without declaration
+        self.config.plugins = ["Highway_Lanes", "Structural_Waterway"]
+        analyser_obj = Analyser_Sax(self.config)
+        self.assertEqual(analyser_obj.interest_keys["node"], set())
+        self.assertEqual(
+            analyser_obj.interest_keys["way"], set(["highway", "waterway"])
+        )
+        self.config.plugins.append("TagFix_BadKey")
+        analyser_obj = Analyser_Sax(self.config)
+        self.assertIsNone(analyser_obj.interest_keys["node"])
+        self.assertIsNone(analyser_obj.interest_keys["way"])
+
+    def test_node_locations(self):
+        # Ways issues placed from the node locations index, the mockup reader
+        # would place them at 0,0
+        import filecmp
+        import re
+
+        self.config.options = {"country": "FR", "project": "openstreetmap"}
+        self.config.plugins = ["Josm_deprecated", "TagFix_BadKey", "Highway_Lanes"]
+        self.config.src = "tests/gibraltar.osm.pbf"
+        self.config.sax_node_locations = True
+        results = []
+        for workers in (1, 3):
+            self.xml_res_file = os.path.join(
+                self.dirname, "sax.test_node_locations_{0}.xml".format(workers)
+            )
+            results.append(self.xml_res_file)
+            self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(
+                self.xml_res_file
+            )
+            self.config.sax_workers = workers
+            with Analyser_Sax(self.config) as analyser_obj:
+                analyser_obj.analyser()
+
+        self.assertTrue(filecmp.cmp(results[0], results[1], shallow=False))
+        with open(results[0], encoding="utf-8") as f:
+            locations = re.findall(r'<location lat="([^"]*)".*\n<way ', f.read())
+        self.assertTrue(locations)
+        self.assertNotIn("0", locations)
+
+    def test_pbf_reader(self):
+        # Without other reader, objects got from the PBF file by its block
+        # index, which also splits the blocks over the workers
+        import filecmp
+        import re
+        import shutil
+
+        from modules import OsmPbfAlea
+
+        self.config.options = {"country": "FR", "project": "openstreetmap"}
+        self.config.plugins = ["Josm_deprecated", "Highway_Lanes", "Name_Spaces"]
+        self.config.src = os.path.join(self.dirname, "sax.test_pbf_reader.osm.pbf")
+        shutil.copy("tests/gibraltar.osm.pbf", self.config.src)
+        self.config.reader = None
+        results = []
+        for workers in (1, 3):
+            self.xml_res_file = os.path.join(
+                self.dirname, "sax.test_pbf_reader_{0}.xml".format(workers)
+            )
+            results.append(self.xml_res_file)
+            self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(
+                self.xml_res_file
+            )
+            self.config.sax_workers = workers
+            with Analyser_Sax(self.config) as analyser_obj:
+                analyser_obj.analyser()
+                self.assertIsInstance(analyser_obj._reader, OsmPbfAlea.OsmPbfReader)
+
+        self.assertTrue(os.path.exists(OsmPbfAlea.index_path(self.config.src)))
+        self.assertTrue(filecmp.cmp(results[0], results[1], shallow=False))
+        with open(results[0], encoding="utf-8") as f:
+            content = f.read()
+        locations = re.findall(
+            r'<location lat="([^"]*)".*\n<(?:way|relation) ', content
+        )
+        self.assertTrue(locations)
+        self.assertNotIn("0", locations)
+        self.root_err = self.load_errors()
+        self.check_num_err(min=1)
+
     def test_resume_full(self):
         # Test with an older timestamp than older object in extract
         self.xml_res_file = os.path.join(self.dirname, "sax.test_resume_full.xml")
@@ -655,6 +1286,100 @@ class TestAnalyserOsmosis(TestAnalyser):
         self.root_err = self.load_errors()
         self.check_num_err(min=0, max=0)
 
+    def test_change(self):
+        self.xml_res_file = os.path.join(self.dirname, "sax.test_change.xml")
+        self.config.plugins = [
+            "Josm_deprecated",
+            "TagFix_BadKey",
+            "Structural_Useless_Relation",
+        ]
+        self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
+        self.config.src = "tests/saint_barthelemy.osc.gz"
+        with Analyser_Sax(self.config) as analyser_obj:
+            analyser_obj.analyser_change()
+
+        self.root_err = self.load_errors()
+        root_analyser = self.root_err.find("analyserChange")
+        # Previous issues removed for all the objects of the change file
+        deletes = set(
+            map(
+                lambda d: (d.attrib["type"], int(d.attrib["id"])),
+                root_analyser.findall("delete"),
+            )
+        )
+        self.assertEqual(len(deletes), 14)
+        self.assertIn(("node", 1759873129), deletes)
+        self.assertIn(("relation", 7802), deletes)
+        # Only the created and modified objects analysed
+        for e in root_analyser.findall("error"):
+            for t in ("node", "way", "relation"):
+                for o in e.findall(t):
+                    self.assertIn(int(o.attrib["id"]), [78, 79, 780, 7800, 7801, 7802])
+        self.check_num_err(min=1)
+
+    def test_change_touched(self):
+        from modules.OsmState import OsmState
+
+        # Dependants from the reader, deleted objects not fetched back
+        self.xml_res_file = os.path.join(self.dirname, "sax.test_change_touched.xml")
+        self.config.plugins = [
+            "Josm_deprecated",
+            "TagFix_BadKey",
+            "Structural_Useless_Relation",
+        ]
+        self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
+        self.config.src = "tests/saint_barthelemy.osc.gz"
+        self.config.reader = TestAnalyserOsmosis.MockupTouchedReader(
+            OsmState(self.config.src_state).timestamp()
+        )
+        with Analyser_Sax(self.config) as analyser_obj:
+            analyser_obj.analyser_change()
+
+        self.assertIsNone(self.config.reader.since_timestamp)
+        self.root_err = self.load_errors()
+        deletes = list(
+            map(
+                lambda d: (d.attrib["type"], int(d.attrib["id"])),
+                self.root_err.find("analyserChange").findall("delete"),
+            )
+        )
+        self.assertEqual(len(deletes), 15)
+        self.assertIn(("way", 24552698), deletes)
+
+    def test_resume_touched(self):
+        from modules.OsmState import OsmState
+
+        timestamp = OsmState(self.config.src_state).timestamp()
+        self.xml_res_file = os.path.join(self.dirname, "sax.test_resume_touched.xml")
+        self.config.plugins = [
+            "Josm_deprecated",
+            "TagFix_BadKey",
+            "Structural_Useless_Relation",
+        ]
+        self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
+        self.config.reader = TestAnalyserOsmosis.MockupTouchedReader(timestamp)
+        with Analyser_Sax(self.config) as analyser_obj:
+            analyser_obj.analyser_resume(
+                dateutil.parser.parse("2012-07-18T11:04:56Z"),
+                {"N": set([1, 2]), "W": set([24552698]), "R": set([3])},
+            )
+
+        self.assertEqual(
+            self.config.reader.since_timestamp,
+            datetime.datetime(2012, 7, 18, 11, 4, 56),
+        )
+        self.root_err = self.load_errors()
+        deletes = list(
+            map(
+                lambda d: (d.attrib["type"], int(d.attrib["id"])),
+                self.root_err.find("analyserChange").findall("delete"),
+            )
+        )
+        # Deleted node 1, and the touched objects
+        self.assertEqual(
+            deletes, [("node", 1), ("node", 1759873129), ("way", 24552698)]
+        )
+
     def test_FR(self):
         self.xml_res_file = os.path.join(self.dirname, "sax.test.FR.xml")
         self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
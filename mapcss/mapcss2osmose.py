@@ -525,9 +525,10 @@ def rule_before_flags(t, c):
 def functionExpression_rule_flags(t, c):
     """
     type = functionExpression
-    waylength function need geo target
+    waylength function need geo target, only available in selectors, aborting
+    the rule without the node locations
     """
-    if t["name"] in ("waylength", "areasize"):
+    if t["name"] in ("waylength", "areasize") and "selector_capture" not in c:
         c["flags"].append("geo")
     elif t["name"] in ("JOSM_search", "JOSM_pref"):
         c["flags"].append("josm")
@@ -628,10 +629,14 @@ def functionExpression_runtime(t, c):
                 ["data['lat']", "data['lon']"]
                 if t["name"] == "at"
                 else (
-                    ["self.father.config.options"]
-                    if t["name"]
-                    in ("inside", "outside", "language", "no_language", "setting")
-                    else []
+                    ["data"]
+                    if t["name"] in ("waylength", "areasize")
+                    else (
+                        ["self.father.config.options"]
+                        if t["name"]
+                        in ("inside", "outside", "language", "no_language", "setting")
+                        else []
+                    )
                 )
             )
         ) + t["params"]
@@ -957,6 +962,12 @@ regex_store: Dict[List[str], str] = {}
 set_store: Set[str] = set()
 subclass_blacklist = []
 is_meta_rule = False
+# Below this number of rules, a flat sequence of key tests is faster than
+# the dispatch on the object keys
+DISPATCH_MIN_RULES = 64
+rule_type = None
+rule_dispatch = False
+rule_store: List[Optional[tuple]] = []
 
 
 def to_p(t):
@@ -995,6 +1006,8 @@ def to_p(t):
                 )
             )
             main_tags_None = any(map(lambda s: len(s) == 0, main_tags))
+            rule_index = len(rule_store)
+            rule_store.append(None if main_tags_None else main_tags)
             fix = {"fixAdd": [], "fixChangeKey": [], "fixRemove": []}
             declarations_text = list(filter(lambda a: a, map(to_p, t["declarations"])))
             fix = dict(
@@ -1016,10 +1029,8 @@ def to_p(t):
                 + "])",
                 sorted(fix.items()),
             )
-            return (
-                selectors_text
-                + "\n"
-                + (
+            body = (
+                (
                     (
                         "if ("
                         + ") or (".join(
@@ -1085,6 +1096,20 @@ def to_p(t):
                     else ""
                 )
             )
+            if not rule_dispatch:
+                return selectors_text + "\n" + body
+            return (
+                selectors_text
+                + "\ndef _"
+                + rule_type
+                + "_rule_"
+                + str(rule_index)
+                + "(self, data, tags, "
+                + {"node": "", "way": "nds, ", "relation": "members, "}[rule_type]
+                + "keys, sets, err):\n    "
+                + body.rstrip("\n").replace("\n", "\n    ")
+                + "\n"
+            )
         elif is_meta_rule:
             list(map(to_p, t["declarations"]))
             return ""
@@ -1120,7 +1145,9 @@ def to_p(t):
         )
         return "((" + ") and (".join(sp) + "))"
     elif t["type"] == "class_selector":
-        return ("not " if t["not"] else "") + "set_" + t["class"]
+        if not rule_dispatch:
+            return ("not " if t["not"] else "") + "set_" + t["class"]
+        return "'" + t["class"] + "'" + (" not in sets" if t["not"] else " in sets")
     elif t["type"] == "predicate_simple":
         return (
             ("not " if t["not"] else "")
@@ -1141,7 +1168,9 @@ def to_p(t):
         if t["set"]:
             s = t["set"] if t["set"][0] != "." else t["set"][1:]
             set_store.add(s)
-            return "set_" + s + " = True"
+            if not rule_dispatch:
+                return "set_" + s + " = True"
+            return "sets.add('" + s + "')"
         # Meta info properties
         elif t["property"] == "-osmoseTags":
             if is_meta_rule:
@@ -1370,6 +1399,130 @@ def build_items(class_):
     return "\n".join(out)
 
 
+def build_method(rule_type, rules):
+    return (
+        """
+    def """
+        + rule_type
+        + """(self, data, tags"""
+        + {"node": "", "way": ", nds", "relation": ", members"}[rule_type]
+        + """):
+        capture_tags = {}
+        keys = tags.keys()
+        err = []
+        """
+        + (
+            (
+                " = ".join(list(map(lambda s: "set_" + s, sorted(set_store))))
+                + " = False"
+            )
+            if len(set_store) > 0
+            else ""
+        )
+        + """
+
+        """
+        + rules.replace("\n", "\n        ")
+        + """
+        return err
+"""
+    )
+
+
+def tags_only_rules(rules):
+    """
+    True if the generated rules only read the tags of the object, not its
+    data, nodes or members, so their result can be reused by tag set.
+    """
+    return not any(
+        map(
+            lambda n: isinstance(n, ast.Name) and n.id in ("data", "nds", "members"),
+            ast.walk(ast.parse(rules)),
+        )
+    )
+
+
+def dispatch_rules(rule_store):
+    # Index each rule once per selector, on its least shared mandatory key.
+    # Rules without any mandatory key are always run.
+    key_count = {}
+    for main_tags in filter(lambda m: m is not None, rule_store):
+        for key in set(k for s in main_tags for k in s):
+            key_count[key] = key_count.get(key, 0) + 1
+    dispatch = {}
+    fallback = []
+    for rule_index, main_tags in enumerate(rule_store):
+        if main_tags is None:
+            fallback.append(rule_index)
+        else:
+            for key in set(
+                map(lambda s: min(s, key=lambda k: (key_count[k], k)), main_tags)
+            ):
+                dispatch.setdefault(key, []).append(rule_index)
+    return dispatch, fallback
+
+
+def interest_keys_rules(rule_store):
+    """
+    Keys without which none of the rules can match, None if some rules have
+    no mandatory key.
+    """
+    dispatch, fallback = dispatch_rules(rule_store)
+    return None if fallback else sorted(dispatch.keys())
+
+
+def build_dispatch_method(rule_type, rules, rule_store):
+    dispatch, fallback = dispatch_rules(rule_store)
+
+    rule_names = list(
+        map(lambda i: "_" + rule_type + "_rule_" + str(i), range(len(rule_store)))
+    )
+    return (
+        """
+    def """
+        + rule_type
+        + """(self, data, tags"""
+        + {"node": "", "way": ", nds", "relation": ", members"}[rule_type]
+        + """):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in mapcss._dispatch_rules(self._"""
+        + rule_type
+        + """_rules_dispatch, self._"""
+        + rule_type
+        + """_rules_fallback, keys):
+            self._"""
+        + rule_type
+        + """_rules[rule](self, data, tags, """
+        + {"node": "", "way": "nds, ", "relation": "members, "}[rule_type]
+        + """keys, sets, err)
+        return err
+
+    """
+        + rules.replace("\n", "\n    ")
+        + "\n\n    _"
+        + rule_type
+        + "_rules = ("
+        + ", ".join(rule_names)
+        + ("," if len(rule_names) == 1 else "")
+        + ")\n    _"
+        + rule_type
+        + "_rules_dispatch = {"
+        + ", ".join(
+            map(
+                lambda kv: "'" + kv[0].replace("'", "\\'") + "': " + str(tuple(kv[1])),
+                sorted(dispatch.items()),
+            )
+        )
+        + "}\n    _"
+        + rule_type
+        + "_rules_fallback = "
+        + str(tuple(fallback))
+        + "\n"
+    )
+
+
 context_map = {
     "inside": "country",
 }
@@ -1481,7 +1634,15 @@ def parse_mapcss(inputfile):
     return listener, tree
 
 
-def compile(inputfile, class_name, mapcss_url=None, only_for=[], not_for=[], prefix=""):
+def compile(
+    inputfile,
+    class_name,
+    mapcss_url=None,
+    only_for=[],
+    not_for=[],
+    prefix="",
+    dispatch_min_rules=DISPATCH_MIN_RULES,
+):
     global item_default, class_map, subclass_blacklist, class_index, meta_tags
 
     listener, tree = parse_mapcss(inputfile)
@@ -1502,18 +1663,29 @@ def compile(inputfile, class_name, mapcss_url=None, only_for=[], not_for=[], pre
     tree = filter_support_rules(tree)
     selectors_type = segregate_selectors_type(tree)
 
-    global class_, tests, regex_store, set_store
-    rules = dict(
-        map(
-            lambda t: [t, to_p({"type": "stylesheet", "rules": selectors_type[t]})],
-            sorted(
-                selectors_type.keys(),
-                key=lambda a: {"node": 0, "way": 1, "relation": 2}[a],
-            ),
-        )
-    )
+    global class_, tests, regex_store, set_store, rule_type, rule_dispatch, rule_store
+    rules = {}
+    interest_keys = {}
+    for rule_type in sorted(
+        selectors_type.keys(), key=lambda a: {"node": 0, "way": 1, "relation": 2}[a]
+    ):
+        rule_dispatch = len(selectors_type[rule_type]) >= dispatch_min_rules
+        rule_store = []
+        rules[rule_type] = [
+            to_p({"type": "stylesheet", "rules": selectors_type[rule_type]}),
+            rule_store if rule_dispatch else None,
+        ]
+        keys = interest_keys_rules(rule_store)
+        if keys is not None:
+            interest_keys[rule_type] = keys
     items = build_items(class_)
     asserts = build_tests(tests)
+    tags_only = list(
+        filter(
+            lambda t: tags_only_rules(rules[t][0]),
+            sorted(rules.keys(), key=lambda a: {"node": 0, "way": 1, "relation": 2}[a]),
+        )
+    )
 
     mapcss = (
         """#-*- coding: utf-8 -*-
@@ -1544,6 +1716,32 @@ class """
             if not_for != []
             else ""
         )
+        + (
+            "\n    tags_only = ['" + "', '".join(tags_only) + "']\n"
+            if tags_only != []
+            else ""
+        )
+        + (
+            "\n    interest_keys = {"
+            + ", ".join(
+                map(
+                    lambda t: "'"
+                    + t
+                    + "': ["
+                    + ", ".join(
+                        map(
+                            lambda k: "'" + k.replace("'", "\\'") + "'",
+                            interest_keys[t],
+                        )
+                    )
+                    + "]",
+                    filter(lambda t: t in interest_keys, ("node", "way", "relation")),
+                )
+            )
+            + "}\n"
+            if interest_keys
+            else ""
+        )
         + """
     def init(self, logger):
         super().init(logger)
@@ -1557,7 +1755,7 @@ class """
                 lambda r: """
         self."""
                 + r[1]
-                + " = re.compile(r'"
+                + " = mapcss.lazy_regex(r'"
                 + r[0].replace("(?U)", "").replace("'", "\\'")
                 + "'"
                 + (", " + {"i": "re.I", "m": "re.M", "s": "re.I"}[r[2]] if r[2] else "")
@@ -1573,31 +1771,11 @@ class """
 """
         + "".join(
             map(
-                lambda t: """
-    def """
-                + t
-                + """(self, data, tags"""
-                + {"node": "", "way": ", nds", "relation": ", members"}[t]
-                + """):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        """
-                + (
-                    (
-                        " = ".join(list(map(lambda s: "set_" + s, sorted(set_store))))
-                        + " = False"
-                    )
-                    if len(set_store) > 0
-                    else ""
-                )
-                + """
-
-        """
-                + rules[t].replace("\n", "\n        ")
-                + """
-        return err
-""",
+                lambda t: (
+                    build_dispatch_method(t, rules[t][0], rules[t][1])
+                    if rules[t][1] is not None
+                    else build_method(t, rules[t][0])
+                ),
                 sorted(
                     rules.keys(), key=lambda a: {"node": 0, "way": 1, "relation": 2}[a]
                 ),
@@ -1633,7 +1811,7 @@ class Test(TestPluginMapcss):
 from .item_map import item_map
 
 
-def mapcss2osmose(mapcss, output_path=None):
+def mapcss2osmose(mapcss, output_path=None, dispatch_min_rules=DISPATCH_MIN_RULES):
     class_name = original_class_name = ".".join(
         os.path.basename(mapcss).replace(".validator.", ".").split(".")[:-1]
     )
@@ -1663,7 +1841,15 @@ def mapcss2osmose(mapcss, output_path=None):
         meta_tags = None
     class_name = class_name.replace(".", "_").replace("-", "_")
 
-    python_code = compile(mapcss, class_name, mapcss_url, only_for, not_for, prefix)
+    python_code = compile(
+        mapcss,
+        class_name,
+        mapcss_url,
+        only_for,
+        not_for,
+        prefix,
+        dispatch_min_rules,
+    )
 
     path = output_path if output_path else os.path.dirname(mapcss)
     output = open((path or ".") + "/" + prefix + class_name + ".py", "w")
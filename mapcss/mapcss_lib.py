@@ -1,38 +1,65 @@
 # -*- coding: utf-8 -*-
+import functools
 import re
 from urllib.parse import unquote
 
+import regex
+
 from modules.OsmoseTranslation import T_
 
 # Utils
 
 
-def memoize(f):
-    class memodict(dict):
-        __slots__ = ()
+# Bounded LRU caches on the hot functions, shared by all the plugins. Sized
+# from the analyser config with cache_resize(), counters read by cache_stats().
+cache_size = 100000
+_caches = {}
 
-        def __missing__(self, key):
-            self[key] = ret = f(key)
-            return ret
 
-    return memodict().__getitem__
+def lru_memoize(name):
+    def decorator(f):
+        _caches[name] = f
+        return functools.lru_cache(maxsize=cache_size)(f)
 
+    return decorator
 
-def memoizeN(f):
-    memo = {}
 
-    def wrapper(*args):
-        try:
-            return memo[args]
-        except KeyError:
-            rv = f(*args)
-            memo[args] = rv
-            return rv
+def cache_resize(maxsize):
+    """
+    Rebuild the caches with maxsize entries each, and reset the counters.
+    """
+    global cache_size
+    cache_size = maxsize
+    for name, f in _caches.items():
+        globals()[name] = functools.lru_cache(maxsize=maxsize)(f)
+
+
+def cache_stats():
+    stats = {}
+    for name in _caches:
+        info = globals()[name].cache_info()
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            # Each miss adds an entry, only evictions remove them
+            "evictions": info.misses - info.currsize,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return stats
 
-    return wrapper
 
+def _dispatch_rules(dispatch, fallback, keys):
+    # Rules indexed by the keys of the object, in declaration order
+    found = list(filter(None, map(dispatch.get, keys)))
+    if fallback:
+        found.append(fallback)
+    if len(found) <= 1:
+        return found[0] if found else ()
+    return sorted(set().union(*found))
 
-@memoize
+
+@lru_memoize("str_value")
 def str_value(string):
     return str_value_(string)
 
@@ -330,11 +357,32 @@ def split(sep, string):
 #    get the value of the key key_name from the object in question
 
 
-@memoizeN
+@lru_memoize("_re_search")
 def _re_search(r, s):
     return r.search(s)
 
 
+class lazy_regex:
+    """
+    Regular expression compiled on its first use. Plugins declare many of
+    them, rules never evaluated on an extract do not pay for the compilation.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.__dict__["pattern"] = pattern
+        self.__dict__["_flags"] = flags
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in ("pattern", "_flags"):
+            raise AttributeError(name)
+        compiled = regex.compile(self.pattern, self._flags)
+        # Next lookups find the compiled regex attributes on the instance
+        for attr in dir(compiled):
+            if not attr.startswith("_"):
+                self.__dict__[attr] = getattr(compiled, attr)
+        return getattr(compiled, name)
+
+
 def tag(tags, key_name):
     if tags is not None and key_name is not None:
         if key_name.__class__ in (str, str_value_):
@@ -509,10 +557,21 @@ def JOSM_search(string):
 #    translate from English to the current language (only for strings in the JOSM user interface) [since 6506]
 def tr(string, *args):
     if string is not None:
-        # Treat '' as ' so JOSM translations work in Osmose too.
-        # A ' is a special character in JOSM, see https://josm.openstreetmap.de/wiki/Translations
-        t = T_(string, *args)
-        return {k: t[k].replace("''", "'") for k in t.keys()}
+        if not args:
+            if string not in _tr_cache:
+                _tr_cache[string] = _tr(string)
+            return dict(_tr_cache[string])
+        return _tr(string, *args)
+
+
+_tr_cache = {}
+
+
+def _tr(string, *args):
+    # Treat '' as ' so JOSM translations work in Osmose too.
+    # A ' is a special character in JOSM, see https://josm.openstreetmap.de/wiki/Translations
+    t = T_(string, *args)
+    return {k: v.replace("''", "'") for k, v in t.items()}
 
 
 # regexp_test(regexp, string)
@@ -631,16 +690,52 @@ def setting(options, key):
 #    returns a cardinal direction in radians [since 8260]
 
 
+# Coordinates of the way nodes, from the reader node locations index
+def _way_coords(data):
+    coords = getattr(data.get("nd"), "coords", None)
+    if not coords or None in coords:
+        return None
+    return coords
+
+
+earth_radius = 6378137
+
+
 # waylength()
 #    returns the length of the way in metres [since 8253]
-def waylength():
-    raise NotImplementedError
+#    Without the node locations, the rule is aborted
+def waylength(data):
+    coords = _way_coords(data)
+    if coords is None:
+        raise RuleAbort()
+    length = 0
+    for (lon1, lat1), (lon2, lat2) in zip(coords, coords[1:]):
+        # Haversine
+        lat1, lat2 = math.radians(lat1), math.radians(lat2)
+        a = (
+            math.sin((lat2 - lat1) / 2) ** 2
+            + math.cos(lat1)
+            * math.cos(lat2)
+            * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+        )
+        length += 2 * earth_radius * math.asin(math.sqrt(min(1, a)))
+    return str_value(length)
 
 
 # areasize()
 #    returns the area of a closed way in square meters [since 8253]
-def areasize():
-    raise NotImplementedError
+#    Without the node locations, the rule is aborted
+def areasize(data):
+    coords = _way_coords(data)
+    if coords is None:
+        raise RuleAbort()
+    # Area on the sphere
+    area = 0
+    for (lon1, lat1), (lon2, lat2) in zip(coords, coords[1:]):
+        area += math.radians(lon2 - lon1) * (
+            2 + math.sin(math.radians(lat1)) + math.sin(math.radians(lat2))
+        )
+    return str_value(abs(area * earth_radius**2 / 2))
 
 
 # at(lat,lon)
@@ -746,3 +841,47 @@ def no_language(options, locales):
         and all(map(lambda c: not language.startswith(c), locales.split(",")))
         or False
     )
+
+
+###########################################################################
+import unittest
+
+
+class Test(unittest.TestCase):
+    def tearDown(self):
+        cache_resize(100000)
+
+    def test_cache(self):
+        cache_resize(2)
+        self.assertEqual(str_value("a"), "a")
+        self.assertEqual(str_value("a"), "a")
+        str_value("b")
+        str_value("c")
+        self.assertEqual(
+            cache_stats()["str_value"],
+            {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2},
+        )
+        self.assertTrue(regexp_test(re.compile("b"), "abc"))
+        self.assertEqual(cache_stats()["_re_search"]["misses"], 1)
+
+    def test_lazy_regex(self):
+        r = lazy_regex(r"^(foo|bar)$", regex.I)
+        self.assertEqual(r.pattern, r"^(foo|bar)$")
+        self.assertNotIn("search", r.__dict__)
+        self.assertTrue(r.search("FOO"))
+        self.assertIn("search", r.__dict__)
+        self.assertFalse(r.match("baz"))
+        self.assertEqual(r.findall("bar"), ["bar"])
+        self.assertTrue(regexp_test(r, "Bar"))
+
+    def test_geometry(self):
+        class WayNodes(list):
+            coords = [(0, 0), (0.001, 0), (0.001, 0.001), (0, 0.001), (0, 0)]
+
+        data = {"nd": WayNodes([1, 2, 3, 4, 1])}
+        self.assertAlmostEqual(waylength(data).to_n(), 445.28, places=2)
+        self.assertAlmostEqual(areasize(data).to_n(), 12392.03, places=2)
+        with self.assertRaises(RuleAbort):
+            waylength({"nd": [1, 2]})
+        with self.assertRaises(RuleAbort):
+            areasize({"member": []})
@@ -20,10 +20,61 @@
 ###########################################################################
 
 import bz2
+import io
+import queue
+import threading
 
 from .IssuesFile_PolygonFilter import PolygonFilter
 
 
+class BZ2ThreadWriter(io.RawIOBase):
+    """
+    Binary file compressed with bz2 in a background thread, compression does
+    not hold the GIL, so it runs along with the analyser. Output is the same
+    as bz2.open().
+    """
+
+    def __init__(self, filename, compresslevel=9):
+        self.file = open(filename, "wb")
+        self.compressor = bz2.BZ2Compressor(compresslevel)
+        self.queue = queue.Queue(maxsize=16)
+        self.error = None
+        self.thread = threading.Thread(target=self._compress, daemon=True)
+        self.thread.start()
+
+    def _compress(self):
+        try:
+            while True:
+                data = self.queue.get()
+                if data is None:
+                    self.file.write(self.compressor.flush())
+                    break
+                self.file.write(self.compressor.compress(data))
+        except Exception as e:
+            self.error = e
+            # Unblock the writer
+            while self.queue.get() is not None:
+                pass
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.error:
+            raise self.error
+        self.queue.put(bytes(b))
+        return len(b)
+
+    def close(self):
+        if not self.closed:
+            self.queue.put(None)
+            self.thread.join()
+            self.file.close()
+            super().close()
+            if self.error:
+                raise self.error
+
+
 class IssuesFile:
 
     def __init__(self, dst, version=None, polygon_id=None):
@@ -40,7 +91,9 @@ class IssuesFile:
     def begin(self):
         if isinstance(self.dst, str):
             if self.dst.endswith(".bz2"):
-                self.output = bz2.open(self.dst, "wt")
+                self.output = io.TextIOWrapper(
+                    io.BufferedWriter(BZ2ThreadWriter(self.dst), 1024 * 1024)
+                )
             else:
                 self.output = open(self.dst, "w")
         else:
@@ -166,3 +219,22 @@ class Test(unittest.TestCase):
             [[{"t": "v"}], [{"t": "v"}]], [[{"~": {"t": "v"}}], [{"~": {"t": "v"}}]]
         )
         self.check([[None, {"t": "v"}]], [[None, {"~": {"t": "v"}}]])
+
+    def test_bz2(self):
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dst = os.path.join(tmp, "issues.xml.bz2")
+            a = IssuesFile(dst)
+            output = a.begin()
+            for i in range(100000):
+                output.write("<error id={0} />\n".format(i))
+            a.end()
+            with bz2.open(dst, "rt") as f:
+                self.assertEqual(
+                    f.read(),
+                    "".join(
+                        map(lambda i: "<error id={0} />\n".format(i), range(100000))
+                    ),
+                )
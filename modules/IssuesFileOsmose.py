@@ -19,28 +19,75 @@
 #                                                                       ##
 ###########################################################################
 
-from . import OsmSax
+import re
+from xml.sax.saxutils import quoteattr
+
 from .IssuesFile import IssuesFile
 
+# Characters changed by quoteattr()
+_escaped_chars = re.compile('[&<>"\n\r\t]')
+
+
+def _attr(value):
+    """
+    Same as quoteattr(), without the replacements when none are needed
+    """
+    if _escaped_chars.search(value):
+        return quoteattr(value)
+    else:
+        return '"' + value + '"'
+
+
+def _attrs(attrs):
+    return "".join(map(lambda kv: " " + kv[0] + "=" + _attr(kv[1]), attrs.items()))
+
+
+def _osm_attrs(data):
+    # Attributes of OSM objects, as OsmSax._formatData()
+    attrs = []
+    for k, v in data.items():
+        if k in ("tag", "nd", "member"):
+            continue
+        elif k == "visible":
+            v = str(v).lower()
+        elif k in ("id", "lat", "lon", "changeset", "version", "uid"):
+            v = str(v)
+        attrs.append(" " + k + "=" + _attr(v))
+    return "".join(attrs)
+
 
 class IssuesFileOsmose(IssuesFile):
+    """
+    Write issues as Osmose XML. Elements are formatted from strings, with the
+    same output as OsmSax.OsmSaxWriter, and written by large chunks.
+    """
+
+    # Number of elements kept in memory before writing
+    buffer_size = 4096
 
     def begin(self):
-        output = super().begin()
-        self.outxml = OsmSax.OsmSaxWriter(output, "UTF-8")
-        self.outxml.startDocument()
-        self.outxml.startElement("analysers", {})
+        super().begin()
+        self.buffer = []
+        self.write = self.buffer.append
+        self.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.write("<analysers>\n")
+        self.text_templates = {}
         self.geom_type_renderer = {
-            "node": self.outxml.NodeCreate,
-            "way": self.outxml.WayCreate,
-            "relation": self.outxml.RelationCreate,
+            "node": self.node,
+            "way": self.way,
+            "relation": self.relation,
             "position": self.position,
         }
 
+    def flush(self):
+        self.output.write("".join(self.buffer))
+        self.buffer.clear()
+
     def end(self):
-        self.outxml.endElement("analysers")
-        self.outxml.endDocument()
-        del self.outxml
+        self.write("</analysers>\n")
+        self.flush()
+        del self.buffer
+        del self.write
         super().end()
 
     def analyser(self, timestamp, analyser_version, change=False):
@@ -50,10 +97,10 @@ class IssuesFileOsmose(IssuesFile):
         attrs["analyser_version"] = str(analyser_version)
         if self.version is not None:
             attrs["version"] = self.version
-        self.outxml.startElement(self.mode, attrs)
+        self.write("<" + self.mode + _attrs(attrs) + ">\n")
 
     def analyser_end(self):
-        self.outxml.endElement(self.mode)
+        self.write("</" + self.mode + ">\n")
 
     def classs(
         self,
@@ -81,7 +128,7 @@ class IssuesFileOsmose(IssuesFile):
             options["level"] = str(level)
         if tags:
             options["tag"] = ",".join(tags)
-        self.outxml.startElement("class", options)
+        self.write("<class" + _attrs(options) + ">\n")
         for key, value in [
             ("classtext", title),
             ("detail", detail),
@@ -91,8 +138,13 @@ class IssuesFileOsmose(IssuesFile):
         ]:
             if value:
                 for lang in sorted(value.keys()):
-                    self.outxml.Element(key, {"lang": lang, "title": value[lang]})
-        self.outxml.endElement("class")
+                    self.write(
+                        "<"
+                        + key
+                        + _attrs({"lang": lang, "title": value[lang]})
+                        + " />\n"
+                    )
+        self.write("</class>\n")
 
     def error(
         self, classs, subclass, text, ids, types, fix, geom, allow_override=False
@@ -100,59 +152,173 @@ class IssuesFileOsmose(IssuesFile):
         if self.filter and not self.filter.apply(classs, subclass, geom):
             return
 
+        write = self.write
         if subclass is not None:
-            self.outxml.startElement(
-                "error", {"class": str(classs), "subclass": str(subclass)}
+            write(
+                "<error class="
+                + _attr(str(classs))
+                + " subclass="
+                + _attr(str(subclass))
+                + ">\n"
             )
         else:
-            self.outxml.startElement("error", {"class": str(classs)})
+            write("<error class=" + _attr(str(classs)) + ">\n")
         for type in geom:
             for g in geom[type]:
                 self.geom_type_renderer[type](g)
         if text:
             for lang in text:
-                self.outxml.Element("text", {"lang": lang, "value": text[lang]})
+                template = self.text_templates.get(lang)
+                if template is None:
+                    template = self.text_templates[lang] = (
+                        "<text lang=" + _attr(lang) + " value="
+                    )
+                write(template + _attr(text[lang]) + " />\n")
         if fix:
             fix = self.fixdiff(fix)
             if not allow_override:
                 fix = self.filterfix(ids, types, fix, geom)
             self.dumpxmlfix(ids, types, fix)
-        self.outxml.endElement("error")
+        write("</error>\n")
+
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def tags(self, tags):
+        for k, v in tags.items():
+            self.write("<tag k=" + _attr(k) + " v=" + _attr(v) + " />\n")
+
+    def node(self, data):
+        if not data:
+            return
+        if data["tag"]:
+            self.write("<node" + _osm_attrs(data) + ">\n")
+            self.tags(data["tag"])
+            self.write("</node>\n")
+        else:
+            self.write("<node" + _osm_attrs(data) + " />\n")
+
+    def way(self, data):
+        if not data:
+            return
+        self.write("<way" + _osm_attrs(data) + ">\n")
+        self.tags(data["tag"])
+        for n in data["nd"]:
+            self.write("<nd ref=" + _attr(str(n)) + " />\n")
+        self.write("</way>\n")
+
+    def relation(self, data):
+        if not data:
+            return
+        self.write("<relation" + _osm_attrs(data) + ">\n")
+        self.tags(data["tag"])
+        for m in data["member"]:
+            m["ref"] = str(m["ref"])
+            self.write("<member" + _attrs(m) + " />\n")
+        self.write("</relation>\n")
 
     def position(self, args):
-        self.outxml.Element(
-            "location", {"lat": str(args["lat"]), "lon": str(args["lon"])}
+        self.write(
+            "<location lat="
+            + _attr(str(args["lat"]))
+            + " lon="
+            + _attr(str(args["lon"]))
+            + " />\n"
         )
 
     def delete(self, t, id):
-        self.outxml.Element("delete", {"type": t, "id": str(id)})
+        self.write("<delete" + _attrs({"type": t, "id": str(id)}) + " />\n")
+
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
 
     def dumpxmlfix(self, ids, types, fixes):
-        self.outxml.startElement("fixes", {})
+        write = self.write
+        write("<fixes>\n")
         for fix in fixes:
-            self.outxml.startElement("fix", {})
+            write("<fix>\n")
             i = 0
             for f in fix:
                 if f is not None and i < len(types):
                     type = types[i]
                     if type:
-                        self.outxml.startElement(type, {"id": str(ids[i])})
+                        write("<" + type + " id=" + _attr(str(ids[i])) + ">\n")
                         for opp, tags in f.items():
                             for k in tags:
                                 if opp in "~+":
-                                    self.outxml.Element(
-                                        "tag",
-                                        {
-                                            "action": self.FixTable[opp],
-                                            "k": k,
-                                            "v": tags[k],
-                                        },
+                                    write(
+                                        "<tag action="
+                                        + _attr(self.FixTable[opp])
+                                        + " k="
+                                        + _attr(k)
+                                        + " v="
+                                        + _attr(tags[k])
+                                        + " />\n"
                                     )
                                 else:
-                                    self.outxml.Element(
-                                        "tag", {"action": self.FixTable[opp], "k": k}
+                                    write(
+                                        "<tag action="
+                                        + _attr(self.FixTable[opp])
+                                        + " k="
+                                        + _attr(k)
+                                        + " />\n"
                                     )
-                        self.outxml.endElement(type)
+                        write("</" + type + ">\n")
                 i += 1
-            self.outxml.endElement("fix")
-        self.outxml.endElement("fixes")
+            write("</fix>\n")
+        write("</fixes>\n")
+
+
+###########################################################################
+import unittest
+
+
+class Test(unittest.TestCase):
+    def test(self):
+        import datetime
+        from io import StringIO
+
+        out = StringIO()
+        a = IssuesFileOsmose(out)
+        a.begin()
+        a.analyser(datetime.datetime(2020, 1, 1), 1)
+        a.error(
+            1,
+            2,
+            {"en": 'a "b" & <c>', "fr": "a 'b'"},
+            [3],
+            ["node"],
+            {"name": "x\ny"},
+            {
+                "node": [{"id": 3, "lat": 1.5, "lon": 2, "tag": {"name": "N"}}],
+                "position": [{"lat": 1.5, "lon": 2}],
+            },
+        )
+        a.delete("way", 4)
+        a.analyser_end()
+        a.end()
+        self.assertEqual(
+            out.getvalue(),
+            """<?xml version="1.0" encoding="UTF-8"?>
+<analysers>
+<analyser timestamp="2020-01-01T00:00:00Z" analyser_version="1">
+<error class="1" subclass="2">
+<node id="3" lat="1.5" lon="2">
+<tag k="name" v="N" />
+</node>
+<location lat="1.5" lon="2" />
+<text lang="en" value='a "b" &amp; &lt;c&gt;' />
+<text lang="fr" value="a 'b'" />
+<fixes>
+<fix>
+<node id="3">
+<tag action="modify" k="name" v="x&#10;y" />
+</node>
+</fix>
+</fixes>
+</error>
+<delete type="way" id="4" />
+</analyser>
+</analysers>
+""",
+        )
@@ -36,9 +36,9 @@ class PolygonFilter(IssuesFilter):
         if "position" not in geom:
             return False
         else:
-            inside = False
             for position in geom["position"]:
                 lat = float(position["lat"])
                 lon = float(position["lon"])
-                inside |= self.pip.point_inside_polygon(lon, lat)
-            return inside
+                if self.pip.point_inside_polygon(lon, lat):
+                    return True
+            return False
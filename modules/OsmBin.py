@@ -43,13 +43,25 @@
 # import OsmBin
 # bin = OsmBin("/data/osmbin", "r")
 # print bin.NodeGet(12)
+# print bin.NodesGet([12, 13])
 # print bin.WayGet(12)
 # print bin.RelationGet(12)
 # print bin.RelationFullRecur(12)
 
+###########################################################################
+# RELATION STORE MIGRATION                                              ##
+###########################################################################
+# Relations used to be stored as one repr() text file each, in a
+# relation/ tree. To convert an existing folder to the relation store:
+# ./OsmBin.py --migrate-relations /data/osmbin
+
+import mmap
 import os
+import struct
 import sys
 
+import numpy
+
 from modules.lockfile import lockfile
 
 from . import OsmReader
@@ -155,6 +167,27 @@ def _CoordToBytes4(coord):
     return _IntToBytes4(int((coord * 10000000) + 1800000000))
 
 
+# Relation record: capacity, relation id (0 when free), payload size
+_RelationHead = struct.Struct(">IQI")
+# Relation member: type, ref, role string index
+_RelationMember = struct.Struct(">BQI")
+_RelationMemberTypes = ["node", "way", "relation"]
+_RelationMemberTypesIndex = {"node": 0, "way": 1, "relation": 2}
+
+
+def _Coords4ToArray(coords):
+    # Vectorised _Bytes4ToCoord, raw 0 (no node) as NaN
+    coords = coords.astype(numpy.int64)
+    return numpy.where(coords == 0, numpy.nan, (coords - 1800000000) / 10000000)
+
+
+def _ArrayToCoords4(coords):
+    # Vectorised _CoordToBytes4, NaN (deleted node) as raw 0
+    missing = numpy.isnan(coords)
+    coords = numpy.where(missing, 0, coords * 10000000 + 1800000000)
+    return coords.astype(numpy.int64).astype(">u4")
+
+
 ###########################################################################
 # InitFolder
 
@@ -197,6 +230,46 @@ def InitFolder(folder):
     print("Creating way.free")
     open(os.path.join(folder, "way.free"), "wb")
 
+    InitRelations(folder)
+
+
+def InitRelations(folder):
+
+    # create relation.idx
+    print("Creating relation.idx")
+    open(os.path.join(folder, "relation.idx"), "wb")
+
+    # reset relation.data
+    print("Creating relation.data")
+    open(os.path.join(folder, "relation.data"), "wb").write(
+        b"--"
+    )  # for no data at location 0
+
+    # reset relation.free
+    print("Creating relation.free")
+    open(os.path.join(folder, "relation.free"), "wb")
+
+    # reset relation.str
+    print("Creating relation.str")
+    open(os.path.join(folder, "relation.str"), "wb")
+
+
+def MigrateRelations(folder):
+    # Load the relations from the former relation/ tree of repr() files
+    reldir = os.path.join(folder, "relation")
+    InitRelations(folder)
+    o = OsmBin(folder, "w")
+    nb = 0
+    for i in sorted(os.listdir(reldir)):
+        for j in sorted(os.listdir(reldir + "/" + i)):
+            for k in sorted(os.listdir(reldir + "/" + i + "/" + j)):
+                o.RelationCreate(
+                    eval(open(reldir + "/" + i + "/" + j + "/" + k).read())
+                )
+                nb += 1
+    del o
+    print("Migrated %d relations, %s can be removed" % (nb, reldir))
+
 
 ###########################################################################
 # OsmBinWriter
@@ -208,6 +281,12 @@ class OsmBin:
         self._mode = mode
         self._folder = folder
         self._reldir = os.path.join(folder, "relation")
+        if not os.path.exists(os.path.join(folder, "relation.idx")) and os.path.isdir(
+            self._reldir
+        ):
+            raise MissingDataError(
+                "relation store, run --migrate-relations on %s" % folder
+            )
         self._fNode_crd = open(
             os.path.join(folder, "node.crd"), {"w": "rb+", "r": "rb"}[mode]
         )
@@ -218,6 +297,26 @@ class OsmBin:
             os.path.join(folder, "way.data"), {"w": "rb+", "r": "rb"}[mode]
         )
         self._fWay_data_size = os.stat(os.path.join(folder, "way.data")).st_size
+        self._fRelation_idx = open(
+            os.path.join(folder, "relation.idx"), {"w": "rb+", "r": "rb"}[mode]
+        )
+        self._fRelation_data = open(
+            os.path.join(folder, "relation.data"), {"w": "rb+", "r": "rb"}[mode]
+        )
+        self._fRelation_data_size = os.stat(
+            os.path.join(folder, "relation.data")
+        ).st_size
+        self._fRelation_str = open(
+            os.path.join(folder, "relation.str"), {"w": "ab+", "r": "rb"}[mode]
+        )
+        self._relation_str = []
+        self._relation_str_index = {}
+        self._relation_str_size = 0
+        self._RelationReadStr()
+        self._node_mmap = None
+        self._node_crd = None
+        self._node_pending = {}
+        self._NodeMap()
         if self._mode == "w":
             lock_file = os.path.join(folder, "lock")
             self._lock = lockfile(lock_file)
@@ -227,9 +326,14 @@ class OsmBin:
 
     def __del__(self):
         try:
+            self._NodeFlush()
+            self._NodeUnmap()
             self._fNode_crd.close()
             self._fWay_idx.close()
             self._fWay_data.close()
+            self._fRelation_idx.close()
+            self._fRelation_data.close()
+            self._fRelation_str.close()
         except AttributeError:
             pass
         if self._mode == "w":
@@ -248,6 +352,15 @@ class OsmBin:
             line = line.strip().split(";")
             self._free[int(line[1])].append(int(line[0]))
 
+        self._relation_free = {}
+        f = open(os.path.join(self._folder, "relation.free"))
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            line = line.strip().split(";")
+            self._relation_free.setdefault(int(line[1]), []).append(int(line[0]))
+
     def _WriteFree(self):
         try:
             self._free
@@ -258,41 +371,108 @@ class OsmBin:
             for ptr in self._free[nbn]:
                 f.write("%d;%d\n" % (ptr, nbn))
         f.close()
+        f = open(os.path.join(self._folder, "relation.free"), "w")
+        for capacity in self._relation_free:
+            for ptr in self._relation_free[capacity]:
+                f.write("%d;%d\n" % (ptr, capacity))
+        f.close()
 
     def begin(self):
         pass
 
     def end(self):
-        pass
+        self._NodeFlush()
 
     #######################################################################
     # node functions
 
+    # node.crd is mapped in memory, as an array of big-endian (lat, lon)
+    # pairs indexed by node id. Writes are buffered and encoded in batch.
+    _node_pending_max = 2**16
+
+    def _NodeMap(self, size=None):
+        self._NodeUnmap()
+        if size is None:
+            size = os.fstat(self._fNode_crd.fileno()).st_size
+        elif size > os.fstat(self._fNode_crd.fileno()).st_size:
+            os.ftruncate(self._fNode_crd.fileno(), size)
+        if size < 8:
+            return
+        self._node_mmap = mmap.mmap(
+            self._fNode_crd.fileno(),
+            size - size % 8,
+            access=mmap.ACCESS_WRITE if self._mode == "w" else mmap.ACCESS_READ,
+        )
+        self._node_crd = numpy.frombuffer(self._node_mmap, dtype=">u4").reshape((-1, 2))
+
+    def _NodeUnmap(self):
+        # Release the array view before closing the map
+        self._node_crd = None
+        if self._node_mmap is not None:
+            self._node_mmap.close()
+            self._node_mmap = None
+
+    def _NodeMapped(self, NodeId):
+        # The file may have grown since mapped, by another writer
+        mapped = len(self._node_crd) if self._node_crd is not None else 0
+        if NodeId >= mapped:
+            if os.fstat(self._fNode_crd.fileno()).st_size // 8 > mapped:
+                self._NodeMap()
+        return self._node_crd is not None and NodeId < len(self._node_crd)
+
+    def _NodeFlush(self):
+        if not self._node_pending:
+            return
+        ids = numpy.fromiter(
+            self._node_pending.keys(), dtype=numpy.int64, count=len(self._node_pending)
+        )
+        coords = numpy.array(list(self._node_pending.values()), dtype=numpy.float64)
+        self._node_pending = {}
+        if self._node_crd is None or ids.max() >= len(self._node_crd):
+            self._NodeMap(8 * (int(ids.max()) + 1))
+        self._node_crd[ids] = _ArrayToCoords4(coords)
+
     def NodeGet(self, NodeId):
+        self._NodeFlush()
+        if NodeId < 0 or not self._NodeMapped(NodeId):
+            return None
+        lat, lon = struct.unpack_from(">II", self._node_mmap, 8 * NodeId)
         data = {}
         data["id"] = NodeId
-        self._fNode_crd.seek(8 * data["id"])
-        read = self._fNode_crd.read(8)
-        if len(read) != 8:
-            return None
-        data["lat"] = _Bytes4ToCoord(read[:4])
-        data["lon"] = _Bytes4ToCoord(read[4:])
+        data["lat"] = float(lat - 1800000000) / 10000000
+        data["lon"] = float(lon - 1800000000) / 10000000
         data["tag"] = {}
         return data
 
+    def NodesGet(self, NodeIds):
+        """
+        Return the (lat, lon) numpy arrays of the nodes NodeIds, NaN for
+        missing nodes.
+        """
+        self._NodeFlush()
+        ids = numpy.asarray(NodeIds, dtype=numpy.int64)
+        lat = numpy.full(ids.shape, numpy.nan)
+        lon = numpy.full(ids.shape, numpy.nan)
+        if len(ids) > 0:
+            self._NodeMapped(int(ids.max()))
+        if self._node_crd is not None:
+            found = (ids >= 0) & (ids < len(self._node_crd))
+            coords = self._node_crd[ids[found]]
+            lat[found] = _Coords4ToArray(coords[:, 0])
+            lon[found] = _Coords4ToArray(coords[:, 1])
+        return lat, lon
+
     def NodeCreate(self, data):
-        LatBytes4 = _CoordToBytes4(data["lat"])
-        LonBytes4 = _CoordToBytes4(data["lon"])
-        self._fNode_crd.seek(8 * data["id"])
-        self._fNode_crd.write(LatBytes4 + LonBytes4)
+        self._node_pending[data["id"]] = (data["lat"], data["lon"])
+        if len(self._node_pending) >= self._node_pending_max:
+            self._NodeFlush()
 
     NodeUpdate = NodeCreate
 
     def NodeDelete(self, data):
-        LatBytes4 = _IntToBytes4(0)
-        LonBytes4 = _IntToBytes4(0)
-        self._fNode_crd.seek(8 * data["id"])
-        self._fNode_crd.write(LatBytes4 + LonBytes4)
+        self._node_pending[data["id"]] = (numpy.nan, numpy.nan)
+        if len(self._node_pending) >= self._node_pending_max:
+            self._NodeFlush()
 
     #######################################################################
     # way functions
@@ -357,33 +537,187 @@ class OsmBin:
     #######################################################################
     # relation functions
 
+    # relation.idx holds the address of each relation record in
+    # relation.data, as way.idx does. A record is a head, the attributes,
+    # the packed members array and the tags. Roles, tag keys and attribute
+    # names are interned in relation.str.
+
+    def _RelationReadStr(self):
+        # Read the strings appended since the last call
+        self._fRelation_str.seek(self._relation_str_size)
+        data = self._fRelation_str.read()
+        pos = 0
+        while pos + 4 <= len(data):
+            size = _Bytes4ToInt(data[pos : pos + 4])
+            if pos + 4 + size > len(data):
+                break
+            string = data[pos + 4 : pos + 4 + size].decode("utf-8")
+            self._relation_str_index[string] = len(self._relation_str)
+            self._relation_str.append(string)
+            pos += 4 + size
+        self._relation_str_size += pos
+
+    def _RelationStrGet(self, index):
+        if index >= len(self._relation_str):
+            self._RelationReadStr()
+        return self._relation_str[index]
+
+    def _RelationStrIndex(self, string):
+        index = self._relation_str_index.get(string)
+        if index is None:
+            data = string.encode("utf-8")
+            self._fRelation_str.write(_IntToBytes4(len(data)) + data)
+            self._fRelation_str.flush()
+            self._relation_str_size += 4 + len(data)
+            index = self._relation_str_index[string] = len(self._relation_str)
+            self._relation_str.append(string)
+        return index
+
+    def _RelationPack(self, data):
+        attrs = [(k, v) for k, v in data.items() if k not in ("id", "tag", "member")]
+        c = [_IntToBytes4(len(attrs))]
+        for k, v in attrs:
+            c.append(_IntToBytes4(self._RelationStrIndex(k)))
+            if v is None:
+                c.append(b"N")
+            elif isinstance(v, bool):
+                c.append(b"B" + _IntToBytes1(v))
+            elif isinstance(v, int):
+                c.append(b"I" + struct.pack(">q", v))
+            elif isinstance(v, float):
+                c.append(b"F" + struct.pack(">d", v))
+            else:
+                v = str(v).encode("utf-8")
+                c.append(b"S" + _IntToBytes4(len(v)) + v)
+        c.append(_IntToBytes4(len(data["member"])))
+        for m in data["member"]:
+            c.append(
+                _RelationMember.pack(
+                    _RelationMemberTypesIndex[m["type"]],
+                    m["ref"],
+                    self._RelationStrIndex(m["role"]),
+                )
+            )
+        c.append(_IntToBytes4(len(data["tag"])))
+        for k, v in data["tag"].items():
+            v = v.encode("utf-8")
+            c.append(_IntToBytes4(self._RelationStrIndex(k)) + _IntToBytes4(len(v)) + v)
+        return b"".join(c)
+
+    def _RelationUnpack(self, RelationId, payload):
+        data = {"id": RelationId}
+        (nb,) = struct.unpack_from(">I", payload, 0)
+        pos = 4
+        for _i in range(nb):
+            k, t = struct.unpack_from(">Ic", payload, pos)
+            k = self._RelationStrGet(k)
+            pos += 5
+            if t == b"N":
+                data[k] = None
+            elif t == b"B":
+                data[k] = bool(payload[pos])
+                pos += 1
+            elif t == b"I":
+                (data[k],) = struct.unpack_from(">q", payload, pos)
+                pos += 8
+            elif t == b"F":
+                (data[k],) = struct.unpack_from(">d", payload, pos)
+                pos += 8
+            else:
+                (size,) = struct.unpack_from(">I", payload, pos)
+                data[k] = payload[pos + 4 : pos + 4 + size].decode("utf-8")
+                pos += 4 + size
+        (nb,) = struct.unpack_from(">I", payload, pos)
+        pos += 4
+        members = []
+        for t, ref, role in _RelationMember.iter_unpack(
+            payload[pos : pos + _RelationMember.size * nb]
+        ):
+            members.append(
+                {
+                    "type": _RelationMemberTypes[t],
+                    "ref": ref,
+                    "role": self._RelationStrGet(role),
+                }
+            )
+        pos += _RelationMember.size * nb
+        (nb,) = struct.unpack_from(">I", payload, pos)
+        pos += 4
+        tags = {}
+        for _i in range(nb):
+            k, size = struct.unpack_from(">II", payload, pos)
+            tags[self._RelationStrGet(k)] = payload[pos + 8 : pos + 8 + size].decode(
+                "utf-8"
+            )
+            pos += 8 + size
+        data["tag"] = tags
+        data["member"] = members
+        return data
+
+    def _RelationAdr(self, RelationId):
+        self._fRelation_idx.seek(5 * RelationId)
+        return _Bytes5ToInt(self._fRelation_idx.read(5))
+
     def RelationGet(self, RelationId, dump_sub_elements=False):
-        RelationId = "%09d" % RelationId
-        RelFolder = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile = RelationId[6:9]
-        if os.path.exists(RelFolder + RelFile):
-            return eval(open(RelFolder + RelFile).read())
-        else:
+        AdrRelation = self._RelationAdr(RelationId)
+        if not AdrRelation:
             return None
+        self._fRelation_data.seek(AdrRelation)
+        _capacity, _id, size = _RelationHead.unpack(
+            self._fRelation_data.read(_RelationHead.size)
+        )
+        return self._RelationUnpack(RelationId, self._fRelation_data.read(size))
 
     def RelationCreate(self, data):
-        RelationId = "%09d" % data["id"]
-        RelFolder = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile = RelationId[6:9]
-        if not os.path.exists(RelFolder):
-            os.makedirs(RelFolder)
-        open(RelFolder + RelFile, "w").write(repr(data))
+        payload = self._RelationPack(data)
+        AdrRelation = self._RelationAdr(data["id"])
+        if AdrRelation:
+            self._fRelation_data.seek(AdrRelation)
+            capacity = _RelationHead.unpack(
+                self._fRelation_data.read(_RelationHead.size)
+            )[0]
+            if len(payload) <= capacity:
+                # Update in place
+                self._fRelation_data.seek(AdrRelation)
+                self._fRelation_data.write(
+                    _RelationHead.pack(capacity, data["id"], len(payload)) + payload
+                )
+                return
+            self.RelationDelete(data)
+        # Search space big enough to store the relation, by steps of 32 bytes
+        capacity = (len(payload) + 31) // 32 * 32
+        if self._relation_free.get(capacity):
+            AdrRelation = self._relation_free[capacity].pop()
+        else:
+            AdrRelation = self._fRelation_data_size
+            self._fRelation_data_size += _RelationHead.size + capacity
+        # File relation.idx
+        self._fRelation_idx.seek(5 * data["id"])
+        self._fRelation_idx.write(_IntToBytes5(AdrRelation))
+        # File relation.data
+        self._fRelation_data.seek(AdrRelation)
+        self._fRelation_data.write(
+            _RelationHead.pack(capacity, data["id"], len(payload))
+            + payload.ljust(capacity, b"\0")
+        )
 
     RelationUpdate = RelationCreate
 
     def RelationDelete(self, data):
-        RelationId = "%09d" % data["id"]
-        RelFolder = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile = RelationId[6:9]
-        try:
-            os.remove(RelFolder + RelFile)
-        except:
-            pass
+        AdrRelation = self._RelationAdr(data["id"])
+        if not AdrRelation:
+            return
+        # Free space
+        self._fRelation_data.seek(AdrRelation)
+        capacity = _RelationHead.unpack(self._fRelation_data.read(_RelationHead.size))[
+            0
+        ]
+        self._fRelation_data.seek(AdrRelation)
+        self._fRelation_data.write(_RelationHead.pack(capacity, 0, 0))
+        self._relation_free.setdefault(capacity, []).append(AdrRelation)
+        # Save deletion
+        self._fRelation_idx.seek(5 * data["id"])
+        self._fRelation_idx.write(_IntToBytes5(0))
 
     def RelationFullRecur(
         self,
@@ -444,12 +778,19 @@ class OsmBin:
                 output.WayCreate(way)
 
     def CopyRelationTo(self, output):
-        for i in os.listdir(self._reldir):
-            for j in os.listdir(self._reldir + "/" + i):
-                for k in os.listdir(self._reldir + "/" + i + "/" + j):
-                    output.RelationCreate(
-                        eval(open(self._reldir + "/" + i + "/" + j + "/" + k).read())
-                    )
+        # Sequential read of relation.data, in storage order
+        self._fRelation_data.flush()
+        f = open(os.path.join(self._folder, "relation.data"), "rb")
+        f.seek(2)
+        while True:
+            head = f.read(_RelationHead.size)
+            if len(head) < _RelationHead.size:
+                break
+            capacity, RelationId, size = _RelationHead.unpack(head)
+            payload = f.read(capacity)
+            if RelationId:
+                output.RelationCreate(self._RelationUnpack(RelationId, payload[:size]))
+        f.close()
 
     def Import(self, f):
         i = OsmReader.open(f)
@@ -479,6 +820,9 @@ if __name__ == "__main__":
         o = OsmBin(sys.argv[2], "w")
         o.Update(sys.argv[3])
 
+    if sys.argv[1] == "--migrate-relations":
+        MigrateRelations(sys.argv[2])
+
     if sys.argv[1] == "--read":
         i = OsmBin(sys.argv[2])
         if sys.argv[3] == "node":
@@ -606,6 +950,28 @@ class Test(unittest.TestCase):
         self.check_node(self.a.NodeGet, 266053076, False)
         self.check_node(self.a.NodeGet, 2619283353, False)
 
+    def test_nodes(self):
+        ids = [266053077, 2619283352, 1, 266053076, 2619283353, 2**40]
+        lat, lon = self.a.NodesGet(ids)
+        self.assertEqual(list(lat[0:2]), [17.9031745, 17.9005419])
+        self.assertEqual(list(lon[0:2]), [-62.8363074, -62.8327042])
+        assert all(numpy.isnan(lat[2:]))
+        assert all(numpy.isnan(lon[2:]))
+
+        self.a.Update("tests/saint_barthelemy.osc.gz")
+        del self.a
+        self.a = OsmBin(self.test_dir, "r")
+        ids = [78, 1759873129, 79]
+        lat, lon = self.a.NodesGet(ids)
+        for i, id in enumerate(ids):
+            self.check_node(
+                self.a.NodeGet,
+                id,
+                not numpy.isnan(lat[i]),
+                {"lat": lat[i], "lon": lon[i]},
+            )
+        self.assertEqual(len(self.a.NodesGet([])[0]), 0)
+
     def test_way(self):
         self.check_way(self.a.WayGet, 24473155)
         self.check_way(
@@ -680,6 +1046,51 @@ class Test(unittest.TestCase):
         self.check_relation(self.a.RelationGet, 47795, False)
         self.check_relation(self.a.RelationGet, 2707694, False)
 
+    def test_relation_resize(self):
+        rel = self.a.RelationGet(2324452)
+        small = dict(rel, member=rel["member"][0:1], tag={})
+        self.a.RelationUpdate(small)
+        self.check_relation(self.a.RelationGet, 2324452, expected=small)
+        big = dict(rel, member=rel["member"] * 10)
+        self.a.RelationUpdate(big)
+        self.check_relation(self.a.RelationGet, 2324452, expected=big)
+        self.a.RelationDelete(big)
+        self.check_relation(self.a.RelationGet, 2324452, False)
+
+        o1 = MockCountObjects()
+        self.a.CopyRelationTo(o1)
+        self.assertEqual(o1.num_rels, 15)
+
+    def test_migrate_relations(self):
+        import shutil
+
+        class Relations(list):
+            def RelationCreate(self, data):
+                self.append(data)
+
+        rels = Relations()
+        self.a.CopyRelationTo(rels)
+        del self.a
+        for data in rels:
+            RelationId = "%09d" % data["id"]
+            RelFolder = os.path.join(
+                self.test_dir, "relation", RelationId[0:3], RelationId[3:6]
+            )
+            os.makedirs(RelFolder, exist_ok=True)
+            open(os.path.join(RelFolder, RelationId[6:9]), "w").write(repr(data))
+        for f in ("relation.idx", "relation.data", "relation.free", "relation.str"):
+            os.remove(os.path.join(self.test_dir, f))
+
+        with self.assertRaises(MissingDataError):
+            OsmBin(self.test_dir, "r")
+
+        MigrateRelations(self.test_dir)
+        shutil.rmtree(os.path.join(self.test_dir, "relation"))
+        self.a = OsmBin(self.test_dir, "r")
+        self.assertEqual(len(rels), 16)
+        for data in rels:
+            self.assertEqual(self.a.RelationGet(data["id"]), data)
+
     def test_relation_full(self):
         res = self.a.RelationFullRecur(529891)
         assert res
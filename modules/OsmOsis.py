@@ -19,6 +19,7 @@
 #                                                                       ##
 ###########################################################################
 
+import os
 import time
 
 import psycopg2
@@ -80,6 +81,21 @@ class OsmOsis:
         r1 = self._PgCurs.fetchone()
         if not r1:
             return None
+        return self._node(r1)
+
+    def NodesGet(self, NodeIds):
+        """
+        Fetch many nodes at once, as a dict by id. Missing nodes are not in
+        the result.
+        """
+        self._PgCurs.execute(
+            "SELECT nodes.id, st_y(nodes.geom), st_x(nodes.geom), nodes.version, users.name, nodes.tags FROM nodes LEFT JOIN users ON nodes.user_id = users.id WHERE nodes.id = ANY(%s);",
+            (list(NodeIds),),
+        )
+        return {r1[0]: self._node(r1) for r1 in self._PgCurs.fetchall()}
+
+    @staticmethod
+    def _node(r1):
         return {
             "id": r1[0],
             "lat": float(r1[1]),
@@ -97,6 +113,20 @@ class OsmOsis:
         r1 = self._PgCurs.fetchone()
         if not r1:
             return None
+        return self._way(r1, dump_sub_elements)
+
+    def WaysGet(self, WayIds):
+        """
+        Fetch many ways at once, without their nodes, as a dict by id.
+        """
+        self._PgCurs.execute(
+            "SELECT ways.id, ways.version, users.name, ways.tags FROM ways LEFT JOIN users ON ways.user_id = users.id WHERE ways.id = ANY(%s);",
+            (list(WayIds),),
+        )
+        return {r1[0]: self._way(r1, False) for r1 in self._PgCurs.fetchall()}
+
+    @staticmethod
+    def _way(r1, dump_sub_elements):
         return {
             "id": r1[0],
             "version": r1[1],
@@ -113,13 +143,7 @@ class OsmOsis:
         r1 = self._PgCurs.fetchone()
         if not r1:
             return None
-        data = {
-            "id": r1[0],
-            "version": r1[1],
-            "user": r1[2] or "",
-            "tag": r1[3],
-            "member": [],
-        }
+        data = self._relation(r1)
 
         if dump_sub_elements:
             self._PgCurs.execute(
@@ -137,6 +161,63 @@ class OsmOsis:
 
         return data
 
+    def RelationsGet(self, RelationIds):
+        """
+        Fetch many relations at once, without their members, as a dict by id.
+        """
+        self._PgCurs.execute(
+            "SELECT relations.id, relations.version, users.name, relations.tags FROM relations LEFT JOIN users ON relations.user_id = users.id WHERE relations.id = ANY(%s);",
+            (list(RelationIds),),
+        )
+        return {r1[0]: self._relation(r1) for r1 in self._PgCurs.fetchall()}
+
+    @staticmethod
+    def _relation(r1):
+        return {
+            "id": r1[0],
+            "version": r1[1],
+            "user": r1[2] or "",
+            "tag": r1[3],
+            "member": [],
+        }
+
+    def ExistingIds(self, Type, Ids):
+        """
+        Ids among Ids of the objects of Type, "N", "W" or "R", still in the
+        database, as a set.
+        """
+        table = {"N": "nodes", "W": "ways", "R": "relations"}[Type]
+        self._PgCurs.execute(
+            "SELECT id FROM {0} WHERE id = ANY(%s);".format(table), (list(Ids),)
+        )
+        return set(r1[0] for r1 in self._PgCurs.fetchall())
+
+    def TouchedGet(self, since_timestamp=None):
+        """
+        Ids of the objects touched by the last change, or since
+        since_timestamp, with the ways and relations depending on them, as sets
+        by type. Deleted objects are not included.
+        """
+        if since_timestamp:
+            self._PgCurs.execute("SELECT tstamp_action FROM metainfo")
+            (tstamp_action,) = self._PgCurs.fetchone()
+            if tstamp_action != since_timestamp:
+                # Same as the osmosis analysers resume
+                for script in ("ActionFromTimestamp.sql", "CreateTouched.sql"):
+                    with open(
+                        os.path.join(os.path.dirname(__file__), "../osmosis", script)
+                    ) as f:
+                        self._PgCurs.execute(
+                            f.read().replace(":timestamp", str(since_timestamp))
+                        )
+                self._PgConn.commit()
+
+        touched = {"N": set(), "W": set(), "R": set()}
+        self._PgCurs.execute("SELECT data_type, id FROM transitive_touched")
+        for data_type, id in self._PgCurs.fetchall():
+            touched[data_type].add(id)
+        return touched
+
     def UserGet(self, UserId):
         self._PgCurs.execute("SELECT name FROM users WHERE id = %d;" % UserId)
         r1 = self._PgCurs.fetchone()
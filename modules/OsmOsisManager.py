@@ -25,6 +25,7 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
 
 import psycopg2
@@ -55,6 +56,8 @@ class OsmOsisManager:
         logger,
     ):
         self.conf = conf
+        # One connection by thread, analysers may run concurrently
+        self._osmosis = {}
 
         self.db_host = db_host
         self.db_user = db_user
@@ -87,24 +90,26 @@ class OsmOsisManager:
         os.environ["JAVACMD_OPTIONS"] += " -Duser.timezone=GMT"
 
     def __del__(self):
-        if hasattr(self, "_osmosis") and self._osmosis:
-            self._osmosis.close()
+        if hasattr(self, "_osmosis"):
+            for osmosis in self._osmosis.values():
+                osmosis.close()
 
     def osmosis(self, schema_path=True):
-        if not hasattr(self, "_osmosis"):
+        thread = threading.get_ident()
+        if thread not in self._osmosis:
             if schema_path:
-                self._osmosis = OsmOsis(
+                self._osmosis[thread] = OsmOsis(
                     self.db_string, self.conf.db_schema_path or self.db_schema
                 )
             else:
-                self._osmosis = OsmOsis(self.db_string)
+                self._osmosis[thread] = OsmOsis(self.db_string)
 
-        return self._osmosis
+        return self._osmosis[thread]
 
     def osmosis_close(self):
-        if hasattr(self, "_osmosis"):
-            self._osmosis.close()
-            del self._osmosis
+        osmosis = self._osmosis.pop(threading.get_ident(), None)
+        if osmosis:
+            osmosis.close()
 
     def psql_c(self, sql):
         cmd = ["psql"]
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Random access to the objects of an OSM PBF file by id, from a sidecar index
+# of its data blocks built in one pass: offset in the file, object kind and id
+# range of each block. Getting an object decodes one block.
+#
+# Usage, to build the index of a file:
+#   python -m modules.OsmPbfAlea file.osm.pbf
+
+import bisect
+import json
+import os
+from collections import OrderedDict
+
+from .osm_pbf_parser import osm_pbf_parser
+
+# Bump when the index format changes
+version = 1
+
+KINDS = ("node", "way", "relation")
+
+
+def index_path(pbf_file):
+    return pbf_file + ".idx"
+
+
+class OsmPbfIndex:
+    """
+    Data blocks of a PBF file, as (block index, offset, kind, min id, max id)
+    entries, kind being 0 for nodes, 1 for ways and 2 for relations.
+    """
+
+    def __init__(self, pbf_file, entries):
+        self.pbf_file = pbf_file
+        self.entries = entries
+        # Entries of each kind by min id, for the lookups
+        self._by_kind = []
+        for kind in range(len(KINDS)):
+            entries = sorted(
+                filter(lambda e: e[2] == kind, self.entries), key=lambda e: e[3]
+            )
+            self._by_kind.append(
+                (
+                    list(map(lambda e: e[3], entries)),
+                    entries,
+                    # Sorted files have disjoint ranges
+                    all(
+                        map(
+                            lambda i: entries[i - 1][4] < entries[i][3],
+                            range(1, len(entries)),
+                        )
+                    ),
+                )
+            )
+
+    @classmethod
+    def build(cls, pbf_file):
+        return cls(
+            pbf_file,
+            list(map(tuple, osm_pbf_parser.index_osm_pbf(pbf_file))),
+        )
+
+    @classmethod
+    def load(cls, pbf_file, build=True, save=True):
+        """
+        Index of pbf_file from its sidecar file, built when missing or older
+        than the PBF file, and saved when possible. None without index and
+        build.
+        """
+        stat = os.stat(pbf_file)
+        try:
+            with open(index_path(pbf_file), encoding="utf-8") as f:
+                index = json.load(f)
+            if (
+                index.get("version") == version
+                and index.get("size") == stat.st_size
+                and index.get("mtime") == stat.st_mtime_ns
+            ):
+                return cls(pbf_file, list(map(tuple, index["blocks"])))
+        except (OSError, ValueError):
+            pass
+
+        if not build:
+            return None
+        index = cls.build(pbf_file)
+        if save:
+            index.save(stat)
+        return index
+
+    def save(self, stat=None):
+        stat = stat or os.stat(self.pbf_file)
+        try:
+            tmp = index_path(self.pbf_file) + ".{0}.tmp".format(os.getpid())
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": version,
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime_ns,
+                        "blocks": self.entries,
+                    },
+                    f,
+                )
+            os.replace(tmp, index_path(self.pbf_file))
+        except OSError:
+            pass
+
+    def blocks(self):
+        """
+        Data blocks as (block index, offset), in the file order.
+        """
+        return sorted(set(map(lambda e: (e[0], e[1]), self.entries)))
+
+    def find(self, kind, id):
+        """
+        Offsets of the blocks that can contain the object kind id.
+        """
+        mins, entries, disjoint = self._by_kind[kind]
+        i = bisect.bisect_right(mins, id)
+        if disjoint:
+            candidates = entries[i - 1 : i] if i > 0 else []
+        else:
+            candidates = entries[:i]
+        return list(map(lambda e: e[1], filter(lambda e: e[4] >= id, candidates)))
+
+
+class _Block(osm_pbf_parser.Visitor):
+    """
+    Objects of a decoded data block by kind and id. The nodes without tags
+    are only in the locations index.
+    """
+
+    def __init__(self):
+        osm_pbf_parser.Visitor.__init__(self)
+        self.objects_by_id = ({}, {}, {})
+
+    def objects(self, groups):
+        for kind, objects in groups:
+            by_id = self.objects_by_id[kind]
+            for data in objects:
+                by_id[data["id"]] = data
+
+    def get(self, kind, id):
+        data = self.objects_by_id[kind].get(id)
+        if data is None and kind == 0:
+            location = self.location(id)
+            if location:
+                data = {"id": id, "lon": location[0], "lat": location[1], "tag": {}}
+        return data
+
+
+class OsmPbfReader:
+    """
+    Get the objects of a PBF file by id, keeping the last decoded blocks.
+    """
+
+    # Number of decoded blocks kept
+    cache_size = 8
+
+    def __init__(self, pbf_file, index=None):
+        self._pbf_file = pbf_file
+        self._index = index
+        self._blocks = OrderedDict()
+
+    def index(self):
+        if self._index is None:
+            self._index = OsmPbfIndex.load(self._pbf_file)
+        return self._index
+
+    def _block(self, offset):
+        block = self._blocks.get(offset)
+        if block is not None:
+            self._blocks.move_to_end(offset)
+            return block
+
+        block = _Block()
+        block.set_locations(True)
+        osm_pbf_parser.read_osm_pbf_blocks(
+            self._pbf_file, block, [(0, offset)], batch=True
+        )
+        self._blocks[offset] = block
+        if len(self._blocks) > self.cache_size:
+            self._blocks.popitem(last=False)
+        return block
+
+    def _Get(self, kind, id):
+        for offset in self.index().find(kind, id):
+            data = self._block(offset).get(kind, id)
+            if data is not None:
+                return data
+        return None
+
+    def NodeGet(self, NodeId):
+        return self._Get(0, NodeId)
+
+    def WayGet(self, WayId, dump_sub_elements=False):
+        return self._Get(1, WayId)
+
+    def RelationGet(self, RelationId, dump_sub_elements=False):
+        return self._Get(2, RelationId)
+
+    def UserGet(self, UserId):
+        return None
+
+
+if __name__ == "__main__":
+    import sys
+
+    for pbf_file in sys.argv[1:]:
+        index = OsmPbfIndex.build(pbf_file)
+        index.save()
+        print("{0}: {1} blocks".format(index_path(pbf_file), len(index.blocks())))
+
+
+###########################################################################
+import shutil
+import tempfile
+import unittest
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.pbf = os.path.join(self.dirname, "gibraltar.osm.pbf")
+        shutil.copy("tests/gibraltar.osm.pbf", self.pbf)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_index(self):
+        index = OsmPbfIndex.load(self.pbf)
+        self.assertTrue(os.path.exists(index_path(self.pbf)))
+        self.assertEqual(
+            list(map(lambda e: e[2], index.entries)), [0, 1, 2]
+        )  # nodes, ways then relations blocks
+        self.assertEqual(list(map(lambda b: b[0], index.blocks())), [0, 1, 2])
+
+        # Loaded from the sidecar file
+        self.assertEqual(OsmPbfIndex.load(self.pbf, build=False).entries, index.entries)
+
+        # Not used for another file
+        with open(self.pbf, "ab") as f:
+            f.write(b"\0")
+        self.assertIsNone(OsmPbfIndex.load(self.pbf, build=False))
+
+        node = index.entries[0]
+        self.assertEqual(index.find(0, node[3]), [node[1]])
+        self.assertEqual(index.find(0, node[4]), [node[1]])
+        self.assertEqual(index.find(0, node[3] - 1), [])
+        self.assertEqual(index.find(0, node[4] + 1), [])
+        way = index.entries[1]
+        self.assertEqual(index.find(1, way[3]), [way[1]])
+        self.assertEqual(index.find(2, way[3]), [])
+
+    def test_find_unsorted(self):
+        index = OsmPbfIndex(
+            self.pbf, [(0, 10, 0, 1, 100), (1, 20, 0, 50, 60), (2, 30, 1, 1, 10)]
+        )
+        self.assertEqual(index.find(0, 55), [10, 20])
+        self.assertEqual(index.find(0, 70), [10])
+        self.assertEqual(index.find(0, 101), [])
+        self.assertEqual(index.find(1, 5), [30])
+        self.assertEqual(index.find(2, 5), [])
+
+    def test_get(self):
+        from .OsmPbf import OsmPbfReader as OsmPbfReaderAll
+
+        class Objects:
+            def __init__(self):
+                self.objects = ({}, {}, {})
+
+            def NodeCreate(self, data):
+                self.objects[0][data["id"]] = data
+
+            def WayCreate(self, data):
+                self.objects[1][data["id"]] = data
+
+            def RelationCreate(self, data):
+                self.objects[2][data["id"]] = data
+
+        objects = Objects()
+        OsmPbfReaderAll(self.pbf).CopyTo(objects)
+
+        reader = OsmPbfReader(self.pbf)
+        for id, data in list(objects.objects[0].items())[::50]:
+            self.assertEqual(reader.NodeGet(id), data)
+        for id, data in list(objects.objects[1].items())[::100]:
+            self.assertEqual(reader.WayGet(id), data)
+            # Nodes without tags
+            node = reader.NodeGet(data["nd"][0])
+            self.assertEqual(node["id"], data["nd"][0])
+            self.assertAlmostEqual(node["lat"], 36.1, delta=0.2)
+            self.assertAlmostEqual(node["lon"], -5.35, delta=0.2)
+        for id, data in objects.objects[2].items():
+            self.assertEqual(reader.RelationGet(id), data)
+
+        self.assertIsNone(reader.NodeGet(1))
+        self.assertIsNone(reader.WayGet(1))
+        self.assertIsNone(reader.RelationGet(10**12))
+        self.assertLessEqual(len(reader._blocks), OsmPbfReader.cache_size)
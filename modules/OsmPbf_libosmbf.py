@@ -23,7 +23,7 @@ import subprocess
 
 import dateutil.parser
 
-from . import config
+from . import OsmPbfAlea, config
 from .osm_pbf_parser import osm_pbf_parser
 from .OsmReader import OsmReader, dummylog
 from .OsmState import OsmState
@@ -36,6 +36,31 @@ except:
     have_osmium = False
 
 
+class WayNodes(list):
+    """
+    Node ids of a way, with a lazy accessor to their locations from the
+    reader node locations index.
+    """
+
+    __slots__ = ("_reader", "_coords")
+
+    def __init__(self, refs, reader):
+        super().__init__(refs)
+        self._reader = reader
+        self._coords = None
+
+    @property
+    def coords(self):
+        # List of (lon, lat), None for the nodes not in the extract
+        if self._coords is None:
+            self._coords = self._reader.locations(self)
+        return self._coords
+
+    def __reduce__(self):
+        # Pickled as a plain list, the index is not shared
+        return (list, (list(self),))
+
+
 class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
 
     def log(self, txt):
@@ -94,9 +119,55 @@ class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
             except:
                 return
 
-    def CopyTo(self, output):
+    def can_shard(self):
+        return True
+
+    def CopyTo(self, output, shard=0, nb_shards=1, batch=True):
         self._output = output
-        osm_pbf_parser.read_osm_pbf(self._pbf_file, self)
+        self._output_block = getattr(output, "BlockStart", None)
+        self._output_create = (
+            output.NodeCreate,
+            output.WayCreate,
+            output.RelationCreate,
+        )
+        # Index the location of all the nodes, to give ways their coordinates
+        self._locations = getattr(output, "node_locations", False)
+        self.set_locations(self._locations)
+        # Skip the objects without any of the tag keys the output reacts to
+        interest_keys = getattr(output, "interest_keys", None) or {}
+        for kind, t in enumerate(("node", "way", "relation")):
+            self.set_interest_keys(kind, interest_keys.get(t))
+        # With a block index, the shard only reads its blocks. The node
+        # locations index needs the nodes of all of them.
+        if nb_shards > 1 and not self._locations:
+            index = OsmPbfAlea.OsmPbfIndex.load(self._pbf_file, build=False)
+            if index:
+                osm_pbf_parser.read_osm_pbf_blocks(
+                    self._pbf_file,
+                    self,
+                    index.blocks()[shard::nb_shards],
+                    batch=batch,
+                )
+                return
+        # Get the objects of a block at once, with interned strings
+        osm_pbf_parser.read_osm_pbf(
+            self._pbf_file, self, shard=shard, nb_shards=nb_shards, batch=batch
+        )
+
+    def block(self, index):
+        if self._output_block:
+            self._output_block(index)
+
+    def objects(self, groups):
+        for kind, objects in groups:
+            create = self._output_create[kind]
+            if kind == 1 and self._locations:
+                for data in objects:
+                    data["nd"] = WayNodes(data["nd"], self)
+                    create(data)
+            else:
+                for data in objects:
+                    create(data)
 
     def node(self, osmid, lon, lat, tags):
         data = {
@@ -114,7 +185,7 @@ class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
         data = {
             "id": osmid,
             "tag": tags,
-            "nd": refs,
+            "nd": WayNodes(refs, self) if self._locations else refs,
             # 'version'
             # 'timestamp'
             # 'uid'
@@ -134,6 +205,8 @@ class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
 
 
 ###########################################################################
+import os
+import pickle
 import unittest
 
 
@@ -181,6 +254,145 @@ class Test(unittest.TestCase):
             dateutil.parser.parse("2014-01-15T19:05:08Z").replace(tzinfo=None),
         )
 
+    def test_copy_shards(self):
+        num_nodes = num_ways = num_rels = 0
+        for shard in range(3):
+            i1 = OsmPbfReader("tests/gibraltar.osm.pbf")
+            o1 = MockCountObjects()
+            i1.CopyTo(o1, shard, 3)
+            num_nodes += o1.num_nodes
+            num_ways += o1.num_ways
+            num_rels += o1.num_rels
+        self.assertEqual(num_nodes, 850)
+        self.assertEqual(num_ways, 3833)
+        self.assertEqual(num_rels, 55)
+
+    def test_copy_shards_index(self):
+        import shutil
+        import tempfile
+
+        class Blocks(MockCountObjects):
+            def __init__(self):
+                super().__init__()
+                self.blocks = []
+
+            def BlockStart(self, index):
+                self.blocks.append(index)
+
+        with tempfile.TemporaryDirectory() as d:
+            pbf = os.path.join(d, "gibraltar.osm.pbf")
+            shutil.copy("tests/gibraltar.osm.pbf", pbf)
+            OsmPbfAlea.OsmPbfIndex.load(pbf)
+
+            # Each shard only reads its blocks, with the same numbering
+            num_nodes = num_ways = num_rels = 0
+            blocks = []
+            for shard in range(2):
+                o1 = Blocks()
+                OsmPbfReader(pbf).CopyTo(o1, shard, 2)
+                self.assertTrue(all(map(lambda b: b % 2 == shard, o1.blocks)))
+                blocks += o1.blocks
+                num_nodes += o1.num_nodes
+                num_ways += o1.num_ways
+                num_rels += o1.num_rels
+        self.assertEqual(sorted(blocks), [0, 1, 2])
+        self.assertEqual(num_nodes, 850)
+        self.assertEqual(num_ways, 3833)
+        self.assertEqual(num_rels, 55)
+
+    def test_copy_batch(self):
+        class Objects:
+            def __init__(self):
+                self.objects = []
+
+            def NodeCreate(self, data):
+                self.objects.append(("node", data, list(data["tag"].items())))
+
+            def WayCreate(self, data):
+                self.objects.append(("way", data, list(data["tag"].items())))
+
+            def RelationCreate(self, data):
+                self.objects.append(("relation", data, list(data["tag"].items())))
+
+        for pbf in ("tests/saint_barthelemy.osm.pbf", "tests/gibraltar.osm.pbf"):
+            o1 = Objects()
+            OsmPbfReader(pbf).CopyTo(o1, batch=False)
+            o2 = Objects()
+            OsmPbfReader(pbf).CopyTo(o2, batch=True)
+            # Same objects in the same order, with the same tags order
+            self.assertEqual(o1.objects, o2.objects)
+
+        # Strings are shared between objects
+        keys = {}
+        for _, data, _ in o2.objects:
+            for k in data["tag"]:
+                self.assertIs(keys.setdefault(k, k), k)
+
+    def test_interest_keys(self):
+        class Objects:
+            def __init__(self, interest_keys):
+                self.interest_keys = interest_keys
+                self.objects = {"node": [], "way": [], "relation": []}
+
+            def NodeCreate(self, data):
+                self.objects["node"].append(data["id"])
+
+            def WayCreate(self, data):
+                self.objects["way"].append(data["id"])
+
+            def RelationCreate(self, data):
+                self.objects["relation"].append(data["id"])
+
+        interest_keys = {"node": ["amenity"], "way": ["highway", "building"]}
+        all = Objects(None)
+        OsmPbfReader("tests/gibraltar.osm.pbf").CopyTo(all, batch=False)
+        for batch in (False, True):
+            o1 = Objects(interest_keys)
+            OsmPbfReader("tests/gibraltar.osm.pbf").CopyTo(o1, batch=batch)
+            self.assertTrue(o1.objects["node"])
+            self.assertLess(len(o1.objects["node"]), len(all.objects["node"]))
+            self.assertTrue(o1.objects["way"])
+            self.assertLess(len(o1.objects["way"]), len(all.objects["way"]))
+            # Not declared, all of them
+            self.assertEqual(o1.objects["relation"], all.objects["relation"])
+
+        # Same objects as filtered afterwards
+        class Tags(Objects):
+            def NodeCreate(self, data):
+                if "amenity" in data["tag"]:
+                    self.objects["node"].append(data["id"])
+
+        o2 = Tags(None)
+        OsmPbfReader("tests/gibraltar.osm.pbf").CopyTo(o2)
+        self.assertEqual(o1.objects["node"], o2.objects["node"])
+
+    def test_node_locations(self):
+        class Ways(MockCountObjects):
+            node_locations = True
+
+            def __init__(self):
+                super().__init__()
+                self.ways = {}
+
+            def WayCreate(self, data):
+                self.ways[data["id"]] = data["nd"]
+
+        o1 = Ways()
+        i1 = OsmPbfReader("tests/gibraltar.osm.pbf")
+        i1.CopyTo(o1)
+        nds = next(iter(o1.ways.values()))
+        self.assertEqual(len(nds.coords), len(nds))
+        self.assertEqual(nds.coords[0], i1.location(nds[0]))
+        self.assertTrue(all(nds.coords))
+        self.assertIsNone(i1.location(1))
+        self.assertEqual(pickle.loads(pickle.dumps(nds)), list(nds))
+
+        # Each shard indexes the nodes of all the shards
+        for shard in range(3):
+            i2 = OsmPbfReader("tests/gibraltar.osm.pbf")
+            i2.CopyTo(Ways(), shard, 3)
+            self.assertEqual(i2.locations_count(), i1.locations_count())
+
     def test_copy_all_pbf_timestamp(self):
         i1 = OsmPbfReader("tests/gibraltar.osm.pbf")
         o1 = MockCountObjects()
@@ -39,6 +39,12 @@ class OsmReader:
     def set_filter_since_timestamp(self, since_timestamp) -> None:
         pass
 
+    def can_shard(self) -> bool:
+        """
+        True if CopyTo() can be split by data blocks over many processes.
+        """
+        return False
+
     def timestamp(self):
         pass
 
@@ -240,11 +240,17 @@ class OscSaxReader(OsmReader, handler.ContentHandler):
 
     def __init__(self, filename, logger=dummylog(), state_file=None):
         self._filename = filename
+        self._state_file = state_file
         self._logger = logger
 
     def is_change(self):
         return True
 
+    def timestamp(self):
+        # State the change leads to
+        if self._state_file:
+            return OsmState(self._state_file).timestamp()
+
     def _GetFile(self):
         try:
             if self._filename.endswith(".bz2"):
@@ -29,6 +29,8 @@ class OsmoseTranslation:
     def __init__(self):
         self.languages = []
         self.trans = {}
+        # Translations by msgid, in languages order, starting with "en"
+        self.templates = {}
         josm_po_path = "po/josm/"
         transport_mapcss_po_path = "po/transport_mapcss/"
         for fn in os.listdir("po/"):
@@ -48,41 +50,33 @@ class OsmoseTranslation:
         for entry in po:
             if entry.msgstr != "":
                 self.trans[l][entry.msgid] = entry.msgstr
+                if entry.msgid not in self.templates:
+                    self.templates[entry.msgid] = {"en": entry.msgid}
+                self.templates[entry.msgid][l] = entry.msgstr
 
     def translate(self, string, *args, **kwargs):
-        out = {}
+        templates = self.templates.get(string) or {"en": string}
 
         if len(args) == 0 and len(kwargs) == 0:
-            out["en"] = string
-
-            for l in self.languages:
-                if string in self.trans[l] and self.trans[l][string] != "":
-                    if len(args) == 0:
-                        out[l] = self.trans[l][string]
-
-        else:
-            args_basic = []
-            args_translated = []
-            for arg in args:
-                if isinstance(arg, dict):
-                    args_basic.append("{" + str(len(args_translated)) + "}")
-                    args_translated.append(arg)
-                elif isinstance(arg, str):
-                    args_basic.append(arg.replace("{", "{{").replace("}", "}}"))
-                else:
-                    args_basic.append(arg)
-
-            out["en"] = string.format(*args_basic, **kwargs)
-            if args_translated:
-                out["en"] = out["en"].format(*map(lambda a: a["en"], args_translated))
-
-            for l in self.languages:
-                if string in self.trans[l] and self.trans[l][string] != "":
-                    out[l] = self.trans[l][string].format(*args_basic, **kwargs)
-                    if args_translated:
-                        out[l] = out[l].format(
-                            *map(lambda a: l in a and a[l] or a["en"], args_translated)
-                        )
+            return dict(templates)
+
+        args_basic = []
+        args_translated = []
+        for arg in args:
+            if isinstance(arg, dict):
+                args_basic.append("{" + str(len(args_translated)) + "}")
+                args_translated.append(arg)
+            elif isinstance(arg, str):
+                args_basic.append(arg.replace("{", "{{").replace("}", "}}"))
+            else:
+                args_basic.append(arg)
+
+        out = {l: t.format(*args_basic, **kwargs) for l, t in templates.items()}
+        if args_translated:
+            out = {
+                l: t.format(*map(lambda a: l in a and a[l] or a["en"], args_translated))
+                for l, t in out.items()
+            }
 
         return out
 
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Manifest of the SAX plugins, read from their source without importing them,
+# to only import the plugins of a country.
+#
+# Usage:
+#   python -m modules.PluginManifest [country] [language]
+
+import ast
+import json
+import os
+
+from modules import config
+
+# Bump when the entries change
+version = 1
+
+base_classes = ("Plugin", "PluginMapCSS")
+
+
+def scan(path):
+    """
+    Read the plugin class of a plugin module source: name, only_for, not_for,
+    methods and error classes. Values not set or not known from the source
+    are None.
+    """
+    name = os.path.basename(path)[: -len(".py")]
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+
+    entry = {
+        "class": None,
+        "only_for": None,
+        "not_for": None,
+        "methods": None,
+        "errors": [],
+    }
+    classes = dict(
+        map(
+            lambda c: (c.name, c),
+            filter(lambda n: isinstance(n, ast.ClassDef), tree.body),
+        )
+    )
+    # Abstract plugins, as loaded by analyser_sax
+    if name not in classes or "P_" + name in classes:
+        return entry
+    clazz = classes[name]
+    entry["class"] = name
+
+    # Inherited values are not known from this source
+    bases = list(map(lambda b: getattr(b, "id", getattr(b, "attr", None)), clazz.bases))
+    standalone = all(map(lambda b: b in base_classes, bases))
+    if standalone:
+        entry["methods"] = []
+
+    for node in clazz.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in (
+                    "only_for",
+                    "not_for",
+                ):
+                    try:
+                        entry[target.id] = list(ast.literal_eval(node.value))
+                    except ValueError:
+                        entry[target.id] = None
+        elif isinstance(node, ast.FunctionDef):
+            if (
+                node.name in ("node", "way", "relation")
+                and entry["methods"] is not None
+            ):
+                entry["methods"].append(node.name)
+
+    # self.errors[123] = ...
+    for node in ast.walk(clazz):
+        if (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Attribute)
+            and node.value.attr == "errors"
+            and isinstance(node.slice, ast.Constant)
+            and isinstance(node.slice.value, int)
+        ):
+            entry["errors"].append(node.slice.value)
+    entry["errors"] = sorted(set(entry["errors"]))
+
+    return entry
+
+
+def load(plugins_dir, cache=None):
+    """
+    Manifest of the plugins of plugins_dir, as entries by module name. Only
+    the modules changed since the cached manifest are read again.
+    """
+    cached = {}
+    if cache:
+        try:
+            with open(cache, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") != version or cached.get("dir") != plugins_dir:
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+    cached_plugins = cached.get("plugins", {})
+
+    plugins = {}
+    changed = False
+    for file in sorted(os.listdir(plugins_dir)):
+        if not file.endswith(".py") or file in ("__init__.py", "Plugin.py"):
+            continue
+        stat = os.stat(os.path.join(plugins_dir, file))
+        name = file[:-3]
+        entry = cached_plugins.get(name)
+        if (
+            not entry
+            or entry["mtime"] != stat.st_mtime_ns
+            or entry["size"] != stat.st_size
+        ):
+            entry = scan(os.path.join(plugins_dir, file))
+            entry["mtime"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            changed = True
+        plugins[name] = entry
+    changed = changed or len(plugins) != len(cached_plugins)
+
+    if cache and changed:
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            tmp = cache + ".{0}.tmp".format(os.getpid())
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": version, "dir": plugins_dir, "plugins": plugins}, f
+                )
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+
+    return plugins
+
+
+def selected(only_for, not_for, conf_limit):
+    """
+    True if a plugin with only_for and not_for runs for the country and
+    language in conf_limit. None values are not known and do not exclude.
+    """
+    if only_for is not None and not any(
+        map(lambda of: any(map(lambda co: co.startswith(of), conf_limit)), only_for)
+    ):
+        return False
+    if not_for is not None and any(
+        map(lambda of: any(map(lambda co: co.startswith(of), conf_limit)), not_for)
+    ):
+        return False
+    return True
+
+
+def for_country(plugins, conf_limit):
+    """
+    Names of the plugin modules to import for conf_limit.
+    """
+    return sorted(
+        filter(
+            lambda name: plugins[name]["class"]
+            and selected(
+                plugins[name]["only_for"], plugins[name]["not_for"], conf_limit
+            ),
+            plugins.keys(),
+        )
+    )
+
+
+cache = os.path.join(config.dir_cache, "plugins-manifest.json")
+
+
+if __name__ == "__main__":
+    import sys
+
+    plugins = load(os.path.join(config.dir_osmose, "plugins"), cache)
+    if len(sys.argv) > 1:
+        names = for_country(plugins, set(sys.argv[1:]))
+    else:
+        names = sorted(filter(lambda name: plugins[name]["class"], plugins.keys()))
+    for name in names:
+        print(json.dumps(dict(plugins[name], name=name)))
+
+
+###########################################################################
+import unittest
+
+
+class Test(unittest.TestCase):
+    def test_scan(self):
+        plugins_dir = os.path.join(config.dir_osmose, "plugins")
+
+        entry = scan(os.path.join(plugins_dir, "Josm_DutchSpecific.py"))
+        self.assertEqual(entry["class"], "Josm_DutchSpecific")
+        self.assertIn("NL-ZH", entry["only_for"])
+        self.assertIsNone(entry["not_for"])
+        self.assertIn(90201, entry["errors"])
+
+        # Abstract
+        self.assertIsNone(
+            scan(os.path.join(plugins_dir, "Name_Dictionary.py"))["class"]
+        )
+        # Inherited values
+        entry = scan(os.path.join(plugins_dir, "Name_Dictionary_Lang_fr.py"))
+        self.assertEqual(entry["class"], "Name_Dictionary_Lang_fr")
+        self.assertEqual(entry["only_for"], ["fr"])
+        self.assertIsNone(entry["not_for"])
+        self.assertIsNone(entry["methods"])
+
+    def test_load(self):
+        import shutil
+        import tempfile
+
+        plugins_dir = os.path.join(config.dir_osmose, "plugins")
+        with tempfile.TemporaryDirectory() as d:
+            for file in (
+                "Josm_DutchSpecific.py",
+                "TagFix_BadKey.py",
+                "Name_Dictionary.py",
+            ):
+                shutil.copy(os.path.join(plugins_dir, file), d)
+            cache = os.path.join(d, "cache", "manifest.json")
+            plugins = load(d, cache)
+            self.assertEqual(
+                sorted(plugins.keys()),
+                ["Josm_DutchSpecific", "Name_Dictionary", "TagFix_BadKey"],
+            )
+            self.assertEqual(load(d, cache), plugins)
+            self.assertEqual(for_country(plugins, set(["FR", "fr"])), ["TagFix_BadKey"])
+            self.assertEqual(
+                for_country(plugins, set(["NL-ZH"])),
+                ["Josm_DutchSpecific", "TagFix_BadKey"],
+            )
+
+            # Read again when changed
+            with open(os.path.join(d, "TagFix_BadKey.py"), "rb") as f:
+                source = f.read()
+            with open(os.path.join(d, "TagFix_BadKey.py"), "wb") as f:
+                f.write(
+                    source.replace(
+                        b"class TagFix_BadKey(Plugin):",
+                        b"class TagFix_BadKey(Plugin):\n    only_for = ['DE']\n",
+                    )
+                )
+            self.assertEqual(load(d, cache)["TagFix_BadKey"]["only_for"], ["DE"])
+
+    def test_selected(self):
+        self.assertFalse(selected([], None, set(["FR"])))
+        self.assertTrue(selected(None, None, set(["FR"])))
+        self.assertTrue(selected(["FR"], [], set(["FR-NC", "fr"])))
+        self.assertFalse(selected(["NL"], [], set(["FR", "fr"])))
+        self.assertFalse(selected([], ["FR"], set(["FR"])))
+        self.assertFalse(selected(None, ["fr"], set(["FR", "fr"])))
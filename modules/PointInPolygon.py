@@ -19,15 +19,32 @@
 #                                                                       ##
 ###########################################################################
 
+import numpy
+
+from . import OsmoseLog
 from .interval_tree import IntervalTree
 from .Polygon import Polygon
 
+# Grid cell states
+OUTSIDE = 0
+INSIDE = 1
+BOUNDARY = 2
+
 
 class PointInPolygon:
+    # Version of the index stored in the polygon cache, to change with the
+    # index data
+    index_version = 1
+
+    def __init__(self, polygon_id, cache_delay=60, logger=OsmoseLog.logger()):
+        self.polygon = Polygon(polygon_id, cache_delay, logger)
+        self.__dict__.update(
+            self.polygon.derived("pip{0}".format(self.index_version), self._index)
+        )
 
-    def __init__(self, polygon_id, cache_delay=60):
-        self.polygon = Polygon(polygon_id, cache_delay)
+    def _index(self, wkt_path):
         self.build()
+        return {k: v for k, v in self.__dict__.items() if k != "polygon"}
 
     def bboxes(self):
         return self.polygon.bboxes()
@@ -77,7 +94,7 @@ class PointInPolygon:
             )
         return ivals
 
-    def build(self):
+    def build(self, grid_size=512):
         ivals = []
         if hasattr(self.polygon.polygon, "geoms"):
             polygons = self.polygon.polygon.geoms
@@ -87,9 +104,118 @@ class PointInPolygon:
             ivals += self.build_polygon(p.exterior.coords)
             for i in p.interiors:
                 ivals += self.build_polygon(i.coords)
-        self.tree = IntervalTree(ivals)
+        self.tree = IntervalTree(list(ivals))
+        self.build_grid(ivals, grid_size)
+
+    def build_grid(self, ivals, grid_size):
+        """
+        Split the polygon bbox in grid_size x grid_size cells. Cells not crossed
+        by a segment of the polygon are fully inside or outside, only points in
+        the cells crossed by the boundary need the exact test.
+        """
+        self.grid = None
+        if not ivals:
+            return
+        x1 = numpy.array([i.x1 for i in ivals])
+        y1 = numpy.array([i.y1 for i in ivals])
+        x2 = numpy.array([i.x2 for i in ivals])
+        y2 = numpy.array([i.y2 for i in ivals])
+        self.minx, self.miny = min(x1.min(), x2.min()), min(y1.min(), y2.min())
+        self.maxx, self.maxy = max(x1.max(), x2.max()), max(y1.max(), y2.max())
+        if self.maxx <= self.minx or self.maxy <= self.miny:
+            return
+        self.nx = self.ny = grid_size
+        self.fx = self.nx / (self.maxx - self.minx)
+        self.fy = self.ny / (self.maxy - self.miny)
+
+        # Cut the segments into pieces not longer than a cell, each piece
+        # crossing at most 2 x 2 cells
+        n = numpy.maximum(
+            1,
+            numpy.ceil(
+                numpy.maximum(abs(x2 - x1) * self.fx, abs(y2 - y1) * self.fy)
+            ).astype(int),
+        )
+        seg = numpy.repeat(numpy.arange(len(n)), n)
+        k = numpy.arange(len(seg)) - numpy.repeat(numpy.cumsum(n) - n, n)
+        t0, t1 = k / n[seg], (k + 1) / n[seg]
+        dx, dy = (x2 - x1)[seg], (y2 - y1)[seg]
+        px1, px2 = x1[seg] + dx * t0, x1[seg] + dx * t1
+        py1, py2 = y1[seg] + dy * t0, y1[seg] + dy * t1
+
+        # Cells covered by the bbox of each piece, enlarged a bit to be safe
+        # with rounding
+        eps = 1e-9
+        i0, i1 = self._cells(
+            numpy.minimum(px1, px2) - eps, self.minx, self.fx, self.nx
+        ), self._cells(numpy.maximum(px1, px2) + eps, self.minx, self.fx, self.nx)
+        j0, j1 = self._cells(
+            numpy.minimum(py1, py2) - eps, self.miny, self.fy, self.ny
+        ), self._cells(numpy.maximum(py1, py2) + eps, self.miny, self.fy, self.ny)
+        grid = numpy.full((self.ny, self.nx), OUTSIDE, dtype=numpy.uint8)
+        for di in (0, 1):
+            for dj in (0, 1):
+                grid[numpy.minimum(j0 + dj, j1), numpy.minimum(i0 + di, i1)] = BOUNDARY
+
+        # In each row, cells between two boundary cells share the same state,
+        # given by the exact test of one of them
+        for j in range(self.ny):
+            row = grid[j]
+            free = row != BOUNDARY
+            starts = numpy.flatnonzero(free & numpy.r_[True, ~free[:-1]])
+            ends = numpy.flatnonzero(free & numpy.r_[~free[1:], True]) + 1
+            y = self.miny + (j + 0.5) / self.fy
+            for i, end in zip(starts, ends):
+                if self.point_inside_polygon_exact(self.minx + (i + 0.5) / self.fx, y):
+                    row[i:end] = INSIDE
+
+        self.grid = grid.tobytes()
+
+    @staticmethod
+    def _cells(v, vmin, f, n):
+        return numpy.clip(numpy.floor((v - vmin) * f).astype(int), 0, n - 1)
 
     def point_inside_polygon(self, x, y):
+        if self.grid is not None:
+            if not (self.minx <= x <= self.maxx and self.miny <= y <= self.maxy):
+                return False
+            state = self.grid[
+                min(int((y - self.miny) * self.fy), self.ny - 1) * self.nx
+                + min(int((x - self.minx) * self.fx), self.nx - 1)
+            ]
+            if state != BOUNDARY:
+                return state == INSIDE
+        return self.point_inside_polygon_exact(x, y)
+
+    def points_inside_polygon(self, x, y):
+        """
+        Vectorised point_inside_polygon() on arrays of coordinates
+        @return numpy array of booleans
+        """
+        x = numpy.asarray(x, dtype=float)
+        y = numpy.asarray(y, dtype=float)
+        if self.grid is None:
+            return numpy.array(
+                list(map(self.point_inside_polygon_exact, x, y)), dtype=bool
+            )
+
+        in_bbox = (
+            (self.minx <= x) & (x <= self.maxx) & (self.miny <= y) & (y <= self.maxy)
+        )
+        state = numpy.full(x.shape, OUTSIDE, dtype=numpy.uint8)
+        cells = self._cells(
+            y[in_bbox], self.miny, self.fy, self.ny
+        ) * self.nx + self._cells(x[in_bbox], self.minx, self.fx, self.nx)
+        state[in_bbox] = numpy.frombuffer(self.grid, dtype=numpy.uint8)[cells]
+
+        inside = state == INSIDE
+        boundary = numpy.nonzero(state == BOUNDARY)[0]
+        inside[boundary] = list(
+            map(self.point_inside_polygon_exact, x[boundary], y[boundary])
+        )
+        return inside
+
+    def point_inside_polygon_exact(self, x, y):
         poly = self.tree.find(y, y)
         inside = False
 
@@ -129,3 +255,33 @@ class Test(unittest.TestCase):
         f = PointInPolygon(87565)
         assert f.point_inside_polygon(28.190278, -25.745)  # Pretoria
         assert not f.point_inside_polygon(27.50195, -29.31559)  # Maseru, Lesotho
+
+    def test_grid(self):
+        import random
+        from types import SimpleNamespace
+
+        from shapely.geometry import Point
+
+        class ShapePointInPolygon(PointInPolygon):
+            def __init__(self, shape):
+                self.polygon = SimpleNamespace(polygon=shape)
+                self.build(grid_size=32)
+
+        # Disc with a hole, and an island in the hole
+        f = ShapePointInPolygon(
+            Point(0, 0)
+            .buffer(10)
+            .difference(Point(1, 1).buffer(4))
+            .union(Point(1, 1).buffer(1))
+        )
+        assert f.point_inside_polygon(8, 0)
+        assert not f.point_inside_polygon(-1, 1)
+        assert f.point_inside_polygon(1, 1)
+        assert not f.point_inside_polygon(20, 0)
+
+        random.seed(0)
+        x = [random.uniform(-12, 12) for _ in range(5000)]
+        y = [random.uniform(-12, 12) for _ in range(5000)]
+        exact = list(map(f.point_inside_polygon_exact, x, y))
+        self.assertEqual(list(map(f.point_inside_polygon, x, y)), exact)
+        self.assertEqual(list(f.points_inside_polygon(x, y)), exact)
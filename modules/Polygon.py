@@ -19,17 +19,20 @@
 #                                                                       ##
 ###########################################################################
 
+import os
+
 import pyproj
+import shapely.wkb
 from shapely.geometry import MultiPolygon
 from shapely.ops import transform
 from shapely.wkt import loads
 
-from modules import downloader
+from modules import OsmoseLog, downloader
 
 
 class Polygon:
 
-    def __init__(self, polygon_id, cache_delay=60):
+    def __init__(self, polygon_id, cache_delay=60, logger=OsmoseLog.logger()):
         # polygon_id can be an integer, or a list of integers
         if isinstance(polygon_id, int):
             polygon_id = (polygon_id,)
@@ -38,11 +41,50 @@ class Polygon:
         for id in polygon_id:
             url = polygon_url + "index.py?id=" + str(id)
             downloader.urlread(url, cache_delay)
-        url = polygon_url + "get_wkt.py?params=0&id=" + ",".join(map(str, polygon_id))
-        wkt = downloader.urlread(url, cache_delay)
+        self.wkt_url = (
+            polygon_url + "get_wkt.py?params=0&id=" + ",".join(map(str, polygon_id))
+        )
+        self.cache_delay = cache_delay
+        self.logger = logger
+
+        self.polygon = shapely.wkb.loads(self.derived("wkb", self._parse_wkt))
+
+    @staticmethod
+    def _parse_wkt(path):
+        wkt = open(path, "r", encoding="utf-8").read()
         if wkt.startswith("SRID="):
             wkt = wkt.split(";", 1)[1]
-        self.polygon = loads(wkt)
+        return shapely.wkb.dumps(loads(wkt))
+
+    def derived(self, name, build):
+        """
+        Object derived from the polygon by build(wkt_path), cached along the
+        downloaded WKT until it changes
+        """
+        return downloader.derived(
+            self.wkt_url, self.cache_delay, name, build, logger=self.logger
+        )
+
+    @staticmethod
+    def warm_cache(cache_delay=60, logger=OsmoseLog.logger()):
+        """
+        Download and parse the polygons of all countries in osmose_config, and
+        store them with their point in polygon index in the cache
+        """
+        import osmose_config
+
+        from .PointInPolygon import PointInPolygon
+
+        polygon_ids = []
+        for country in osmose_config.config.values():
+            if country.polygon_id and country.polygon_id not in polygon_ids:
+                polygon_ids.append(country.polygon_id)
+
+        for polygon_id in polygon_ids:
+            try:
+                PointInPolygon(polygon_id, cache_delay, logger)
+            except Exception as e:
+                logger.err("Polygon {0}: {1}".format(polygon_id, e))
 
     def as_simplified_wkt(self, out_src, metric_src) -> str:
         wgs84 = pyproj.CRS("EPSG:4326")
@@ -80,6 +122,10 @@ class Polygon:
             ]
 
 
+if __name__ == "__main__":
+    Polygon.warm_cache()
+
+
 ###########################################################################
 import unittest
 
@@ -110,3 +156,40 @@ class Test(unittest.TestCase):
         b = p.bboxes()
         self.assertNotEqual(b, None)
         self.assertEqual(len(b), 1)
+
+    def test_cache(self):
+        import glob
+
+        from modules import config
+
+        # Fake downloaded polygon, out of the OSM relation ids range
+        polygon_id = -1
+        polygon_url = "http://polygons.openstreetmap.fr/"
+        urls = [
+            polygon_url + "index.py?id=-1",
+            polygon_url + "get_wkt.py?params=0&id=-1",
+        ]
+        os.makedirs(config.dir_cache, exist_ok=True)
+        open(downloader.get_cache_path(urls[0]), "w").write("")
+        open(downloader.get_cache_path(urls[1]), "w").write(
+            "SRID=4326;MULTIPOLYGON(((0 0,10 0,10 10,0 10,0 0),(2 2,2 4,4 4,4 2,2 2)))"
+        )
+        try:
+            p = Polygon(polygon_id)
+            self.assertTrue(
+                os.path.exists(downloader.get_cache_path(urls[1]) + ".wkb.pickle")
+            )
+            self.assertEqual(Polygon(polygon_id).polygon, p.polygon)
+
+            from .PointInPolygon import PointInPolygon
+
+            self.assertEqual(
+                PointInPolygon(polygon_id).point_inside_polygon(1, 1), True
+            )
+            self.assertEqual(
+                PointInPolygon(polygon_id).point_inside_polygon(3, 3), False
+            )
+        finally:
+            for url in urls:
+                for f in glob.glob(downloader.get_cache_path(url) + "*"):
+                    os.remove(f)
@@ -57,7 +57,7 @@ class Test(unittest.TestCase):
 
     def test(self):
         self.assertEqual(version(1), 876922281)
-        self.assertEqual(version(PointInPolygon), 1846769484)
+        self.assertEqual(version(PointInPolygon), 704167276)
 
         try:
             version("1")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+import json
+import os
+import re
+import time
+
+# Statements EXPLAIN ANALYZE can run, with their side effects
+re_explainable = re.compile(
+    r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|VALUES|"
+    r"CREATE\s+((UNLOGGED|TEMP|TEMPORARY)\s+)?TABLE\s.*\sAS\s|"
+    r"CREATE\s+MATERIALIZED\s+VIEW\s.*\sAS\s)",
+    re.IGNORECASE | re.DOTALL,
+)
+re_select = re.compile(r"^\s*(SELECT|WITH|VALUES)\b", re.IGNORECASE)
+
+
+def split(sql):
+    """
+    Split SQL on the statements separators, skipping the ones in quoted
+    strings, dollar quoted strings and comments.
+    """
+    statements = []
+    start = 0
+    i = 0
+    while i < len(sql):
+        c = sql[i]
+        if c == "'" or c == '"':
+            i = sql.find(c, i + 1)
+            if i == -1:
+                break
+        elif c == "-" and sql.startswith("--", i):
+            i = sql.find("\n", i)
+            if i == -1:
+                break
+        elif c == "$":
+            m = re.match(r"\$[A-Za-z_]*\$", sql[i:])
+            if m:
+                i = sql.find(m.group(0), i + len(m.group(0)))
+                if i == -1:
+                    break
+                i += len(m.group(0)) - 1
+        elif c == ";":
+            statements.append(sql[start:i])
+            start = i + 1
+        i += 1
+    statements.append(sql[start:])
+    return list(filter(lambda s: s.strip(), statements))
+
+
+class SqlProfile:
+    """
+    Record the run time and the EXPLAIN (ANALYZE, BUFFERS) plan of the SQL
+    statements of an analyser, written to a JSON file.
+    """
+
+    def __init__(self, path, analyser=None):
+        self.path = path
+        self.analyser = analyser
+        self.queries = []
+
+    def execute(self, curs, sql, location):
+        """
+        Execute SQL, statement by statement, on curs. Statements with a
+        result are explained on the side and executed, others are executed by
+        EXPLAIN ANALYZE itself. The cursor is left on the last statement
+        result.
+        """
+        for statement in split(sql):
+            if re_select.match(statement):
+                plan = self.explain(curs, statement)
+                start = time.time()
+                curs.execute(statement)
+                self.record(location, statement, time.time() - start, plan)
+            else:
+                start = time.time()
+                plan = None
+                if re_explainable.match(statement):
+                    plan = self.explain(curs, statement, keep=True)
+                if plan is None:
+                    curs.execute(statement)
+                self.record(
+                    location,
+                    statement,
+                    time.time() - start,
+                    plan,
+                    curs.rowcount if plan is None else None,
+                )
+
+    def explain(self, curs, statement, keep=False):
+        """
+        Run EXPLAIN ANALYZE on statement and return the plan. Its effects are
+        rolled back unless keep. Returns None when it can not be explained.
+        """
+        curs.execute("SAVEPOINT sql_profile")
+        try:
+            curs.execute(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {0}".format(statement)
+            )
+            plan = curs.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plan = plan[0]
+        except Exception:
+            curs.execute("ROLLBACK TO SAVEPOINT sql_profile")
+            return None
+        if keep:
+            curs.execute("RELEASE SAVEPOINT sql_profile")
+        else:
+            curs.execute("ROLLBACK TO SAVEPOINT sql_profile")
+        return plan
+
+    def record(self, location, sql, wall_time, plan=None, rows=None):
+        query = {
+            "location": location,
+            "sql": sql.strip(),
+            "time": wall_time,
+            "rows": rows,
+            "execution_time": None,
+            "shared_hit_blocks": None,
+            "shared_read_blocks": None,
+            "plan": plan,
+        }
+        if plan:
+            query["rows"] = plan["Plan"].get("Actual Rows")
+            query["execution_time"] = plan.get("Execution Time")
+            query["shared_hit_blocks"] = plan["Plan"].get("Shared Hit Blocks")
+            query["shared_read_blocks"] = plan["Plan"].get("Shared Read Blocks")
+        self.queries.append(query)
+        return query
+
+    def write(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"analyser": self.analyser, "queries": self.queries}, f, indent=1)
+        os.replace(tmp, self.path)
+
+
+###########################################################################
+import unittest
+
+
+class Test(unittest.TestCase):
+    class Cursor:
+        def __init__(self):
+            self.executed = []
+            self.rowcount = 3
+
+        def execute(self, sql):
+            self.executed.append(sql)
+            if sql.startswith("EXPLAIN") and "fails" in sql:
+                raise Exception("can not be explained")
+
+        def fetchone(self):
+            return [
+                [
+                    {
+                        "Plan": {
+                            "Actual Rows": 7,
+                            "Shared Hit Blocks": 10,
+                            "Shared Read Blocks": 2,
+                        },
+                        "Execution Time": 1.5,
+                    }
+                ]
+            ]
+
+    def test_split(self):
+        self.assertEqual(
+            split("SELECT 1; SELECT ';', \"a;b\" -- c;d\n;\n"),
+            ["SELECT 1", " SELECT ';', \"a;b\" -- c;d\n"],
+        )
+        self.assertEqual(
+            split("CREATE FUNCTION f() AS $$ BEGIN; END; $$ LANGUAGE plpgsql;"),
+            ["CREATE FUNCTION f() AS $$ BEGIN; END; $$ LANGUAGE plpgsql"],
+        )
+        self.assertEqual(split("SELECT 1"), ["SELECT 1"])
+
+    def test_execute(self):
+        import tempfile
+
+        curs = self.Cursor()
+        with tempfile.TemporaryDirectory() as d:
+            profile = SqlProfile(os.path.join(d, "profile.json"), "test")
+            profile.execute(
+                curs,
+                "CREATE UNLOGGED TABLE t AS SELECT 1; CREATE INDEX i ON t(a); CREATE TABLE fails AS SELECT 1; SELECT * FROM t",
+                "test.py:1",
+            )
+            profile.write()
+            with open(profile.path) as f:
+                queries = json.load(f)["queries"]
+
+        self.assertEqual(
+            curs.executed,
+            [
+                # Executed by EXPLAIN ANALYZE
+                "SAVEPOINT sql_profile",
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) CREATE UNLOGGED TABLE t AS SELECT 1",
+                "RELEASE SAVEPOINT sql_profile",
+                # Not explainable
+                " CREATE INDEX i ON t(a)",
+                # Explain fails
+                "SAVEPOINT sql_profile",
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)  CREATE TABLE fails AS SELECT 1",
+                "ROLLBACK TO SAVEPOINT sql_profile",
+                " CREATE TABLE fails AS SELECT 1",
+                # Explained on the side
+                "SAVEPOINT sql_profile",
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)  SELECT * FROM t",
+                "ROLLBACK TO SAVEPOINT sql_profile",
+                " SELECT * FROM t",
+            ],
+        )
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(queries[0]["rows"], 7)
+        self.assertEqual(queries[0]["shared_hit_blocks"], 10)
+        self.assertEqual(queries[0]["execution_time"], 1.5)
+        self.assertEqual(queries[1]["rows"], 3)
+        self.assertIsNone(queries[1]["plan"])
+        self.assertEqual(queries[3]["location"], "test.py:1")
@@ -21,6 +21,7 @@
 
 import hashlib
 import os
+import pickle
 import time
 from datetime import datetime
 from typing import Dict, Optional
@@ -29,7 +30,7 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
-from . import config
+from . import OsmoseLog, config
 
 # Depends on locale
 # https://docs.python.org/3/library/datetime.html?highlight=strftime#strftime-and-strptime-behavior
@@ -174,6 +175,37 @@ def urlread(url: str, delay: int, post: Optional[Dict[str, str]] = None):
     return open(path(url, delay, post), "r", encoding="utf-8").read()
 
 
+def derived(
+    url: str, delay: int, name: str, build, post=None, logger=OsmoseLog.logger()
+):
+    """
+    Data computed by build(path) from the downloaded url, cached next to the
+    download and shared by all the runs until the download changes. name
+    identifies the computation.
+    """
+    source = path(url, delay, post)
+    cache = source + "." + name + ".pickle"
+    mtime = os.stat(source).st_mtime
+    try:
+        if os.stat(cache).st_mtime == mtime:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        pass
+
+    data = build(source)
+    tmp = cache + ".{0}.tmp".format(os.getpid())
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Same mtime as the download it is computed from
+        os.utime(tmp, (mtime, mtime))
+        os.replace(tmp, cache)
+    except OSError as e:
+        logger.err("{0} not cached: {1}".format(cache, e))
+    return data
+
+
 def set_millesime(url: str, millesime: Optional[datetime]) -> None:
     with open(
         get_cache_path(url) + ".millesime", "w", encoding="utf-8"
@@ -280,6 +312,33 @@ class Test(unittest.TestCase):
 
         self.check_file_content(dst4)
 
+    def test_derived(self):
+        url = "https://osmose.openstreetmap.fr/test-downloader-derived"
+        cache = get_cache_path(url)
+        with open(cache, "w", encoding="utf-8") as f:
+            f.write("1 2 3")
+
+        built = []
+
+        def build(path):
+            built.append(path)
+            return list(map(int, open(path, encoding="utf-8").read().split()))
+
+        self.assertEqual(derived(url, 10, "ints", build), [1, 2, 3])
+        self.assertEqual(derived(url, 10, "ints", build), [1, 2, 3])
+        self.assertEqual(built, [cache])
+
+        # Built again when the download changes
+        with open(cache, "w", encoding="utf-8") as f:
+            f.write("4")
+        old_time = time.time() - 60
+        os.utime(cache, (old_time, old_time))
+        self.assertEqual(derived(url, 10, "ints", build), [4])
+        self.assertEqual(len(built), 2)
+
+        os.remove(cache)
+        os.remove(cache + ".ints.pickle")
+
     def test_update_cache_404(self):
         with self.assertRaises(requests.HTTPError):
             update_cache(self.url_404, 0)
@@ -52,6 +52,12 @@ def run(conf, analyser, plugin=None, format="osmose"):
             "verbose": False,
             "plugin": plugin and [plugin] or [],
             "change": False,
+            "sax_workers": 1,
+            "db_itersize": 2000,
+            "mapcss_cache_size": 100000,
+            "sax_tags_cache_size": 100000,
+            "sax_node_locations": False,
+            "sax_interest_keys": True,
         }
     )
 
@@ -17,6 +17,8 @@
 ##                                                                       ##
 #########################################################################*/
 
+#include <algorithm>
+#include <unordered_set>
 #include <vector>
 #include <boost/python.hpp>
 using namespace boost::python;
@@ -64,6 +66,45 @@ boost::python::list referencesToDict(const References & refs) {
     return list;
 }
 
+// Interned strings used as keys and values of the batch objects
+static PyObject * str_id, * str_lon, * str_lat, * str_tag, * str_nd, * str_member;
+static PyObject * str_ref, * str_role, * str_type, * str_node, * str_way, * str_relation;
+
+static void init_strings() {
+    str_id = PyUnicode_InternFromString("id");
+    str_lon = PyUnicode_InternFromString("lon");
+    str_lat = PyUnicode_InternFromString("lat");
+    str_tag = PyUnicode_InternFromString("tag");
+    str_nd = PyUnicode_InternFromString("nd");
+    str_member = PyUnicode_InternFromString("member");
+    str_ref = PyUnicode_InternFromString("ref");
+    str_role = PyUnicode_InternFromString("role");
+    str_type = PyUnicode_InternFromString("type");
+    str_node = PyUnicode_InternFromString("node");
+    str_way = PyUnicode_InternFromString("way");
+    str_relation = PyUnicode_InternFromString("relation");
+}
+
+// Set a new reference as item of a dict
+inline void setItem(PyObject * dict, PyObject * key, PyObject * value) {
+    PyDict_SetItem(dict, key, value);
+    Py_DECREF(value);
+}
+
+// Kinds of the object groups of a batch
+enum Kind { KIND_NODE = 0, KIND_WAY = 1, KIND_RELATION = 2 };
+
+// Node location, in units of 100 nanodegrees as in OSM
+struct Location {
+    uint64_t osmid;
+    int32_t lon;
+    int32_t lat;
+
+    bool operator<(const Location & o) const {
+        return osmid < o.osmid;
+    }
+};
+
 struct Visitor
 {
   Visitor() {}
@@ -78,21 +119,81 @@ struct Visitor
       since_timestamp = timestamp;
   }
 
+  void block_callback(uint64_t index) {
+      call_method<void>(self, "block", index);
+  }
+
+  void block(uint64_t index) {
+      (void)index;
+  }
+
   void node_callback(uint64_t osmid, double lon, double lat, const Tags & tags, const uint64_t timestamp) {
       if (!tags.empty() && (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp)) {
-          call_method<void>(self, "node", osmid, lon, lat, tagsToDict(tags));
+          if (interesting(KIND_NODE, tags)) {
+              call_method<void>(self, "node", osmid, lon, lat, tagsToDict(tags));
+          }
       } else {
           filtered_nodes_osmid.push_back(osmid);
       }
   }
 
+  void set_locations(bool enable) {
+      locations = enable;
+  }
+
+  bool locations_enabled() const {
+      return locations;
+  }
+
+  void location_callback(uint64_t osmid, int64_t lon, int64_t lat) {
+      if (!location_index.empty() && osmid <= location_index.back().osmid) {
+          location_sorted = false;
+      }
+      location_index.push_back(Location{osmid, (int32_t)lon, (int32_t)lat});
+  }
+
+  const Location * find_location(uint64_t osmid) {
+      if (!location_sorted) {
+          std::stable_sort(location_index.begin(), location_index.end());
+          location_sorted = true;
+      }
+      auto it = std::lower_bound(location_index.begin(), location_index.end(), Location{osmid, 0, 0});
+      if (it == location_index.end() || it->osmid != osmid) {
+          return nullptr;
+      }
+      return &*it;
+  }
+
+  boost::python::object location(uint64_t osmid) {
+      const Location * l = find_location(osmid);
+      if (!l) {
+          return boost::python::object();
+      }
+      return boost::python::make_tuple(l->lon / 1e7, l->lat / 1e7);
+  }
+
+  // Locations of a list of node ids, None for the unknown ones
+  boost::python::list locations_of(const boost::python::list & osmids) {
+      boost::python::list list;
+      for (boost::python::ssize_t i = 0, l = boost::python::len(osmids); i < l; ++i) {
+          list.append(location(boost::python::extract<uint64_t>(osmids[i])));
+      }
+      return list;
+  }
+
+  uint64_t locations_count() const {
+      return location_index.size();
+  }
+
   boost::python::list filtered_nodes() const {
       return nodeIdToList(filtered_nodes_osmid);
   }
 
   void way_callback(uint64_t osmid, const Tags & tags, const std::vector<uint64_t> & refs, const uint64_t timestamp) {
       if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
-          call_method<void>(self, "way", osmid, tagsToDict(tags), nodeIdToList(refs));
+          if (interesting(KIND_WAY, tags)) {
+              call_method<void>(self, "way", osmid, tagsToDict(tags), nodeIdToList(refs));
+          }
       } else {
           filtered_ways_osmid.push_back(osmid);
       }
@@ -104,7 +205,9 @@ struct Visitor
 
   void relation_callback(uint64_t osmid, const Tags & tags, const References & refs, const uint64_t timestamp) {
       if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
-          call_method<void>(self, "relation", osmid, tagsToDict(tags), referencesToDict(refs));
+          if (interesting(KIND_RELATION, tags)) {
+              call_method<void>(self, "relation", osmid, tagsToDict(tags), referencesToDict(refs));
+          }
       } else {
           filtered_relations_osmid.push_back(osmid);
       }
@@ -114,26 +217,257 @@ struct Visitor
       return nodeIdToList(filtered_relations_osmid);
   }
 
+  // Batch mode: the objects of a block are built as the data dicts of
+  // OsmReader, and given to objects() as a list of (kind, objects) groups in
+  // the file order. Strings of a block are decoded once from its string
+  // table, and interned.
+
+  // Only give the objects of a kind with one of the tag keys, all of them
+  // when keys is None. The skipped objects are not in the filtered lists.
+
+  void set_interest_keys(int kind, const boost::python::object & keys) {
+      interest_all[kind] = keys.is_none();
+      interest_keys[kind].clear();
+      if (!interest_all[kind]) {
+          interest_keys[kind].insert(stl_input_iterator<std::string>(keys), stl_input_iterator<std::string>());
+      }
+  }
+
+  bool interesting(int kind, const Tags & tags) const {
+      if (interest_all[kind]) {
+          return true;
+      }
+      for (const auto & i: tags) {
+          if (interest_keys[kind].count(i.first)) {
+              return true;
+          }
+      }
+      return false;
+  }
+
+  bool interesting(int kind, const TagIndexes & tags) const {
+      if (interest_all[kind]) {
+          return true;
+      }
+      for (const auto & i: tags) {
+          if (interest_strings[kind][i.first]) {
+              return true;
+          }
+      }
+      return false;
+  }
+
+  void set_batch(bool enable) {
+      batch = enable;
+  }
+
+  bool batch_enabled() const {
+      return batch;
+  }
+
+  void strings_callback(const OSMPBF::StringTable & stringtable) {
+      strings.clear();
+      strings.reserve(stringtable.s_size());
+      for (int i = 0; i < stringtable.s_size(); ++i) {
+          const std::string & s = stringtable.s(i);
+          PyObject * string = PyUnicode_DecodeUTF8(s.data(), s.size(), "replace");
+          PyUnicode_InternInPlace(&string);
+          strings.push_back(boost::python::object(boost::python::handle<>(string)));
+      }
+      string_values = &stringtable;
+      for (int kind = KIND_NODE; kind <= KIND_RELATION; ++kind) {
+          if (!interest_all[kind]) {
+              interest_strings[kind].assign(stringtable.s_size(), false);
+              for (int i = 0; i < stringtable.s_size(); ++i) {
+                  interest_strings[kind][i] = interest_keys[kind].count(stringtable.s(i)) > 0;
+              }
+          }
+      }
+  }
+
+  void batch_node_callback(uint64_t osmid, double lon, double lat, const TagIndexes & tags, const uint64_t timestamp) {
+      if (!tags.empty() && (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp)) {
+          if (!interesting(KIND_NODE, tags)) {
+              return;
+          }
+          PyObject * data = PyDict_New();
+          setItem(data, str_id, PyLong_FromUnsignedLongLong(osmid));
+          setItem(data, str_lon, PyFloat_FromDouble(lon));
+          setItem(data, str_lat, PyFloat_FromDouble(lat));
+          setItem(data, str_tag, tagIndexesToDict(tags));
+          append(KIND_NODE, data);
+      } else {
+          filtered_nodes_osmid.push_back(osmid);
+      }
+  }
+
+  void batch_way_callback(uint64_t osmid, const TagIndexes & tags, const std::vector<uint64_t> & refs, const uint64_t timestamp) {
+      if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
+          if (!interesting(KIND_WAY, tags)) {
+              return;
+          }
+          PyObject * nd = PyList_New(refs.size());
+          for (size_t i = 0; i < refs.size(); ++i) {
+              PyList_SET_ITEM(nd, i, PyLong_FromUnsignedLongLong(refs[i]));
+          }
+          PyObject * data = PyDict_New();
+          setItem(data, str_id, PyLong_FromUnsignedLongLong(osmid));
+          setItem(data, str_tag, tagIndexesToDict(tags));
+          setItem(data, str_nd, nd);
+          append(KIND_WAY, data);
+      } else {
+          filtered_ways_osmid.push_back(osmid);
+      }
+  }
+
+  void batch_relation_callback(const OSMPBF::Relation & rel, const TagIndexes & tags, const uint64_t timestamp) {
+      if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
+          if (!interesting(KIND_RELATION, tags)) {
+              return;
+          }
+          PyObject * members = PyList_New(rel.memids_size());
+          uint64_t id = 0;
+          for (int i = 0; i < rel.memids_size(); ++i) {
+              id += rel.memids(i);
+              PyObject * member = PyDict_New();
+              setItem(member, str_ref, PyLong_FromUnsignedLongLong(id));
+              PyDict_SetItem(member, str_role, strings[rel.roles_sid(i)].ptr());
+              switch(rel.types(i)) {
+                  case OSMPBF::Relation::NODE : PyDict_SetItem(member, str_type, str_node);
+                      break;
+                  case OSMPBF::Relation::WAY : PyDict_SetItem(member, str_type, str_way);
+                      break;
+                  case OSMPBF::Relation::RELATION : PyDict_SetItem(member, str_type, str_relation);
+                      break;
+              }
+              PyList_SET_ITEM(members, i, member);
+          }
+          PyObject * data = PyDict_New();
+          setItem(data, str_id, PyLong_FromUnsignedLongLong(rel.id()));
+          setItem(data, str_tag, tagIndexesToDict(tags));
+          setItem(data, str_member, members);
+          append(KIND_RELATION, data);
+      } else {
+          filtered_relations_osmid.push_back(rel.id());
+      }
+  }
+
+  void batch_end_callback() {
+      boost::python::list groups_ = groups;
+      groups = boost::python::list();
+      group = boost::python::list();
+      group_kind = -1;
+      strings.clear();
+      string_values = nullptr;
+      call_method<void>(self, "objects", groups_);
+  }
+
+  void objects(const boost::python::list & groups) {
+      (void)groups;
+  }
+
+  // Index of the data blocks, as (block index, offset, kind, min id, max id)
+
+  void index_callback(uint64_t index, int64_t offset, int kind, int64_t min_id, int64_t max_id) {
+      index_entries.append(boost::python::make_tuple(index, offset, kind, min_id, max_id));
+  }
+
+  boost::python::list index_entries;
+
  private:
+    // New dict of the tags, keys in the same order as tagsToDict()
+    PyObject * tagIndexesToDict(const TagIndexes & tags) {
+        TagIndexes sorted(tags);
+        std::stable_sort(sorted.begin(), sorted.end(), [this](const std::pair<uint32_t, uint32_t> & a, const std::pair<uint32_t, uint32_t> & b) {
+            return string_values->s(a.first) < string_values->s(b.first);
+        });
+        PyObject * dict = PyDict_New();
+        for (const auto & i: sorted) {
+            PyDict_SetItem(dict, strings[i.first].ptr(), strings[i.second].ptr());
+        }
+        return dict;
+    }
+
+    // Steals the reference to data
+    void append(int kind, PyObject * data) {
+        if (kind != group_kind) {
+            group = boost::python::list();
+            groups.append(boost::python::make_tuple(kind, group));
+            group_kind = kind;
+        }
+        PyList_Append(group.ptr(), data);
+        Py_DECREF(data);
+    }
+
     PyObject* self;
     uint64_t since_timestamp = 0;
+    bool locations = false;
+    bool location_sorted = true;
+    std::vector<Location> location_index;
     std::vector<uint64_t> filtered_nodes_osmid;
     std::vector<uint64_t> filtered_ways_osmid;
     std::vector<uint64_t> filtered_relations_osmid;
+    bool interest_all[3] = {true, true, true};
+    std::unordered_set<std::string> interest_keys[3];
+    std::vector<bool> interest_strings[3];
+    bool batch = false;
+    std::vector<boost::python::object> strings;
+    const OSMPBF::StringTable * string_values = nullptr;
+    boost::python::list groups;
+    boost::python::list group;
+    int group_kind = -1;
 };
 
+// Read the file, or only the data blocks whose index modulo nb_shards is
+// shard. In batch mode, the objects of each block are given at once to
+// Visitor.objects().
+void read_pbf(const std::string & filename, Visitor & visitor, uint64_t shard, uint64_t nb_shards, bool batch) {
+    visitor.set_batch(batch);
+    read_osm_pbf_shard<Visitor>(filename, visitor, shard, nb_shards);
+}
+
+// Only read the data blocks of a list of (block index, offset in the file)
+void read_pbf_blocks(const std::string & filename, Visitor & visitor, const boost::python::list & blocks, bool batch) {
+    std::vector<std::pair<uint64_t, int64_t> > offsets;
+    for (boost::python::ssize_t i = 0, l = boost::python::len(blocks); i < l; ++i) {
+        uint64_t index = boost::python::extract<uint64_t>(blocks[i][0]);
+        int64_t offset = boost::python::extract<int64_t>(blocks[i][1]);
+        offsets.push_back(std::make_pair(index, offset));
+    }
+    visitor.set_batch(batch);
+    read_osm_pbf_blocks<Visitor>(filename, visitor, offsets);
+}
+
+// Offset in the file, kinds and id ranges of the data blocks
+boost::python::list index_pbf(const std::string & filename) {
+    Visitor visitor;
+    index_osm_pbf<Visitor>(filename, visitor);
+    return visitor.index_entries;
+}
+
 
 BOOST_PYTHON_MODULE(osm_pbf_parser)
 {
+    init_strings();
+
     class_<Visitor, Visitor>("Visitor")
         .def("set_since_timestamp", &Visitor::set_since_timestamp)
+        .def("block", &Visitor::block)
         .def("node", &Visitor::filtered_nodes)
         .def("filtered_nodes", &Visitor::filtered_nodes)
+        .def("set_locations", &Visitor::set_locations)
+        .def("location", &Visitor::location)
+        .def("locations", &Visitor::locations_of)
+        .def("locations_count", &Visitor::locations_count)
         .def("way", &Visitor::way_callback)
         .def("filtered_ways", &Visitor::filtered_ways)
         .def("relation", &Visitor::relation_callback)
         .def("filtered_relations", &Visitor::filtered_relations)
+        .def("objects", &Visitor::objects)
+        .def("set_interest_keys", &Visitor::set_interest_keys)
     ;
 
-    def("read_osm_pbf", read_osm_pbf<Visitor>);
+    def("read_osm_pbf", read_pbf, (arg("pbf"), arg("visitor"), arg("shard") = 0, arg("nb_shards") = 1, arg("batch") = false));
+    def("read_osm_pbf_blocks", read_pbf_blocks, (arg("pbf"), arg("visitor"), arg("blocks"), arg("batch") = false));
+    def("index_osm_pbf", index_pbf, (arg("pbf")));
 }
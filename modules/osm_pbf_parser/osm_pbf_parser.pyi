@@ -1,14 +1,27 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 class Visitor:
     def set_since_timestamp(self, timestamp: int) -> None: ...
+    def block(self, index: int) -> None: ...
     def node(self, osmid: int, lon: int, lat: int, tags: Dict[str, str]) -> None: ...
     def filtered_nodes(self) -> List[int]: ...
+    def set_locations(self, enable: bool) -> None: ...
+    def location(self, osmid: int) -> Optional[Tuple[float, float]]: ...
+    def locations(self, osmids: List[int]) -> List[Optional[Tuple[float, float]]]: ...
+    def locations_count(self) -> int: ...
     def way(self, osmid: int, tags: Dict, refs: List[int]) -> None: ...
     def filtered_ways(self) -> List[int]: ...
     def relation(
         self, osmid: int, tags: Dict, ref: List[Dict[str, Union[str, int]]]
     ) -> None: ...
     def filtered_relations(self) -> List[int]: ...
+    def objects(self, groups: List[Tuple[int, List[Dict]]]) -> None: ...
+    def set_interest_keys(self, kind: int, keys: Optional[Iterable[str]]) -> None: ...
 
-def read_osm_pbf(pbf: str, visitor: Visitor) -> None: ...
+def read_osm_pbf_blocks(
+    pbf: str, visitor: Visitor, blocks: List[Tuple[int, int]], batch: bool = False
+) -> None: ...
+def index_osm_pbf(pbf: str) -> List[Tuple[int, int, int, int, int]]: ...
+def read_osm_pbf(
+    pbf: str, visitor: Visitor, shard: int = 0, nb_shards: int = 1, batch: bool = False
+) -> None: ...
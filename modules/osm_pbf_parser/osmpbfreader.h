@@ -26,12 +26,14 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 */
 #pragma once
 
+#include <algorithm>
 #include <stdint.h>
 #include <netinet/in.h>
 #include <zlib.h>
 #include <string>
 #include <fstream>
 #include <iostream>
+#include <vector>
 
 // this describes the low-level blob storage
 #include <osmpbf/fileformat.pb.h>
@@ -64,6 +66,9 @@ struct Reference {
 
 typedef std::vector<Reference> References;
 
+// Key/values of an object, as indexes in the string table of the block
+typedef std::vector<std::pair<uint32_t, uint32_t> > TagIndexes;
+
 // Main function
 template<typename Visitor>
 void read_osm_pbf(const std::string & filename, Visitor & visitor);
@@ -101,6 +106,15 @@ Tags get_tags(const T& object, const OSMPBF::PrimitiveBlock &primblock){
     return result;
 }
 
+template<typename T>
+TagIndexes get_tag_indexes(const T& object){
+    TagIndexes result;
+    for(int i = 0; i < object.keys_size(); ++i){
+        result.push_back(std::make_pair(object.keys(i), object.vals(i)));
+    }
+    return result;
+}
+
 template<typename Visitor>
 struct Parser {
 
@@ -108,27 +122,83 @@ struct Parser {
         while(!this->file.eof() && !finished) {
             OSMPBF::BlobHeader header = this->read_header();
             if(!this->finished){
-                int32_t sz = this->read_blob(header);
                 if(header.type() == "OSMData") {
-                    this->parse_primitiveblock(sz);
+                    // Only decode the blocks belonging to this shard, skip the others
+                    if(this->block_index % this->nb_shards == this->shard) {
+                        int32_t sz = this->read_blob(header);
+                        visitor.block_callback(this->block_index);
+                        this->parse_primitiveblock(sz);
+                    }
+                    else if(visitor.locations_enabled() && !this->other_nodes_done) {
+                        // The node locations index needs the nodes of all
+                        // the shards. Nodes come first in the file, stop at
+                        // the first block without them.
+                        int32_t sz = this->read_blob(header);
+                        if(!this->parse_primitiveblock(sz, true))
+                            this->other_nodes_done = true;
+                    }
+                    else {
+                        this->skip_blob(header);
+                    }
+                    ++this->block_index;
                 }
                 else if(header.type() == "OSMHeader"){
+                    this->skip_blob(header);
                 }
                 else {
+                    this->skip_blob(header);
                     warn() << "  unknown blob type: " << header.type();
                 }
             }
         }
     }
 
-    Parser(const std::string & filename, Visitor & visitor)
-        : visitor(visitor), file(filename.c_str(), std::ios::binary ), finished(false)
+    // Report the offset in the file, the kinds and the id range of the
+    // objects of each data block
+    void index(){
+        while(!this->file.eof() && !finished) {
+            int64_t offset = this->file.tellg();
+            OSMPBF::BlobHeader header = this->read_header();
+            if(!this->finished){
+                if(header.type() == "OSMData") {
+                    int32_t sz = this->read_blob(header);
+                    this->index_primitiveblock(sz, offset);
+                    ++this->block_index;
+                }
+                else {
+                    this->skip_blob(header);
+                }
+            }
+        }
+    }
+
+    // Only parse the data blocks at the offsets, with their index in the file
+    void parse_blocks(const std::vector<std::pair<uint64_t, int64_t> > & blocks){
+        for(const auto & block: blocks) {
+            this->file.clear();
+            if(!this->file.seekg(block.second))
+                fatal() << "unable to seek to the block at " << block.second;
+            OSMPBF::BlobHeader header = this->read_header();
+            if(this->finished || header.type() != "OSMData")
+                fatal() << "no data block at " << block.second;
+            int32_t sz = this->read_blob(header);
+            visitor.block_callback(block.first);
+            this->parse_primitiveblock(sz);
+        }
+    }
+
+    Parser(const std::string & filename, Visitor & visitor, uint64_t shard = 0, uint64_t nb_shards = 1, bool verbose = true)
+        : visitor(visitor), file(filename.c_str(), std::ios::binary ), finished(false),
+          shard(shard), nb_shards(nb_shards), block_index(0), other_nodes_done(false), verbose(verbose)
     {
+        if(nb_shards == 0 || shard >= nb_shards)
+            fatal() << "Invalid shard " << shard << " of " << nb_shards;
         if(!file.is_open())
             fatal() << "Unable to open the file " << filename;
         buffer = new char[max_uncompressed_blob_size];
         unpack_buffer = new char[max_uncompressed_blob_size];
-        info() << "Reading the file" << filename;
+        if(verbose)
+            info() << "Reading the file" << filename;
     }
 
     ~Parser(){
@@ -142,6 +212,11 @@ private:
     char* buffer;
     char* unpack_buffer;
     bool finished;
+    uint64_t shard;
+    uint64_t nb_shards;
+    uint64_t block_index;
+    bool other_nodes_done;
+    bool verbose;
 
     OSMPBF::BlobHeader read_header(){
         int32_t sz;
@@ -149,7 +224,8 @@ private:
 
         // read the first 4 bytes of the file, this is the size of the blob-header
         if( !file.read((char*)&sz, 4) ){
-            info() << "We finished reading the file";
+            if(this->verbose)
+                info() << "We finished reading the file";
             this->finished = true;
             return result;
         }
@@ -169,6 +245,11 @@ private:
         return result;
     }
 
+    void skip_blob(const OSMPBF::BlobHeader & header){
+        if(!this->file.seekg(header.datasize(), std::ios::cur))
+            fatal() << "unable to skip blob from file";
+    }
+
     int32_t read_blob(const OSMPBF::BlobHeader & header){
         OSMPBF::Blob blob;
         // size of the following blob
@@ -226,13 +307,89 @@ private:
         return 0;
     }
 
-    void parse_primitiveblock(int32_t sz) {
+    // Report the node locations, in units of 100 nanodegrees
+    void index_locations(const OSMPBF::PrimitiveGroup& pg, const OSMPBF::PrimitiveBlock &primblock) {
+        for(int i = 0; i < pg.nodes_size(); ++i) {
+            const OSMPBF::Node& n = pg.nodes(i);
+            visitor.location_callback(n.id(),
+                (primblock.lon_offset() + primblock.granularity() * n.lon()) / 100,
+                (primblock.lat_offset() + primblock.granularity() * n.lat()) / 100);
+        }
+        if(pg.has_dense()) {
+            const OSMPBF::DenseNodes& dn = pg.dense();
+            int64_t id = 0, lon = 0, lat = 0;
+            for(int i = 0; i < dn.id_size(); ++i) {
+                id += dn.id(i);
+                lon += dn.lon(i);
+                lat += dn.lat(i);
+                visitor.location_callback(id,
+                    (primblock.lon_offset() + primblock.granularity() * lon) / 100,
+                    (primblock.lat_offset() + primblock.granularity() * lat) / 100);
+            }
+        }
+    }
+
+    void index_primitiveblock(int32_t sz, int64_t offset) {
         OSMPBF::PrimitiveBlock primblock;
         if(!primblock.ParseFromArray(this->unpack_buffer, sz))
             fatal() << "unable to parse primitive block";
 
+        // Id range by kind: node, way, relation
+        bool found[3] = {false, false, false};
+        int64_t min_id[3], max_id[3];
+        auto add = [&](int kind, int64_t id) {
+            if(!found[kind]) {
+                found[kind] = true;
+                min_id[kind] = max_id[kind] = id;
+            }
+            else {
+                min_id[kind] = std::min(min_id[kind], id);
+                max_id[kind] = std::max(max_id[kind], id);
+            }
+        };
+        for(int i = 0, l = primblock.primitivegroup_size(); i < l; i++) {
+            const OSMPBF::PrimitiveGroup& pg = primblock.primitivegroup(i);
+            for(int j = 0; j < pg.nodes_size(); ++j)
+                add(0, pg.nodes(j).id());
+            if(pg.has_dense()) {
+                int64_t id = 0;
+                for(int j = 0; j < pg.dense().id_size(); ++j) {
+                    id += pg.dense().id(j);
+                    add(0, id);
+                }
+            }
+            for(int j = 0; j < pg.ways_size(); ++j)
+                add(1, pg.ways(j).id());
+            for(int j = 0; j < pg.relations_size(); ++j)
+                add(2, pg.relations(j).id());
+        }
+        for(int kind = 0; kind < 3; ++kind)
+            if(found[kind])
+                visitor.index_callback(this->block_index, offset, kind, min_id[kind], max_id[kind]);
+    }
+
+    // With locations_only, only report the node locations. Returns if the
+    // block has nodes.
+    bool parse_primitiveblock(int32_t sz, bool locations_only = false) {
+        OSMPBF::PrimitiveBlock primblock;
+        if(!primblock.ParseFromArray(this->unpack_buffer, sz))
+            fatal() << "unable to parse primitive block";
+
+        // In batch mode the visitor gets the string table and the objects
+        // with string indexes, then the whole block at once
+        bool batch = !locations_only && visitor.batch_enabled();
+        if(batch)
+            visitor.strings_callback(primblock.stringtable());
+
+        bool has_nodes = false;
         for(int i = 0, l = primblock.primitivegroup_size(); i < l; i++) {
             const OSMPBF::PrimitiveGroup& pg = primblock.primitivegroup(i);
+            has_nodes = has_nodes || pg.nodes_size() > 0 || pg.has_dense();
+
+            if(visitor.locations_enabled())
+                this->index_locations(pg, primblock);
+            if(locations_only)
+                continue;
 
             // Simple Nodes
             for(int i = 0; i < pg.nodes_size(); ++i) {
@@ -241,7 +398,10 @@ private:
                 double lon = 0.000000001 * (primblock.lon_offset() + (primblock.granularity() * n.lon())) ;
                 double lat = 0.000000001 * (primblock.lat_offset() + (primblock.granularity() * n.lat())) ;
                 uint64_t timestamp = n.info().has_timestamp() ? n.info().timestamp() : 0;
-                visitor.node_callback(n.id(), lon, lat, get_tags(n, primblock), timestamp);
+                if(batch)
+                    visitor.batch_node_callback(n.id(), lon, lat, get_tag_indexes(n), timestamp);
+                else
+                    visitor.node_callback(n.id(), lon, lat, get_tags(n, primblock), timestamp);
             }
 
             // Dense Nodes
@@ -260,17 +420,26 @@ private:
                     lat +=  0.000000001 * (primblock.lat_offset() + (primblock.granularity() * dn.lat(i)));
 
                     Tags tags;
+                    TagIndexes tag_indexes;
                     while (current_kv < dn.keys_vals_size() && dn.keys_vals(current_kv) != 0){
                         uint64_t key = dn.keys_vals(current_kv);
                         uint64_t val = dn.keys_vals(current_kv + 1);
-                        std::string key_string = primblock.stringtable().s(key);
-                        std::string val_string = primblock.stringtable().s(val);
                         current_kv += 2;
-                        tags[key_string] = val_string;
+                        if(batch) {
+                            tag_indexes.push_back(std::make_pair(key, val));
+                        }
+                        else {
+                            std::string key_string = primblock.stringtable().s(key);
+                            std::string val_string = primblock.stringtable().s(val);
+                            tags[key_string] = val_string;
+                        }
                     }
                     ++current_kv;
                     timestamp += dn.has_denseinfo() ? dn.denseinfo().timestamp(i) : 0;
-                    visitor.node_callback(id, lon, lat, tags, timestamp);
+                    if(batch)
+                        visitor.batch_node_callback(id, lon, lat, tag_indexes, timestamp);
+                    else
+                        visitor.node_callback(id, lon, lat, tags, timestamp);
                 }
             }
 
@@ -285,12 +454,21 @@ private:
                 }
                 uint64_t id = w.id();
                 uint64_t timestamp = w.info().has_timestamp() ? w.info().timestamp() : 0;
-                visitor.way_callback(id, get_tags(w, primblock), refs, timestamp);
+                if(batch)
+                    visitor.batch_way_callback(id, get_tag_indexes(w), refs, timestamp);
+                else
+                    visitor.way_callback(id, get_tags(w, primblock), refs, timestamp);
             }
 
 
             for(int i=0; i < pg.relations_size(); ++i){
                 const OSMPBF::Relation& rel = pg.relations(i);
+                uint64_t timestamp = rel.info().has_timestamp() ? rel.info().timestamp() : 0;
+                if(batch) {
+                    visitor.batch_relation_callback(rel, get_tag_indexes(rel), timestamp);
+                    continue;
+                }
+
                 uint64_t id = 0;
                 References refs;
 
@@ -299,10 +477,12 @@ private:
                     refs.push_back(Reference(rel.types(l), id, primblock.stringtable().s(rel.roles_sid(l))));
                 }
 
-                uint64_t timestamp = rel.info().has_timestamp() ? rel.info().timestamp() : 0;
                 visitor.relation_callback(rel.id(), get_tags(rel, primblock), refs, timestamp);
             }
         }
+        if(batch)
+            visitor.batch_end_callback();
+        return has_nodes;
     }
 };
 
@@ -312,4 +492,25 @@ void read_osm_pbf(const std::string & filename, Visitor & visitor){
     p.parse();
 }
 
+// Only index the data blocks
+template<typename Visitor>
+void index_osm_pbf(const std::string & filename, Visitor & visitor){
+    Parser<Visitor> p(filename, visitor);
+    p.index();
+}
+
+// Only parse the data blocks at the offsets
+template<typename Visitor>
+void read_osm_pbf_blocks(const std::string & filename, Visitor & visitor, const std::vector<std::pair<uint64_t, int64_t> > & blocks){
+    Parser<Visitor> p(filename, visitor, 0, 1, false);
+    p.parse_blocks(blocks);
+}
+
+// Only parse the data blocks whose index modulo nb_shards is shard
+template<typename Visitor>
+void read_osm_pbf_shard(const std::string & filename, Visitor & visitor, uint64_t shard, uint64_t nb_shards){
+    Parser<Visitor> p(filename, visitor, shard, nb_shards);
+    p.parse();
+}
+
 }
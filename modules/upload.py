@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Upload of the analyser results to the frontend, in a background thread
+# while the next analysers run. Pending uploads are copied to a spool
+# directory, the ones left by a failed or interrupted run are sent again by
+# the next runs, for max_runs runs and max_age seconds.
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import traceback
+
+import requests
+
+from . import OsmoseLog
+
+
+class UploadQueue:
+    """
+    Upload results in order, with one HTTP session by frontend URL. The
+    frontend password of an analyser is only asked to password_for(analyser)
+    when sending, it is not spooled. put() blocks while maxsize uploads are waiting, with maxsize 0 it waits for the
+    upload. close() waits for all the uploads and returns the error code of
+    the failed ones of this run: 1 not uploaded, 4 refused by the frontend.
+    The failures of the uploads resumed from a previous run are only logged,
+    in resumed_err_code.
+    """
+
+    def __init__(
+        self,
+        spool_dir,
+        password_for,
+        logger=OsmoseLog.logger(),
+        maxsize=2,
+        retries=3,
+        retry_delay=15,
+        timeout=1800,
+        max_runs=3,
+        max_age=3 * 24 * 3600,
+    ):
+        self.spool_dir = spool_dir
+        self.password_for = password_for
+        self.logger = logger
+        self.sync = maxsize == 0
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.err_code = 0
+        self.resumed_err_code = 0
+        self._queue = queue.Queue(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self._sessions = {}
+        # Spooled job name by url, country and analyser, only the last result
+        # of an analyser is uploaded
+        self._pending = {}
+
+        os.makedirs(spool_dir, exist_ok=True)
+        names = os.listdir(spool_dir)
+        names = list(filter(lambda f: f.split(".")[0].isdigit(), names))
+        self._seq = max(map(lambda f: int(f.split(".")[0]), names), default=0)
+        spooled = sorted(
+            filter(lambda f: f.endswith(".json"), names),
+            key=lambda f: tuple(map(int, f.split(".")[0:2])),
+        )
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        for name in spooled:
+            name = name[: -len(".json")]
+            try:
+                with open(self._path(name + ".json"), encoding="utf-8") as f:
+                    job = json.load(f)
+                job["runs"] += 1
+            except (OSError, ValueError, KeyError, TypeError):
+                self._remove(name)
+                continue
+            if job["runs"] > max_runs or time.time() - job["time"] > max_age:
+                self.logger.err(
+                    "drop upload of {0}/{1} to {2}, failed on {3} runs".format(
+                        job["country"], job["analyser"], job["url"], job["runs"]
+                    )
+                )
+                self._remove(name)
+                continue
+            self._write(name, job)
+            self.logger.log(
+                "resume upload of {0}/{1}".format(job["country"], job["analyser"])
+            )
+            self._spooled(name, job, resumed=True)
+        # Result files without upload
+        for name in names:
+            if name.endswith(".data") or name.endswith(".tmp"):
+                self._remove_data(name.split(".")[0])
+
+    def _path(self, name):
+        return os.path.join(self.spool_dir, name)
+
+    def _remove(self, name):
+        try:
+            os.remove(self._path(name + ".json"))
+        except OSError:
+            pass
+        self._remove_data(name.split(".")[0])
+
+    def _remove_data(self, seq):
+        # The result file is shared by the uploads to each URL
+        with self._lock:
+            if not any(
+                map(
+                    lambda f: f.startswith(seq + ".") and f.endswith(".json"),
+                    os.listdir(self.spool_dir),
+                )
+            ):
+                for ext in (".data", ".tmp"):
+                    try:
+                        os.remove(self._path(seq + ext))
+                    except OSError:
+                        pass
+
+    def _write(self, name, job):
+        tmp = self._path(name + ".json.tmp")
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump(job, f)
+        os.replace(tmp, self._path(name + ".json"))
+
+    def put(self, urls, analyser, country, path):
+        """
+        Spool the result file path of analyser, and queue its upload to each
+        of urls.
+        """
+        with self._lock:
+            self._seq += 1
+            seq = "{0:08d}".format(self._seq)
+        shutil.copyfile(path, self._path(seq + ".tmp"))
+        os.replace(self._path(seq + ".tmp"), self._path(seq + ".data"))
+        jobs = []
+        for i, url in enumerate(urls):
+            job = {
+                "url": url,
+                "analyser": analyser,
+                "country": country,
+                "data": seq + ".data",
+                "time": time.time(),
+                "runs": 0,
+            }
+            name = "{0}.{1}".format(seq, i)
+            self._write(name, job)
+            jobs.append((name, job))
+        for name, job in jobs:
+            self._spooled(name, job)
+        if self.sync:
+            self._queue.join()
+
+    def _spooled(self, name, job, resumed=False):
+        key = (job["url"], job["country"], job["analyser"])
+        with self._lock:
+            previous = self._pending.get(key)
+            self._pending[key] = name
+        if previous:
+            # Not uploaded yet, replaced by the new result
+            self._remove(previous)
+        self._queue.put((name, job, resumed))
+
+    def close(self):
+        """
+        Wait for the queued uploads, return the error code of the failed ones.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self.resumed_err_code:
+            self.logger.err(
+                "uploads resumed from a previous run failed: error code {0}".format(
+                    self.resumed_err_code
+                )
+            )
+        return self.err_code
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                name, job, resumed = item
+                if os.path.exists(self._path(name + ".json")):
+                    err_code = self._upload(name, job)
+                    key = (job["url"], job["country"], job["analyser"])
+                    with self._lock:
+                        if resumed:
+                            self.resumed_err_code |= err_code
+                        else:
+                            self.err_code |= err_code
+                        if self._pending.get(key) == name:
+                            del self._pending[key]
+                    if err_code & 4:
+                        # Refused, sending it again will not help
+                        self.logger.err(
+                            "drop upload of {0}/{1} to {2}, refused".format(
+                                job["country"], job["analyser"], job["url"]
+                            )
+                        )
+                    if err_code == 0 or err_code & 4:
+                        self._remove(name)
+            except Exception:
+                tb = traceback.format_exc()
+                self.logger.err("error on upload...")
+                for l in tb.splitlines():
+                    self.logger.sub().log(l)
+                with self._lock:
+                    if item[2]:
+                        self.resumed_err_code |= 1
+                    else:
+                        self.err_code |= 1
+            finally:
+                self._queue.task_done()
+
+    def _session(self, url):
+        if url not in self._sessions:
+            session = requests.Session()
+            session.headers["User-Agent"] = (
+                "python-requests - https://osmose.openstreetmap.fr/"
+            )
+            self._sessions[url] = session
+        return self._sessions[url]
+
+    def _upload(self, name, job):
+        logger = self.logger
+        logger.log("update {0}/{1}".format(job["country"], job["analyser"]))
+        password = self.password_for(job["analyser"])
+        if not password:
+            logger.sub().err("No password to upload result to %s" % job["url"])
+            return 1
+        err_code = 0
+        update_finished = False
+        nb_iter = 0
+        was_on_timeout = False
+        while not update_finished and nb_iter < self.retries:
+            time.sleep(nb_iter * self.retry_delay)
+            nb_iter += 1
+            logger.sub().log("iteration=%d" % nb_iter)
+            r = None
+            try:
+                u = (
+                    job["url"]
+                    + "?analyser="
+                    + job["analyser"]
+                    + "&country="
+                    + job["country"]
+                )
+                with open(self._path(job["data"]), "rb") as content:
+                    r = self._session(job["url"]).post(
+                        u,
+                        timeout=self.timeout,
+                        data={
+                            "analyser": job["analyser"],
+                            "country": job["country"],
+                            "code": password,
+                        },
+                        files={"content": content},
+                    )
+                r.raise_for_status()
+                logger.sub().log(r.text.strip())
+                update_finished = True
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 504:
+                    was_on_timeout = True
+                    logger.sub().sub().err("got an HTTP timeout status")
+                else:
+                    dt = r.text.strip()
+                    logger.sub().sub().err(
+                        "UPDATE ERROR %s/%s : %s\n"
+                        % (job["country"], job["analyser"], dt)
+                    )
+                    if dt == "FAIL: Already up to date":
+                        update_finished = True
+                    if nb_iter >= self.retries and not was_on_timeout:
+                        err_code |= 4
+            except Exception as e:
+                if isinstance(e, requests.exceptions.ConnectTimeout):
+                    was_on_timeout = True
+                    logger.sub().sub().err("got a connection timeout")
+                else:
+                    tb = traceback.format_exc()
+                    logger.err("error on update...")
+                    for l in tb.splitlines():
+                        logger.sub().log(l)
+                # Connect again on the next iteration
+                self._sessions.pop(job["url"], None)
+
+        if not update_finished:
+            err_code |= 1
+        return err_code
+
+
+###########################################################################
+import tempfile
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Frontend(BaseHTTPRequestHandler):
+    # Keep the connections open between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server.wait.wait(5)
+        with server.lock:
+            server.requests.append((self.path, self.client_address, body))
+            status, text = server.responses.pop(0) if server.responses else (200, "OK")
+        text = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(text)))
+        self.end_headers()
+        self.wfile.write(text)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Frontend)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.responses = []
+        self.server.wait = threading.Event()
+        self.server.wait.set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{0}/control/send-update".format(
+            self.server.server_address[1]
+        )
+        self.dirname = tempfile.mkdtemp()
+        self.spool = os.path.join(self.dirname, "spool")
+        self.result = os.path.join(self.dirname, "result.xml.bz2")
+        with open(self.result, "wb") as f:
+            f.write(b"result")
+        self.logger = OsmoseLog.logger(open(os.devnull, "w"))
+        self.passwords = {"a1": "pass", "a2": "pass", "a3": "pass", "a4": "pass"}
+
+    def tearDown(self):
+        self.server.wait.set()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.dirname)
+
+    def uploads(self, **kwargs):
+        return UploadQueue(
+            self.spool,
+            lambda analyser: self.passwords.get(analyser),
+            self.logger,
+            retry_delay=0,
+            **kwargs
+        )
+
+    def test_upload(self):
+        uploads = self.uploads()
+        for analyser in ("a1", "a2", "a3"):
+            uploads.put([self.url], analyser, "monaco", self.result)
+        self.assertEqual(uploads.close(), 0)
+
+        self.assertEqual(
+            list(map(lambda r: r[0].split("?")[1], self.server.requests)),
+            [
+                "analyser=a1&country=monaco",
+                "analyser=a2&country=monaco",
+                "analyser=a3&country=monaco",
+            ],
+        )
+        self.assertIn(b'name="code"\r\n\r\npass\r\n', self.server.requests[0][2])
+        self.assertIn(b"result", self.server.requests[0][2])
+        # One connection for all the uploads
+        self.assertEqual(len(set(map(lambda r: r[1], self.server.requests))), 1)
+        self.assertEqual(os.listdir(self.spool), [])
+
+    def test_background(self):
+        # put() returns while the previous results are uploading
+        self.server.wait.clear()
+        uploads = self.uploads(maxsize=2)
+        uploads.put([self.url], "a1", "monaco", self.result)
+        uploads.put([self.url], "a2", "monaco", self.result)
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(len(os.listdir(self.spool)), 4)  # 2 jobs and results
+        self.server.wait.set()
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(len(self.server.requests), 2)
+
+        # Synchronous
+        uploads = self.uploads(maxsize=0)
+        uploads.put([self.url], "a3", "monaco", self.result)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(uploads.close(), 0)
+
+    def test_errors(self):
+        # Refused, not spooled for the next run
+        self.server.responses = [(500, "FAIL")] * 3
+        uploads = self.uploads()
+        uploads.put([self.url], "a1", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1 | 4)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(os.listdir(self.spool), [])
+
+        self.server.responses = [(400, "FAIL: Already up to date")]
+        uploads = self.uploads()
+        uploads.put([self.url], "a2", "monaco", self.result)
+        self.assertEqual(uploads.close(), 0)
+
+        self.server.responses = [(504, "")] * 3
+        uploads = self.uploads()
+        uploads.put([self.url], "a3", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1)
+        shutil.rmtree(self.spool)
+
+        uploads = self.uploads()
+        uploads.put(["http://127.0.0.1:1/"], "a4", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1)
+
+    def test_spool(self):
+        # Failed uploads are sent again by the next runs
+        self.server.responses = [(504, "")] * 3
+        uploads = self.uploads()
+        uploads.put([self.url], "a1", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1)
+        os.remove(self.result)
+        # Without the password
+        with open(os.path.join(self.spool, "00000001.0.json")) as f:
+            self.assertEqual(
+                sorted(json.load(f).keys()),
+                ["analyser", "country", "data", "runs", "time", "url"],
+            )
+
+        # Not in the error code of the next run
+        self.server.responses = [(504, "")] * 3
+        uploads = self.uploads()
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(uploads.resumed_err_code, 1)
+
+        # Kept while the password is unknown
+        del self.passwords["a1"]
+        self.server.requests = []
+        uploads = self.uploads()
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(uploads.resumed_err_code, 1)
+        self.assertEqual(self.server.requests, [])
+
+        # The password of the run sending it
+        self.passwords["a1"] = "new"
+        uploads = self.uploads(max_runs=4)
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(uploads.resumed_err_code, 0)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertIn(b"result", self.server.requests[0][2])
+        self.assertIn(b'name="code"\r\n\r\nnew\r\n', self.server.requests[0][2])
+        self.assertEqual(os.listdir(self.spool), [])
+
+    def test_spool_drop(self):
+        self.server.responses = [(504, "")] * 9
+        uploads = self.uploads(max_runs=2)
+        uploads.put([self.url], "a1", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1)
+        for _i in range(2):
+            self.assertEqual(self.uploads(max_runs=2).close(), 0)
+        self.assertEqual(len(self.server.requests), 9)
+
+        # Dropped after max_runs
+        uploads = self.uploads(max_runs=2)
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(len(self.server.requests), 9)
+        self.assertEqual(os.listdir(self.spool), [])
+
+        # Or max_age
+        self.server.responses = [(504, "")] * 3
+        uploads = self.uploads()
+        uploads.put([self.url], "a1", "monaco", self.result)
+        self.assertEqual(uploads.close(), 1)
+        self.assertEqual(self.uploads(max_age=-1).close(), 0)
+        self.assertEqual(os.listdir(self.spool), [])
+
+    def test_urls(self):
+        # The result is spooled once for all the URLs
+        self.server.wait.clear()
+        uploads = self.uploads()
+        uploads.put([self.url, self.url + "2"], "a1", "monaco", self.result)
+        self.assertEqual(
+            sorted(os.listdir(self.spool)),
+            ["00000001.0.json", "00000001.1.json", "00000001.data"],
+        )
+        self.server.wait.set()
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(
+            list(map(lambda r: r[0].split("?")[0][-1], self.server.requests)),
+            ["e", "2"],
+        )
+        self.assertEqual(os.listdir(self.spool), [])
+
+    def test_replaced(self):
+        # Only the last result of an analyser is uploaded
+        self.server.wait.clear()
+        uploads = self.uploads(maxsize=4)
+        uploads.put([self.url], "a1", "monaco", self.result)
+        uploads.put([self.url], "a2", "monaco", self.result)
+        with open(self.result, "wb") as f:
+            f.write(b"newer")
+        uploads.put([self.url], "a2", "monaco", self.result)
+        self.server.wait.set()
+        self.assertEqual(uploads.close(), 0)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIn(b"newer", self.server.requests[1][2])
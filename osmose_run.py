@@ -20,6 +20,7 @@
 #                                                                      ##
 ###########################################################################
 
+import concurrent.futures
 import importlib
 import inspect
 import os
@@ -29,11 +30,12 @@ import time
 import traceback
 
 import dateutil.parser
-import requests
 
 import modules.config
 import modules.OsmOsisManager
 import osmose_config as config
+from analysers.Analyser_Merge import Analyser_Merge
+from analysers.Analyser_Osmosis import Analyser_Osmosis
 from modules import (
     IssuesFileCsv,
     IssuesFileGeoJson,
@@ -41,6 +43,7 @@ from modules import (
     OsmoseLog,
     download,
     downloader,
+    upload,
 )
 from modules.lockfile import lockfile
 
@@ -135,8 +138,17 @@ class analyser_config:
 
         self.verbose = options.verbose
 
+        self.sax_workers = options.sax_workers
+        self.db_itersize = options.db_itersize
+        self.sql_profile = None
+        self.mapcss_cache_size = options.mapcss_cache_size
+        self.sax_tags_cache_size = options.sax_tags_cache_size
+        self.sax_node_locations = options.sax_node_locations
+        self.sax_interest_keys = options.sax_interest_keys
+
         if options.change and xml_change:
             self.src = xml_change
+            self.src_state = os.path.join(conf.download["diff_path"], "state.txt")
         elif "dst" in conf.download:
             self.src = conf.download["dst"]
             if "diff_path" in conf.download:
@@ -162,6 +174,63 @@ def issues_file_from_fromat(dst, format, bz2=False, version=None, polygon_id=Non
     return c(dst, version, polygon_id)
 
 
+def analyser_classes(module, analyser):
+    return [
+        (name, obj)
+        for name, obj in inspect.getmembers(module)
+        if inspect.isclass(obj)
+        and obj.__module__ == "analysers.analyser_" + analyser
+        and (name.startswith("Analyser") or name.startswith("analyser"))
+    ]
+
+
+def parallel_analyser(module, analyser, options):
+    # Only read the imported data and build temporary tables, so can run
+    # concurrently on their own database connections. Resume mode updates
+    # the shared touched objects tables, so keep it sequential.
+    if options.resume or (
+        options.resume_analyser and analyser in options.resume_analyser
+    ):
+        return False
+    classes = analyser_classes(module, analyser)
+    return len(classes) > 0 and all(
+        issubclass(obj, Analyser_Osmosis) and not issubclass(obj, Analyser_Merge)
+        for name, obj in classes
+    )
+
+
+def requires_tables_prebuild(
+    conf, options, osmosis_manager, xml_change, classes, logger
+):
+    # Build once the tables shared by the analysers, before running them
+    # concurrently. The touched views are temporary, built by each analyser.
+    tables = []
+    for obj in classes:
+        for table in getattr(obj, "requires_tables_common", []) + getattr(
+            obj,
+            (
+                "requires_tables_diff"
+                if options.change and xml_change
+                else "requires_tables_full"
+            ),
+            [],
+        ):
+            for prefix in ["touched_", "not_touched_"]:
+                if table.startswith(prefix):
+                    table = table[len(prefix) :]
+            if table not in tables:
+                tables.append(table)
+
+    analyser_conf = analyser_config(conf, options, osmosis_manager, xml_change)
+    analyser_conf.error_file = None
+    if options.profile_sql:
+        analyser_conf.sql_profile = os.path.join(
+            conf.dir_results, "requires_tables-" + conf.country + ".sql-profile.json"
+        )
+    with Analyser_Osmosis(analyser_conf, logger) as analyser_obj:
+        analyser_obj.requires_tables_build(tables)
+
+
 def execc(conf, logger, analysers, options, osmosis_manager):
     err_code = 0
 
@@ -252,13 +321,35 @@ def execc(conf, logger, analysers, options, osmosis_manager):
     lunched_analyser_change = []
     lunched_analyser_resume = []
 
-    for analyser in analysers:
+    analyser_times = []
+
+    # Results are uploaded while the next analysers run
+    uploads = None
+    if not options.skip_upload:
+
+        def upload_password(analyser_name):
+            # Not spooled with the results, looked up when sending them
+            for analyser, module in analysers.items():
+                if analyser in conf.analyser and any(
+                    name[len("Analyser_") :] == analyser_name
+                    for name, obj in analyser_classes(module, analyser)
+                ):
+                    return conf.analyser[analyser]
+
+        uploads = upload.UploadQueue(
+            os.path.join(modules.config.dir_work, "upload-spool", conf.country),
+            upload_password,
+            logger.sub(),
+            maxsize=options.upload_queue_size,
+        )
+
+    def execc_analyser(analyser):
+        err_code = 0
+        start = time.time()
+
         if os.getenv("SENTRY_DSN"):
             sentry_sdk.set_tag("analyser", analyser)
 
-        if not options.analyser and analyser not in conf.analyser:
-            continue
-
         logger.log(logger.log_av_r + conf.country + " : " + analyser + logger.log_ap)
 
         password = conf.analyser.get(analyser)
@@ -281,6 +372,8 @@ def execc(conf, logger, analysers, options, osmosis_manager):
                     )
 
                     dst = os.path.join(conf.dir_results, name + "-" + conf.country)
+                    if options.profile_sql:
+                        analyser_conf.sql_profile = dst + ".sql-profile.json"
                     analyser_conf.error_file = issues_file_from_fromat(
                         dst,
                         options.result_format,
@@ -373,79 +466,20 @@ def execc(conf, logger, analysers, options, osmosis_manager):
                                     lunched_analyser_change.append([obj, analyser_conf])
 
                     # update
-                    if not options.skip_upload and password != "xxx":
-                        logger.sub().log("update")
+                    if uploads and password != "xxx":
+                        logger.sub().log("update queued")
 
                         if analyser in conf.analyser_updt_url:
                             list_urls = conf.analyser_updt_url[analyser]
                         else:
                             list_urls = [conf.updt_url]
 
-                        for url in list_urls:
-                            update_finished = False
-                            nb_iter = 0
-                            was_on_timeout = False
-                            while not update_finished and nb_iter < 3:
-                                time.sleep(nb_iter * 15)
-                                nb_iter += 1
-                                logger.sub().sub().log("iteration=%d" % nb_iter)
-                                try:
-                                    u = (
-                                        url
-                                        + "?analyser="
-                                        + analyser_name
-                                        + "&country="
-                                        + conf.country
-                                    )
-                                    r = requests.post(
-                                        u,
-                                        timeout=1800,
-                                        data={
-                                            "analyser": analyser_name,
-                                            "country": conf.country,
-                                            "code": password,
-                                        },
-                                        files={
-                                            "content": open(
-                                                analyser_conf.error_file.dst, "rb"
-                                            )
-                                        },
-                                    )
-                                    r.raise_for_status()
-                                    logger.sub().sub().log(r.text.strip())
-                                    update_finished = True
-                                except requests.exceptions.HTTPError as e:
-                                    if e.response.status_code == 504:
-                                        was_on_timeout = True
-                                        logger.sub().sub().sub().err(
-                                            "got an HTTP timeout status"
-                                        )
-                                    else:
-                                        dt = r.text.strip()
-                                        logger.sub().sub().sub().err(
-                                            "UPDATE ERROR %s/%s : %s\n"
-                                            % (conf.country, analyser_name, dt)
-                                        )
-                                        if dt == "FAIL: Already up to date":
-                                            update_finished = True
-                                        if nb_iter >= 3 and not was_on_timeout:
-                                            err_code |= 4
-                                except Exception as e:
-                                    if isinstance(
-                                        e, requests.exceptions.ConnectTimeout
-                                    ):
-                                        was_on_timeout = True
-                                        logger.sub().sub().sub().err(
-                                            "got a connection timeout"
-                                        )
-                                    else:
-                                        tb = traceback.format_exc()
-                                        logger.sub().err("error on update...")
-                                        for l in tb.splitlines():
-                                            logger.sub().sub().log(l)
-
-                        if not update_finished:
-                            err_code |= 1
+                        uploads.put(
+                            list_urls,
+                            analyser_name,
+                            conf.country,
+                            analyser_conf.error_file.dst,
+                        )
 
         except Exception as e:
             tb = traceback.format_exc()
@@ -455,7 +489,78 @@ def execc(conf, logger, analysers, options, osmosis_manager):
             err_code |= 2
             if os.getenv("SENTRY_DSN"):
                 sentry_sdk.capture_exception(e)
-            continue
+        finally:
+            analyser_times.append((analyser, time.time() - start))
+            logger.sub().log(
+                "{0} done in {1:.1f}s".format(analyser, analyser_times[-1][1])
+            )
+
+        return err_code
+
+    selected = [
+        analyser
+        for analyser in analysers
+        if options.analyser or analyser in conf.analyser
+    ]
+    parallel = []
+    if options.db_slots > 1 and osmosis_manager and not options.skip_analyser:
+        parallel = [
+            analyser
+            for analyser in selected
+            if parallel_analyser(analysers[analyser], analyser, options)
+        ]
+
+    # The concurrent analysers run together, after the other ones
+    for analyser in selected:
+        if analyser not in parallel:
+            err_code |= execc_analyser(analyser)
+
+    if parallel:
+        logger.log(
+            logger.log_av_r
+            + "{0} osmosis analysers on {1} database slots".format(
+                len(parallel), options.db_slots
+            )
+            + logger.log_ap
+        )
+        start = time.time()
+        try:
+            requires_tables_prebuild(
+                conf,
+                options,
+                osmosis_manager,
+                xml_change,
+                [
+                    obj
+                    for analyser in parallel
+                    for name, obj in analyser_classes(analysers[analyser], analyser)
+                ],
+                logger.sub(),
+            )
+        except Exception:
+            tb = traceback.format_exc()
+            logger.sub().err("error on shared tables build, run analysers one by one")
+            for l in tb.splitlines():
+                logger.sub().sub().log(l)
+            for analyser in parallel:
+                err_code |= execc_analyser(analyser)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=options.db_slots
+            ) as executor:
+                for analyser_err_code in executor.map(execc_analyser, parallel):
+                    err_code |= analyser_err_code
+        logger.log(
+            "osmosis analysers done in {0:.1f}s, {1:.1f}s of analysers time".format(
+                time.time() - start,
+                sum(t for analyser, t in analyser_times if analyser in parallel),
+            )
+        )
+
+    if options.verbose:
+        logger.log("analysers wall time")
+        for analyser, t in sorted(analyser_times, key=lambda a: -a[1]):
+            logger.sub().log("{0:>8.1f}s {1}".format(t, analyser))
 
     if os.getenv("SENTRY_DSN"):
         sentry_sdk.set_tag("analyser", None)
@@ -474,6 +579,10 @@ def execc(conf, logger, analysers, options, osmosis_manager):
             with obj(analyser_conf, logger.sub()) as analyser_obj:
                 analyser_obj.analyser_deferred_clean()
 
+    if uploads:
+        logger.log(logger.log_av_r + "waiting for uploads" + logger.log_ap)
+        err_code |= uploads.close()
+
     return err_code
 
 
@@ -707,6 +816,68 @@ if __name__ == "__main__":
         help="Plugin to run (can be repeated). For analyser 'sax' only",
     )
 
+    parser.add_option(
+        "--sax-workers",
+        dest="sax_workers",
+        type=int,
+        default=1,
+        help="Number of processes running the plugins. For analyser 'sax' only",
+    )
+
+    parser.add_option(
+        "--mapcss-cache-size",
+        dest="mapcss_cache_size",
+        type=int,
+        default=100000,
+        help="Maximum number of entries in each of the MapCSS plugins caches. For analyser 'sax' only",
+    )
+
+    parser.add_option(
+        "--sax-tags-cache-size",
+        dest="sax_tags_cache_size",
+        type=int,
+        default=100000,
+        help="Maximum number of tag sets in the cache of each plugin method only depending on the tags, 0 to disable. For analyser 'sax' only",
+    )
+
+    parser.add_option(
+        "--sax-node-locations",
+        dest="sax_node_locations",
+        action="store_true",
+        help="Index the location of all the nodes, about 16 bytes per node, to give way plugins their coordinates. For analyser 'sax' on PBF only",
+    )
+
+    parser.add_option(
+        "--no-sax-interest-keys",
+        dest="sax_interest_keys",
+        action="store_false",
+        default=True,
+        help="Give all the objects to all the plugins, even without any of the tag keys the plugins declare to react to. For analyser 'sax' only",
+    )
+
+    parser.add_option(
+        "--db-slots",
+        dest="db_slots",
+        type=int,
+        default=1,
+        help="Number of osmosis analysers run concurrently, each on its own database connection. When more than 1, the osmosis analysers run after all the other analysers",
+    )
+
+    parser.add_option(
+        "--db-itersize",
+        dest="db_itersize",
+        type=int,
+        default=2000,
+        help="Number of rows fetched at once from the osmosis analysers queries",
+    )
+
+    parser.add_option(
+        "--profile-sql",
+        dest="profile_sql",
+        action="store_true",
+        help="Record the time and the EXPLAIN ANALYZE plan of the osmosis analysers queries, in a JSON file next to the results",
+    )
+
     parser.add_option(
         "--change",
         dest="change",
@@ -763,6 +934,13 @@ if __name__ == "__main__":
         action="store_true",
         help="Don't upload the analyse result",
     )
+    parser.add_option(
+        "--upload-queue-size",
+        dest="upload_queue_size",
+        type="int",
+        default=2,
+        help="Number of analyse results waiting for upload before blocking the next analyser, 0 to upload before the next analyser",
+    )
     parser.add_option(
         "--no-clean",
         dest="no_clean",
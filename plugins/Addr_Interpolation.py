@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Addr_Interpolation(Plugin):
+    interest_keys = {"way": ["addr:interpolation"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
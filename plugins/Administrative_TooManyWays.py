@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Administrative_TooManyWays(Plugin):
+    interest_keys = {"relation": ["boundary"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -8,6 +8,20 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Bicycle(PluginMapCSS):
 
+    tags_only = ["way"]
+
+    interest_keys = {
+        "way": [
+            "bicycle",
+            "cycleway",
+            "cycleway:left",
+            "footway",
+            "highway",
+            "oneway",
+            "service",
+        ]
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -64,10 +78,10 @@ class Bicycle(PluginMapCSS):
             ),
         )
 
-        self.re_1825c777 = re.compile(r"footway|construction")
-        self.re_5b286a0d = re.compile(r"no|use_sidepath")
-        self.re_6781a1fd = re.compile(r"no|none|separate")
-        self.re_67b51e41 = re.compile(r"opposite|opposite_lane")
+        self.re_1825c777 = mapcss.lazy_regex(r"footway|construction")
+        self.re_5b286a0d = mapcss.lazy_regex(r"no|use_sidepath")
+        self.re_6781a1fd = mapcss.lazy_regex(r"no|none|separate")
+        self.re_67b51e41 = mapcss.lazy_regex(r"opposite|opposite_lane")
 
     def way(self, data, tags, nds):
         capture_tags = {}
@@ -8,6 +8,50 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Colour(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "building:colour",
+            "colour",
+            "colour:arrow",
+            "colour:back",
+            "colour:text",
+            "light:colour",
+            "ref:colour",
+            "roof:colour",
+            "seamark:buoy_lateral:colour",
+            "seamark:light:colour",
+            "seamark:topmark:colour",
+        ],
+        "way": [
+            "building:colour",
+            "colour",
+            "colour:arrow",
+            "colour:back",
+            "colour:text",
+            "light:colour",
+            "ref:colour",
+            "roof:colour",
+            "seamark:buoy_lateral:colour",
+            "seamark:light:colour",
+            "seamark:topmark:colour",
+        ],
+        "relation": [
+            "building:colour",
+            "colour",
+            "colour:arrow",
+            "colour:back",
+            "colour:text",
+            "light:colour",
+            "ref:colour",
+            "roof:colour",
+            "seamark:buoy_lateral:colour",
+            "seamark:light:colour",
+            "seamark:topmark:colour",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -30,13 +74,13 @@ class Colour(PluginMapCSS):
             resource="https://www.w3.org/TR/css-color-3/#svg-color",
         )
 
-        self.re_32723f56 = re.compile(
+        self.re_32723f56 = mapcss.lazy_regex(
             r"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|grey|green|greenyellow|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen|#[^;]*)(; ?(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|grey|green|greenyellow|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen|#[^;]*))*$"
         )
-        self.re_43080bc2 = re.compile(
+        self.re_43080bc2 = mapcss.lazy_regex(
             r"^(#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})|[^#;]+)(; ?(#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})|[^#;]+))*$"
         )
-        self.re_7d65c79d = re.compile(r"^([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$")
+        self.re_7d65c79d = mapcss.lazy_regex(r"^([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$")
 
     def node(self, data, tags):
         capture_tags = {}
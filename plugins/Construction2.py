@@ -8,6 +8,10 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Construction2(PluginMapCSS):
 
+    tags_only = ["way"]
+
+    interest_keys = {"way": ["construction", "highway", "proposed"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -8,6 +8,14 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Covid19(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["delivery:covid19", "opening_hours:covid19", "takeaway:covid19"],
+        "way": ["delivery:covid19", "opening_hours:covid19", "takeaway:covid19"],
+        "relation": ["delivery:covid19", "opening_hours:covid19", "takeaway:covid19"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -42,8 +50,8 @@ class Covid19(PluginMapCSS):
             ),
         )
 
-        self.re_3f390088 = re.compile(r"off|restricted")
-        self.re_64916a2b = re.compile(r"same|off|open|restricted")
+        self.re_3f390088 = mapcss.lazy_regex(r"off|restricted")
+        self.re_64916a2b = mapcss.lazy_regex(r"same|off|open|restricted")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -28,6 +28,7 @@ from .modules import Cuisine_Guess_lib
 class Cuisine_Guess(Plugin):
 
     only_for = ["FR"]
+    interest_keys = {"node": ["amenity"], "way": ["amenity"], "relation": ["amenity"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
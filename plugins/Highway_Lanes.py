@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 
 
 class Highway_Lanes(Plugin):
+    interest_keys = {"way": ["highway"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
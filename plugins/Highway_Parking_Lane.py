@@ -25,6 +25,7 @@ from plugins.Plugin import Plugin
 
 
 class Highway_Parking_Lane(Plugin):
+    interest_keys = {"way": ["highway"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 
 class Highway_Sides(Plugin):
+    interest_keys = {"way": ["highway"]}
+
     def init(self, logger):
         Plugin.init(self, logger)
 
@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 class Historic_Wayside_cross_without_material(Plugin):
 
     only_for = ["DE", "AT", "CH"]
+    interest_keys = {"node": ["historic"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
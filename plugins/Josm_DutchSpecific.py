@@ -25,6 +25,8 @@ class Josm_DutchSpecific(PluginMapCSS):
         "NL-NH",
     ]
 
+    tags_only = ["node", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -53,222 +55,256 @@ class Josm_DutchSpecific(PluginMapCSS):
             item=9020, level=3, tags=[], title=mapcss.tr("NL mofa tagging")
         )
 
-        self.re_011bedaa = re.compile(
+        self.re_011bedaa = mapcss.lazy_regex(
             r"^hgv(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_023db19d = re.compile(
+        self.re_023db19d = mapcss.lazy_regex(
             r"^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_033b234a = re.compile(r"^bicycle(:forward|:both_ways)?(:conditional)?$")
-        self.re_0660931d = re.compile(r"(?i)(oplaad|laadpunt|laadpaal)")
-        self.re_06bae8ee = re.compile(
+        self.re_033b234a = mapcss.lazy_regex(
+            r"^bicycle(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_0660931d = mapcss.lazy_regex(r"(?i)(oplaad|laadpunt|laadpaal)")
+        self.re_06bae8ee = mapcss.lazy_regex(
             r"^maxspeed:advisory(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_06ddeafa = re.compile(r"\bbouwweg")
-        self.re_076895f4 = re.compile(r"payment:O[vV][-_]?[cC]hipkaart")
-        self.re_08935e4d = re.compile(
+        self.re_06ddeafa = mapcss.lazy_regex(r"\bbouwweg")
+        self.re_076895f4 = mapcss.lazy_regex(r"payment:O[vV][-_]?[cC]hipkaart")
+        self.re_08935e4d = mapcss.lazy_regex(
             r"^maxspeed:advisory(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_08ba1dfb = re.compile(r"(^|; ?)NL:C18\b")
-        self.re_08f9030c = re.compile(r"(^|; ?)NL:L301\b")
-        self.re_0abf5cfa = re.compile(r"(^|; ?)NL:C21\b")
-        self.re_0c61efa0 = re.compile(
+        self.re_08ba1dfb = mapcss.lazy_regex(r"(^|; ?)NL:C18\b")
+        self.re_08f9030c = mapcss.lazy_regex(r"(^|; ?)NL:L301\b")
+        self.re_0abf5cfa = mapcss.lazy_regex(r"(^|; ?)NL:C21\b")
+        self.re_0c61efa0 = mapcss.lazy_regex(
             r"^maxlength(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_0cbcfeaf = re.compile(
+        self.re_0cbcfeaf = mapcss.lazy_regex(
             r"^maxspeed(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_0e042431 = re.compile(
+        self.re_0e042431 = mapcss.lazy_regex(
             r"^hazmat(:[A-E])?(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_0e900094 = re.compile(r"(^|; ?)NL:C17\b")
-        self.re_0f9e3c59 = re.compile(r"^foot(:forward|:both_ways)?(:conditional)?$")
-        self.re_143f11c5 = re.compile(r"^(no|use_sidepath)$")
-        self.re_1582ff37 = re.compile(r"(?i)bus\s?(baan|strook)")
-        self.re_1705b261 = re.compile(
+        self.re_0e900094 = mapcss.lazy_regex(r"(^|; ?)NL:C17\b")
+        self.re_0f9e3c59 = mapcss.lazy_regex(
+            r"^foot(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_143f11c5 = mapcss.lazy_regex(r"^(no|use_sidepath)$")
+        self.re_1582ff37 = mapcss.lazy_regex(r"(?i)bus\s?(baan|strook)")
+        self.re_1705b261 = mapcss.lazy_regex(
             r"(?i)(^|\sen\s)((on)?verplicht\s)?(\(?brom\)?)?fietspad$"
         )
-        self.re_17085e60 = re.compile(r"houseboat|static_caravan")
-        self.re_19b1af6a = re.compile(r"^paving_stones:([1-9])0$")
-        self.re_1aa298e1 = re.compile(
+        self.re_17085e60 = mapcss.lazy_regex(r"houseboat|static_caravan")
+        self.re_19b1af6a = mapcss.lazy_regex(r"^paving_stones:([1-9])0$")
+        self.re_1aa298e1 = mapcss.lazy_regex(
             r"^maxheight(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_1cc9227a = re.compile(
+        self.re_1cc9227a = mapcss.lazy_regex(
             r"^maxspeed(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_1d0c9a01 = re.compile(r"^NL:zone[36]0$")
-        self.re_1d478f9e = re.compile(r"\bNL:C0?2\b")
-        self.re_1d614d5c = re.compile(r"^maxspeed(:forward|:backward|:both_ways)?$")
-        self.re_1faa7e13 = re.compile(r"^hgv(:forward|:both_ways)?(:conditional)?$")
-        self.re_21dc697e = re.compile(
+        self.re_1d0c9a01 = mapcss.lazy_regex(r"^NL:zone[36]0$")
+        self.re_1d478f9e = mapcss.lazy_regex(r"\bNL:C0?2\b")
+        self.re_1d614d5c = mapcss.lazy_regex(
+            r"^maxspeed(:forward|:backward|:both_ways)?$"
+        )
+        self.re_1faa7e13 = mapcss.lazy_regex(
+            r"^hgv(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_21dc697e = mapcss.lazy_regex(
             r"^maxaxleload(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_229e1925 = re.compile(
+        self.re_229e1925 = mapcss.lazy_regex(
             r"^hazmat(:[A-E])?(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_2441139b = re.compile(
+        self.re_2441139b = mapcss.lazy_regex(
             r"(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b"
         )
-        self.re_251abd6a = re.compile(
+        self.re_251abd6a = mapcss.lazy_regex(
             r"^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$"
         )
-        self.re_252a5d6c = re.compile(r"forward")
-        self.re_25a62b9d = re.compile(
+        self.re_252a5d6c = mapcss.lazy_regex(r"forward")
+        self.re_25a62b9d = mapcss.lazy_regex(
             r"^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_26516863 = re.compile(r".:covid19$")
-        self.re_26ae994a = re.compile(
+        self.re_26516863 = mapcss.lazy_regex(r".:covid19$")
+        self.re_26ae994a = mapcss.lazy_regex(
             r"^motorcycle(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_26e04b1e = re.compile(r"\b(([Aa]f)?gesloten|[Gg]eopend)\b")
-        self.re_2823d45d = re.compile(
+        self.re_26e04b1e = mapcss.lazy_regex(r"\b(([Aa]f)?gesloten|[Gg]eopend)\b")
+        self.re_2823d45d = mapcss.lazy_regex(
             r"^maxlength(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_287f5dd8 = re.compile(r"^(\+|00)31 ?0?( ?[0-9]){3,6}$")
-        self.re_293c2706 = re.compile(r"^[A-Z][a-z]{1,4}\. ")
-        self.re_2cd26805 = re.compile(
+        self.re_287f5dd8 = mapcss.lazy_regex(r"^(\+|00)31 ?0?( ?[0-9]){3,6}$")
+        self.re_293c2706 = mapcss.lazy_regex(r"^[A-Z][a-z]{1,4}\. ")
+        self.re_2cd26805 = mapcss.lazy_regex(
             r"^maxlength(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_2f938f56 = re.compile(
+        self.re_2f938f56 = mapcss.lazy_regex(
             r"^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\."
         )
-        self.re_30fdb33a = re.compile(r"(?i)^(lift)$")
-        self.re_31154585 = re.compile(
+        self.re_30fdb33a = mapcss.lazy_regex(r"(?i)^(lift)$")
+        self.re_31154585 = mapcss.lazy_regex(
             r"^motorcycle(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_3254c1c6 = re.compile(
+        self.re_3254c1c6 = mapcss.lazy_regex(
             r"(?i)(parkeren$|parkeerplaats$|^toegang(sweg)?\s|^richting\s|drive.thro?u(gh)?)"
         )
-        self.re_32d334cf = re.compile(r"(^|.+:)addr:street($|:.+)")
-        self.re_33480e64 = re.compile(
+        self.re_32d334cf = mapcss.lazy_regex(r"(^|.+:)addr:street($|:.+)")
+        self.re_33480e64 = mapcss.lazy_regex(
             r"^maxheight(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_339dfcbd = re.compile(
+        self.re_339dfcbd = mapcss.lazy_regex(
             r"^maxweight(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_33af5199 = re.compile(
+        self.re_33af5199 = mapcss.lazy_regex(
             r"^motorcycle(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_33fbfa8d = re.compile(r"(?i)post\W?nl$")
-        self.re_345ec50a = re.compile(
+        self.re_33fbfa8d = mapcss.lazy_regex(r"(?i)post\W?nl$")
+        self.re_345ec50a = mapcss.lazy_regex(
             r"^maxweight(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_3894ceb2 = re.compile(r"^oneway:")
-        self.re_39064d44 = re.compile(
+        self.re_3894ceb2 = mapcss.lazy_regex(r"^oneway:")
+        self.re_39064d44 = mapcss.lazy_regex(
             r"^(motorway(_link)?|trunk(_link)?|cycleway|service|busway|construction|proposed|raceway)$"
         )
-        self.re_3b2cb1d7 = re.compile(r"(?i)(uit?laa[dt]|honden.*wandel|los.?loop)")
-        self.re_3bd9d067 = re.compile(r"^(yes|-?1)$")
-        self.re_3c163648 = re.compile(r"(?i)ball?(veld(je)?)?$")
-        self.re_3cd0133e = re.compile(
+        self.re_3b2cb1d7 = mapcss.lazy_regex(
+            r"(?i)(uit?laa[dt]|honden.*wandel|los.?loop)"
+        )
+        self.re_3bd9d067 = mapcss.lazy_regex(r"^(yes|-?1)$")
+        self.re_3c163648 = mapcss.lazy_regex(r"(?i)ball?(veld(je)?)?$")
+        self.re_3cd0133e = mapcss.lazy_regex(
             r"^access(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_4065f95d = re.compile(r"(^|; ?)NL:(C19|L0?1)\b")
-        self.re_42dce20e = re.compile(r"^(no|0)*$")
-        self.re_44720f99 = re.compile(r"(?i)^roltrap(pen)?$")
-        self.re_4547b418 = re.compile(r"(^|; ?)NL:A0?1-")
-        self.re_460900e8 = re.compile(
+        self.re_4065f95d = mapcss.lazy_regex(r"(^|; ?)NL:(C19|L0?1)\b")
+        self.re_42dce20e = mapcss.lazy_regex(r"^(no|0)*$")
+        self.re_44720f99 = mapcss.lazy_regex(r"(?i)^roltrap(pen)?$")
+        self.re_4547b418 = mapcss.lazy_regex(r"(^|; ?)NL:A0?1-")
+        self.re_460900e8 = mapcss.lazy_regex(
             r"^maxspeed:advisory(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_467ce1ba = re.compile(
+        self.re_467ce1ba = mapcss.lazy_regex(
             r"(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$"
         )
-        self.re_47aaa0f7 = re.compile(r"^(yes|designated)$")
-        self.re_49026388 = re.compile(r"(^|.+:)addr:housenumber($|:.+)")
-        self.re_4cfe628c = re.compile(r"^access(:forward|:both_ways)?(:conditional)?$")
-        self.re_4d17a717 = re.compile(r"^(no|-1|0)*$")
-        self.re_4d87e9ab = re.compile(r"^access(:backward|:both_ways)?(:conditional)?$")
-        self.re_4e099629 = re.compile(r"^trailer(:forward|:both_ways)?(:conditional)?$")
-        self.re_4e4468f8 = re.compile(r"^foot(:backward|:both_ways)?(:conditional)?$")
-        self.re_5012755c = re.compile(r"^priority:.")
-        self.re_51f98600 = re.compile(r"^yes$")
-        self.re_53816e1a = re.compile(
+        self.re_47aaa0f7 = mapcss.lazy_regex(r"^(yes|designated)$")
+        self.re_49026388 = mapcss.lazy_regex(r"(^|.+:)addr:housenumber($|:.+)")
+        self.re_4cfe628c = mapcss.lazy_regex(
+            r"^access(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_4d17a717 = mapcss.lazy_regex(r"^(no|-1|0)*$")
+        self.re_4d87e9ab = mapcss.lazy_regex(
+            r"^access(:backward|:both_ways)?(:conditional)?$"
+        )
+        self.re_4e099629 = mapcss.lazy_regex(
+            r"^trailer(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_4e4468f8 = mapcss.lazy_regex(
+            r"^foot(:backward|:both_ways)?(:conditional)?$"
+        )
+        self.re_5012755c = mapcss.lazy_regex(r"^priority:.")
+        self.re_51f98600 = mapcss.lazy_regex(r"^yes$")
+        self.re_53816e1a = mapcss.lazy_regex(
             r"^maxwidth(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_543ffeee = re.compile(r"(?i)(rolstoel|invaliden)")
-        self.re_54b75cfc = re.compile(
+        self.re_543ffeee = mapcss.lazy_regex(r"(?i)(rolstoel|invaliden)")
+        self.re_54b75cfc = mapcss.lazy_regex(
             r"^maxwidth(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_550ffc74 = re.compile(r"^building(:part)?$")
-        self.re_556f4d08 = re.compile(
+        self.re_550ffc74 = mapcss.lazy_regex(r"^building(:part)?$")
+        self.re_556f4d08 = mapcss.lazy_regex(
             r"^maxweight(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_5577fcc2 = re.compile(r"^hgv(:backward|:both_ways)?(:conditional)?$")
-        self.re_5578cc63 = re.compile(r"100.+19:00")
-        self.re_55879a11 = re.compile(r"^(no|-1|0)$")
-        self.re_561be3ff = re.compile(r"^addr:(city|postcode)$")
-        self.re_594405dc = re.compile(r"^(00|\+)31 ?0( ?[0-9]){7,}")
-        self.re_59aca94c = re.compile(r"(^|; ?)NL:C20\b")
-        self.re_5a895116 = re.compile(r"(^|; ?)NL:A0?4\b")
-        self.re_5b4448e5 = re.compile(r"(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)")
-        self.re_5e498788 = re.compile(r"^(left|right|both|yes)$")
-        self.re_5ed5036a = re.compile(r"(?i)^speeltuin$")
-        self.re_5ef8db88 = re.compile(r"^addr:(street|housenumber|postcode|city)$")
-        self.re_5f5aa10b = re.compile(r"^footway(:left|:right|:both)?:")
-        self.re_5fbb635f = re.compile(r"[1-9]$")
-        self.re_617e36ee = re.compile(
+        self.re_5577fcc2 = mapcss.lazy_regex(
+            r"^hgv(:backward|:both_ways)?(:conditional)?$"
+        )
+        self.re_5578cc63 = mapcss.lazy_regex(r"100.+19:00")
+        self.re_55879a11 = mapcss.lazy_regex(r"^(no|-1|0)$")
+        self.re_561be3ff = mapcss.lazy_regex(r"^addr:(city|postcode)$")
+        self.re_594405dc = mapcss.lazy_regex(r"^(00|\+)31 ?0( ?[0-9]){7,}")
+        self.re_59aca94c = mapcss.lazy_regex(r"(^|; ?)NL:C20\b")
+        self.re_5a895116 = mapcss.lazy_regex(r"(^|; ?)NL:A0?4\b")
+        self.re_5b4448e5 = mapcss.lazy_regex(
+            r"(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)"
+        )
+        self.re_5e498788 = mapcss.lazy_regex(r"^(left|right|both|yes)$")
+        self.re_5ed5036a = mapcss.lazy_regex(r"(?i)^speeltuin$")
+        self.re_5ef8db88 = mapcss.lazy_regex(
+            r"^addr:(street|housenumber|postcode|city)$"
+        )
+        self.re_5f5aa10b = mapcss.lazy_regex(r"^footway(:left|:right|:both)?:")
+        self.re_5fbb635f = mapcss.lazy_regex(r"[1-9]$")
+        self.re_617e36ee = mapcss.lazy_regex(
             r"^hazmat(:[A-E])?(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_619cd3d8 = re.compile(r"(^|; ?)NL:C22(\[[A-E]\])?(;|$)")
-        self.re_6211f625 = re.compile(r"(?i)(voormalige?)")
-        self.re_62e192cf = re.compile(r"^(motorway(_link)?|construction|proposed)$")
-        self.re_63f5f8f1 = re.compile(
+        self.re_619cd3d8 = mapcss.lazy_regex(r"(^|; ?)NL:C22(\[[A-E]\])?(;|$)")
+        self.re_6211f625 = mapcss.lazy_regex(r"(?i)(voormalige?)")
+        self.re_62e192cf = mapcss.lazy_regex(
+            r"^(motorway(_link)?|construction|proposed)$"
+        )
+        self.re_63f5f8f1 = mapcss.lazy_regex(
             r"^maxheight(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_640dd184 = re.compile(
+        self.re_640dd184 = mapcss.lazy_regex(
             r"^trailer(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_6454d3f5 = re.compile(
+        self.re_6454d3f5 = mapcss.lazy_regex(
             r"stenen$|^hout$|\bbestraa?t(ing)?$|grond$|^puin$|^grind$|zand$"
         )
-        self.re_65dfbf19 = re.compile(
+        self.re_65dfbf19 = mapcss.lazy_regex(
             r"^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_676d2c9e = re.compile(
+        self.re_676d2c9e = mapcss.lazy_regex(
             r"\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]"
         )
-        self.re_682234cc = re.compile(
+        self.re_682234cc = mapcss.lazy_regex(
             r"^foot(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_68a71d57 = re.compile(r"backward")
-        self.re_697de1f2 = re.compile(r"^moped(:forward|:both_ways)?(:conditional)?$")
-        self.re_6b1906aa = re.compile(r"(?i)(klanten|bezoek(ers)?|medewerkers)\b")
-        self.re_6b8a2885 = re.compile(
+        self.re_68a71d57 = mapcss.lazy_regex(r"backward")
+        self.re_697de1f2 = mapcss.lazy_regex(
+            r"^moped(:forward|:both_ways)?(:conditional)?$"
+        )
+        self.re_6b1906aa = mapcss.lazy_regex(
+            r"(?i)(klanten|bezoek(ers)?|medewerkers)\b"
+        )
+        self.re_6b8a2885 = mapcss.lazy_regex(
             r"^bicycle(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_6cd83c9e = re.compile(r"(?i)^gratis\s|gratis\)")
-        self.re_6e264741 = re.compile(r"(?i)^(Geldmaat|ABN.?AMRO|ING|Rabobank|SNS)\b")
-        self.re_7087ae0d = re.compile(
+        self.re_6cd83c9e = mapcss.lazy_regex(r"(?i)^gratis\s|gratis\)")
+        self.re_6e264741 = mapcss.lazy_regex(
+            r"(?i)^(Geldmaat|ABN.?AMRO|ING|Rabobank|SNS)\b"
+        )
+        self.re_7087ae0d = mapcss.lazy_regex(
             r"^trailer(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_7184e9bc = re.compile(r"^sidewalk:(left|right|both)$")
-        self.re_71a0b33c = re.compile(r"(?i)(drinkwater|\swater|kraan)")
-        self.re_7372291c = re.compile(
+        self.re_7184e9bc = mapcss.lazy_regex(r"^sidewalk:(left|right|both)$")
+        self.re_71a0b33c = mapcss.lazy_regex(r"(?i)(drinkwater|\swater|kraan)")
+        self.re_7372291c = mapcss.lazy_regex(
             r"^bicycle(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_73ea17b1 = re.compile(
+        self.re_73ea17b1 = mapcss.lazy_regex(
             r"^moped(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_745836a5 = re.compile(r"^(brand|name|operator)$")
-        self.re_74d9b833 = re.compile(r"^(.+):surface$")
-        self.re_7531ba03 = re.compile(
+        self.re_745836a5 = mapcss.lazy_regex(r"^(brand|name|operator)$")
+        self.re_74d9b833 = mapcss.lazy_regex(r"^(.+):surface$")
+        self.re_7531ba03 = mapcss.lazy_regex(
             r"^maxaxleload(:forward|:both_ways)?(:conditional)?$"
         )
-        self.re_7537ca1e = re.compile(r"\bNL:G0?7\b")
-        self.re_75b7dc3e = re.compile(r"^oneway:hazmat")
-        self.re_774d1ba2 = re.compile(
+        self.re_7537ca1e = mapcss.lazy_regex(r"\bNL:G0?7\b")
+        self.re_75b7dc3e = mapcss.lazy_regex(r"^oneway:hazmat")
+        self.re_774d1ba2 = mapcss.lazy_regex(
             r"^maxwidth(:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_78809448 = re.compile(r"^moped(:backward|:both_ways)?(:conditional)?$")
-        self.re_798edef1 = re.compile(
+        self.re_78809448 = mapcss.lazy_regex(
+            r"^moped(:backward|:both_ways)?(:conditional)?$"
+        )
+        self.re_798edef1 = mapcss.lazy_regex(
             r"(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\."
         )
-        self.re_7acb98bb = re.compile(
+        self.re_7acb98bb = mapcss.lazy_regex(
             r"^maxspeed(:forward|:backward|:both_ways)?(:conditional)?$"
         )
-        self.re_7be1bafc = re.compile(r"^1[23]0$")
-        self.re_7c3d18b2 = re.compile(r"^(0031|\+31|0) ?[1-9]( ?[0-9]){11}")
-        self.re_7d72e705 = re.compile(
+        self.re_7be1bafc = mapcss.lazy_regex(r"^1[23]0$")
+        self.re_7c3d18b2 = mapcss.lazy_regex(r"^(0031|\+31|0) ?[1-9]( ?[0-9]){11}")
+        self.re_7d72e705 = mapcss.lazy_regex(
             r"^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$"
         )
 
@@ -1753,20 +1789,23 @@ class Josm_DutchSpecific(PluginMapCSS):
         return err
 
     def way(self, data, tags, nds):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        set_abbrname = set_addrOnBuilding = set_altLivingStreet = set_badPhoneNumber = (
-            set_completedSurfacePavingStonesNumber
-        ) = set_housenameWithFix = set_multipleGsigns = set_steps = False
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._way_rules_dispatch, self._way_rules_fallback, keys
+        ):
+            self._way_rules[rule](self, data, tags, nds, keys, sets, err)
+        return err
 
-        # way[highway=cycleway][traffic_sign~="NL:G11"][moped][moped=~/^(yes|designated)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][moped][moped=~/^(no|use_sidepath)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][mofa][mofa=~/^(no|use_sidepath)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G13"][moped][moped=~/^(yes|designated)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G13"][mofa][mofa=~/^(yes|designated)$/]
-        # way[highway][traffic_sign~="NL:D103"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
-        # way[highway][traffic_sign~="NL:D104"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+    # way[highway=cycleway][traffic_sign~="NL:G11"][moped][moped=~/^(yes|designated)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][moped][moped=~/^(no|use_sidepath)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][mofa][mofa=~/^(no|use_sidepath)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][moped][moped=~/^(yes|designated)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][mofa][mofa=~/^(yes|designated)$/]
+    # way[highway][traffic_sign~="NL:D103"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+    # way[highway][traffic_sign~="NL:D104"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+    def _way_rule_0(self, data, tags, nds, keys, sets, err):
         if ("highway" in keys and "mofa" in keys and "traffic_sign" in keys) or (
             "highway" in keys and "moped" in keys and "traffic_sign" in keys
         ):
@@ -1988,9 +2027,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:D103"][!moped]
-        # way[highway][traffic_sign~="NL:D104"][!moped]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][!moped]
+    # way[highway][traffic_sign~="NL:D103"][!moped]
+    # way[highway][traffic_sign~="NL:D104"][!moped]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][!moped]
+    def _way_rule_1(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2062,7 +2102,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][!mofa]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][!mofa]
+    def _way_rule_2(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2100,7 +2141,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=cycleway][traffic_sign~="NL:G13"][!mofa][!motor_vehicle][!access]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][!mofa][!motor_vehicle][!access]
+    def _way_rule_3(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2144,11 +2186,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:F13"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F17"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F19"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F19"][!hgv]
-        # way[highway][traffic_sign~="NL:F21"][!hgv]
+    # way[highway][traffic_sign~="NL:F13"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F17"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F19"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F19"][!hgv]
+    # way[highway][traffic_sign~="NL:F21"][!hgv]
+    def _way_rule_4(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2303,14 +2346,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:F13"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F17"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F13"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F17"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][hgv=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F21"][hgv=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F13"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F17"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F13"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F17"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][hgv=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F21"][hgv=no][highway!=construction]
+    def _way_rule_5(self, data, tags, nds, keys, sets, err):
         if (
             ("bus" in keys and "highway" in keys and "traffic_sign" in keys)
             or ("hgv" in keys and "highway" in keys and "traffic_sign" in keys)
@@ -2543,7 +2587,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=steps][traffic_sign=~/(^|; ?)NL:L301\b/]
+    # way[highway=steps][traffic_sign=~/(^|; ?)NL:L301\b/]
+    def _way_rule_6(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2562,9 +2607,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     pass
             if match:
                 # set steps
-                set_steps = True
+                sets.add("steps")
 
-        # way[highway][traffic_sign*="NL:G"][count(split(";NL:G",concat(";",replace(tag("traffic_sign")," ",""))))>2]
+    # way[highway][traffic_sign*="NL:G"][count(split(";NL:G",concat(";",replace(tag("traffic_sign")," ",""))))>2]
+    def _way_rule_7(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2599,9 +2645,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     pass
             if match:
                 # set multipleGsigns
-                set_multipleGsigns = True
+                sets.add("multipleGsigns")
 
-        # way[living_street=yes][highway][highway!~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/]
+    # way[living_street=yes][highway][highway!~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/]
+    def _way_rule_8(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "living_street" in keys:
             match = False
             if not match:
@@ -2629,21 +2676,22 @@ class Josm_DutchSpecific(PluginMapCSS):
                     pass
             if match:
                 # set .altLivingStreet
-                set_altLivingStreet = True
-
-        # way[highway][traffic_sign~="NL:F13"][highway!=busway][highway!=service][highway!=bus_guideway][highway!=construction]
-        # way[highway][traffic_sign~="NL:G5"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
-        # way[highway][traffic_sign~="NL:G05"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
-        # way[highway][traffic_sign~="NL:G7"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G07"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G7-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G07-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G9"][highway!=bridleway][highway!=construction]!.multipleGsigns!.steps
-        # way[highway][traffic_sign~="NL:G09"][highway!=bridleway][highway!=construction]!.multipleGsigns!.steps
-        # way[highway][traffic_sign~="NL:G11"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
-        # way[highway][traffic_sign~="NL:G12a"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
-        # way[highway][traffic_sign~="NL:G13"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
-        # way[highway][traffic_sign*="NL:L301"][highway!=steps][highway!=construction][traffic_sign=~/(^|; ?)NL:L301\b/]
+                sets.add("altLivingStreet")
+
+    # way[highway][traffic_sign~="NL:F13"][highway!=busway][highway!=service][highway!=bus_guideway][highway!=construction]
+    # way[highway][traffic_sign~="NL:G5"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G05"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G7"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G07"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G7-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G07-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G9"][highway!=bridleway][highway!=construction]!.multipleGsigns!.steps
+    # way[highway][traffic_sign~="NL:G09"][highway!=bridleway][highway!=construction]!.multipleGsigns!.steps
+    # way[highway][traffic_sign~="NL:G11"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
+    # way[highway][traffic_sign~="NL:G12a"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
+    # way[highway][traffic_sign~="NL:G13"][highway!=cycleway][highway!=construction]!.multipleGsigns!.steps
+    # way[highway][traffic_sign*="NL:L301"][highway!=steps][highway!=construction][traffic_sign=~/(^|; ?)NL:L301\b/]
+    def _way_rule_9(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -2690,7 +2738,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_altLivingStreet)
+                        ("altLivingStreet" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2749,7 +2797,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_altLivingStreet)
+                        ("altLivingStreet" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2808,7 +2856,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
+                        ("multipleGsigns" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2849,7 +2897,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
+                        ("multipleGsigns" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2890,7 +2938,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
+                        ("multipleGsigns" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2931,7 +2979,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
+                        ("multipleGsigns" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -2972,8 +3020,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
-                        and (not set_steps)
+                        ("multipleGsigns" not in sets)
+                        and ("steps" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -3002,8 +3050,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
-                        and (not set_steps)
+                        ("multipleGsigns" not in sets)
+                        and ("steps" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -3032,8 +3080,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
-                        and (not set_steps)
+                        ("multipleGsigns" not in sets)
+                        and ("steps" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -3062,8 +3110,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
-                        and (not set_steps)
+                        ("multipleGsigns" not in sets)
+                        and ("steps" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -3092,8 +3140,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_multipleGsigns)
-                        and (not set_steps)
+                        ("multipleGsigns" not in sets)
+                        and ("steps" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "highway"))
                         and (
                             mapcss.list_contains(
@@ -3190,7 +3238,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:L51"][!cyclestreet][highway!=construction]
+    # way[highway][traffic_sign~="NL:L51"][!cyclestreet][highway!=construction]
+    def _way_rule_10(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -3235,60 +3284,61 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:C1"][!vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C1"][!vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C1"][!vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
-        # way[highway][traffic_sign~="NL:C01"][!vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C01"][!vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C01"][!vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
-        # way[highway][traffic_sign~="NL:C6"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C6"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C6"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C06"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C06"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C06"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C7"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C7"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C7"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
-        # way[highway][traffic_sign~="NL:C07"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C07"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C07"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
-        # way[highway][traffic_sign~="NL:C9"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C9"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C9"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
-        # way[highway][traffic_sign~="NL:C9"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C9"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C9"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
-        # way[highway][traffic_sign~="NL:C09"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C09"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C09"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
-        # way[highway][traffic_sign~="NL:C09"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C09"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C09"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
-        # way[highway][traffic_sign~="NL:C10"][!trailer][!/^trailer(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C10"][!trailer:forward][!/^trailer(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C10"][!trailer:backward][!/^trailer(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:trailer!=yes]
-        # way[highway][traffic_sign~="NL:C11"][!motorcycle][!/^motorcycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C11"][!motorcycle:forward][!/^motorcycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C11"][!motorcycle:backward][!/^motorcycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:motorcycle!=yes]
-        # way[highway][traffic_sign~="NL:C12"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C12"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C12"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C13"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C13"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C13"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C14"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C14"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C14"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C15"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C15"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C15"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C15"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C15"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C15"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C16"][!foot][!/^foot(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C16"][!foot:forward][!/^foot(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C16"][!foot:backward][!/^foot(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:foot!=yes]
+    # way[highway][traffic_sign~="NL:C1"][!vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C1"][!vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C1"][!vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
+    # way[highway][traffic_sign~="NL:C01"][!vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C01"][!vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C01"][!vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
+    # way[highway][traffic_sign~="NL:C6"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C6"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C6"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C06"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C06"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C06"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C7"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C7"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C7"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
+    # way[highway][traffic_sign~="NL:C07"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C07"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C07"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
+    # way[highway][traffic_sign~="NL:C9"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C9"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C9"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
+    # way[highway][traffic_sign~="NL:C9"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C9"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C9"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
+    # way[highway][traffic_sign~="NL:C09"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C09"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C09"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
+    # way[highway][traffic_sign~="NL:C09"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C09"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C09"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
+    # way[highway][traffic_sign~="NL:C10"][!trailer][!/^trailer(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C10"][!trailer:forward][!/^trailer(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C10"][!trailer:backward][!/^trailer(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:trailer!=yes]
+    # way[highway][traffic_sign~="NL:C11"][!motorcycle][!/^motorcycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C11"][!motorcycle:forward][!/^motorcycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C11"][!motorcycle:backward][!/^motorcycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:motorcycle!=yes]
+    # way[highway][traffic_sign~="NL:C12"][!motor_vehicle][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C12"][!motor_vehicle:forward][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C12"][!motor_vehicle:backward][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C13"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C13"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C13"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C14"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C14"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C14"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C15"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C15"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C15"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C15"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C15"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C15"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C16"][!foot][!/^foot(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C16"][!foot:forward][!/^foot(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C16"][!foot:backward][!/^foot(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:foot!=yes]
+    def _way_rule_11(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "traffic_sign" in keys)
             or ("highway" in keys and "traffic_sign:backward" in keys)
@@ -5290,9 +5340,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:backward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:backward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway][/^oneway:hazmat/!~/^yes$/]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:backward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:backward|:both_ways)?(:conditional)?$/][!/^(motor_)?vehicle(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway][/^oneway:hazmat/!~/^yes$/]
+    def _way_rule_12(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "traffic_sign" in keys)
             or ("highway" in keys and "traffic_sign:backward" in keys)
@@ -5459,21 +5510,22 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C17\b/][!maxlength][!/^maxlength(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C17\b/][!maxlength:forward][!/^maxlength(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C17\b/][!maxlength:backward][!/^maxlength(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C18\b/][!maxwidth][!/^maxwidth(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C18\b/][!maxwidth:forward][!/^maxwidth(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C18\b/][!maxwidth:backward][!/^maxwidth(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight][!/^maxheight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:forward][!/^maxheight(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:backward][!/^maxheight(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C20\b/][!maxaxleload][!/^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C20\b/][!maxaxleload:forward][!/^maxaxleload(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C20\b/][!maxaxleload:backward][!/^maxaxleload(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C21\b/][!maxweight][!/^maxweight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C21\b/][!maxweight:forward][!/^maxweight(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C21\b/][!maxweight:backward][!/^maxweight(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C17\b/][!maxlength][!/^maxlength(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C17\b/][!maxlength:forward][!/^maxlength(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C17\b/][!maxlength:backward][!/^maxlength(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C18\b/][!maxwidth][!/^maxwidth(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C18\b/][!maxwidth:forward][!/^maxwidth(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C18\b/][!maxwidth:backward][!/^maxwidth(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight][!/^maxheight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:forward][!/^maxheight(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:backward][!/^maxheight(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C20\b/][!maxaxleload][!/^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C20\b/][!maxaxleload:forward][!/^maxaxleload(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C20\b/][!maxaxleload:backward][!/^maxaxleload(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C21\b/][!maxweight][!/^maxweight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C21\b/][!maxweight:forward][!/^maxweight(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C21\b/][!maxweight:backward][!/^maxweight(:backward|:both_ways)?(:conditional)?$/][highway]
+    def _way_rule_13(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "traffic_sign" in keys)
             or ("highway" in keys and "traffic_sign:backward" in keys)
@@ -5968,14 +6020,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:C2"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C02"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C3"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C03"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C3"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
-        # way[highway][traffic_sign:forward~="NL:C03"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
-        # way[highway][traffic_sign:backward~="NL:C2"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C02"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    # way[highway][traffic_sign~="NL:C2"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C02"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C3"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C03"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C3"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
+    # way[highway][traffic_sign:forward~="NL:C03"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
+    # way[highway][traffic_sign:backward~="NL:C2"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C02"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    def _way_rule_14(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "traffic_sign" in keys)
             or ("highway" in keys and "traffic_sign:backward" in keys)
@@ -6337,8 +6390,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:C5"][oneway?][highway!=construction]
-        # way[highway][traffic_sign~="NL:C05"][oneway?][highway!=construction]
+    # way[highway][traffic_sign~="NL:C5"][oneway?][highway!=construction]
+    # way[highway][traffic_sign~="NL:C05"][oneway?][highway!=construction]
+    def _way_rule_15(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "oneway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -6412,8 +6466,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:D1"][junction!=roundabout][junction!=circular]
-        # way[highway][traffic_sign~="NL:D01"][junction!=roundabout][junction!=circular]
+    # way[highway][traffic_sign~="NL:D1"][junction!=roundabout][junction!=circular]
+    # way[highway][traffic_sign~="NL:D01"][junction!=roundabout][junction!=circular]
+    def _way_rule_16(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -6491,8 +6546,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:D1"][junction=circular][oneway!~/^(yes|-?1)$/]
-        # way[highway][traffic_sign~="NL:D01"][junction=circular][oneway!~/^(yes|-?1)$/]
+    # way[highway][traffic_sign~="NL:D1"][junction=circular][oneway!~/^(yes|-?1)$/]
+    # way[highway][traffic_sign~="NL:D01"][junction=circular][oneway!~/^(yes|-?1)$/]
+    def _way_rule_17(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "junction" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -6571,12 +6627,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[traffic_sign="NL:B1"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign="NL:B01"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign:forward="NL:B1"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
-        # way[traffic_sign:forward="NL:B01"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
-        # way[traffic_sign:backward="NL:B1"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign:backward="NL:B01"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign="NL:B1"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign="NL:B01"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign:forward="NL:B1"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
+    # way[traffic_sign:forward="NL:B01"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
+    # way[traffic_sign:backward="NL:B1"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign:backward="NL:B01"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    def _way_rule_18(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "traffic_sign" in keys)
             or ("highway" in keys and "traffic_sign:backward" in keys)
@@ -6779,30 +6836,31 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:right=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:right=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:left=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:left=no][parking:both:restriction!=no_parking]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:right=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:right=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:left=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:right=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:right=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:left=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:left=no][parking:both:restriction!=no_parking]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:right=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:right=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    def _way_rule_19(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "parking:both" in keys and "traffic_sign" in keys)
             or (
@@ -7818,10 +7876,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign~="NL:F5"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F05"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F6"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F06"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F5"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F05"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F6"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F06"][!priority][!/^priority:./][highway!=construction]
+    def _way_rule_20(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "traffic_sign" in keys:
             match = False
             if not match:
@@ -7955,14 +8014,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][traffic_sign:forward~="NL:F5"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F05"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F6"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F06"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F5"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F05"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F6"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F06"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F5"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F05"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F6"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F06"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F5"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F05"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F6"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F06"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    def _way_rule_21(self, data, tags, nds, keys, sets, err):
         if ("highway" in keys and "traffic_sign:backward" in keys) or (
             "highway" in keys and "traffic_sign:forward" in keys
         ):
@@ -8264,10 +8324,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    def _way_rule_22(self, data, tags, nds, keys, sets, err):
         if (
             ("contact:mobile" in keys)
             or ("contact:phone" in keys)
@@ -8315,7 +8376,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: country code should not be followed by a 0","{0.key}")
-                set_badPhoneNumber = True
+                sets.add("badPhoneNumber")
                 err.append(
                     {
                         "class": 90201,
@@ -8327,9 +8388,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    def _way_rule_23(self, data, tags, nds, keys, sets, err):
         if ("contact:mobile" in keys) or ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -8363,7 +8425,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)","{0.key}")
-                set_badPhoneNumber = True
+                sets.add("badPhoneNumber")
                 err.append(
                     {
                         "class": 90201,
@@ -8375,10 +8437,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    def _way_rule_24(self, data, tags, nds, keys, sets, err):
         if (
             ("contact:mobile" in keys)
             or ("contact:phone" in keys)
@@ -8390,7 +8453,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_badPhoneNumber)
+                        ("badPhoneNumber" not in sets)
                         and (
                             mapcss.regexp_test(
                                 mapcss._value_capture(
@@ -8409,7 +8472,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_badPhoneNumber)
+                        ("badPhoneNumber" not in sets)
                         and (
                             mapcss.regexp_test(
                                 mapcss._value_capture(
@@ -8428,7 +8491,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_badPhoneNumber)
+                        ("badPhoneNumber" not in sets)
                         and (
                             mapcss.regexp_test(
                                 mapcss._value_capture(
@@ -8447,7 +8510,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_badPhoneNumber)
+                        ("badPhoneNumber" not in sets)
                         and (
                             mapcss.regexp_test(
                                 mapcss._value_capture(
@@ -8474,7 +8537,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][building!~/houseboat|static_caravan/][inside("NL")]:closed
+    # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][building!~/houseboat|static_caravan/][inside("NL")]:closed
+    def _way_rule_25(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -8515,7 +8579,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .addrOnBuilding
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("In Nederland is het gebouw niet gekoppeld aan het adres. Het adres is wel gekoppeld aan het gebruiksdoel.")
-                set_addrOnBuilding = True
+                sets.add("addrOnBuilding")
                 err.append(
                     {
                         "class": 90201,
@@ -8526,15 +8590,16 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
-        # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
+    # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    def _way_rule_26(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_addrOnBuilding)
+                        ("addrOnBuilding" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, self.re_561be3ff)
                         )
@@ -8560,7 +8625,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_addrOnBuilding)
+                        ("addrOnBuilding" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "addr:street"))
                         and (
                             not mapcss._tag_capture(
@@ -8602,8 +8667,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway:surface][surface][highway=cycleway][surface=*"cycleway:surface"][inside("NL")]
-        # way[footway:surface][surface][highway=footway][surface=*"footway:surface"][inside("NL")]
+    # way[cycleway:surface][surface][highway=cycleway][surface=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][surface][highway=footway][surface=*"footway:surface"][inside("NL")]
+    def _way_rule_27(self, data, tags, nds, keys, sets, err):
         if ("cycleway:surface" in keys and "highway" in keys and "surface" in keys) or (
             "footway:surface" in keys and "highway" in keys and "surface" in keys
         ):
@@ -8669,8 +8735,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway:surface][surface][highway=cycleway][surface!=*"cycleway:surface"][inside("NL")]
-        # way[footway:surface][surface][highway=footway][surface!=*"footway:surface"][inside("NL")]
+    # way[cycleway:surface][surface][highway=cycleway][surface!=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][surface][highway=footway][surface!=*"footway:surface"][inside("NL")]
+    def _way_rule_28(self, data, tags, nds, keys, sets, err):
         if ("cycleway:surface" in keys and "highway" in keys and "surface" in keys) or (
             "footway:surface" in keys and "highway" in keys and "surface" in keys
         ):
@@ -8731,8 +8798,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway:surface][highway=cycleway][!surface][inside("NL")]
-        # way[footway:surface][highway=footway][!surface][inside("NL")]
+    # way[cycleway:surface][highway=cycleway][!surface][inside("NL")]
+    # way[footway:surface][highway=footway][!surface][inside("NL")]
+    def _way_rule_29(self, data, tags, nds, keys, sets, err):
         if ("cycleway:surface" in keys and "highway" in keys) or (
             "footway:surface" in keys and "highway" in keys
         ):
@@ -8819,7 +8887,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[footway:surface][cycleway:surface][segregated=no][highway][footway:surface!=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][cycleway:surface][segregated=no][highway][footway:surface!=*"cycleway:surface"][inside("NL")]
+    def _way_rule_30(self, data, tags, nds, keys, sets, err):
         if (
             "cycleway:surface" in keys
             and "footway:surface" in keys
@@ -8870,8 +8939,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[/^footway(:left|:right|:both)?:/][/^sidewalk:(left|right|both)$/][/^sidewalk:(left|right|both)$/=~/^yes$/][inside("NL")]
-        # way[/^footway(:left|:right|:both)?:/][sidewalk][sidewalk=~/^(left|right|both|yes)$/][inside("NL")]
+    # way[/^footway(:left|:right|:both)?:/][/^sidewalk:(left|right|both)$/][/^sidewalk:(left|right|both)$/=~/^yes$/][inside("NL")]
+    # way[/^footway(:left|:right|:both)?:/][sidewalk][sidewalk=~/^(left|right|both|yes)$/][inside("NL")]
+    def _way_rule_31(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -8926,8 +8996,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=footway][cycleway][cycleway!=no][cycleway!=lane][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
-        # way[highway=footway][segregated=yes][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    # way[highway=footway][cycleway][cycleway!=no][cycleway!=lane][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    # way[highway=footway][segregated=yes][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    def _way_rule_32(self, data, tags, nds, keys, sets, err):
         if ("cycleway" in keys and "highway" in keys) or (
             "highway" in keys and "segregated" in keys
         ):
@@ -9012,10 +9083,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway=opposite][inside("NL")]
-        # way[cycleway:left=opposite][inside("NL")]
-        # way[cycleway:right=opposite][inside("NL")]
-        # way[cycleway:both=opposite][inside("NL")]
+    # way[cycleway=opposite][inside("NL")]
+    # way[cycleway:left=opposite][inside("NL")]
+    # way[cycleway:right=opposite][inside("NL")]
+    # way[cycleway:both=opposite][inside("NL")]
+    def _way_rule_33(self, data, tags, nds, keys, sets, err):
         if (
             ("cycleway" in keys)
             or ("cycleway:both" in keys)
@@ -9074,10 +9146,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway][cycleway^=opposite_][inside("NL")]
-        # way[cycleway:left][cycleway:left^=opposite_][inside("NL")]
-        # way[cycleway:right][cycleway:right^=opposite_][inside("NL")]
-        # way[cycleway:both][cycleway:both^=opposite_][inside("NL")]
+    # way[cycleway][cycleway^=opposite_][inside("NL")]
+    # way[cycleway:left][cycleway:left^=opposite_][inside("NL")]
+    # way[cycleway:right][cycleway:right^=opposite_][inside("NL")]
+    # way[cycleway:both][cycleway:both^=opposite_][inside("NL")]
+    def _way_rule_34(self, data, tags, nds, keys, sets, err):
         if (
             ("cycleway" in keys)
             or ("cycleway:both" in keys)
@@ -9166,7 +9239,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[sidewalk=none][inside("NL")]
+    # way[sidewalk=none][inside("NL")]
+    def _way_rule_35(self, data, tags, nds, keys, sets, err):
         if "sidewalk" in keys:
             match = False
             if not match:
@@ -9206,7 +9280,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[postal_code][inside("NL")]
+    # way[postal_code][inside("NL")]
+    def _way_rule_36(self, data, tags, nds, keys, sets, err):
         if "postal_code" in keys:
             match = False
             if not match:
@@ -9237,7 +9312,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[building=terrace][inside("NL")]
+    # area[building=terrace][inside("NL")]
+    def _way_rule_37(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -9273,7 +9349,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[addr:interpolation][inside("NL")]
+    # *[addr:interpolation][inside("NL")]
+    def _way_rule_38(self, data, tags, nds, keys, sets, err):
         if "addr:interpolation" in keys:
             match = False
             if not match:
@@ -9299,12 +9376,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[is_in=NL]
-        # *[is_in:country][inside("NL")]
-        # *[is_in:city][inside("NL")]
-        # *[is_in:province][inside("NL")]
-        # *[is_in:continent][inside("NL")]
-        # *[is_in:country_code=NL]
+    # *[is_in=NL]
+    # *[is_in:country][inside("NL")]
+    # *[is_in:city][inside("NL")]
+    # *[is_in:province][inside("NL")]
+    # *[is_in:continent][inside("NL")]
+    # *[is_in:country_code=NL]
+    def _way_rule_39(self, data, tags, nds, keys, sets, err):
         if (
             ("is_in" in keys)
             or ("is_in:city" in keys)
@@ -9381,7 +9459,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[railway][tracks][tracks!=1][inside("NL")]
+    # way[railway][tracks][tracks!=1][inside("NL")]
+    def _way_rule_40(self, data, tags, nds, keys, sets, err):
         if "railway" in keys and "tracks" in keys:
             match = False
             if not match:
@@ -9413,8 +9492,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
-        # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
+    # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    def _way_rule_41(self, data, tags, nds, keys, sets, err):
         if ("addr:housename" in keys) or ("building:name" in keys):
             match = False
             if not match:
@@ -9457,7 +9537,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixChangeKey:"{0.key}=>name"
-                set_housenameWithFix = True
+                sets.add("housenameWithFix")
                 err.append(
                     {
                         "class": 90202,
@@ -9506,8 +9586,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    def _way_rule_42(self, data, tags, nds, keys, sets, err):
         if ("addr:housename" in keys and "name" in keys) or (
             "building:name" in keys and "name" in keys
         ):
@@ -9516,7 +9597,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_housenameWithFix)
+                        ("housenameWithFix" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "addr:housename")
                         )
@@ -9541,7 +9622,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_housenameWithFix)
+                        ("housenameWithFix" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "building:name")
                         )
@@ -9568,7 +9649,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixRemove:"{0.key}"
-                set_housenameWithFix = True
+                sets.add("housenameWithFix")
                 err.append(
                     {
                         "class": 90202,
@@ -9584,8 +9665,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    def _way_rule_43(self, data, tags, nds, keys, sets, err):
         if ("addr:housename" in keys and "name" in keys) or (
             "building:name" in keys and "name" in keys
         ):
@@ -9594,7 +9676,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_housenameWithFix)
+                        ("housenameWithFix" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "addr:housename")
                         )
@@ -9614,7 +9696,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_housenameWithFix)
+                        ("housenameWithFix" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "building:name")
                         )
@@ -9645,7 +9727,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[/.:covid19$/][inside("NL")]
+    # *[/.:covid19$/][inside("NL")]
+    def _way_rule_44(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -9675,7 +9758,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[bicycle_road?][inside("NL")]
+    # way[bicycle_road?][inside("NL")]
+    def _way_rule_45(self, data, tags, nds, keys, sets, err):
         if "bicycle_road" in keys:
             match = False
             if not match:
@@ -9704,7 +9788,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[surface][surface=~/stenen$|^hout$|\bbestraa?t(ing)?$|grond$|^puin$|^grind$|zand$/]
+    # way[surface][surface=~/stenen$|^hout$|\bbestraa?t(ing)?$|grond$|^puin$|^grind$|zand$/]
+    def _way_rule_46(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -9737,7 +9822,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    def _way_rule_47(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -9797,7 +9883,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    def _way_rule_48(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -9825,7 +9912,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"*:surface=paving_stones + *:paving_stones:shape=square + *:paving_stones:length=[length in meter, e.g. 0.3]"
                 # assertNoMatch:"way highway=residential sidewalk:surface=paving_stones cycleway:surface=paving_stones:20"
                 # assertNoMatch:"way highway=residential sidewalk:surface=paving_stones:30 cycleway:surface=paving_stones:20"
-                set_completedSurfacePavingStonesNumber = True
+                sets.add("completedSurfacePavingStonesNumber")
                 err.append(
                     {
                         "class": 90202,
@@ -9837,14 +9924,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    def _way_rule_49(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_completedSurfacePavingStonesNumber)
+                        ("completedSurfacePavingStonesNumber" not in sets)
                         and (
                             mapcss.regexp_test(
                                 self.re_19b1af6a,
@@ -9869,20 +9957,21 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[name][highway=service][name=~/(?i)(parkeren$|parkeerplaats$|^toegang(sweg)?\s|^richting\s|drive.thro?u(gh)?)/]
-        # way[name][highway][name=~/(?i)(^|\sen\s)((on)?verplicht\s)?(\(?brom\)?)?fietspad$/]
-        # way[name][highway][name=~/(?i)^roltrap(pen)?$/]
-        # way[name][highway][name=~/(?i)(rolstoel|invaliden)/]
-        # way[name][highway][name=~/(?i)(uit?laa[dt]|honden.*wandel|los.?loop)/]
-        # way[name][highway][name=~/(?i)bus\s?(baan|strook)/][highway!=busway][highway!=service][highway!=construction]
-        # way[name][highway][name=~/\bbouwweg/]
-        # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
-        # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
-        # *[name][name=~/(?i)^gratis\s|gratis\)/]
-        # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
-        # *[name][leisure=playground][name=~/(?i)^speeltuin$/]
-        # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
-        # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    # way[name][highway=service][name=~/(?i)(parkeren$|parkeerplaats$|^toegang(sweg)?\s|^richting\s|drive.thro?u(gh)?)/]
+    # way[name][highway][name=~/(?i)(^|\sen\s)((on)?verplicht\s)?(\(?brom\)?)?fietspad$/]
+    # way[name][highway][name=~/(?i)^roltrap(pen)?$/]
+    # way[name][highway][name=~/(?i)(rolstoel|invaliden)/]
+    # way[name][highway][name=~/(?i)(uit?laa[dt]|honden.*wandel|los.?loop)/]
+    # way[name][highway][name=~/(?i)bus\s?(baan|strook)/][highway!=busway][highway!=service][highway!=construction]
+    # way[name][highway][name=~/\bbouwweg/]
+    # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
+    # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
+    # *[name][name=~/(?i)^gratis\s|gratis\)/]
+    # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
+    # *[name][leisure=playground][name=~/(?i)^speeltuin$/]
+    # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
+    # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    def _way_rule_50(self, data, tags, nds, keys, sets, err):
         if (
             ("amenity" in keys and "name" in keys)
             or ("highway" in keys and "name" in keys)
@@ -10172,7 +10261,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    def _way_rule_51(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -10216,15 +10306,16 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[name][highway][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # way[name][highway][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # way[name][highway][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # way[name][highway][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _way_rule_52(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "name"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "highway"))
                         and (
@@ -10243,7 +10334,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "name"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "highway"))
                         and (
@@ -10278,7 +10369,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential name=\"Jac. P. Thijsseplein\""
                 # assertNoMatch:"way highway=residential name=\"Th. Weeversweg\""
                 # assertNoMatch:"way highway=residential name=\"Wim Kan Dreef\""
-                set_abbrname = True
+                sets.add("abbrname")
                 err.append(
                     {
                         "class": 90203,
@@ -10287,15 +10378,16 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _way_rule_53(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "name"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "place"))
                         and (
@@ -10314,7 +10406,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "name"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "place"))
                         and (
@@ -10344,7 +10436,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Gebiedsnaam met afkorting")
-                set_abbrname = True
+                sets.add("abbrname")
                 err.append(
                     {
                         "class": 90203,
@@ -10353,15 +10445,16 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
-        # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    def _way_rule_54(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "railway" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "railway"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "name"))
                         and (
@@ -10380,7 +10473,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_abbrname)
+                        ("abbrname" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "railway"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "name"))
                         and (
@@ -10400,7 +10493,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Spoorgebied met afgekorte naam")
                 # suggestAlternative:"aansluiting, emplacement, goederen, industrieterrein, inhaalspoor, opstelterrein, overloopwissel, raccordement of rangeerterrein"
-                set_abbrname = True
+                sets.add("abbrname")
                 err.append(
                     {
                         "class": 90203,
@@ -10409,8 +10502,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
-        # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
+    # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    def _way_rule_55(self, data, tags, nds, keys, sets, err):
         if ("name:fy" in keys and "name:nl" in keys) or ("name:nl" in keys):
             match = False
             if not match:
@@ -10507,8 +10601,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[heritage=1][heritage:operator!=whc]
-        # *[heritage=2][heritage:operator!=rce][inside("NL")]
+    # *[heritage=1][heritage:operator!=whc]
+    # *[heritage=2][heritage:operator!=rce][inside("NL")]
+    def _way_rule_56(self, data, tags, nds, keys, sets, err):
         if "heritage" in keys:
             match = False
             if not match:
@@ -10569,7 +10664,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[ref:rce][!heritage:operator]
+    # *[ref:rce][!heritage:operator]
+    def _way_rule_57(self, data, tags, nds, keys, sets, err):
         if "ref:rce" in keys:
             match = False
             if not match:
@@ -10602,7 +10698,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # *[heritage:operator=rce][!heritage]
+    # *[heritage:operator=rce][!heritage]
+    def _way_rule_58(self, data, tags, nds, keys, sets, err):
         if "heritage:operator" in keys:
             match = False
             if not match:
@@ -10632,12 +10729,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=living_street][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")]
-        # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][highway!=living_street][inside("NL")]
-        # way[maxspeed:type="NL:zone30"][maxspeed!=30][maxspeed:both_ways!=30][highway]
-        # way[maxspeed:type="NL:zone60"][maxspeed!=60][maxspeed:both_ways!=60][highway]
-        # way[maxspeed:type="NL:urban"][maxspeed!=50][maxspeed:both_ways!=50][highway]
-        # way[maxspeed:type="NL:rural"][maxspeed!=80][maxspeed:both_ways!=80][highway]
+    # way[highway=living_street][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")]
+    # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][highway!=living_street][inside("NL")]
+    # way[maxspeed:type="NL:zone30"][maxspeed!=30][maxspeed:both_ways!=30][highway]
+    # way[maxspeed:type="NL:zone60"][maxspeed!=60][maxspeed:both_ways!=60][highway]
+    # way[maxspeed:type="NL:urban"][maxspeed!=50][maxspeed:both_ways!=50][highway]
+    # way[maxspeed:type="NL:rural"][maxspeed!=80][maxspeed:both_ways!=80][highway]
+    def _way_rule_59(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys)
             or ("highway" in keys and "maxspeed:type" in keys)
@@ -10796,13 +10894,14 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[maxspeed:type][!maxspeed][maxspeed:type^="NL:zone"][!maxspeed:both_ways][maxspeed:type!~/^NL:zone[36]0$/][highway]
-        # way[traffic_sign][!maxspeed][traffic_sign=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][!maxspeed:forward][traffic_sign:forward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][!maxspeed:backward][traffic_sign:backward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][!maxspeed:advisory][traffic_sign=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][!maxspeed:advisory:forward][traffic_sign:forward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][!maxspeed:advisory:backward][traffic_sign:backward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[maxspeed:type][!maxspeed][maxspeed:type^="NL:zone"][!maxspeed:both_ways][maxspeed:type!~/^NL:zone[36]0$/][highway]
+    # way[traffic_sign][!maxspeed][traffic_sign=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][!maxspeed:forward][traffic_sign:forward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][!maxspeed:backward][traffic_sign:backward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][!maxspeed:advisory][traffic_sign=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][!maxspeed:advisory:forward][traffic_sign:forward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][!maxspeed:advisory:backward][traffic_sign:backward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:backward|:both_ways)?(:conditional)?$/][highway]
+    def _way_rule_60(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "maxspeed:type" in keys)
             or ("highway" in keys and "traffic_sign" in keys)
@@ -11054,7 +11153,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=motorway][maxspeed][maxspeed=~/^1[23]0$/][maxspeed:conditional=~/100.+19:00/][inside("NL")]
+    # way[highway=motorway][maxspeed][maxspeed=~/^1[23]0$/][maxspeed:conditional=~/100.+19:00/][inside("NL")]
+    def _way_rule_61(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "maxspeed" in keys and "maxspeed:conditional" in keys:
             match = False
             if not match:
@@ -11102,13 +11202,14 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=motorway][maxspeed][maxspeed>130][inside("NL")]
-        # way[highway=motorway_link][maxspeed][maxspeed>130][inside("NL")]
-        # way[highway=trunk][maxspeed][maxspeed>100][inside("NL")]
-        # way[highway=trunk_link][maxspeed][maxspeed>100][inside("NL")]
-        # way[motorroad=yes][maxspeed][maxspeed>100][inside("NL")][highway!~/^(motorway(_link)?|construction|proposed)$/]
-        # way[highway][maxspeed][maxspeed>80][highway!~/^(motorway(_link)?|trunk(_link)?|cycleway|service|busway|construction|proposed|raceway)$/][motorroad!=yes][inside("NL")]
-        # way[highway=cycleway][maxspeed][maxspeed>40][!motor_vehicle][!vehicle][!access][inside("NL")]
+    # way[highway=motorway][maxspeed][maxspeed>130][inside("NL")]
+    # way[highway=motorway_link][maxspeed][maxspeed>130][inside("NL")]
+    # way[highway=trunk][maxspeed][maxspeed>100][inside("NL")]
+    # way[highway=trunk_link][maxspeed][maxspeed>100][inside("NL")]
+    # way[motorroad=yes][maxspeed][maxspeed>100][inside("NL")][highway!~/^(motorway(_link)?|construction|proposed)$/]
+    # way[highway][maxspeed][maxspeed>80][highway!~/^(motorway(_link)?|trunk(_link)?|cycleway|service|busway|construction|proposed|raceway)$/][motorroad!=yes][inside("NL")]
+    # way[highway=cycleway][maxspeed][maxspeed>40][!motor_vehicle][!vehicle][!access][inside("NL")]
+    def _way_rule_62(self, data, tags, nds, keys, sets, err):
         if ("highway" in keys and "maxspeed" in keys) or (
             "maxspeed" in keys and "motorroad" in keys
         ):
@@ -11285,11 +11386,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[maxspeed:mofa][maxspeed:mofa>25][inside("NL")]
-        # way[maxspeed:moped][maxspeed:moped>45][inside("NL")]
-        # way[maxspeed:bus][maxspeed:bus>100][inside("NL")]
-        # way[maxspeed:trailer][maxspeed:trailer>90][inside("NL")]
-        # way[maxspeed:hgv][maxspeed:hgv>80][inside("NL")]
+    # way[maxspeed:mofa][maxspeed:mofa>25][inside("NL")]
+    # way[maxspeed:moped][maxspeed:moped>45][inside("NL")]
+    # way[maxspeed:bus][maxspeed:bus>100][inside("NL")]
+    # way[maxspeed:trailer][maxspeed:trailer>90][inside("NL")]
+    # way[maxspeed:hgv][maxspeed:hgv>80][inside("NL")]
+    def _way_rule_63(self, data, tags, nds, keys, sets, err):
         if (
             ("maxspeed:bus" in keys)
             or ("maxspeed:hgv" in keys)
@@ -11380,9 +11482,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[maxspeed][maxspeed=~/[1-9]$/][maxspeed!=5][maxspeed!=15][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
-        # way[maxspeed=20][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
-        # way[maxspeed=40][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
+    # way[maxspeed][maxspeed=~/[1-9]$/][maxspeed!=5][maxspeed!=15][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
+    # way[maxspeed=20][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
+    # way[maxspeed=40][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
+    def _way_rule_64(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "maxspeed" in keys:
             match = False
             if not match:
@@ -11496,7 +11599,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[oneway:bicycle][!oneway:mofa][oneway?][oneway:bicycle=~/^(no|-1|0)$/][mofa!~/^(no|use_sidepath)$/][motor_vehicle!~/^(no|use_sidepath)$/][inside("NL")]
+    # way[oneway:bicycle][!oneway:mofa][oneway?][oneway:bicycle=~/^(no|-1|0)$/][mofa!~/^(no|use_sidepath)$/][motor_vehicle!~/^(no|use_sidepath)$/][inside("NL")]
+    def _way_rule_65(self, data, tags, nds, keys, sets, err):
         if "oneway" in keys and "oneway:bicycle" in keys:
             match = False
             if not match:
@@ -11583,10 +11687,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa][!mofa:forward][bicycle:forward!=designated][bicycle:forward!=yes][inside("NL")]
-        # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa][!mofa:backward][bicycle:backward!=designated][bicycle:backward!=yes][inside("NL")]
-        # way[bicycle:both_ways][moped:both_ways][bicycle:both_ways=*"moped:both_ways"][!mofa][!mofa:both_ways][bicycle:both_ways!=designated][bicycle:both_ways!=yes][inside("NL")]
-        # way[bicycle][moped][bicycle=*moped][!mofa][bicycle!=designated][bicycle!=yes][inside("NL")]
+    # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa][!mofa:forward][bicycle:forward!=designated][bicycle:forward!=yes][inside("NL")]
+    # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa][!mofa:backward][bicycle:backward!=designated][bicycle:backward!=yes][inside("NL")]
+    # way[bicycle:both_ways][moped:both_ways][bicycle:both_ways=*"moped:both_ways"][!mofa][!mofa:both_ways][bicycle:both_ways!=designated][bicycle:both_ways!=yes][inside("NL")]
+    # way[bicycle][moped][bicycle=*moped][!mofa][bicycle!=designated][bicycle!=yes][inside("NL")]
+    def _way_rule_66(self, data, tags, nds, keys, sets, err):
         if (
             ("bicycle" in keys and "moped" in keys)
             or ("bicycle:backward" in keys and "moped:backward" in keys)
@@ -11784,7 +11889,144 @@ class Josm_DutchSpecific(PluginMapCSS):
                     }
                 )
 
-        return err
+    _way_rules = (
+        _way_rule_0,
+        _way_rule_1,
+        _way_rule_2,
+        _way_rule_3,
+        _way_rule_4,
+        _way_rule_5,
+        _way_rule_6,
+        _way_rule_7,
+        _way_rule_8,
+        _way_rule_9,
+        _way_rule_10,
+        _way_rule_11,
+        _way_rule_12,
+        _way_rule_13,
+        _way_rule_14,
+        _way_rule_15,
+        _way_rule_16,
+        _way_rule_17,
+        _way_rule_18,
+        _way_rule_19,
+        _way_rule_20,
+        _way_rule_21,
+        _way_rule_22,
+        _way_rule_23,
+        _way_rule_24,
+        _way_rule_25,
+        _way_rule_26,
+        _way_rule_27,
+        _way_rule_28,
+        _way_rule_29,
+        _way_rule_30,
+        _way_rule_31,
+        _way_rule_32,
+        _way_rule_33,
+        _way_rule_34,
+        _way_rule_35,
+        _way_rule_36,
+        _way_rule_37,
+        _way_rule_38,
+        _way_rule_39,
+        _way_rule_40,
+        _way_rule_41,
+        _way_rule_42,
+        _way_rule_43,
+        _way_rule_44,
+        _way_rule_45,
+        _way_rule_46,
+        _way_rule_47,
+        _way_rule_48,
+        _way_rule_49,
+        _way_rule_50,
+        _way_rule_51,
+        _way_rule_52,
+        _way_rule_53,
+        _way_rule_54,
+        _way_rule_55,
+        _way_rule_56,
+        _way_rule_57,
+        _way_rule_58,
+        _way_rule_59,
+        _way_rule_60,
+        _way_rule_61,
+        _way_rule_62,
+        _way_rule_63,
+        _way_rule_64,
+        _way_rule_65,
+        _way_rule_66,
+    )
+    _way_rules_dispatch = {
+        "addr:housename": (41, 42, 43),
+        "addr:interpolation": (38,),
+        "amenity": (50,),
+        "bicycle": (66,),
+        "bicycle:backward": (66,),
+        "bicycle:both_ways": (66,),
+        "bicycle:forward": (66,),
+        "bicycle_road": (45,),
+        "building": (25, 37),
+        "building:name": (41, 42, 43),
+        "bus": (5,),
+        "contact:mobile": (22, 23, 24),
+        "contact:phone": (22, 23, 24),
+        "contact:whatsapp": (22, 24),
+        "cycleway": (32, 33, 34),
+        "cycleway:both": (33, 34),
+        "cycleway:left": (33, 34),
+        "cycleway:right": (33, 34),
+        "cycleway:surface": (27, 28, 29),
+        "footway:surface": (27, 28, 29),
+        "heritage": (56,),
+        "heritage:operator": (58,),
+        "hgv": (5,),
+        "highway": (59,),
+        "is_in": (39,),
+        "is_in:city": (39,),
+        "is_in:continent": (39,),
+        "is_in:country": (39,),
+        "is_in:country_code": (39,),
+        "is_in:province": (39,),
+        "junction": (17,),
+        "leisure": (50,),
+        "living_street": (8, 59),
+        "maxspeed": (62, 64),
+        "maxspeed:bus": (63,),
+        "maxspeed:conditional": (61,),
+        "maxspeed:hgv": (63,),
+        "maxspeed:mofa": (63,),
+        "maxspeed:moped": (63,),
+        "maxspeed:trailer": (63,),
+        "maxspeed:type": (59, 60),
+        "mofa": (0,),
+        "moped": (0,),
+        "motorroad": (62,),
+        "name": (50, 51, 52),
+        "name:fy": (55,),
+        "name:nl": (55,),
+        "oneway": (15,),
+        "oneway:bicycle": (65,),
+        "parking:both": (19,),
+        "parking:lane:right": (19,),
+        "parking:left": (19,),
+        "parking:right": (19,),
+        "phone": (22, 23, 24),
+        "place": (53,),
+        "postal_code": (36,),
+        "psv": (5,),
+        "railway": (54,),
+        "ref:rce": (57,),
+        "segregated": (30, 32),
+        "sidewalk": (35,),
+        "surface": (46, 47),
+        "tracks": (40,),
+        "traffic_sign": (1, 2, 3, 4, 6, 7, 9, 10, 11, 12, 13, 14, 16, 18, 20, 60),
+        "traffic_sign:backward": (11, 12, 13, 14, 18, 21, 60),
+        "traffic_sign:forward": (11, 12, 13, 14, 18, 21, 60),
+    }
+    _way_rules_fallback = (26, 31, 44, 48, 49)
 
     def relation(self, data, tags, members):
         capture_tags = {}
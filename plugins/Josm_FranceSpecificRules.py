@@ -12,6 +12,72 @@ class Josm_FranceSpecificRules(PluginMapCSS):
 
     only_for = ["FR"]
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "fuel:octane_95",
+            "name",
+            "nat_ref",
+            "operator",
+            "power",
+            "ref",
+            "ref:ERDF:gdo",
+            "ref:FR:ARCEP",
+            "ref:FR:FANTOIR",
+            "ref:FR:FANTOIR:left",
+            "ref:FR:FANTOIR:right",
+            "ref:FR:Orange",
+            "ref:FR:Orange:NRO",
+            "ref:FR:PTT",
+            "ref:FR:PTT:NRA",
+            "ref:FR:SFR",
+            "ref:FR:gdo",
+            "school:FR",
+        ],
+        "way": [
+            "fuel:octane_95",
+            "junction",
+            "name",
+            "nat_ref",
+            "nat_ref:backward",
+            "nat_ref:forward",
+            "operator",
+            "power",
+            "railway",
+            "ref:ERDF:gdo",
+            "ref:FR:ARCEP",
+            "ref:FR:FANTOIR",
+            "ref:FR:FANTOIR:left",
+            "ref:FR:FANTOIR:right",
+            "ref:FR:Orange",
+            "ref:FR:Orange:NRO",
+            "ref:FR:PTT",
+            "ref:FR:PTT:NRA",
+            "ref:FR:SFR",
+            "ref:FR:gdo",
+            "school:FR",
+        ],
+        "relation": [
+            "fuel:octane_95",
+            "name",
+            "operator",
+            "power",
+            "ref:ERDF:gdo",
+            "ref:FR:ARCEP",
+            "ref:FR:FANTOIR",
+            "ref:FR:FANTOIR:left",
+            "ref:FR:FANTOIR:right",
+            "ref:FR:Orange",
+            "ref:FR:Orange:NRO",
+            "ref:FR:PTT",
+            "ref:FR:PTT:NRA",
+            "ref:FR:SFR",
+            "ref:FR:gdo",
+            "school:FR",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -136,44 +202,46 @@ class Josm_FranceSpecificRules(PluginMapCSS):
             title=mapcss.tr("validation rules Fantoir in France"),
         )
 
-        self.re_045a0f34 = re.compile(r"(?i)co.?voiturage")
-        self.re_107d2c86 = re.compile(r"PT[1-9]{1}[0-9]*")
-        self.re_1473b7c6 = re.compile(
+        self.re_045a0f34 = mapcss.lazy_regex(r"(?i)co.?voiturage")
+        self.re_107d2c86 = mapcss.lazy_regex(r"PT[1-9]{1}[0-9]*")
+        self.re_1473b7c6 = mapcss.lazy_regex(
             r"^(motorway|trunk|primary|secondary|tertiary|unclassified)$"
         )
-        self.re_173ac8d4 = re.compile(r"[0-9]{5}[A-Z0-9]{3}")
-        self.re_23d0d993 = re.compile(r"[A-Z0-9]{3}")
-        self.re_299ea34e = re.compile(
+        self.re_173ac8d4 = mapcss.lazy_regex(r"[0-9]{5}[A-Z0-9]{3}")
+        self.re_23d0d993 = mapcss.lazy_regex(r"[A-Z0-9]{3}")
+        self.re_299ea34e = mapcss.lazy_regex(
             r"^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$"
         )
-        self.re_30299d59 = re.compile(r"^(Enedis|GRDF)$")
-        self.re_3b28b3c0 = re.compile(
+        self.re_30299d59 = mapcss.lazy_regex(r"^(Enedis|GRDF)$")
+        self.re_3b28b3c0 = mapcss.lazy_regex(
             r"^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$"
         )
-        self.re_3b90619c = re.compile(r"^\D")
-        self.re_419bc5d2 = re.compile(
+        self.re_3b90619c = mapcss.lazy_regex(r"^\D")
+        self.re_419bc5d2 = mapcss.lazy_regex(
             r"^(([1-9][0-9]|0[1-9])[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D)$"
         )
-        self.re_4bae79a8 = re.compile(
+        self.re_4bae79a8 = mapcss.lazy_regex(
             r"[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}"
         )
-        self.re_4e9373ac = re.compile(
+        self.re_4e9373ac = mapcss.lazy_regex(
             r"^(([1-9][0-9]|0[1-9])[ANP]9[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D)$"
         )
-        self.re_66c32242 = re.compile(
+        self.re_66c32242 = mapcss.lazy_regex(
             r"^([1-9][0-9]|0[1-9])[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$"
         )
-        self.re_6ac6c83c = re.compile(r"^(pole|tower)$")
-        self.re_6beaf147 = re.compile(
+        self.re_6ac6c83c = mapcss.lazy_regex(r"^(pole|tower)$")
+        self.re_6beaf147 = mapcss.lazy_regex(
             r"^([1-9][0-9]|0[1-9])[AN]8[0-9]{3}(|A|N)([0-9]?[0-9])(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$"
         )
-        self.re_7510958f = re.compile(
+        self.re_7510958f = mapcss.lazy_regex(
             r"^(([1-9][0-9]|0[1-9])PR([0-9]|[1-9][0-9]|[1-9][0-9][0-9])[DGU](|C))$"
         )
-        self.re_7f0c6b73 = re.compile(
+        self.re_7f0c6b73 = mapcss.lazy_regex(
             r"^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))+))|no)$"
         )
-        self.re_7f2e60da = re.compile(r"^(75Periph_Paris_[0-9]{2}_(1[0-9]|[1-9])D)$")
+        self.re_7f2e60da = mapcss.lazy_regex(
+            r"^(75Periph_Paris_[0-9]{2}_(1[0-9]|[1-9])D)$"
+        )
 
     def node(self, data, tags):
         capture_tags = {}
@@ -12,6 +12,10 @@ class Josm_ItalySpecific(PluginMapCSS):
 
     only_for = ["IT"]
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {"node": ["amenity"], "way": ["amenity"], "relation": ["amenity"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -12,6 +12,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
 
     only_for = ["BR"]
 
+    tags_only = ["node", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -432,153 +434,165 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
             ),
         )
 
-        self.re_01454d46 = re.compile(r"(?i)\bmotel\b")
-        self.re_044c8944 = re.compile(
+        self.re_01454d46 = mapcss.lazy_regex(r"(?i)\bmotel\b")
+        self.re_044c8944 = mapcss.lazy_regex(
             r"^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)"
         )
-        self.re_04873a60 = re.compile(r"^(river|stream)$")
-        self.re_05a345c7 = re.compile(r"^(forest|grass|greenfield|meadow|orchard)$")
-        self.re_066203d3 = re.compile(r"^[0-9]+$")
-        self.re_073e5345 = re.compile(r"\b[A-Z]{2,3} (- )?[0-9]{2,3}\b")
-        self.re_07f31a73 = re.compile(
+        self.re_04873a60 = mapcss.lazy_regex(r"^(river|stream)$")
+        self.re_05a345c7 = mapcss.lazy_regex(
+            r"^(forest|grass|greenfield|meadow|orchard)$"
+        )
+        self.re_066203d3 = mapcss.lazy_regex(r"^[0-9]+$")
+        self.re_073e5345 = mapcss.lazy_regex(r"\b[A-Z]{2,3} (- )?[0-9]{2,3}\b")
+        self.re_07f31a73 = mapcss.lazy_regex(
             r"^(living_street|pedestrian|residential|road|service|track)$"
         )
-        self.re_0b27200b = re.compile(r"(?i)^s(\.|-| )?\/?n\.?º?$")
-        self.re_0db5b64e = re.compile(r"village|town|city")
-        self.re_1054eb5a = re.compile(
+        self.re_0b27200b = mapcss.lazy_regex(r"(?i)^s(\.|-| )?\/?n\.?º?$")
+        self.re_0db5b64e = mapcss.lazy_regex(r"village|town|city")
+        self.re_1054eb5a = mapcss.lazy_regex(
             r"bridleway|bus_stop|cycleway|crossing|footway|give_way|motorway_junction|path|raceway|rest_area|services|speed_camera|steps|stop"
         )
-        self.re_10f1c360 = re.compile(r"(,|( |-) ?[A-Z]{2})")
-        self.re_126ba9a9 = re.compile(r"(?i)^Borrach(aria|eiro)")
-        self.re_12b48afb = re.compile(r"^(grassland|heath|scrub|wood)$")
-        self.re_131cc885 = re.compile(r" ou ")
-        self.re_139e342b = re.compile(r"(?i)^Helipo(n|r)to.*")
-        self.re_13f4c147 = re.compile(r"(?i)(?u)^paço\b")
-        self.re_152c10ee = re.compile(r"hamlet|isolated_dwelling|town|village")
-        self.re_15690541 = re.compile(r"^(?i)estrada de ferro")
-        self.re_160d1bfc = re.compile(r"^(?i)creche\b")
-        self.re_178f5446 = re.compile(
+        self.re_10f1c360 = mapcss.lazy_regex(r"(,|( |-) ?[A-Z]{2})")
+        self.re_126ba9a9 = mapcss.lazy_regex(r"(?i)^Borrach(aria|eiro)")
+        self.re_12b48afb = mapcss.lazy_regex(r"^(grassland|heath|scrub|wood)$")
+        self.re_131cc885 = mapcss.lazy_regex(r" ou ")
+        self.re_139e342b = mapcss.lazy_regex(r"(?i)^Helipo(n|r)to.*")
+        self.re_13f4c147 = mapcss.lazy_regex(r"(?i)(?u)^paço\b")
+        self.re_152c10ee = mapcss.lazy_regex(r"hamlet|isolated_dwelling|town|village")
+        self.re_15690541 = mapcss.lazy_regex(r"^(?i)estrada de ferro")
+        self.re_160d1bfc = mapcss.lazy_regex(r"^(?i)creche\b")
+        self.re_178f5446 = mapcss.lazy_regex(
             r"(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*"
         )
-        self.re_17fd35b3 = re.compile(r"^pt:")
-        self.re_1b6eb989 = re.compile(
+        self.re_17fd35b3 = mapcss.lazy_regex(r"^pt:")
+        self.re_1b6eb989 = mapcss.lazy_regex(
             r"^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$"
         )
-        self.re_1d232d4c = re.compile(
+        self.re_1d232d4c = mapcss.lazy_regex(
             r"^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b"
         )
-        self.re_20188fb1 = re.compile(r"^[0-9]+( |-)*([A-Z])?$")
-        self.re_20c7dd98 = re.compile(
+        self.re_20188fb1 = mapcss.lazy_regex(r"^[0-9]+( |-)*([A-Z])?$")
+        self.re_20c7dd98 = mapcss.lazy_regex(
             r"^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$"
         )
-        self.re_20cf30ba = re.compile(
+        self.re_20cf30ba = mapcss.lazy_regex(
             r"^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|rodovia|rotatória|rua|travessa|trevo|viela) .*"
         )
-        self.re_20fc5143 = re.compile(r"^(?i)Bairro\b")
-        self.re_243f4993 = re.compile(r"^(\+55|0800)")
-        self.re_280004fd = re.compile(
+        self.re_20fc5143 = mapcss.lazy_regex(r"^(?i)Bairro\b")
+        self.re_243f4993 = mapcss.lazy_regex(r"^(\+55|0800)")
+        self.re_280004fd = mapcss.lazy_regex(
             r"^(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b"
         )
-        self.re_292e0bb5 = re.compile(r"(?i)\b[0-9]+ ?m?\b")
-        self.re_2cd1e949 = re.compile(r"^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)")
-        self.re_2dbaea13 = re.compile(r"^(?i)\bSAMU\b")
-        self.re_2e8e4f2b = re.compile(r"(?i)google")
-        self.re_2fcb6bab = re.compile(r"^(?i)ciclovia .*")
-        self.re_2ffc377d = re.compile(r".* D(a|e|o)s? .*")
-        self.re_31732cd0 = re.compile(
+        self.re_292e0bb5 = mapcss.lazy_regex(r"(?i)\b[0-9]+ ?m?\b")
+        self.re_2cd1e949 = mapcss.lazy_regex(r"^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)")
+        self.re_2dbaea13 = mapcss.lazy_regex(r"^(?i)\bSAMU\b")
+        self.re_2e8e4f2b = mapcss.lazy_regex(r"(?i)google")
+        self.re_2fcb6bab = mapcss.lazy_regex(r"^(?i)ciclovia .*")
+        self.re_2ffc377d = mapcss.lazy_regex(r".* D(a|e|o)s? .*")
+        self.re_31732cd0 = mapcss.lazy_regex(
             r"(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$"
         )
-        self.re_3570fd42 = re.compile(r"(?i)\bAPA\b")
-        self.re_35bb0f2f = re.compile(
+        self.re_3570fd42 = mapcss.lazy_regex(r"(?i)\bAPA\b")
+        self.re_35bb0f2f = mapcss.lazy_regex(
             r"^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b"
         )
-        self.re_362f879f = re.compile(r"college|school")
-        self.re_375e3de4 = re.compile(
+        self.re_362f879f = mapcss.lazy_regex(r"college|school")
+        self.re_375e3de4 = mapcss.lazy_regex(
             r".*([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3}).*"
         )
-        self.re_38a8f0ff = re.compile(r"^(?i)(?u)edifício.*")
-        self.re_39d67968 = re.compile(r"^[a-z].*")
-        self.re_3aeda39d = re.compile(
+        self.re_38a8f0ff = mapcss.lazy_regex(r"^(?i)(?u)edifício.*")
+        self.re_39d67968 = mapcss.lazy_regex(r"^[a-z].*")
+        self.re_3aeda39d = mapcss.lazy_regex(
             r"hamlet|island|isolated_dwelling|neighbourhood|suburb|village"
         )
-        self.re_3b304b9b = re.compile(
+        self.re_3b304b9b = mapcss.lazy_regex(
             r"(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b"
         )
-        self.re_3eb0ab44 = re.compile(r"clinic|doctors|hospital")
-        self.re_408831d0 = re.compile(r"^(br|bR|Br)[0-9]{14}$")
-        self.re_46ab4d8d = re.compile(r"^(?i)(?u)c(â|a)mara\b")
-        self.re_4a8ca94e = re.compile(r"^(?i)(?u)praça.*")
-        self.re_4bd3b925 = re.compile(r"^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$")
-        self.re_4cf86823 = re.compile(r"(?i)\bsaude\b")
-        self.re_509425de = re.compile(r"(?i)(?u)\bAPA\b|Área de Proteção Ambiental")
-        self.re_524288b6 = re.compile(r"^BR[0-9]{14}$")
-        self.re_52ab3b8b = re.compile(
+        self.re_3eb0ab44 = mapcss.lazy_regex(r"clinic|doctors|hospital")
+        self.re_408831d0 = mapcss.lazy_regex(r"^(br|bR|Br)[0-9]{14}$")
+        self.re_46ab4d8d = mapcss.lazy_regex(r"^(?i)(?u)c(â|a)mara\b")
+        self.re_4a8ca94e = mapcss.lazy_regex(r"^(?i)(?u)praça.*")
+        self.re_4bd3b925 = mapcss.lazy_regex(r"^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$")
+        self.re_4cf86823 = mapcss.lazy_regex(r"(?i)\bsaude\b")
+        self.re_509425de = mapcss.lazy_regex(
+            r"(?i)(?u)\bAPA\b|Área de Proteção Ambiental"
+        )
+        self.re_524288b6 = mapcss.lazy_regex(r"^BR[0-9]{14}$")
+        self.re_52ab3b8b = mapcss.lazy_regex(
             r"^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$"
         )
-        self.re_53abc074 = re.compile(
+        self.re_53abc074 = mapcss.lazy_regex(
             r"^(give_way|mini_roundabout|stop|turning_circle)$"
         )
-        self.re_568a42f4 = re.compile(r"\b[A-Z]{2,4} (- )?[0-9]{2,3}\b")
-        self.re_57b8ef8e = re.compile(r"_[0-9]$")
-        self.re_57bee688 = re.compile(r"^[0-9]{5}( |\.)[0-9]{3}$")
-        self.re_5849be19 = re.compile(
+        self.re_568a42f4 = mapcss.lazy_regex(r"\b[A-Z]{2,4} (- )?[0-9]{2,3}\b")
+        self.re_57b8ef8e = mapcss.lazy_regex(r"_[0-9]$")
+        self.re_57bee688 = mapcss.lazy_regex(r"^[0-9]{5}( |\.)[0-9]{3}$")
+        self.re_5849be19 = mapcss.lazy_regex(
             r"^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*"
         )
-        self.re_58f616c9 = re.compile(
+        self.re_58f616c9 = mapcss.lazy_regex(
             r"^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$"
         )
-        self.re_591572a5 = re.compile(r"city|hamlet|isolated_dwelling|village")
-        self.re_5ab76b11 = re.compile(r"^(clinic|doctors|hospital)$")
-        self.re_5ac7053e = re.compile(r"^(1(a|b)?|[1-9][0-9]?)$")
-        self.re_5cd37790 = re.compile(r"(?i)^motel\b")
-        self.re_5d3348cb = re.compile(r"city|farm|neighbourhood|suburb|town|village")
-        self.re_5ddbb7eb = re.compile(
+        self.re_591572a5 = mapcss.lazy_regex(r"city|hamlet|isolated_dwelling|village")
+        self.re_5ab76b11 = mapcss.lazy_regex(r"^(clinic|doctors|hospital)$")
+        self.re_5ac7053e = mapcss.lazy_regex(r"^(1(a|b)?|[1-9][0-9]?)$")
+        self.re_5cd37790 = mapcss.lazy_regex(r"(?i)^motel\b")
+        self.re_5d3348cb = mapcss.lazy_regex(
+            r"city|farm|neighbourhood|suburb|town|village"
+        )
+        self.re_5ddbb7eb = mapcss.lazy_regex(
             r"^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$"
         )
-        self.re_6024a566 = re.compile(r"(?i)^Aer(ódromo|oporto) de.*")
-        self.re_604bb645 = re.compile(
+        self.re_6024a566 = mapcss.lazy_regex(r"(?i)^Aer(ódromo|oporto) de.*")
+        self.re_604bb645 = mapcss.lazy_regex(
             r"(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b"
         )
-        self.re_60ad6838 = re.compile(
+        self.re_60ad6838 = mapcss.lazy_regex(
             r"^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodoanel|Rodovia|Rotatória|Rótula|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*"
         )
-        self.re_6416be64 = re.compile(r"^(island|islet)$")
-        self.re_64387998 = re.compile(r"^(?i)Bairro d(a|e|o)s?\b")
-        self.re_6566db6a = re.compile(r"(?i).*heliport$")
-        self.re_65710fdb = re.compile(
+        self.re_6416be64 = mapcss.lazy_regex(r"^(island|islet)$")
+        self.re_64387998 = mapcss.lazy_regex(r"^(?i)Bairro d(a|e|o)s?\b")
+        self.re_6566db6a = mapcss.lazy_regex(r"(?i).*heliport$")
+        self.re_65710fdb = mapcss.lazy_regex(
             r"(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)"
         )
-        self.re_667ce569 = re.compile(
+        self.re_667ce569 = mapcss.lazy_regex(
             r"^(?i)(?u)((via de )?(acesso|ligação)(( (a|à))? propriedade)?|entrada|entroncamento|rampa|retorno|rotat(ó|o)ria|r(ó|o)tula|sa(í|i)da|trevo|estrada( municipal| de terra)?|rua|rodovia|via)( (de acesso|sem nome|projetad(a|o)))?$"
         )
-        self.re_67c67cf2 = re.compile(r"^[0-9]+0$")
-        self.re_6b6e390d = re.compile(r"(Alameda|Avenida|Rua|Travessa|Viela) .*")
-        self.re_6bf570a0 = re.compile(
+        self.re_67c67cf2 = mapcss.lazy_regex(r"^[0-9]+0$")
+        self.re_6b6e390d = mapcss.lazy_regex(r"(Alameda|Avenida|Rua|Travessa|Viela) .*")
+        self.re_6bf570a0 = mapcss.lazy_regex(
             r"^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*"
         )
-        self.re_6c0d6e9e = re.compile(r"school|university")
-        self.re_6e34cd0f = re.compile(r"(?i)\bcoreto\b")
-        self.re_6efb8049 = re.compile(r"(?i).*airport$")
-        self.re_72d45155 = re.compile(r"route|street")
-        self.re_7633bf4e = re.compile(r"Rodovia ([A-Z]{2,3}-[0-9]{2,4})")
-        self.re_793b22ec = re.compile(r"^(?i)(?u)c((â|a)me|ama)ra\b")
-        self.re_7a246e93 = re.compile(r"^(100|18{0,1}|19[0-9])$")
-        self.re_7a5b2736 = re.compile(r"\.")
-        self.re_7afc6883 = re.compile(r"^[A-Z]{4}$")
-        self.re_7b7c453d = re.compile(
+        self.re_6c0d6e9e = mapcss.lazy_regex(r"school|university")
+        self.re_6e34cd0f = mapcss.lazy_regex(r"(?i)\bcoreto\b")
+        self.re_6efb8049 = mapcss.lazy_regex(r"(?i).*airport$")
+        self.re_72d45155 = mapcss.lazy_regex(r"route|street")
+        self.re_7633bf4e = mapcss.lazy_regex(r"Rodovia ([A-Z]{2,3}-[0-9]{2,4})")
+        self.re_793b22ec = mapcss.lazy_regex(r"^(?i)(?u)c((â|a)me|ama)ra\b")
+        self.re_7a246e93 = mapcss.lazy_regex(r"^(100|18{0,1}|19[0-9])$")
+        self.re_7a5b2736 = mapcss.lazy_regex(r"\.")
+        self.re_7afc6883 = mapcss.lazy_regex(r"^[A-Z]{4}$")
+        self.re_7b7c453d = mapcss.lazy_regex(
             r"^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*"
         )
-        self.re_7ec1fb9a = re.compile(r"(?i)^prefeitura\b")
-        self.re_7f53e992 = re.compile(
+        self.re_7ec1fb9a = mapcss.lazy_regex(r"(?i)^prefeitura\b")
+        self.re_7f53e992 = mapcss.lazy_regex(
             r"^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$"
         )
 
     def node(self, data, tags):
-        capture_tags = {}
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._node_rules_dispatch, self._node_rules_fallback, keys
+        ):
+            self._node_rules[rule](self, data, tags, keys, sets, err)
+        return err
 
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _node_rule_0(self, data, tags, keys, sets, err):
         if "addr:street" in keys:
             match = False
             if not match:
@@ -617,7 +631,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _node_rule_1(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -682,7 +697,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _node_rule_2(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -707,7 +723,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _node_rule_3(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -734,7 +751,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _node_rule_4(self, data, tags, keys, sets, err):
         if "leisure" in keys and "name" in keys:
             match = False
             if not match:
@@ -766,7 +784,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _node_rule_5(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -792,7 +811,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _node_rule_6(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -830,7 +850,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _node_rule_7(self, data, tags, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -862,7 +883,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _node_rule_8(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -889,23 +911,24 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
 
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    def _node_rule_9(self, data, tags, keys, sets, err):
         if ("designation" in keys) or ("name" in keys) or ("ref" in keys):
             match = False
             if not match:
@@ -1082,7 +1105,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[source=*name][inside("BR")]
+    # *[source=*name][inside("BR")]
+    def _node_rule_10(self, data, tags, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -1111,7 +1135,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _node_rule_11(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -1136,8 +1161,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[maxheight][barrier!=height_restrictor][!traffic_sign][inside("BR")]
-        # node[maxspeed][highway!=speed_camera][!traffic_sign][inside("BR")]
+    # node[maxheight][barrier!=height_restrictor][!traffic_sign][inside("BR")]
+    # node[maxspeed][highway!=speed_camera][!traffic_sign][inside("BR")]
+    def _node_rule_12(self, data, tags, keys, sets, err):
         if ("maxheight" in keys) or ("maxspeed" in keys):
             match = False
             if not match:
@@ -1196,7 +1222,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[noname?][inside("BR")]
+    # node[noname?][inside("BR")]
+    def _node_rule_13(self, data, tags, keys, sets, err):
         if "noname" in keys:
             match = False
             if not match:
@@ -1222,7 +1249,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _node_rule_14(self, data, tags, keys, sets, err):
         if "designation" in keys:
             match = False
             if not match:
@@ -1248,7 +1276,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[highway=motorway_junction][!name][!ref][inside("BR")]
+    # node[highway=motorway_junction][!name][!ref][inside("BR")]
+    def _node_rule_15(self, data, tags, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -1282,7 +1311,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _node_rule_16(self, data, tags, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -1321,7 +1351,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _node_rule_17(self, data, tags, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -1364,7 +1395,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _node_rule_18(self, data, tags, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -1407,14 +1439,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _node_rule_19(self, data, tags, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -1469,8 +1502,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # node[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # node[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # node[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _node_rule_20(self, data, tags, keys, sets, err):
         if ("addr:city" in keys and "place" in keys) or (
             "addr:suburb" in keys and "place" in keys
         ):
@@ -1534,7 +1568,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _node_rule_21(self, data, tags, keys, sets, err):
         if "addr:city" in keys:
             match = False
             if not match:
@@ -1561,7 +1596,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _node_rule_22(self, data, tags, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -1606,7 +1642,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _node_rule_23(self, data, tags, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -1650,7 +1687,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[place=~/^(island|islet)$/][inside("BR")]
+    # node[place=~/^(island|islet)$/][inside("BR")]
+    def _node_rule_24(self, data, tags, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -1677,7 +1715,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _node_rule_25(self, data, tags, keys, sets, err):
         if "iata" in keys:
             match = False
             if not match:
@@ -1703,7 +1742,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _node_rule_26(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -1757,8 +1797,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _node_rule_27(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -1832,7 +1873,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _node_rule_28(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -1880,7 +1922,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _node_rule_29(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -1928,20 +1971,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
 
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _node_rule_30(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -1980,7 +2024,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _node_rule_31(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -2018,7 +2063,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[highway=~/^(give_way|mini_roundabout|stop|turning_circle)$/][name][inside("BR")]
+    # node[highway=~/^(give_way|mini_roundabout|stop|turning_circle)$/][name][inside("BR")]
+    def _node_rule_32(self, data, tags, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -2051,7 +2097,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[highway=speed_camera][!maxspeed][inside("BR")]
+    # node[highway=speed_camera][!maxspeed][inside("BR")]
+    def _node_rule_33(self, data, tags, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -2081,7 +2128,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _node_rule_34(self, data, tags, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -2110,8 +2158,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _node_rule_35(self, data, tags, keys, sets, err):
         if ("aeroway" in keys and "designation" in keys) or (
             "aeroway" in keys and "ref" in keys
         ):
@@ -2207,7 +2256,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _node_rule_36(self, data, tags, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -2233,17 +2283,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _node_rule_37(self, data, tags, keys, sets, err):
         if "addr:postcode" in keys:
             match = False
             if not match:
@@ -2290,7 +2341,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _node_rule_38(self, data, tags, keys, sets, err):
         if "postal_code" in keys:
             match = False
             if not match:
@@ -2337,11 +2389,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _node_rule_39(self, data, tags, keys, sets, err):
         if "alt_source" in keys and "source" in keys:
             match = False
             if not match:
@@ -2368,7 +2421,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _node_rule_40(self, data, tags, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -2394,7 +2448,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _node_rule_41(self, data, tags, keys, sets, err):
         if "long_name" in keys:
             match = False
             if not match:
@@ -2421,7 +2476,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _node_rule_42(self, data, tags, keys, sets, err):
         if "building:levels" in keys:
             match = False
             if not match:
@@ -2447,7 +2503,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _node_rule_43(self, data, tags, keys, sets, err):
         if "hires" in keys:
             match = False
             if not match:
@@ -2472,7 +2529,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[man_made=tower]["tower:type"=lighting][inside("BR")]
+    # node[man_made=tower]["tower:type"=lighting][inside("BR")]
+    def _node_rule_44(self, data, tags, keys, sets, err):
         if "man_made" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -2508,8 +2566,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _node_rule_45(self, data, tags, keys, sets, err):
         if ("name" in keys) or ("tourism" in keys):
             match = False
             if not match:
@@ -2579,7 +2638,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _node_rule_46(self, data, tags, keys, sets, err):
         if "amenity" in keys and "tourism" in keys:
             match = False
             if not match:
@@ -2616,7 +2676,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _node_rule_47(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -2653,8 +2714,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _node_rule_48(self, data, tags, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -2711,8 +2773,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _node_rule_49(self, data, tags, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -2769,7 +2832,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _node_rule_50(self, data, tags, keys, sets, err):
         if "aeroway" in keys and "ref" in keys:
             match = False
             if not match:
@@ -2799,10 +2863,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[surface][!traffic_calming][inside("BR")]
-        # Rule Blacklisted (id: 282605167)
+    # node[surface][!traffic_calming][inside("BR")]
+    # Rule Blacklisted (id: 282605167)
 
-        # *[waterway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    def _node_rule_51(self, data, tags, keys, sets, err):
         if "layer" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -2835,7 +2900,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[waterway][layer>0][!bridge][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    def _node_rule_52(self, data, tags, keys, sets, err):
         if "layer" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -2868,10 +2934,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _node_rule_53(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -2904,7 +2971,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _node_rule_54(self, data, tags, keys, sets, err):
         if "route" in keys:
             match = False
             if not match:
@@ -2933,8 +3001,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _node_rule_55(self, data, tags, keys, sets, err):
         if ("landuse" in keys and "name" in keys) or (
             "name" in keys and "natural" in keys
         ):
@@ -3003,7 +3072,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _node_rule_56(self, data, tags, keys, sets, err):
         if "wikipedia" in keys:
             match = False
             if not match:
@@ -3036,19 +3106,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _node_rule_57(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -3073,10 +3144,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[admin_level][!capital][inside("BR")]
-        # node[border_type][inside("BR")]
-        # node[boundary][inside("BR")]
-        # node[type=boundary][inside("BR")]
+    # node[admin_level][!capital][inside("BR")]
+    # node[border_type][inside("BR")]
+    # node[boundary][inside("BR")]
+    # node[type=boundary][inside("BR")]
+    def _node_rule_58(self, data, tags, keys, sets, err):
         if (
             ("admin_level" in keys)
             or ("border_type" in keys)
@@ -3132,9 +3204,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _node_rule_59(self, data, tags, keys, sets, err):
         if ("boundary" in keys) or ("leisure" in keys):
             match = False
             if not match:
@@ -3190,7 +3263,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _node_rule_60(self, data, tags, keys, sets, err):
         if "boundary" in keys:
             match = False
             if not match:
@@ -3224,7 +3298,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _node_rule_61(self, data, tags, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -3262,7 +3337,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _node_rule_62(self, data, tags, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -3290,7 +3366,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[destination][inside("BR")]
+    # node[destination][inside("BR")]
+    def _node_rule_63(self, data, tags, keys, sets, err):
         if "destination" in keys:
             match = False
             if not match:
@@ -3314,7 +3391,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[exit_to][inside("BR")]
+    # node[exit_to][inside("BR")]
+    def _node_rule_64(self, data, tags, keys, sets, err):
         if "exit_to" in keys:
             match = False
             if not match:
@@ -3337,7 +3415,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[highway=motorway_junction][ref][ref!~/^[0-9]+( |-)*([A-Z])?$/][inside("BR")]
+    # node[highway=motorway_junction][ref][ref!~/^[0-9]+( |-)*([A-Z])?$/][inside("BR")]
+    def _node_rule_65(self, data, tags, keys, sets, err):
         if "highway" in keys and "ref" in keys:
             match = False
             if not match:
@@ -3380,7 +3459,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[highway=motorway_junction][name][inside("BR")]
+    # node[highway=motorway_junction][name][inside("BR")]
+    def _node_rule_66(self, data, tags, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -3412,7 +3492,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[junction][inside("BR")]
+    # node[junction][inside("BR")]
+    def _node_rule_67(self, data, tags, keys, sets, err):
         if "junction" in keys:
             match = False
             if not match:
@@ -3439,7 +3520,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _node_rule_68(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -3466,7 +3548,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _node_rule_69(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -3491,7 +3574,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _node_rule_70(self, data, tags, keys, sets, err):
         if "alt_ref" in keys:
             match = False
             if not match:
@@ -3516,7 +3600,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _node_rule_71(self, data, tags, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -3542,8 +3627,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _node_rule_72(self, data, tags, keys, sets, err):
         if ("name" in keys and "surface" in keys) or (
             "name" in keys and "website" in keys
         ):
@@ -3584,7 +3670,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # node[natural=peak][name=~/(?i)\b[0-9]+ ?m?\b/][inside("BR")]
+    # node[natural=peak][name=~/(?i)\b[0-9]+ ?m?\b/][inside("BR")]
+    def _node_rule_73(self, data, tags, keys, sets, err):
         if "name" in keys and "natural" in keys:
             match = False
             if not match:
@@ -3619,7 +3706,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _node_rule_74(self, data, tags, keys, sets, err):
         if "leisure" in keys and "sport" in keys and "surface" in keys:
             match = False
             if not match:
@@ -3660,7 +3748,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _node_rule_75(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -3697,7 +3786,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _node_rule_76(self, data, tags, keys, sets, err):
         if "amenity" in keys and "brand" in keys:
             match = False
             if not match:
@@ -3731,7 +3821,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _node_rule_77(self, data, tags, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -3768,7 +3859,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _node_rule_78(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -3798,7 +3890,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _node_rule_79(self, data, tags, keys, sets, err):
         if "addr:housenumber" in keys:
             match = False
             if not match:
@@ -3842,7 +3935,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _node_rule_80(self, data, tags, keys, sets, err):
         if "addr:housenumber" in keys and "note" in keys:
             match = False
             if not match:
@@ -3878,7 +3972,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _node_rule_81(self, data, tags, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -3902,7 +3997,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _node_rule_82(self, data, tags, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -3939,7 +4035,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _node_rule_83(self, data, tags, keys, sets, err):
         if "name" in keys and "office" in keys:
             match = False
             if not match:
@@ -3979,8 +4076,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _node_rule_84(self, data, tags, keys, sets, err):
         if ("amenity" in keys and "name" in keys) or (
             "name" in keys and "office" in keys
         ):
@@ -4036,7 +4134,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _node_rule_85(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4075,7 +4174,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _node_rule_86(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4114,7 +4214,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _node_rule_87(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -4137,7 +4238,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _node_rule_88(self, data, tags, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -4173,7 +4275,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _node_rule_89(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4210,7 +4313,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _node_rule_90(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4255,7 +4359,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _node_rule_91(self, data, tags, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -4283,7 +4388,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _node_rule_92(self, data, tags, keys, sets, err):
         if "landuse" in keys and "leisure" in keys:
             match = False
             if not match:
@@ -4323,7 +4429,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _node_rule_93(self, data, tags, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -4354,7 +4461,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _node_rule_94(self, data, tags, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -4408,7 +4516,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _node_rule_95(self, data, tags, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -4449,8 +4558,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _node_rule_96(self, data, tags, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -4503,8 +4613,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _node_rule_97(self, data, tags, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -4548,17 +4659,177 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        return err
+    _node_rules = (
+        _node_rule_0,
+        _node_rule_1,
+        _node_rule_2,
+        _node_rule_3,
+        _node_rule_4,
+        _node_rule_5,
+        _node_rule_6,
+        _node_rule_7,
+        _node_rule_8,
+        _node_rule_9,
+        _node_rule_10,
+        _node_rule_11,
+        _node_rule_12,
+        _node_rule_13,
+        _node_rule_14,
+        _node_rule_15,
+        _node_rule_16,
+        _node_rule_17,
+        _node_rule_18,
+        _node_rule_19,
+        _node_rule_20,
+        _node_rule_21,
+        _node_rule_22,
+        _node_rule_23,
+        _node_rule_24,
+        _node_rule_25,
+        _node_rule_26,
+        _node_rule_27,
+        _node_rule_28,
+        _node_rule_29,
+        _node_rule_30,
+        _node_rule_31,
+        _node_rule_32,
+        _node_rule_33,
+        _node_rule_34,
+        _node_rule_35,
+        _node_rule_36,
+        _node_rule_37,
+        _node_rule_38,
+        _node_rule_39,
+        _node_rule_40,
+        _node_rule_41,
+        _node_rule_42,
+        _node_rule_43,
+        _node_rule_44,
+        _node_rule_45,
+        _node_rule_46,
+        _node_rule_47,
+        _node_rule_48,
+        _node_rule_49,
+        _node_rule_50,
+        _node_rule_51,
+        _node_rule_52,
+        _node_rule_53,
+        _node_rule_54,
+        _node_rule_55,
+        _node_rule_56,
+        _node_rule_57,
+        _node_rule_58,
+        _node_rule_59,
+        _node_rule_60,
+        _node_rule_61,
+        _node_rule_62,
+        _node_rule_63,
+        _node_rule_64,
+        _node_rule_65,
+        _node_rule_66,
+        _node_rule_67,
+        _node_rule_68,
+        _node_rule_69,
+        _node_rule_70,
+        _node_rule_71,
+        _node_rule_72,
+        _node_rule_73,
+        _node_rule_74,
+        _node_rule_75,
+        _node_rule_76,
+        _node_rule_77,
+        _node_rule_78,
+        _node_rule_79,
+        _node_rule_80,
+        _node_rule_81,
+        _node_rule_82,
+        _node_rule_83,
+        _node_rule_84,
+        _node_rule_85,
+        _node_rule_86,
+        _node_rule_87,
+        _node_rule_88,
+        _node_rule_89,
+        _node_rule_90,
+        _node_rule_91,
+        _node_rule_92,
+        _node_rule_93,
+        _node_rule_94,
+        _node_rule_95,
+        _node_rule_96,
+        _node_rule_97,
+    )
+    _node_rules_dispatch = {
+        "access": (36,),
+        "addr:city": (20, 21),
+        "addr:housenumber": (79,),
+        "addr:postcode": (37,),
+        "addr:street": (0,),
+        "addr:suburb": (20,),
+        "admin_level": (58,),
+        "aeroway": (35, 48, 49, 50),
+        "alt_ref": (70,),
+        "alt_source": (39,),
+        "amenity": (6, 26, 27, 28, 29, 30, 31, 75, 82, 84, 87),
+        "border_type": (58,),
+        "boundary": (58, 59, 60),
+        "brand": (76,),
+        "building:levels": (42,),
+        "contact:phone": (96, 97),
+        "crossing": (34,),
+        "designation": (9, 14, 35),
+        "destination": (63,),
+        "exit_to": (64,),
+        "highway": (15, 32, 33, 66),
+        "hires": (43,),
+        "iata": (25,),
+        "junction": (67,),
+        "landuse": (40, 55, 92),
+        "layer": (51, 52),
+        "leisure": (4, 59, 91),
+        "long_name": (41,),
+        "man_made": (44,),
+        "maxheight": (12,),
+        "maxspeed": (12,),
+        "name": (1, 2, 3, 5, 8, 9, 11, 45, 47, 53, 57, 68, 69, 85, 86, 89, 90),
+        "natural": (55, 73),
+        "noname": (13,),
+        "note": (80,),
+        "office": (83, 84),
+        "phone": (96, 97),
+        "place": (7, 19, 22, 23, 24),
+        "population": (16, 17, 18),
+        "postal_code": (38,),
+        "protect_class": (61, 62),
+        "ref": (9, 65),
+        "ref:vatin": (93, 94, 95),
+        "route": (54,),
+        "shop": (77, 88),
+        "source": (10, 81),
+        "sport": (74,),
+        "surface": (71, 72),
+        "tourism": (45, 46),
+        "type": (58,),
+        "website": (72,),
+        "wikipedia": (56,),
+    }
+    _node_rules_fallback = (78,)
 
     def way(self, data, tags, nds):
-        capture_tags = {}
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._way_rules_dispatch, self._way_rules_fallback, keys
+        ):
+            self._way_rules[rule](self, data, tags, nds, keys, sets, err)
+        return err
 
-        # way[name=*ref][highway][inside("BR")]
-        # Rule Blacklisted (id: 995006835)
+    # way[name=*ref][highway][inside("BR")]
+    # Rule Blacklisted (id: 995006835)
 
-        # way[highway][name=~/\b[A-Z]{2,4} (- )?[0-9]{2,3}\b/][inside("BR")]
+    # way[highway][name=~/\b[A-Z]{2,4} (- )?[0-9]{2,3}\b/][inside("BR")]
+    def _way_rule_0(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -4589,8 +4860,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=cycleway][name][name!~/^(?i)ciclovia .*/][inside("BR")]
-        # way[highway][highway!~/bridleway|bus_stop|cycleway|crossing|footway|give_way|motorway_junction|path|raceway|rest_area|services|speed_camera|steps|stop/][name][name!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodoanel|Rodovia|Rotatória|Rótula|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # way[highway=cycleway][name][name!~/^(?i)ciclovia .*/][inside("BR")]
+    # way[highway][highway!~/bridleway|bus_stop|cycleway|crossing|footway|give_way|motorway_junction|path|raceway|rest_area|services|speed_camera|steps|stop/][name][name!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodoanel|Rodovia|Rotatória|Rótula|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _way_rule_1(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -4663,7 +4935,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _way_rule_2(self, data, tags, nds, keys, sets, err):
         if "addr:street" in keys:
             match = False
             if not match:
@@ -4702,7 +4975,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][name][name=~/\./]
+    # way[highway][name][name=~/\./]
+    def _way_rule_3(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -4735,7 +5009,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _way_rule_4(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4800,7 +5075,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=track][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|rodovia|rotatória|rua|travessa|trevo|viela) .*/][inside("BR")]
+    # way[highway=track][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|rodovia|rotatória|rua|travessa|trevo|viela) .*/][inside("BR")]
+    def _way_rule_5(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -4839,7 +5115,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _way_rule_6(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4864,7 +5141,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _way_rule_7(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4891,7 +5169,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][name=~/^(?i)(?u)((via de )?(acesso|ligação)(( (a|à))? propriedade)?|entrada|entroncamento|rampa|retorno|rotat(ó|o)ria|r(ó|o)tula|sa(í|i)da|trevo|estrada( municipal| de terra)?|rua|rodovia|via)( (de acesso|sem nome|projetad(a|o)))?$/][inside("BR")]
+    # way[highway][name=~/^(?i)(?u)((via de )?(acesso|ligação)(( (a|à))? propriedade)?|entrada|entroncamento|rampa|retorno|rotat(ó|o)ria|r(ó|o)tula|sa(í|i)da|trevo|estrada( municipal| de terra)?|rua|rodovia|via)( (de acesso|sem nome|projetad(a|o)))?$/][inside("BR")]
+    def _way_rule_8(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -4926,7 +5205,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _way_rule_9(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys and "name" in keys:
             match = False
             if not match:
@@ -4958,7 +5238,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _way_rule_10(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -4984,7 +5265,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _way_rule_11(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -5022,7 +5304,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _way_rule_12(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -5054,7 +5337,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _way_rule_13(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -5081,10 +5365,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
 
-        # way[highway][type=route][inside("BR")]
+    # way[highway][type=route][inside("BR")]
+    def _way_rule_14(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "type" in keys:
             match = False
             if not match:
@@ -5114,10 +5399,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][highway!~/bus_stop|milestone|motorway_junction|traffic_signals/][ref][ref!~/^(([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3});?)+$/][inside("BR")]
-        # Rule Blacklisted (id: 481849808)
+    # way[highway][highway!~/bus_stop|milestone|motorway_junction|traffic_signals/][ref][ref!~/^(([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3});?)+$/][inside("BR")]
+    # Rule Blacklisted (id: 481849808)
 
-        # way[highway][!ref][name=~/.*([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3}).*/][inside("BR")]
+    # way[highway][!ref][name=~/.*([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3}).*/][inside("BR")]
+    def _way_rule_15(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -5152,7 +5438,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][name=~/Rodovia ([A-Z]{2,3}-[0-9]{2,4})/][inside("BR")]
+    # way[highway][name=~/Rodovia ([A-Z]{2,3}-[0-9]{2,4})/][inside("BR")]
+    def _way_rule_16(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -5185,24 +5472,25 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[name=*"addr:street"][highway][inside("BR")]
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
-        # Rule Blacklisted (id: 1279481357)
+    # way[name=*"addr:street"][highway][inside("BR")]
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    # Rule Blacklisted (id: 1279481357)
 
-        # *[source=*name][inside("BR")]
+    # *[source=*name][inside("BR")]
+    def _way_rule_17(self, data, tags, nds, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -5231,7 +5519,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _way_rule_18(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -5256,7 +5545,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _way_rule_19(self, data, tags, nds, keys, sets, err):
         if "designation" in keys:
             match = False
             if not match:
@@ -5282,13 +5572,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=~/^(trunk|motorway)$/][!operator][inside("BR")]
-        # Rule Blacklisted (id: 1594044971)
+    # way[highway=~/^(trunk|motorway)$/][!operator][inside("BR")]
+    # Rule Blacklisted (id: 1594044971)
 
-        # way[highway$=_link][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][inside("BR")]
-        # Rule Blacklisted (id: 200264401)
+    # way[highway$=_link][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][inside("BR")]
+    # Rule Blacklisted (id: 200264401)
 
-        # way[highway][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][ref][inside("BR")]
+    # way[highway][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][ref][inside("BR")]
+    def _way_rule_20(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "name" in keys and "ref" in keys:
             match = False
             if not match:
@@ -5324,7 +5615,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _way_rule_21(self, data, tags, nds, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -5363,7 +5655,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _way_rule_22(self, data, tags, nds, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -5406,7 +5699,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _way_rule_23(self, data, tags, nds, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -5449,14 +5743,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _way_rule_24(self, data, tags, nds, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -5511,8 +5806,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _way_rule_25(self, data, tags, nds, keys, sets, err):
         if ("addr:city" in keys and "place" in keys) or (
             "addr:suburb" in keys and "place" in keys
         ):
@@ -5584,7 +5880,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _way_rule_26(self, data, tags, nds, keys, sets, err):
         if "addr:city" in keys:
             match = False
             if not match:
@@ -5611,7 +5908,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _way_rule_27(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -5656,7 +5954,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _way_rule_28(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -5700,13 +5999,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _way_rule_29(self, data, tags, nds, keys, sets, err):
         if "iata" in keys:
             match = False
             if not match:
@@ -5732,7 +6032,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _way_rule_30(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -5786,8 +6087,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _way_rule_31(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -5861,7 +6163,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _way_rule_32(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -5909,7 +6212,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _way_rule_33(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -5957,20 +6261,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
 
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _way_rule_34(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -6009,7 +6314,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _way_rule_35(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -6047,10 +6353,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=give_way][inside("BR")]
-        # way[highway=mini_roundabout][inside("BR")]
-        # way[highway=stop][inside("BR")]
-        # way[highway=turning_circle][inside("BR")]
+    # way[highway=give_way][inside("BR")]
+    # way[highway=mini_roundabout][inside("BR")]
+    # way[highway=stop][inside("BR")]
+    # way[highway=turning_circle][inside("BR")]
+    def _way_rule_36(self, data, tags, nds, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -6102,7 +6409,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][junction=circular][!oneway?][inside("BR")]
+    # way[highway][junction=circular][!oneway?][inside("BR")]
+    def _way_rule_37(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "junction" in keys:
             match = False
             if not match:
@@ -6136,7 +6444,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _way_rule_38(self, data, tags, nds, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -6165,8 +6474,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _way_rule_39(self, data, tags, nds, keys, sets, err):
         if ("aeroway" in keys and "designation" in keys) or (
             "aeroway" in keys and "ref" in keys
         ):
@@ -6262,7 +6572,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _way_rule_40(self, data, tags, nds, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -6288,17 +6599,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _way_rule_41(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys:
             match = False
             if not match:
@@ -6345,7 +6657,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _way_rule_42(self, data, tags, nds, keys, sets, err):
         if "postal_code" in keys:
             match = False
             if not match:
@@ -6392,12 +6705,13 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # way[highway]["addr:postcode"][highway!=services][inside("BR")]
-        # area[place]["addr:postcode"][inside("BR")]
+    # way[highway]["addr:postcode"][highway!=services][inside("BR")]
+    # area[place]["addr:postcode"][inside("BR")]
+    def _way_rule_43(self, data, tags, nds, keys, sets, err):
         if ("addr:postcode" in keys and "highway" in keys) or (
             "addr:postcode" in keys and "place" in keys
         ):
@@ -6491,7 +6805,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _way_rule_44(self, data, tags, nds, keys, sets, err):
         if "alt_source" in keys and "source" in keys:
             match = False
             if not match:
@@ -6518,7 +6833,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _way_rule_45(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -6544,7 +6860,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _way_rule_46(self, data, tags, nds, keys, sets, err):
         if "long_name" in keys:
             match = False
             if not match:
@@ -6571,7 +6888,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _way_rule_47(self, data, tags, nds, keys, sets, err):
         if "building:levels" in keys:
             match = False
             if not match:
@@ -6597,7 +6915,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _way_rule_48(self, data, tags, nds, keys, sets, err):
         if "hires" in keys:
             match = False
             if not match:
@@ -6622,8 +6941,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _way_rule_49(self, data, tags, nds, keys, sets, err):
         if ("name" in keys) or ("tourism" in keys):
             match = False
             if not match:
@@ -6693,7 +7013,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _way_rule_50(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "tourism" in keys:
             match = False
             if not match:
@@ -6730,7 +7051,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _way_rule_51(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -6767,8 +7089,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _way_rule_52(self, data, tags, nds, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -6825,8 +7148,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _way_rule_53(self, data, tags, nds, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -6883,7 +7207,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _way_rule_54(self, data, tags, nds, keys, sets, err):
         if "aeroway" in keys and "ref" in keys:
             match = False
             if not match:
@@ -6913,21 +7238,22 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[waterway][tunnel=yes][inside("BR")]
-        # Rule Blacklisted (id: 1154433213)
+    # way[waterway][tunnel=yes][inside("BR")]
+    # Rule Blacklisted (id: 1154433213)
 
-        # way[highway][layer<0][!tunnel][inside("BR")]
-        # *[waterway][layer<0][!tunnel][inside("BR")]
-        # Rule Blacklisted (id: 1415734409)
+    # way[highway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    # Rule Blacklisted (id: 1415734409)
 
-        # way[highway][layer>0][!bridge][highway!=bus_stop][inside("BR")]
-        # *[waterway][layer>0][!bridge][inside("BR")]
-        # Rule Blacklisted (id: 58812649)
+    # way[highway][layer>0][!bridge][highway!=bus_stop][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    # Rule Blacklisted (id: 58812649)
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # way[highway=motorway_junction][inside("BR")]
+    # way[highway=motorway_junction][inside("BR")]
+    def _way_rule_55(self, data, tags, nds, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -6953,7 +7279,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _way_rule_56(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -6986,7 +7313,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][maxspeed][maxspeed!~/^[0-9]+$/][inside("BR")]
+    # way[highway][maxspeed][maxspeed!~/^[0-9]+$/][inside("BR")]
+    def _way_rule_57(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "maxspeed" in keys:
             match = False
             if not match:
@@ -7020,7 +7348,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][maxspeed][maxspeed!~/^[0-9]+0$/][inside("BR")]
+    # way[highway][maxspeed][maxspeed!~/^[0-9]+0$/][inside("BR")]
+    def _way_rule_58(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "maxspeed" in keys:
             match = False
             if not match:
@@ -7054,7 +7383,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _way_rule_59(self, data, tags, nds, keys, sets, err):
         if "route" in keys:
             match = False
             if not match:
@@ -7083,8 +7413,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _way_rule_60(self, data, tags, nds, keys, sets, err):
         if ("landuse" in keys and "name" in keys) or (
             "name" in keys and "natural" in keys
         ):
@@ -7153,7 +7484,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _way_rule_61(self, data, tags, nds, keys, sets, err):
         if "wikipedia" in keys:
             match = False
             if not match:
@@ -7186,11 +7518,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway][lanes=1][!oneway?][!junction][!narrow][inside("BR")]
-        # Rule Blacklisted (id: 226394604)
+    # way[highway][lanes=1][!oneway?][!junction][!narrow][inside("BR")]
+    # Rule Blacklisted (id: 226394604)
 
-        # way[cycleway=lane]["cycleway:left"=lane][inside("BR")]
-        # way[cycleway=lane]["cycleway:right"=lane][inside("BR")]
+    # way[cycleway=lane]["cycleway:left"=lane][inside("BR")]
+    # way[cycleway=lane]["cycleway:right"=lane][inside("BR")]
+    def _way_rule_62(self, data, tags, nds, keys, sets, err):
         if ("cycleway" in keys and "cycleway:left" in keys) or (
             "cycleway" in keys and "cycleway:right" in keys
         ):
@@ -7242,19 +7575,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _way_rule_63(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -7279,7 +7613,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[boundary=administrative][!admin_level]!.way_in_relation
+    # way[boundary=administrative][!admin_level]!.way_in_relation
+    def _way_rule_64(self, data, tags, nds, keys, sets, err):
         if "boundary" in keys:
             match = False
             # Skip selector using undeclared class way_in_relation
@@ -7297,7 +7632,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    # way[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    def _way_rule_65(self, data, tags, nds, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -7339,8 +7675,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[admin_level][!boundary]!.way_in_relation
-        # way[admin_level][boundary][boundary!=administrative]!.way_in_relation
+    # way[admin_level][!boundary]!.way_in_relation
+    # way[admin_level][boundary][boundary!=administrative]!.way_in_relation
+    def _way_rule_66(self, data, tags, nds, keys, sets, err):
         if ("admin_level" in keys) or ("admin_level" in keys and "boundary" in keys):
             match = False
             # Skip selector using undeclared class way_in_relation
@@ -7359,9 +7696,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _way_rule_67(self, data, tags, nds, keys, sets, err):
         if ("boundary" in keys) or ("leisure" in keys):
             match = False
             if not match:
@@ -7417,7 +7755,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _way_rule_68(self, data, tags, nds, keys, sets, err):
         if "boundary" in keys:
             match = False
             if not match:
@@ -7451,7 +7790,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _way_rule_69(self, data, tags, nds, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -7489,7 +7829,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _way_rule_70(self, data, tags, nds, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -7517,7 +7858,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    def _way_rule_71(self, data, tags, nds, keys, sets, err):
         if "boundary" in keys and "leisure" in keys and "name" in keys:
             match = False
             if not match:
@@ -7565,7 +7907,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    def _way_rule_72(self, data, tags, nds, keys, sets, err):
         if "boundary" in keys and "name" in keys:
             match = False
             if not match:
@@ -7606,7 +7949,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _way_rule_73(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -7633,7 +7977,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _way_rule_74(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -7658,7 +8003,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _way_rule_75(self, data, tags, nds, keys, sets, err):
         if "alt_ref" in keys:
             match = False
             if not match:
@@ -7683,7 +8029,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=path][tracktype][inside("BR")]
+    # way[highway=path][tracktype][inside("BR")]
+    def _way_rule_76(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "tracktype" in keys:
             match = False
             if not match:
@@ -7713,10 +8060,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway!=track][tracktype][inside("BR")]
-        # Rule Blacklisted (id: 2012241162)
+    # way[highway!=track][tracktype][inside("BR")]
+    # Rule Blacklisted (id: 2012241162)
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _way_rule_77(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -7742,8 +8090,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _way_rule_78(self, data, tags, nds, keys, sets, err):
         if ("name" in keys and "surface" in keys) or (
             "name" in keys and "website" in keys
         ):
@@ -7784,7 +8133,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[highway=~/^(living_street|pedestrian|residential|road|service|track)$/][ref][inside("BR")]
+    # way[highway=~/^(living_street|pedestrian|residential|road|service|track)$/][ref][inside("BR")]
+    def _way_rule_79(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "ref" in keys:
             match = False
             if not match:
@@ -7815,7 +8165,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=wetland][!wetland][inside("BR")]
+    # area[natural=wetland][!wetland][inside("BR")]
+    def _way_rule_80(self, data, tags, nds, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -7845,7 +8196,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=beach][!surface][inside("BR")]
+    # area[natural=beach][!surface][inside("BR")]
+    def _way_rule_81(self, data, tags, nds, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -7879,7 +8231,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    def _way_rule_82(self, data, tags, nds, keys, sets, err):
         if "natural" in keys and "surface" in keys:
             match = False
             if not match:
@@ -7924,11 +8277,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[bridge][!layer][inside("BR")]
-        # way[tunnel][!layer][inside("BR")]
-        # Rule Blacklisted (id: 1354724892)
+    # way[bridge][!layer][inside("BR")]
+    # way[tunnel][!layer][inside("BR")]
+    # Rule Blacklisted (id: 1354724892)
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _way_rule_83(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys and "sport" in keys and "surface" in keys:
             match = False
             if not match:
@@ -7969,7 +8323,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[leisure=track][!area?][inside("BR")]:closed
+    # way[leisure=track][!area?][inside("BR")]:closed
+    def _way_rule_84(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -8002,10 +8357,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
-        # Part of rule not implemented
+    # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
+    # Part of rule not implemented
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _way_rule_85(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -8042,7 +8398,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _way_rule_86(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "brand" in keys:
             match = False
             if not match:
@@ -8076,7 +8433,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _way_rule_87(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -8113,7 +8471,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _way_rule_88(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -8143,7 +8502,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _way_rule_89(self, data, tags, nds, keys, sets, err):
         if "addr:housenumber" in keys:
             match = False
             if not match:
@@ -8187,7 +8547,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _way_rule_90(self, data, tags, nds, keys, sets, err):
         if "addr:housenumber" in keys and "note" in keys:
             match = False
             if not match:
@@ -8223,7 +8584,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _way_rule_91(self, data, tags, nds, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -8247,7 +8609,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _way_rule_92(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -8284,7 +8647,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _way_rule_93(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "office" in keys:
             match = False
             if not match:
@@ -8324,8 +8688,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _way_rule_94(self, data, tags, nds, keys, sets, err):
         if ("amenity" in keys and "name" in keys) or (
             "name" in keys and "office" in keys
         ):
@@ -8381,7 +8746,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _way_rule_95(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -8420,7 +8786,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _way_rule_96(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -8459,7 +8826,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _way_rule_97(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -8482,7 +8850,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _way_rule_98(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -8518,7 +8887,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _way_rule_99(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -8555,8 +8925,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # way[waterway=~/^(river|stream)$/][name][name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
-        # way[waterway=~/^(river|stream)$/][alt_name][alt_name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    # way[waterway=~/^(river|stream)$/][name][name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    # way[waterway=~/^(river|stream)$/][alt_name][alt_name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    def _way_rule_100(self, data, tags, nds, keys, sets, err):
         if ("alt_name" in keys and "waterway" in keys) or (
             "name" in keys and "waterway" in keys
         ):
@@ -8631,7 +9002,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[place=square][leisure!=park][inside("BR")]
+    # area[place=square][leisure!=park][inside("BR")]
+    def _way_rule_101(self, data, tags, nds, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -8671,7 +9043,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _way_rule_102(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -8716,7 +9089,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _way_rule_103(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -8744,7 +9118,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _way_rule_104(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys and "leisure" in keys:
             match = False
             if not match:
@@ -8784,7 +9159,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _way_rule_105(self, data, tags, nds, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -8815,7 +9191,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _way_rule_106(self, data, tags, nds, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -8869,7 +9246,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _way_rule_107(self, data, tags, nds, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -8910,11 +9288,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _way_rule_108(self, data, tags, nds, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -8967,8 +9346,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _way_rule_109(self, data, tags, nds, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -9012,14 +9392,183 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        return err
+    _way_rules = (
+        _way_rule_0,
+        _way_rule_1,
+        _way_rule_2,
+        _way_rule_3,
+        _way_rule_4,
+        _way_rule_5,
+        _way_rule_6,
+        _way_rule_7,
+        _way_rule_8,
+        _way_rule_9,
+        _way_rule_10,
+        _way_rule_11,
+        _way_rule_12,
+        _way_rule_13,
+        _way_rule_14,
+        _way_rule_15,
+        _way_rule_16,
+        _way_rule_17,
+        _way_rule_18,
+        _way_rule_19,
+        _way_rule_20,
+        _way_rule_21,
+        _way_rule_22,
+        _way_rule_23,
+        _way_rule_24,
+        _way_rule_25,
+        _way_rule_26,
+        _way_rule_27,
+        _way_rule_28,
+        _way_rule_29,
+        _way_rule_30,
+        _way_rule_31,
+        _way_rule_32,
+        _way_rule_33,
+        _way_rule_34,
+        _way_rule_35,
+        _way_rule_36,
+        _way_rule_37,
+        _way_rule_38,
+        _way_rule_39,
+        _way_rule_40,
+        _way_rule_41,
+        _way_rule_42,
+        _way_rule_43,
+        _way_rule_44,
+        _way_rule_45,
+        _way_rule_46,
+        _way_rule_47,
+        _way_rule_48,
+        _way_rule_49,
+        _way_rule_50,
+        _way_rule_51,
+        _way_rule_52,
+        _way_rule_53,
+        _way_rule_54,
+        _way_rule_55,
+        _way_rule_56,
+        _way_rule_57,
+        _way_rule_58,
+        _way_rule_59,
+        _way_rule_60,
+        _way_rule_61,
+        _way_rule_62,
+        _way_rule_63,
+        _way_rule_64,
+        _way_rule_65,
+        _way_rule_66,
+        _way_rule_67,
+        _way_rule_68,
+        _way_rule_69,
+        _way_rule_70,
+        _way_rule_71,
+        _way_rule_72,
+        _way_rule_73,
+        _way_rule_74,
+        _way_rule_75,
+        _way_rule_76,
+        _way_rule_77,
+        _way_rule_78,
+        _way_rule_79,
+        _way_rule_80,
+        _way_rule_81,
+        _way_rule_82,
+        _way_rule_83,
+        _way_rule_84,
+        _way_rule_85,
+        _way_rule_86,
+        _way_rule_87,
+        _way_rule_88,
+        _way_rule_89,
+        _way_rule_90,
+        _way_rule_91,
+        _way_rule_92,
+        _way_rule_93,
+        _way_rule_94,
+        _way_rule_95,
+        _way_rule_96,
+        _way_rule_97,
+        _way_rule_98,
+        _way_rule_99,
+        _way_rule_100,
+        _way_rule_101,
+        _way_rule_102,
+        _way_rule_103,
+        _way_rule_104,
+        _way_rule_105,
+        _way_rule_106,
+        _way_rule_107,
+        _way_rule_108,
+        _way_rule_109,
+    )
+    _way_rules_dispatch = {
+        "access": (40,),
+        "addr:city": (25, 26),
+        "addr:housenumber": (89,),
+        "addr:postcode": (41, 43),
+        "addr:street": (2,),
+        "addr:suburb": (25,),
+        "admin_level": (66,),
+        "aeroway": (39, 52, 53, 54),
+        "alt_name": (100,),
+        "alt_ref": (75,),
+        "alt_source": (44,),
+        "amenity": (11, 30, 31, 32, 33, 34, 35, 85, 92, 94, 97),
+        "boundary": (64, 67, 68, 71, 72),
+        "brand": (86,),
+        "building:levels": (47,),
+        "contact:phone": (108, 109),
+        "crossing": (38,),
+        "cycleway": (62,),
+        "designation": (19, 39),
+        "highway": (0, 1, 3, 5, 8, 15, 16, 36, 55),
+        "hires": (48,),
+        "iata": (29,),
+        "junction": (37,),
+        "landuse": (45, 60, 104),
+        "leisure": (9, 67, 84, 103),
+        "long_name": (46,),
+        "maxspeed": (57, 58),
+        "name": (4, 6, 7, 10, 13, 18, 49, 51, 56, 63, 73, 74, 95, 96, 99, 102),
+        "natural": (60, 80, 81, 82),
+        "note": (90,),
+        "office": (93, 94),
+        "phone": (108, 109),
+        "place": (12, 24, 27, 28, 65, 101),
+        "population": (21, 22, 23),
+        "postal_code": (42,),
+        "protect_class": (69, 70),
+        "ref": (20, 79),
+        "ref:vatin": (105, 106, 107),
+        "route": (59,),
+        "shop": (87, 98),
+        "source": (17, 91),
+        "sport": (83,),
+        "surface": (77, 78),
+        "tourism": (49, 50),
+        "tracktype": (76,),
+        "type": (14,),
+        "waterway": (100,),
+        "website": (78,),
+        "wikipedia": (61,),
+    }
+    _way_rules_fallback = (88,)
 
     def relation(self, data, tags, members):
-        capture_tags = {}
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._relation_rules_dispatch, self._relation_rules_fallback, keys
+        ):
+            self._relation_rules[rule](self, data, tags, members, keys, sets, err)
+        return err
 
-        # relation[highway][name=~/\b[A-Z]{2,3} (- )?[0-9]{2,3}\b/][inside("BR")]
+    # relation[highway][name=~/\b[A-Z]{2,3} (- )?[0-9]{2,3}\b/][inside("BR")]
+    def _relation_rule_0(self, data, tags, members, keys, sets, err):
         if "highway" in keys and "name" in keys:
             match = False
             if not match:
@@ -9050,7 +9599,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _relation_rule_1(self, data, tags, members, keys, sets, err):
         if "addr:street" in keys:
             match = False
             if not match:
@@ -9089,7 +9639,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _relation_rule_2(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9154,7 +9705,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _relation_rule_3(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9179,7 +9731,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _relation_rule_4(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9206,7 +9759,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _relation_rule_5(self, data, tags, members, keys, sets, err):
         if "leisure" in keys and "name" in keys:
             match = False
             if not match:
@@ -9238,7 +9792,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _relation_rule_6(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9264,7 +9819,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _relation_rule_7(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -9302,7 +9858,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _relation_rule_8(self, data, tags, members, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -9334,7 +9891,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _relation_rule_9(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9361,10 +9919,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
 
-        # relation[type=route][highway][inside("BR")]
+    # relation[type=route][highway][inside("BR")]
+    def _relation_rule_10(self, data, tags, members, keys, sets, err):
         if "highway" in keys and "type" in keys:
             match = False
             if not match:
@@ -9393,20 +9952,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    def _relation_rule_11(self, data, tags, members, keys, sets, err):
         if ("designation" in keys) or ("name" in keys) or ("ref" in keys):
             match = False
             if not match:
@@ -9583,7 +10143,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[source=*name][inside("BR")]
+    # *[source=*name][inside("BR")]
+    def _relation_rule_12(self, data, tags, members, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -9612,7 +10173,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _relation_rule_13(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9637,7 +10199,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _relation_rule_14(self, data, tags, members, keys, sets, err):
         if "designation" in keys:
             match = False
             if not match:
@@ -9663,7 +10226,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _relation_rule_15(self, data, tags, members, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -9702,7 +10266,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _relation_rule_16(self, data, tags, members, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -9745,7 +10310,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _relation_rule_17(self, data, tags, members, keys, sets, err):
         if "place" in keys and "population" in keys:
             match = False
             if not match:
@@ -9788,14 +10354,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _relation_rule_18(self, data, tags, members, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -9850,8 +10417,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _relation_rule_19(self, data, tags, members, keys, sets, err):
         if ("addr:city" in keys and "place" in keys and "type" in keys) or (
             "addr:suburb" in keys and "place" in keys and "type" in keys
         ):
@@ -9923,7 +10491,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _relation_rule_20(self, data, tags, members, keys, sets, err):
         if "addr:city" in keys:
             match = False
             if not match:
@@ -9950,7 +10519,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _relation_rule_21(self, data, tags, members, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -9995,7 +10565,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _relation_rule_22(self, data, tags, members, keys, sets, err):
         if "name" in keys and "place" in keys:
             match = False
             if not match:
@@ -10039,13 +10610,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _relation_rule_23(self, data, tags, members, keys, sets, err):
         if "iata" in keys:
             match = False
             if not match:
@@ -10071,7 +10643,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _relation_rule_24(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10125,8 +10698,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _relation_rule_25(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10200,7 +10774,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _relation_rule_26(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10248,7 +10823,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _relation_rule_27(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10296,20 +10872,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
 
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _relation_rule_28(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10348,7 +10925,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _relation_rule_29(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -10386,10 +10964,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[highway=give_way][inside("BR")]
-        # relation[highway=mini_roundabout][inside("BR")]
-        # relation[highway=stop][inside("BR")]
-        # relation[highway=turning_circle][inside("BR")]
+    # relation[highway=give_way][inside("BR")]
+    # relation[highway=mini_roundabout][inside("BR")]
+    # relation[highway=stop][inside("BR")]
+    # relation[highway=turning_circle][inside("BR")]
+    def _relation_rule_30(self, data, tags, members, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -10441,9 +11020,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[enforcement=maxspeed][!maxspeed][inside("BR")]
-        # relation[enforcement=maxheight][!maxheight][inside("BR")]
-        # relation[enforcement=maxweight][!maxweight][inside("BR")]
+    # relation[enforcement=maxspeed][!maxspeed][inside("BR")]
+    # relation[enforcement=maxheight][!maxheight][inside("BR")]
+    # relation[enforcement=maxweight][!maxweight][inside("BR")]
+    def _relation_rule_31(self, data, tags, members, keys, sets, err):
         if "enforcement" in keys:
             match = False
             if not match:
@@ -10503,7 +11083,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _relation_rule_32(self, data, tags, members, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -10532,8 +11113,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _relation_rule_33(self, data, tags, members, keys, sets, err):
         if ("aeroway" in keys and "designation" in keys) or (
             "aeroway" in keys and "ref" in keys
         ):
@@ -10629,7 +11211,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _relation_rule_34(self, data, tags, members, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -10655,17 +11238,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _relation_rule_35(self, data, tags, members, keys, sets, err):
         if "addr:postcode" in keys:
             match = False
             if not match:
@@ -10712,7 +11296,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _relation_rule_36(self, data, tags, members, keys, sets, err):
         if "postal_code" in keys:
             match = False
             if not match:
@@ -10759,11 +11344,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # area[place]["addr:postcode"][inside("BR")]
+    # area[place]["addr:postcode"][inside("BR")]
+    def _relation_rule_37(self, data, tags, members, keys, sets, err):
         if "addr:postcode" in keys and "place" in keys and "type" in keys:
             match = False
             if not match:
@@ -10837,7 +11423,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _relation_rule_38(self, data, tags, members, keys, sets, err):
         if "alt_source" in keys and "source" in keys:
             match = False
             if not match:
@@ -10864,7 +11451,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _relation_rule_39(self, data, tags, members, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -10890,7 +11478,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _relation_rule_40(self, data, tags, members, keys, sets, err):
         if "long_name" in keys:
             match = False
             if not match:
@@ -10917,7 +11506,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _relation_rule_41(self, data, tags, members, keys, sets, err):
         if "building:levels" in keys:
             match = False
             if not match:
@@ -10943,7 +11533,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _relation_rule_42(self, data, tags, members, keys, sets, err):
         if "hires" in keys:
             match = False
             if not match:
@@ -10968,8 +11559,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _relation_rule_43(self, data, tags, members, keys, sets, err):
         if ("name" in keys) or ("tourism" in keys):
             match = False
             if not match:
@@ -11039,7 +11631,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _relation_rule_44(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "tourism" in keys:
             match = False
             if not match:
@@ -11076,7 +11669,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _relation_rule_45(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -11113,8 +11707,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _relation_rule_46(self, data, tags, members, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -11171,8 +11766,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _relation_rule_47(self, data, tags, members, keys, sets, err):
         if "aeroway" in keys and "name" in keys:
             match = False
             if not match:
@@ -11229,7 +11825,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _relation_rule_48(self, data, tags, members, keys, sets, err):
         if "aeroway" in keys and "ref" in keys:
             match = False
             if not match:
@@ -11259,7 +11856,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[waterway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    def _relation_rule_49(self, data, tags, members, keys, sets, err):
         if "layer" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -11292,7 +11890,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[waterway][layer>0][!bridge][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    def _relation_rule_50(self, data, tags, members, keys, sets, err):
         if "layer" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -11325,10 +11924,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _relation_rule_51(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -11361,7 +11961,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _relation_rule_52(self, data, tags, members, keys, sets, err):
         if "route" in keys:
             match = False
             if not match:
@@ -11390,8 +11991,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _relation_rule_53(self, data, tags, members, keys, sets, err):
         if ("landuse" in keys and "name" in keys) or (
             "name" in keys and "natural" in keys
         ):
@@ -11460,7 +12062,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _relation_rule_54(self, data, tags, members, keys, sets, err):
         if "wikipedia" in keys:
             match = False
             if not match:
@@ -11493,19 +12096,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _relation_rule_55(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -11530,7 +12134,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[boundary][type!=boundary][inside("BR")]
+    # relation[boundary][type!=boundary][inside("BR")]
+    def _relation_rule_56(self, data, tags, members, keys, sets, err):
         if "boundary" in keys:
             match = False
             if not match:
@@ -11561,7 +12166,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[type=boundary][!boundary][inside("BR")]
+    # relation[type=boundary][!boundary][inside("BR")]
+    def _relation_rule_57(self, data, tags, members, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -11591,7 +12197,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[admin_level][boundary!=administrative][inside("BR")]
+    # relation[admin_level][boundary!=administrative][inside("BR")]
+    def _relation_rule_58(self, data, tags, members, keys, sets, err):
         if "admin_level" in keys:
             match = False
             if not match:
@@ -11623,7 +12230,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[boundary=administrative][!admin_level][inside("BR")]
+    # relation[boundary=administrative][!admin_level][inside("BR")]
+    def _relation_rule_59(self, data, tags, members, keys, sets, err):
         if "boundary" in keys:
             match = False
             if not match:
@@ -11657,7 +12265,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    # relation[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    def _relation_rule_60(self, data, tags, members, keys, sets, err):
         if "place" in keys:
             match = False
             if not match:
@@ -11699,7 +12308,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[boundary=administrative][type=multipolygon][inside("BR")]
+    # relation[boundary=administrative][type=multipolygon][inside("BR")]
+    def _relation_rule_61(self, data, tags, members, keys, sets, err):
         if "boundary" in keys and "type" in keys:
             match = False
             if not match:
@@ -11732,9 +12342,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _relation_rule_62(self, data, tags, members, keys, sets, err):
         if ("boundary" in keys) or ("leisure" in keys):
             match = False
             if not match:
@@ -11790,7 +12401,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _relation_rule_63(self, data, tags, members, keys, sets, err):
         if "boundary" in keys:
             match = False
             if not match:
@@ -11824,7 +12436,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _relation_rule_64(self, data, tags, members, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -11862,7 +12475,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _relation_rule_65(self, data, tags, members, keys, sets, err):
         if "protect_class" in keys:
             match = False
             if not match:
@@ -11890,7 +12504,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    def _relation_rule_66(self, data, tags, members, keys, sets, err):
         if (
             "boundary" in keys
             and "leisure" in keys
@@ -11943,7 +12558,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    def _relation_rule_67(self, data, tags, members, keys, sets, err):
         if "boundary" in keys and "name" in keys and "type" in keys:
             match = False
             if not match:
@@ -11984,7 +12600,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # relation[destination][type!=waterway][inside("BR")]
+    # relation[destination][type!=waterway][inside("BR")]
+    def _relation_rule_68(self, data, tags, members, keys, sets, err):
         if "destination" in keys:
             match = False
             if not match:
@@ -12015,7 +12632,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _relation_rule_69(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12042,7 +12660,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _relation_rule_70(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12067,7 +12686,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _relation_rule_71(self, data, tags, members, keys, sets, err):
         if "alt_ref" in keys:
             match = False
             if not match:
@@ -12092,7 +12712,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _relation_rule_72(self, data, tags, members, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -12118,8 +12739,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _relation_rule_73(self, data, tags, members, keys, sets, err):
         if ("name" in keys and "surface" in keys) or (
             "name" in keys and "website" in keys
         ):
@@ -12160,7 +12782,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=wetland][!wetland][inside("BR")]
+    # area[natural=wetland][!wetland][inside("BR")]
+    def _relation_rule_74(self, data, tags, members, keys, sets, err):
         if "natural" in keys and "type" in keys:
             match = False
             if not match:
@@ -12190,7 +12813,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=beach][!surface][inside("BR")]
+    # area[natural=beach][!surface][inside("BR")]
+    def _relation_rule_75(self, data, tags, members, keys, sets, err):
         if "natural" in keys and "type" in keys:
             match = False
             if not match:
@@ -12224,7 +12848,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    def _relation_rule_76(self, data, tags, members, keys, sets, err):
         if "natural" in keys and "surface" in keys and "type" in keys:
             match = False
             if not match:
@@ -12269,7 +12894,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _relation_rule_77(self, data, tags, members, keys, sets, err):
         if "leisure" in keys and "sport" in keys and "surface" in keys:
             match = False
             if not match:
@@ -12310,10 +12936,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
-        # Part of rule not implemented
+    # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
+    # Part of rule not implemented
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _relation_rule_78(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -12350,7 +12977,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _relation_rule_79(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "brand" in keys:
             match = False
             if not match:
@@ -12384,7 +13012,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _relation_rule_80(self, data, tags, members, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -12421,7 +13050,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _relation_rule_81(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -12451,7 +13081,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _relation_rule_82(self, data, tags, members, keys, sets, err):
         if "addr:housenumber" in keys:
             match = False
             if not match:
@@ -12495,7 +13126,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _relation_rule_83(self, data, tags, members, keys, sets, err):
         if "addr:housenumber" in keys and "note" in keys:
             match = False
             if not match:
@@ -12531,7 +13163,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _relation_rule_84(self, data, tags, members, keys, sets, err):
         if "source" in keys:
             match = False
             if not match:
@@ -12555,7 +13188,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _relation_rule_85(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "name" in keys:
             match = False
             if not match:
@@ -12592,7 +13226,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _relation_rule_86(self, data, tags, members, keys, sets, err):
         if "name" in keys and "office" in keys:
             match = False
             if not match:
@@ -12632,8 +13267,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _relation_rule_87(self, data, tags, members, keys, sets, err):
         if ("amenity" in keys and "name" in keys) or (
             "name" in keys and "office" in keys
         ):
@@ -12689,7 +13325,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _relation_rule_88(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12728,7 +13365,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _relation_rule_89(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12767,7 +13405,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _relation_rule_90(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -12790,7 +13429,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _relation_rule_91(self, data, tags, members, keys, sets, err):
         if "name" in keys and "shop" in keys:
             match = False
             if not match:
@@ -12826,7 +13466,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _relation_rule_92(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12863,7 +13504,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area[place=square][leisure!=park][inside("BR")]
+    # area[place=square][leisure!=park][inside("BR")]
+    def _relation_rule_93(self, data, tags, members, keys, sets, err):
         if "place" in keys and "type" in keys:
             match = False
             if not match:
@@ -12903,7 +13545,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _relation_rule_94(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -12948,7 +13591,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _relation_rule_95(self, data, tags, members, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -12976,7 +13620,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _relation_rule_96(self, data, tags, members, keys, sets, err):
         if "landuse" in keys and "leisure" in keys:
             match = False
             if not match:
@@ -13016,7 +13661,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _relation_rule_97(self, data, tags, members, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -13047,7 +13693,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _relation_rule_98(self, data, tags, members, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -13101,7 +13748,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _relation_rule_99(self, data, tags, members, keys, sets, err):
         if "ref:vatin" in keys:
             match = False
             if not match:
@@ -13142,11 +13790,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _relation_rule_100(self, data, tags, members, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -13199,8 +13848,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _relation_rule_101(self, data, tags, members, keys, sets, err):
         if ("contact:phone" in keys) or ("phone" in keys):
             match = False
             if not match:
@@ -13244,7 +13894,159 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     }
                 )
 
-        return err
+    _relation_rules = (
+        _relation_rule_0,
+        _relation_rule_1,
+        _relation_rule_2,
+        _relation_rule_3,
+        _relation_rule_4,
+        _relation_rule_5,
+        _relation_rule_6,
+        _relation_rule_7,
+        _relation_rule_8,
+        _relation_rule_9,
+        _relation_rule_10,
+        _relation_rule_11,
+        _relation_rule_12,
+        _relation_rule_13,
+        _relation_rule_14,
+        _relation_rule_15,
+        _relation_rule_16,
+        _relation_rule_17,
+        _relation_rule_18,
+        _relation_rule_19,
+        _relation_rule_20,
+        _relation_rule_21,
+        _relation_rule_22,
+        _relation_rule_23,
+        _relation_rule_24,
+        _relation_rule_25,
+        _relation_rule_26,
+        _relation_rule_27,
+        _relation_rule_28,
+        _relation_rule_29,
+        _relation_rule_30,
+        _relation_rule_31,
+        _relation_rule_32,
+        _relation_rule_33,
+        _relation_rule_34,
+        _relation_rule_35,
+        _relation_rule_36,
+        _relation_rule_37,
+        _relation_rule_38,
+        _relation_rule_39,
+        _relation_rule_40,
+        _relation_rule_41,
+        _relation_rule_42,
+        _relation_rule_43,
+        _relation_rule_44,
+        _relation_rule_45,
+        _relation_rule_46,
+        _relation_rule_47,
+        _relation_rule_48,
+        _relation_rule_49,
+        _relation_rule_50,
+        _relation_rule_51,
+        _relation_rule_52,
+        _relation_rule_53,
+        _relation_rule_54,
+        _relation_rule_55,
+        _relation_rule_56,
+        _relation_rule_57,
+        _relation_rule_58,
+        _relation_rule_59,
+        _relation_rule_60,
+        _relation_rule_61,
+        _relation_rule_62,
+        _relation_rule_63,
+        _relation_rule_64,
+        _relation_rule_65,
+        _relation_rule_66,
+        _relation_rule_67,
+        _relation_rule_68,
+        _relation_rule_69,
+        _relation_rule_70,
+        _relation_rule_71,
+        _relation_rule_72,
+        _relation_rule_73,
+        _relation_rule_74,
+        _relation_rule_75,
+        _relation_rule_76,
+        _relation_rule_77,
+        _relation_rule_78,
+        _relation_rule_79,
+        _relation_rule_80,
+        _relation_rule_81,
+        _relation_rule_82,
+        _relation_rule_83,
+        _relation_rule_84,
+        _relation_rule_85,
+        _relation_rule_86,
+        _relation_rule_87,
+        _relation_rule_88,
+        _relation_rule_89,
+        _relation_rule_90,
+        _relation_rule_91,
+        _relation_rule_92,
+        _relation_rule_93,
+        _relation_rule_94,
+        _relation_rule_95,
+        _relation_rule_96,
+        _relation_rule_97,
+        _relation_rule_98,
+        _relation_rule_99,
+        _relation_rule_100,
+        _relation_rule_101,
+    )
+    _relation_rules_dispatch = {
+        "access": (34,),
+        "addr:city": (19, 20),
+        "addr:housenumber": (82,),
+        "addr:postcode": (35, 37),
+        "addr:street": (1,),
+        "addr:suburb": (19,),
+        "admin_level": (58,),
+        "aeroway": (46, 47),
+        "alt_ref": (71,),
+        "alt_source": (38,),
+        "amenity": (7, 24, 25, 26, 27, 28, 29, 78, 85, 87, 90),
+        "boundary": (56, 59, 61, 62, 63, 67),
+        "brand": (79,),
+        "building:levels": (41,),
+        "contact:phone": (100, 101),
+        "crossing": (32,),
+        "designation": (11, 14, 33),
+        "destination": (68,),
+        "enforcement": (31,),
+        "highway": (0, 10, 30),
+        "hires": (42,),
+        "iata": (23,),
+        "landuse": (39, 53, 96),
+        "layer": (49, 50),
+        "leisure": (5, 62, 66, 95),
+        "long_name": (40,),
+        "name": (2, 3, 4, 6, 9, 11, 13, 43, 45, 51, 55, 69, 70, 88, 89, 92, 94),
+        "natural": (53, 74, 75, 76),
+        "note": (83,),
+        "office": (86, 87),
+        "phone": (100, 101),
+        "place": (8, 18, 21, 22, 60, 93),
+        "population": (15, 16, 17),
+        "postal_code": (36,),
+        "protect_class": (64, 65),
+        "ref": (11, 33, 48),
+        "ref:vatin": (97, 98, 99),
+        "route": (52,),
+        "shop": (80, 91),
+        "source": (12, 84),
+        "sport": (77,),
+        "surface": (72, 73),
+        "tourism": (43, 44),
+        "type": (57,),
+        "website": (73,),
+        "wikipedia": (54,),
+    }
+    _relation_rules_fallback = (81,)
 
 
 from plugins.PluginMapCSS import TestPluginMapcss
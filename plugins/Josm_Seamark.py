@@ -12,6 +12,70 @@ class Josm_Seamark(PluginMapCSS):
         "https://github.com/OpenNauticalChart/josm/blob/master/Seamark.validator.mapcss"
     )
 
+    tags_only = ["node"]
+
+    interest_keys = {
+        "node": [
+            "seamark:beacon:cardinal:colour",
+            "seamark:beacon_cardinal:color",
+            "seamark:beacon_cardinal:colour_pattern",
+            "seamark:beacon_isolated_danger:color",
+            "seamark:beacon_isolated_danger:colour_pattern",
+            "seamark:beacon_lateral:color",
+            "seamark:beacon_lateral:colour",
+            "seamark:beacon_lateral:colour_pattern",
+            "seamark:beacon_lateral:system",
+            "seamark:beacon_safe_water:colour_pattern",
+            "seamark:beacon_special_purpose:color",
+            "seamark:beacon_special_purpose:colour_pattern",
+            "seamark:bridge:colour_pattern",
+            "seamark:building:colour_pattern",
+            "seamark:buoy_cardinal:color",
+            "seamark:buoy_cardinal:colour",
+            "seamark:buoy_cardinal:colour_pattern",
+            "seamark:buoy_installation:colour_pattern",
+            "seamark:buoy_isolated_danger:color",
+            "seamark:buoy_isolated_danger:colour_pattern",
+            "seamark:buoy_lateral:color",
+            "seamark:buoy_lateral:colour",
+            "seamark:buoy_lateral:colour_pattern",
+            "seamark:buoy_safe_water:color",
+            "seamark:buoy_safe_water:colour_pattern",
+            "seamark:buoy_special_purpose:colour_pattern",
+            "seamark:daymark:colour_pattern",
+            "seamark:landmark:colour_pattern",
+            "seamark:light_float:colour_pattern",
+            "seamark:light_vessel:colour_pattern",
+            "seamark:mooring:colour_pattern",
+            "seamark:notice:1:category",
+            "seamark:notice:1:system",
+            "seamark:notice:2:category",
+            "seamark:notice:2:system",
+            "seamark:notice:3:category",
+            "seamark:notice:3:system",
+            "seamark:notice:4:category",
+            "seamark:notice:4:system",
+            "seamark:notice:5:category",
+            "seamark:notice:5:system",
+            "seamark:notice:6:category",
+            "seamark:notice:6:system",
+            "seamark:notice:7:category",
+            "seamark:notice:7:system",
+            "seamark:notice:8:category",
+            "seamark:notice:8:system",
+            "seamark:notice:9:category",
+            "seamark:notice:9:system",
+            "seamark:notice:category",
+            "seamark:notice:colour_pattern",
+            "seamark:notice:system",
+            "seamark:pile:colour_pattern",
+            "seamark:platform:colour_pattern",
+            "seamark:topmark:colour_pattern",
+            "seamark:type",
+            "seamark:wreck:category",
+        ]
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -123,48 +187,50 @@ class Josm_Seamark(PluginMapCSS):
             ),
         )
 
-        self.re_01dd9715 = re.compile(r"right|left")
-        self.re_09200db5 = re.compile(
+        self.re_01dd9715 = mapcss.lazy_regex(r"right|left")
+        self.re_09200db5 = mapcss.lazy_regex(
             r"keep_to_port_margin|keep_to_starboard_margin|keep_to_mid|cross_river_to_port|cross_river_to_starboard|reduce_speed"
         )
-        self.re_09c0bae9 = re.compile(r"opening_to_right|opening_to_left")
-        self.re_0b7ab6fc = re.compile(
+        self.re_09c0bae9 = mapcss.lazy_regex(r"opening_to_right|opening_to_left")
+        self.re_0b7ab6fc = mapcss.lazy_regex(
             r"keep_to_port_margin|keep_to_starboard_margin|keep_to_mid-river|cross_river_to_port|cross_river_to_starboard"
         )
-        self.re_0c508f2a = re.compile(
+        self.re_0c508f2a = mapcss.lazy_regex(
             r"entry_permitted|overhead_cable|weir|ferry_non_independent|ferry_independent|berthing_permitted|berthing_lateral_limits|berthing_rafting_limit|berthing_unmarked_pushing|berthing_marked_pushing_1|berthing_marked_pushing_2|berthing_marked_pushing_3|berthing_unmarked_non_pushing|berthing_marked_non_pushing_1|berthing_marked_non_pushing_2|berthing_marked_non_pushing_3|berthing_unmarked|berthing_marked_1|berthing_marked_2|berthing_marked_3|anchoring_permitted|mooring_permitted|vehicle_loading_berth|turning_area|secondary_waterway_crossing|secondary_waterway_right|secondary_waterway_left|main_waterway_right_secondary_ahead|main_waterway_left_secondary_ahead|main_waterway_right_secondary_left|main_waterway_left_secondary_right|main_waterway_right_secondary_ahead_left|main_waterway_left_secondary_ahead_right|main_waterway_crossing|main_waterway_junction|main_waterway_ahead_right|main_waterway_ahead_left|main_waterway_ahead_right_secondary_left|main_waterway_ahead_left_secondary_right|prohibition_ends|drinking_water|telephone|motor_craft_permitted|sport_craft_permitted|waterskiing_permitted|sailing_craft_permitted|unpowered_craft_permitted|sailboards_permitted|high_speeds_permitted|launching_beaching_permitted|radio_information|waterbikes_permitted"
         )
-        self.re_0e114cad = re.compile(r"bniwr2|ppwbc")
-        self.re_0e3e01fc = re.compile(
+        self.re_0e114cad = mapcss.lazy_regex(r"bniwr2|ppwbc")
+        self.re_0e3e01fc = mapcss.lazy_regex(
             r"no_entry|closed_area|no_overtaking|no_convoy_overtaking|no_passing|no_convoy_passing|no_berthing|no_berthing_lateral_limit|no_anchoring|no_mooring|no_turning|no_wash|no_passage_left|no_passage_right|no_motor_craft|no_sport_craft|no_waterskiing|no_sailing_craft|no_unpowered_craft|no_sailboards|no_high_speeds|no_launching_beaching|no_waterbikes"
         )
-        self.re_1389a933 = re.compile(
+        self.re_1389a933 = mapcss.lazy_regex(
             r"move_to_left|move_to_right|move_to_port|move_to_starboard|keep_to_port|keep_to_starboard|cross_to_port|cross_to_starboard|stop|speed_limit|sound_horn|keep_lookout|give_way_junction|give_way_crossing|make_radio_contact"
         )
-        self.re_141d4d2f = re.compile(
+        self.re_141d4d2f = mapcss.lazy_regex(
             r"horizontal|vertical|diagonal|squared|stripes|border|cross|saltire"
         )
-        self.re_253b0e7a = re.compile(
+        self.re_253b0e7a = mapcss.lazy_regex(
             r"channel_two_way|channel_one_way|opening_to_right|opening_to_left|proceed_to_left|proceed_to_right"
         )
-        self.re_281803e9 = re.compile(r"preferred_channel_starboard|turnoff_right")
-        self.re_288a42ac = re.compile(r"port|waterway_right|channel_right")
-        self.re_2a269778 = re.compile(
+        self.re_281803e9 = mapcss.lazy_regex(
+            r"preferred_channel_starboard|turnoff_right"
+        )
+        self.re_288a42ac = mapcss.lazy_regex(r"port|waterway_right|channel_right")
+        self.re_2a269778 = mapcss.lazy_regex(
             r"main_waterway_right_secondary_ahead_left|main_waterway_left_secondary_ahead_right"
         )
-        self.re_32e3abb7 = re.compile(r"starboard|waterway_left|channel_left")
-        self.re_336a6c28 = re.compile(
+        self.re_32e3abb7 = mapcss.lazy_regex(r"starboard|waterway_left|channel_left")
+        self.re_336a6c28 = mapcss.lazy_regex(
             r"limited_depth|limited_headroom|limited_width|navigation_restrictions|channel_distance_left|channel_distance_right"
         )
-        self.re_39084725 = re.compile(r"limited_headroom")
-        self.re_430e795b = re.compile(
+        self.re_39084725 = mapcss.lazy_regex(r"limited_headroom")
+        self.re_430e795b = mapcss.lazy_regex(
             r"main_waterway_right_secondary_ahead_left|main_waterway_left_secondary_ahead_right|traffic_between_margins"
         )
-        self.re_61629c48 = re.compile(
+        self.re_61629c48 = mapcss.lazy_regex(
             r"preferred_channel_starboard|preferred_channel_port|waterway_separation|channel_separation"
         )
-        self.re_637abe26 = re.compile(r"preferred_channel_port|turnoff_left")
-        self.re_7c5430c7 = re.compile(r"no_anchoring")
+        self.re_637abe26 = mapcss.lazy_regex(r"preferred_channel_port|turnoff_left")
+        self.re_7c5430c7 = mapcss.lazy_regex(r"no_anchoring")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -10,6 +10,32 @@ class Josm_SuspiciousSwimming_Pool(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/wiki/Rules/SuspiciousSwimming_Pool"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "building",
+            "contact:phone",
+            "contact:url",
+            "contact:website",
+            "leisure",
+        ],
+        "way": [
+            "building",
+            "contact:phone",
+            "contact:url",
+            "contact:website",
+            "leisure",
+        ],
+        "relation": [
+            "building",
+            "contact:phone",
+            "contact:url",
+            "contact:website",
+            "leisure",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -12,6 +12,14 @@ class Josm_addresses(PluginMapCSS):
 
     not_for = ["CA"]
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["addr:housename", "addr:housenumber"],
+        "way": ["addr:housename", "addr:housenumber"],
+        "relation": ["addr:housename", "addr:housenumber"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -34,7 +42,7 @@ class Josm_addresses(PluginMapCSS):
             ),
         )
 
-        self.re_4983542e = re.compile(r"[0-9]")
+        self.re_4983542e = mapcss.lazy_regex(r"[0-9]")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -10,6 +10,8 @@ class Josm_combinations(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/combinations.mapcss"
 
+    tags_only = ["node", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -49,82 +51,92 @@ class Josm_combinations(PluginMapCSS):
             title=mapcss.tr("Use {0} only as value of {1}", "transition", "placement"),
         )
 
-        self.re_01d4d495 = re.compile(
+        self.re_01d4d495 = mapcss.lazy_regex(
             r"^(paved|asphalt|cobblestone|cobblestone:flattened|sett|concrete|concrete:plates|paving_stones|metal|wood|unhewn_cobblestone)$"
         )
-        self.re_050395e0 = re.compile(r"^maxspeed:?")
-        self.re_06b82725 = re.compile(r"^(yes|minor|no)$")
-        self.re_0737b0c4 = re.compile(
+        self.re_050395e0 = mapcss.lazy_regex(r"^maxspeed:?")
+        self.re_06b82725 = mapcss.lazy_regex(r"^(yes|minor|no)$")
+        self.re_0737b0c4 = mapcss.lazy_regex(
             r"^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$"
         )
-        self.re_0889a956 = re.compile(r"^(basin|reservoir)$")
-        self.re_088b0835 = re.compile(r"^addr:")
-        self.re_0aef1f28 = re.compile(r"^cycleway(:|$)")
-        self.re_0fb2a009 = re.compile(r"^[0-9]+(\.[0-9]+)?( m)?$")
-        self.re_12ce6b85 = re.compile(r":forward")
-        self.re_143f11c5 = re.compile(r"^(no|use_sidepath)$")
-        self.re_19e33301 = re.compile(r"^no$")
-        self.re_1bc43c40 = re.compile(r"^(left|right|both)$")
-        self.re_1dcd648f = re.compile(r"^(runway|taxiway)$")
-        self.re_209d461d = re.compile(
+        self.re_0889a956 = mapcss.lazy_regex(r"^(basin|reservoir)$")
+        self.re_088b0835 = mapcss.lazy_regex(r"^addr:")
+        self.re_0aef1f28 = mapcss.lazy_regex(r"^cycleway(:|$)")
+        self.re_0fb2a009 = mapcss.lazy_regex(r"^[0-9]+(\.[0-9]+)?( m)?$")
+        self.re_12ce6b85 = mapcss.lazy_regex(r":forward")
+        self.re_143f11c5 = mapcss.lazy_regex(r"^(no|use_sidepath)$")
+        self.re_19e33301 = mapcss.lazy_regex(r"^no$")
+        self.re_1bc43c40 = mapcss.lazy_regex(r"^(left|right|both)$")
+        self.re_1dcd648f = mapcss.lazy_regex(r"^(runway|taxiway)$")
+        self.re_209d461d = mapcss.lazy_regex(
             r"^(path|footway|cycleway|construction|proposed)$"
         )
-        self.re_213d4d09 = re.compile(r"^parking.*")
-        self.re_22985ce9 = re.compile(r"^oneway:(bicycle|bus|mofa|moped|psv)$")
-        self.re_22ceec1b = re.compile(r"^.*:lanes$")
-        self.re_23888fca = re.compile(r"^(motorway|motorway_link|trunk|trunk_link)$")
-        self.re_25d98c90 = re.compile(r"_name$")
-        self.re_27d9cb1c = re.compile(r"^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$")
-        self.re_29fa4401 = re.compile(r"^(beach|bare_rock|cliff|peak|water)$")
-        self.re_2d1850d1 = re.compile(r"^recycling:")
-        self.re_2fb1110d = re.compile(r":highway$")
-        self.re_2fc1bb0a = re.compile(r"^(canal|fairway|lock|river|tidal_channel)$")
-        self.re_333281f7 = re.compile(r"^oneway:(.+:)?conditional$")
-        self.re_33560b51 = re.compile(
+        self.re_213d4d09 = mapcss.lazy_regex(r"^parking.*")
+        self.re_22985ce9 = mapcss.lazy_regex(r"^oneway:(bicycle|bus|mofa|moped|psv)$")
+        self.re_22ceec1b = mapcss.lazy_regex(r"^.*:lanes$")
+        self.re_23888fca = mapcss.lazy_regex(
+            r"^(motorway|motorway_link|trunk|trunk_link)$"
+        )
+        self.re_25d98c90 = mapcss.lazy_regex(r"_name$")
+        self.re_27d9cb1c = mapcss.lazy_regex(r"^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$")
+        self.re_29fa4401 = mapcss.lazy_regex(r"^(beach|bare_rock|cliff|peak|water)$")
+        self.re_2d1850d1 = mapcss.lazy_regex(r"^recycling:")
+        self.re_2fb1110d = mapcss.lazy_regex(r":highway$")
+        self.re_2fc1bb0a = mapcss.lazy_regex(
+            r"^(canal|fairway|lock|river|tidal_channel)$"
+        )
+        self.re_333281f7 = mapcss.lazy_regex(r"^oneway:(.+:)?conditional$")
+        self.re_33560b51 = mapcss.lazy_regex(
             r"^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$"
         )
-        self.re_337d9a77 = re.compile(r"^maxspeed:.+")
-        self.re_382feae2 = re.compile(
+        self.re_337d9a77 = mapcss.lazy_regex(r"^maxspeed:.+")
+        self.re_382feae2 = mapcss.lazy_regex(
             r"^(sand|mud|ground|earth|dirt|grass|ice|salt|snow|woodchips)$"
         )
-        self.re_390b8c0f = re.compile(r"^(building|building:part)$")
-        self.re_3a43a33d = re.compile(r"[a-z]-[A-Z].*[0-9]-[0-9]")
-        self.re_3ad9e1f5 = re.compile(
+        self.re_390b8c0f = mapcss.lazy_regex(r"^(building|building:part)$")
+        self.re_3a43a33d = mapcss.lazy_regex(r"[a-z]-[A-Z].*[0-9]-[0-9]")
+        self.re_3ad9e1f5 = mapcss.lazy_regex(
             r"^(motorway|motorway_link|trunk|trunk_link|primary|primary_link|secondary|secondary_link|tertiary|tertiary_link|unclassified|residential|service|living_street)$"
         )
-        self.re_3b1153a4 = re.compile(r"^plant:")
-        self.re_3b4f8f73 = re.compile(r"^(recreation_ground|piste|farm|farmland)$")
-        self.re_3baad59c = re.compile(r"^.*:lanes:both_ways$")
-        self.re_3e28f822 = re.compile(r"^.*:lanes:(forward|backward|both_ways)$")
-        self.re_41650b2e = re.compile(r"^(bar|dojo|pub|restaurant|swimming_pool)$")
-        self.re_43e7f95e = re.compile(r"mph")
-        self.re_49fc2c26 = re.compile(r"^(bowling_alley|slipway|swimming_pool|track)$")
-        self.re_4f156c8f = re.compile(
+        self.re_3b1153a4 = mapcss.lazy_regex(r"^plant:")
+        self.re_3b4f8f73 = mapcss.lazy_regex(
+            r"^(recreation_ground|piste|farm|farmland)$"
+        )
+        self.re_3baad59c = mapcss.lazy_regex(r"^.*:lanes:both_ways$")
+        self.re_3e28f822 = mapcss.lazy_regex(r"^.*:lanes:(forward|backward|both_ways)$")
+        self.re_41650b2e = mapcss.lazy_regex(
+            r"^(bar|dojo|pub|restaurant|swimming_pool)$"
+        )
+        self.re_43e7f95e = mapcss.lazy_regex(r"mph")
+        self.re_49fc2c26 = mapcss.lazy_regex(
+            r"^(bowling_alley|slipway|swimming_pool|track)$"
+        )
+        self.re_4f156c8f = mapcss.lazy_regex(
             r"^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$"
         )
-        self.re_4fbfe59b = re.compile(r"^(water|spring)$")
-        self.re_503776bb = re.compile(r"^generator:")
-        self.re_5111b0b1 = re.compile(r"^(no|none|separate)$")
-        self.re_51b15093 = re.compile(
+        self.re_4fbfe59b = mapcss.lazy_regex(r"^(water|spring)$")
+        self.re_503776bb = mapcss.lazy_regex(r"^generator:")
+        self.re_5111b0b1 = mapcss.lazy_regex(r"^(no|none|separate)$")
+        self.re_51b15093 = mapcss.lazy_regex(
             r"^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$"
         )
-        self.re_521b2098 = re.compile(r"water|bay|strait")
-        self.re_53cf0b2e = re.compile(r"^(cycleway|footway|path)$")
-        self.re_57c5150b = re.compile(r"^placement:.*$")
-        self.re_5cf0a79f = re.compile(
+        self.re_521b2098 = mapcss.lazy_regex(r"water|bay|strait")
+        self.re_53cf0b2e = mapcss.lazy_regex(r"^(cycleway|footway|path)$")
+        self.re_57c5150b = mapcss.lazy_regex(r"^placement:.*$")
+        self.re_5cf0a79f = mapcss.lazy_regex(
             r"^(parking|parking_space|parking_entrance|motorcycle_parking)$"
         )
-        self.re_5dd46ebe = re.compile(r"^(pedestrian|raceway)$")
-        self.re_5ee853b2 = re.compile(r"^(ferry|road)$")
-        self.re_60ec5bd8 = re.compile(r"^bicycle:")
-        self.re_68c05e86 = re.compile(r"^(wall|retaining_wall)$")
-        self.re_6f957488 = re.compile(
+        self.re_5dd46ebe = mapcss.lazy_regex(r"^(pedestrian|raceway)$")
+        self.re_5ee853b2 = mapcss.lazy_regex(r"^(ferry|road)$")
+        self.re_60ec5bd8 = mapcss.lazy_regex(r"^bicycle:")
+        self.re_68c05e86 = mapcss.lazy_regex(r"^(wall|retaining_wall)$")
+        self.re_6f957488 = mapcss.lazy_regex(
             r"^(unpaved|compacted|gravel|fine_gravel|pebblestone|ground|earth|dirt|grass|sand|mud|ice|salt|snow|woodchips)$"
         )
-        self.re_7346b495 = re.compile(r":backward")
-        self.re_734e4397 = re.compile(r"^(yes|stepping_stones)$")
-        self.re_78efbab0 = re.compile(r"(^|;)manual(;|$)")
-        self.re_7d1b2fa8 = re.compile(
+        self.re_7346b495 = mapcss.lazy_regex(r":backward")
+        self.re_734e4397 = mapcss.lazy_regex(r"^(yes|stepping_stones)$")
+        self.re_78efbab0 = mapcss.lazy_regex(r"(^|;)manual(;|$)")
+        self.re_7d1b2fa8 = mapcss.lazy_regex(
             r"^((7[0-4]|[1-6]?[0-9])(\.[0-9]*)?( m)?|(2(4[0-5]|[0-3][0-9])|1?[0-9]?[0-9])((\.[0-9]*)?( ft|\')|\'(11|10|[0-9])(\.[0-9]*)?\"))$"
         )
 
@@ -3825,16 +3837,17 @@ class Josm_combinations(PluginMapCSS):
         return err
 
     def way(self, data, tags, nds):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        set_AllSameCycleway = set_AllSameMaxspeed = set_AllSameSidewalk = (
-            set_MotorwayTrunk
-        ) = set_PlacementTransitionWarning = set_TunnelCulvertWithoutWaterway = (
-            set_fully_paved_surface
-        ) = set_only_one_tag = set_unpaved_surface = False
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._way_rules_dispatch, self._way_rules_fallback, keys
+        ):
+            self._way_rules[rule](self, data, tags, nds, keys, sets, err)
+        return err
 
-        # way[surface=~/^(unpaved|compacted|gravel|fine_gravel|pebblestone|ground|earth|dirt|grass|sand|mud|ice|salt|snow|woodchips)$/]
+    # way[surface=~/^(unpaved|compacted|gravel|fine_gravel|pebblestone|ground|earth|dirt|grass|sand|mud|ice|salt|snow|woodchips)$/]
+    def _way_rule_0(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -3848,9 +3861,10 @@ class Josm_combinations(PluginMapCSS):
                     pass
             if match:
                 # set unpaved_surface
-                set_unpaved_surface = True
+                sets.add("unpaved_surface")
 
-        # way[surface=~/^(paved|asphalt|cobblestone|cobblestone:flattened|sett|concrete|concrete:plates|paving_stones|metal|wood|unhewn_cobblestone)$/]
+    # way[surface=~/^(paved|asphalt|cobblestone|cobblestone:flattened|sett|concrete|concrete:plates|paving_stones|metal|wood|unhewn_cobblestone)$/]
+    def _way_rule_1(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -3864,72 +3878,73 @@ class Josm_combinations(PluginMapCSS):
                     pass
             if match:
                 # set fully_paved_surface
-                set_fully_paved_surface = True
-
-        # way[junction][!highway][junction!=yes][!area:highway]
-        # way[living_street][!highway]
-        # way[maintenance][!highway]
-        # way[median][!highway]
-        # way[motorroad][!highway]
-        # way[sac_scale][!highway]
-        # way[sidewalk][!highway]
-        # way[step_count][!highway][man_made!=tower]
-        # way[tracktype][!highway]
-        # way[trail_visibility][!highway]
-        # way[trolley_wire][!highway]
-        # way[zip_left][!highway]
-        # way[zip_right][!highway]
-        # way[detail][!railway][route!=railway]
-        # way[eddy_current_brake][!railway][route!=railway]
-        # way[electrified][!railway][route!=railway][!highway]
-        # way[etcs][!railway][route!=railway]
-        # way[gauge][!railway][route!=railway]
-        # way[grade_of_track][!railway][route!=railway]
-        # way[kursbuchstrecke][!railway][route!=railway]
-        # way[lzb][!railway][route!=railway]
-        # way[old_railway_operator][!railway][route!=railway]
-        # way[operating_procedure][!railway][route!=railway]
-        # way[pzb][!railway][route!=railway]
-        # way[structure_gauge][!railway][route!=railway]
-        # way[tilting_technology][!railway][route!=railway]
-        # way[track_class][!railway][route!=railway]
-        # way[tracks][!railway][route!=railway]
-        # way[traffic_mode][!railway][route!=railway]
-        # way[workrules][!railway][route!=railway]
-        # way[length_unit][!waterway]
-        # way[canal][!waterway]
-        # way[have_riverbank][!waterway]
-        # area[min_height][!height][/^(building|building:part)$/]
-        # area[building:min_level][!building:levels][/^(building|building:part)$/]
-        # *[border_type][!boundary]
-        # *[piste:difficulty][!piste:type]
-        # *[place][!name][place!=islet][place!=plot][noname!=yes]
-        # *[transformer][!power]
-        # *[source:date][!source]
-        # *[source:name][!name][noname!=yes]
-        # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
-        # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
-        # *[source:building][!building]
-        # *[source:ref][!ref][noref!=yes]
-        # *[source:population][!population]
-        # *[source:postal_code][!postal_code]
-        # *[source:ele][!ele]
-        # *[source:ref:INSEE][!ref:INSEE]
-        # *[source:lit][!lit]
-        # *[source:hgv][!hgv]
-        # *[source:highway][!highway]
-        # *[source:maxaxleload][!maxaxleload]
-        # *[source:surface][!surface]
-        # *[source:bridge][!bridge]
-        # *[source:old_name][!old_name]
-        # *[source:bicycle][!bicycle]
-        # *[source:designation][!designation]
-        # *[source:height][!height]
-        # *[source:lanes][!lanes]
-        # *[source:postcode][!addr:postcode]
-        # *[source:housenumber][!addr:housenumber]
-        # *[source:addr:postcode][!addr:postcode]
-        # *[source:addr:housenumber][!addr:housenumber]
+                sets.add("fully_paved_surface")
+
+    # way[junction][!highway][junction!=yes][!area:highway]
+    # way[living_street][!highway]
+    # way[maintenance][!highway]
+    # way[median][!highway]
+    # way[motorroad][!highway]
+    # way[sac_scale][!highway]
+    # way[sidewalk][!highway]
+    # way[step_count][!highway][man_made!=tower]
+    # way[tracktype][!highway]
+    # way[trail_visibility][!highway]
+    # way[trolley_wire][!highway]
+    # way[zip_left][!highway]
+    # way[zip_right][!highway]
+    # way[detail][!railway][route!=railway]
+    # way[eddy_current_brake][!railway][route!=railway]
+    # way[electrified][!railway][route!=railway][!highway]
+    # way[etcs][!railway][route!=railway]
+    # way[gauge][!railway][route!=railway]
+    # way[grade_of_track][!railway][route!=railway]
+    # way[kursbuchstrecke][!railway][route!=railway]
+    # way[lzb][!railway][route!=railway]
+    # way[old_railway_operator][!railway][route!=railway]
+    # way[operating_procedure][!railway][route!=railway]
+    # way[pzb][!railway][route!=railway]
+    # way[structure_gauge][!railway][route!=railway]
+    # way[tilting_technology][!railway][route!=railway]
+    # way[track_class][!railway][route!=railway]
+    # way[tracks][!railway][route!=railway]
+    # way[traffic_mode][!railway][route!=railway]
+    # way[workrules][!railway][route!=railway]
+    # way[length_unit][!waterway]
+    # way[canal][!waterway]
+    # way[have_riverbank][!waterway]
+    # area[min_height][!height][/^(building|building:part)$/]
+    # area[building:min_level][!building:levels][/^(building|building:part)$/]
+    # *[border_type][!boundary]
+    # *[piste:difficulty][!piste:type]
+    # *[place][!name][place!=islet][place!=plot][noname!=yes]
+    # *[transformer][!power]
+    # *[source:date][!source]
+    # *[source:name][!name][noname!=yes]
+    # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
+    # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
+    # *[source:building][!building]
+    # *[source:ref][!ref][noref!=yes]
+    # *[source:population][!population]
+    # *[source:postal_code][!postal_code]
+    # *[source:ele][!ele]
+    # *[source:ref:INSEE][!ref:INSEE]
+    # *[source:lit][!lit]
+    # *[source:hgv][!hgv]
+    # *[source:highway][!highway]
+    # *[source:maxaxleload][!maxaxleload]
+    # *[source:surface][!surface]
+    # *[source:bridge][!bridge]
+    # *[source:old_name][!old_name]
+    # *[source:bicycle][!bicycle]
+    # *[source:designation][!designation]
+    # *[source:height][!height]
+    # *[source:lanes][!lanes]
+    # *[source:postcode][!addr:postcode]
+    # *[source:housenumber][!addr:housenumber]
+    # *[source:addr:postcode][!addr:postcode]
+    # *[source:addr:housenumber][!addr:housenumber]
+    def _way_rule_2(self, data, tags, nds, keys, sets, err):
         if (
             ("border_type" in keys)
             or ("building:min_level" in keys)
@@ -4778,20 +4793,21 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[generator:source][power!=generator]
-        # *[generator:method][power!=generator]
-        # *[generator:type][power!=generator]
-        # way[fence_type][barrier!=fence]
-        # *[recycling_type][amenity!=recycling]
-        # *[information][tourism!=information]
-        # *[shelter_type][amenity!=shelter]
-        # *[archaeological_site][historic!=archaeological_site]
-        # *[artwork_type][tourism!=artwork][exhibit!=artwork]
-        # *[castle_type][historic!=castle]
-        # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
-        # way[cutline][man_made!=cutline]
-        # *[zoo][tourism!=zoo]
-        # *[bunker_type][military!=bunker]
+    # *[generator:source][power!=generator]
+    # *[generator:method][power!=generator]
+    # *[generator:type][power!=generator]
+    # way[fence_type][barrier!=fence]
+    # *[recycling_type][amenity!=recycling]
+    # *[information][tourism!=information]
+    # *[shelter_type][amenity!=shelter]
+    # *[archaeological_site][historic!=archaeological_site]
+    # *[artwork_type][tourism!=artwork][exhibit!=artwork]
+    # *[castle_type][historic!=castle]
+    # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
+    # way[cutline][man_made!=cutline]
+    # *[zoo][tourism!=zoo]
+    # *[bunker_type][military!=bunker]
+    def _way_rule_3(self, data, tags, nds, keys, sets, err):
         if (
             ("archaeological_site" in keys)
             or ("artwork_type" in keys)
@@ -5030,10 +5046,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[bridge:movable][bridge!=movable][man_made!=bridge]
-        # *[substation][power!=substation][pipeline!=substation]
-        # *[reservoir_type][landuse!=reservoir][water!=reservoir]
-        # way[waterway=pressurised][tunnel!=flooded][man_made!=pipeline]
+    # *[bridge:movable][bridge!=movable][man_made!=bridge]
+    # *[substation][power!=substation][pipeline!=substation]
+    # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    # way[waterway=pressurised][tunnel!=flooded][man_made!=pipeline]
+    def _way_rule_4(self, data, tags, nds, keys, sets, err):
         if (
             ("bridge:movable" in keys)
             or ("reservoir_type" in keys)
@@ -5140,8 +5157,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
-        # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    def _way_rule_5(self, data, tags, nds, keys, sets, err):
         if ("iata" in keys) or ("icao" in keys):
             match = False
             if not match:
@@ -5213,7 +5231,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    def _way_rule_6(self, data, tags, nds, keys, sets, err):
         if "pump_mechanism" in keys:
             match = False
             if not match:
@@ -5266,21 +5285,22 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[railway=construction][!construction][!construction:railway]
-        # way[highway=construction][!construction][!construction:highway]
-        # area[building=construction][!construction][!construction:building]
-        # area[landuse=construction][!construction][!construction:landuse]
-        # *[actuator=manual][!handle]
-        # *[mechanical_driver=manual][!handle]
-        # way[boundary=administrative][!admin_level]
-        # *[tourism=information][!information]
-        # *[leisure=pitch][!sport]
-        # *[aeroway=terminal][!building]
-        # *[office=government][!government]
-        # *[power=generator][!generator:source]
-        # *[amenity=social_facility][!social_facility]
-        # *[amenity=place_of_worship][!religion]
-        # *[man_made=tower][!tower:type]
+    # way[railway=construction][!construction][!construction:railway]
+    # way[highway=construction][!construction][!construction:highway]
+    # area[building=construction][!construction][!construction:building]
+    # area[landuse=construction][!construction][!construction:landuse]
+    # *[actuator=manual][!handle]
+    # *[mechanical_driver=manual][!handle]
+    # way[boundary=administrative][!admin_level]
+    # *[tourism=information][!information]
+    # *[leisure=pitch][!sport]
+    # *[aeroway=terminal][!building]
+    # *[office=government][!government]
+    # *[power=generator][!generator:source]
+    # *[amenity=social_facility][!social_facility]
+    # *[amenity=place_of_worship][!religion]
+    # *[man_made=tower][!tower:type]
+    def _way_rule_7(self, data, tags, nds, keys, sets, err):
         if (
             ("actuator" in keys)
             or ("aeroway" in keys)
@@ -5516,8 +5536,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[bridge:structure][!bridge][man_made!=bridge]
-        # *[segregated][!highway][railway!=crossing]
+    # way[bridge:structure][!bridge][man_made!=bridge]
+    # *[segregated][!highway][railway!=crossing]
+    def _way_rule_8(self, data, tags, nds, keys, sets, err):
         if ("bridge:structure" in keys) or ("segregated" in keys):
             match = False
             if not match:
@@ -5566,7 +5587,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[tunnel=culvert][man_made!=tunnel][!waterway]
+    # way[tunnel=culvert][man_made!=tunnel][!waterway]
+    def _way_rule_9(self, data, tags, nds, keys, sets, err):
         if "tunnel" in keys:
             match = False
             if not match:
@@ -5591,7 +5613,7 @@ class Josm_combinations(PluginMapCSS):
                 # set TunnelCulvertWithoutWaterway
                 # group:tr("suspicious tag combination")
                 # throwWarning:tr("{0} without {1} or {2}","{0.tag}","{1.tag}","{2.key}")
-                set_TunnelCulvertWithoutWaterway = True
+                sets.add("TunnelCulvertWithoutWaterway")
                 err.append(
                     {
                         "class": 9001002,
@@ -5605,8 +5627,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[usage=penstock][man_made!=pipeline]
-        # way[usage=penstock][waterway!=pressurised]
+    # way[usage=penstock][man_made!=pipeline]
+    # way[usage=penstock][waterway!=pressurised]
+    def _way_rule_10(self, data, tags, nds, keys, sets, err):
         if "usage" in keys:
             match = False
             if not match:
@@ -5652,7 +5675,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    def _way_rule_11(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -5694,7 +5718,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    def _way_rule_12(self, data, tags, nds, keys, sets, err):
         if "smoothness" in keys:
             match = False
             if not match:
@@ -5742,8 +5767,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
-        # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
+    # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    def _way_rule_13(self, data, tags, nds, keys, sets, err):
         if ("boat" in keys) or ("intermittent" in keys):
             match = False
             if not match:
@@ -5838,7 +5864,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[snowplowing][!highway][!amenity][!leisure]
+    # *[snowplowing][!highway][!amenity][!leisure]
+    def _way_rule_14(self, data, tags, nds, keys, sets, err):
         if "snowplowing" in keys:
             match = False
             if not match:
@@ -5869,7 +5896,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    def _way_rule_15(self, data, tags, nds, keys, sets, err):
         if "toll" in keys:
             match = False
             if not match:
@@ -5907,22 +5935,23 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=marketplace][highway]
-        # *[power=plant][/^generator:/]
-        # *[power=generator][/^plant:/]
-        # *[power=plant][voltage]
-        # *[power=plant][frequency]
-        # *[internet_access=no][internet_access:fee]
-        # *[amenity=vending_machine][shop]
-        # *[noname?][name]
-        # *[noref?][ref]
-        # *[nohousenumber?][addr:housenumber]
-        # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
-        # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
-        # way[oneway?][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway?][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway=-1][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway=-1][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # *[amenity=marketplace][highway]
+    # *[power=plant][/^generator:/]
+    # *[power=generator][/^plant:/]
+    # *[power=plant][voltage]
+    # *[power=plant][frequency]
+    # *[internet_access=no][internet_access:fee]
+    # *[amenity=vending_machine][shop]
+    # *[noname?][name]
+    # *[noref?][ref]
+    # *[nohousenumber?][addr:housenumber]
+    # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
+    # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    # way[oneway?][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway?][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway=-1][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway=-1][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    def _way_rule_16(self, data, tags, nds, keys, sets, err):
         if (
             ("actuator" in keys and "handle" in keys)
             or ("addr:housenumber" in keys and "nohousenumber" in keys)
@@ -6253,22 +6282,23 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[barrier=kerb][kerb=no]
-        # way[highway=construction][construction][construction=~/^(yes|minor|no)$/]
-        # way[railway=construction][construction][construction=~/^(yes|minor|no)$/]
-        # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
-        # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
-        # *[man_made=bridge][bridge=yes]
-        # *[man_made=tunnel][tunnel=yes]
-        # *[amenity=police][police]
-        # way[junction=yes][highway]
-        # way[tracktype=grade1][surface].unpaved_surface
-        # way[tracktype=grade2][surface][surface=~/^(sand|mud|ground|earth|dirt|grass|ice|salt|snow|woodchips)$/]
-        # way[tracktype=grade4][surface].fully_paved_surface
-        # way[tracktype=grade5][surface].fully_paved_surface
-        # way[segregated][bicycle=no]
-        # way[segregated][foot=no]
-        # way[man_made=pipeline][tunnel=flooded]
+    # *[barrier=kerb][kerb=no]
+    # way[highway=construction][construction][construction=~/^(yes|minor|no)$/]
+    # way[railway=construction][construction][construction=~/^(yes|minor|no)$/]
+    # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
+    # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
+    # *[man_made=bridge][bridge=yes]
+    # *[man_made=tunnel][tunnel=yes]
+    # *[amenity=police][police]
+    # way[junction=yes][highway]
+    # way[tracktype=grade1][surface].unpaved_surface
+    # way[tracktype=grade2][surface][surface=~/^(sand|mud|ground|earth|dirt|grass|ice|salt|snow|woodchips)$/]
+    # way[tracktype=grade4][surface].fully_paved_surface
+    # way[tracktype=grade5][surface].fully_paved_surface
+    # way[segregated][bicycle=no]
+    # way[segregated][foot=no]
+    # way[man_made=pipeline][tunnel=flooded]
+    def _way_rule_17(self, data, tags, nds, keys, sets, err):
         if (
             ("amenity" in keys and "police" in keys)
             or ("barrier" in keys and "kerb" in keys)
@@ -6438,7 +6468,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_unpaved_surface)
+                        ("unpaved_surface" in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "tracktype")
                             == mapcss._value_capture(capture_tags, 0, "grade1")
@@ -6471,7 +6501,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_fully_paved_surface)
+                        ("fully_paved_surface" in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "tracktype")
                             == mapcss._value_capture(capture_tags, 0, "grade4")
@@ -6484,7 +6514,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_fully_paved_surface)
+                        ("fully_paved_surface" in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "tracktype")
                             == mapcss._value_capture(capture_tags, 0, "grade5")
@@ -6542,8 +6572,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[building:part][building]
-        # *[addr:street][addr:place][outside("CZ,DK")]
+    # *[building:part][building]
+    # *[addr:street][addr:place][outside("CZ,DK")]
+    def _way_rule_18(self, data, tags, nds, keys, sets, err):
         if ("addr:place" in keys and "addr:street" in keys) or (
             "building" in keys and "building:part" in keys
         ):
@@ -6581,7 +6612,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=~/^(cycleway|footway|path)$/][segregated=no][sidewalk=~/^(left|right|both)$/]
+    # way[highway=~/^(cycleway|footway|path)$/][segregated=no][sidewalk=~/^(left|right|both)$/]
+    def _way_rule_19(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "segregated" in keys and "sidewalk" in keys:
             match = False
             if not match:
@@ -6627,8 +6659,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[railway][electrified=no][frequency]
-        # way[railway][electrified=no][voltage]
+    # way[railway][electrified=no][frequency]
+    # way[railway][electrified=no][voltage]
+    def _way_rule_20(self, data, tags, nds, keys, sets, err):
         if ("electrified" in keys and "frequency" in keys and "railway" in keys) or (
             "electrified" in keys and "railway" in keys and "voltage" in keys
         ):
@@ -6675,7 +6708,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[waterway][bridge=yes][waterway!=weir]
+    # way[waterway][bridge=yes][waterway!=weir]
+    def _way_rule_21(self, data, tags, nds, keys, sets, err):
         if "bridge" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -6715,7 +6749,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[waterway=weir][bridge=yes][highway]
+    # way[waterway=weir][bridge=yes][highway]
+    def _way_rule_22(self, data, tags, nds, keys, sets, err):
         if "bridge" in keys and "highway" in keys and "waterway" in keys:
             match = False
             if not match:
@@ -6752,15 +6787,16 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[access][eval(number_of_tags())=1]
-        # way[area][eval(number_of_tags())=1]!.area_yes_autofix
-        # way[lanes][eval(number_of_tags())=1]
-        # way[layer][eval(number_of_tags())=1]
-        # way[level][eval(number_of_tags())=1]
-        # way[lit][eval(number_of_tags())=1]
-        # way[name][eval(number_of_tags())=1]
-        # way[ref][eval(number_of_tags())=1]
-        # way[surface][eval(number_of_tags())=1]
+    # way[access][eval(number_of_tags())=1]
+    # way[area][eval(number_of_tags())=1]!.area_yes_autofix
+    # way[lanes][eval(number_of_tags())=1]
+    # way[layer][eval(number_of_tags())=1]
+    # way[level][eval(number_of_tags())=1]
+    # way[lit][eval(number_of_tags())=1]
+    # way[name][eval(number_of_tags())=1]
+    # way[ref][eval(number_of_tags())=1]
+    # way[surface][eval(number_of_tags())=1]
+    def _way_rule_23(self, data, tags, nds, keys, sets, err):
         if (
             ("access" in keys)
             or ("area" in keys)
@@ -6842,7 +6878,7 @@ class Josm_combinations(PluginMapCSS):
                 # set only_one_tag
                 # group:tr("missing tag")
                 # throwWarning:tr("incomplete object: only {0}","{0.key}")
-                set_only_one_tag = True
+                sets.add("only_one_tag")
                 err.append(
                     {
                         "class": 9001001,
@@ -6854,8 +6890,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[name][area][eval(number_of_tags())=2]
-        # way[name][ref][eval(number_of_tags())=2]
+    # way[name][area][eval(number_of_tags())=2]
+    # way[name][ref][eval(number_of_tags())=2]
+    def _way_rule_24(self, data, tags, nds, keys, sets, err):
         if ("area" in keys and "name" in keys) or ("name" in keys and "ref" in keys):
             match = False
             if not match:
@@ -6893,7 +6930,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[tourism=attraction][eval(number_of_tags())=1]
+    # way[tourism=attraction][eval(number_of_tags())=1]
+    def _way_rule_25(self, data, tags, nds, keys, sets, err):
         if "tourism" in keys:
             match = False
             if not match:
@@ -6919,7 +6957,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[name][tourism=attraction][eval(number_of_tags())=2]
+    # way[name][tourism=attraction][eval(number_of_tags())=2]
+    def _way_rule_26(self, data, tags, nds, keys, sets, err):
         if "name" in keys and "tourism" in keys:
             match = False
             if not match:
@@ -6950,9 +6989,10 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
-        # *[boundary][/^addr:/]
-        # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
+    # *[boundary][/^addr:/]
+    # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    def _way_rule_27(self, data, tags, nds, keys, sets, err):
         if ("boundary" in keys) or ("highway" in keys) or ("place" in keys):
             match = False
             if not match:
@@ -7029,7 +7069,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    def _way_rule_28(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys and "postal_code" in keys:
             match = False
             if not match:
@@ -7065,7 +7106,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    def _way_rule_29(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys and "postal_code" in keys:
             match = False
             if not match:
@@ -7101,7 +7143,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[postal_code]["addr:postcode"][highway][postal_code=*"addr:postcode"]
+    # way[postal_code]["addr:postcode"][highway][postal_code=*"addr:postcode"]
+    def _way_rule_30(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys and "highway" in keys and "postal_code" in keys:
             match = False
             if not match:
@@ -7140,7 +7183,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[postal_code]["addr:postcode"][highway][postal_code!=*"addr:postcode"]
+    # way[postal_code]["addr:postcode"][highway][postal_code!=*"addr:postcode"]
+    def _way_rule_31(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys and "highway" in keys and "postal_code" in keys:
             match = False
             if not match:
@@ -7176,7 +7220,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway]["addr:postcode"][highway!=services][highway!=rest_area][!postal_code]
+    # way[highway]["addr:postcode"][highway!=services][highway!=rest_area][!postal_code]
+    def _way_rule_32(self, data, tags, nds, keys, sets, err):
         if "addr:postcode" in keys and "highway" in keys:
             match = False
             if not match:
@@ -7231,7 +7276,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=footway][cycleway=lane]
+    # way[highway=footway][cycleway=lane]
+    def _way_rule_33(self, data, tags, nds, keys, sets, err):
         if "cycleway" in keys and "highway" in keys:
             match = False
             if not match:
@@ -7262,14 +7308,15 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[oneway][!highway][!area:highway][!railway][!aerialway][attraction!=summer_toboggan][aeroway!~/^(runway|taxiway)$/][leisure!=track][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/]
-        # way[lanes][!barrier][!ford][!highway][!area:highway][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
-        # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
-        # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
-        # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
-        # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
-        # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
-        # way[incline][!highway][!area:highway][!railway][aeroway!~/^(runway|taxiway)$/][attraction!=summer_toboggan][leisure!=slipway]
+    # way[oneway][!highway][!area:highway][!railway][!aerialway][attraction!=summer_toboggan][aeroway!~/^(runway|taxiway)$/][leisure!=track][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/]
+    # way[lanes][!barrier][!ford][!highway][!area:highway][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
+    # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
+    # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
+    # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
+    # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
+    # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    # way[incline][!highway][!area:highway][!railway][aeroway!~/^(runway|taxiway)$/][attraction!=summer_toboggan][leisure!=slipway]
+    def _way_rule_34(self, data, tags, nds, keys, sets, err):
         if (
             ("bridge" in keys)
             or ("incline" in keys)
@@ -7337,7 +7384,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_only_one_tag)
+                        ("only_one_tag" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "lanes"))
                         and (not mapcss._tag_capture(capture_tags, 1, tags, "barrier"))
                         and (not mapcss._tag_capture(capture_tags, 2, tags, "ford"))
@@ -7371,7 +7418,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_TunnelCulvertWithoutWaterway)
+                        ("TunnelCulvertWithoutWaterway" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "tunnel"))
                         and (not mapcss._tag_capture(capture_tags, 1, tags, "highway"))
                         and (
@@ -7717,10 +7764,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway][barrier]
-        # *[highway][waterway][waterway!=dam][waterway!=weir]
-        # way[highway][natural][natural!=ridge]
-        # *[landuse][building][landuse!=retail]
+    # way[highway][barrier]
+    # *[highway][waterway][waterway!=dam][waterway!=weir]
+    # way[highway][natural][natural!=ridge]
+    # *[landuse][building][landuse!=retail]
+    def _way_rule_35(self, data, tags, nds, keys, sets, err):
         if (
             ("barrier" in keys and "highway" in keys)
             or ("building" in keys and "landuse" in keys)
@@ -7802,7 +7850,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[natural=water][leisure=swimming_pool]
+    # *[natural=water][leisure=swimming_pool]
+    def _way_rule_36(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys and "natural" in keys:
             match = False
             if not match:
@@ -7831,7 +7880,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[sport][sport!=skiing][!building][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    # *[sport][sport!=skiing][!building][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    def _way_rule_37(self, data, tags, nds, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -7940,8 +7990,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[building:levels][!building][!building:part]
-        # way[usage][!railway][!waterway][route!=railway][man_made!=pipeline]
+    # *[building:levels][!building][!building:part]
+    # way[usage][!railway][!waterway][route!=railway][man_made!=pipeline]
+    def _way_rule_38(self, data, tags, nds, keys, sets, err):
         if ("building:levels" in keys) or ("usage" in keys):
             match = False
             if not match:
@@ -7996,7 +8047,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    def _way_rule_39(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -8065,7 +8117,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[name][alt_name][name=*alt_name]
+    # way[name][alt_name][name=*alt_name]
+    def _way_rule_40(self, data, tags, nds, keys, sets, err):
         if "alt_name" in keys and "name" in keys:
             match = False
             if not match:
@@ -8101,7 +8154,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[destination][!oneway?][junction!=roundabout][highway]
+    # way[destination][!oneway?][junction!=roundabout][highway]
+    def _way_rule_41(self, data, tags, nds, keys, sets, err):
         if "destination" in keys and "highway" in keys:
             match = False
             if not match:
@@ -8139,7 +8193,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[maxspeed:forward][maxspeed:backward][!maxspeed]["maxspeed:forward"=*"maxspeed:backward"]
+    # way[maxspeed:forward][maxspeed:backward][!maxspeed]["maxspeed:forward"=*"maxspeed:backward"]
+    def _way_rule_42(self, data, tags, nds, keys, sets, err):
         if "maxspeed:backward" in keys and "maxspeed:forward" in keys:
             match = False
             if not match:
@@ -8189,7 +8244,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[maxspeed:forward][maxspeed:backward][maxspeed]["maxspeed:forward"=*maxspeed]["maxspeed:backward"=*maxspeed]
+    # way[maxspeed:forward][maxspeed:backward][maxspeed]["maxspeed:forward"=*maxspeed]["maxspeed:backward"=*maxspeed]
+    def _way_rule_43(self, data, tags, nds, keys, sets, err):
         if (
             "maxspeed" in keys
             and "maxspeed:backward" in keys
@@ -8233,7 +8289,7 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"maxspeed"
                 # fixRemove:"maxspeed:backward"
                 # fixRemove:"maxspeed:forward"
-                set_AllSameMaxspeed = True
+                sets.add("AllSameMaxspeed")
                 err.append(
                     {
                         "class": 9001002,
@@ -8249,7 +8305,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway:left][cycleway:right][!cycleway]["cycleway:left"=*"cycleway:right"]
+    # way[cycleway:left][cycleway:right][!cycleway]["cycleway:left"=*"cycleway:right"]
+    def _way_rule_44(self, data, tags, nds, keys, sets, err):
         if "cycleway:left" in keys and "cycleway:right" in keys:
             match = False
             if not match:
@@ -8295,7 +8352,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway:left][cycleway:right][cycleway]["cycleway:left"=*cycleway]["cycleway:right"=*cycleway]
+    # way[cycleway:left][cycleway:right][cycleway]["cycleway:left"=*cycleway]["cycleway:right"=*cycleway]
+    def _way_rule_45(self, data, tags, nds, keys, sets, err):
         if "cycleway" in keys and "cycleway:left" in keys and "cycleway:right" in keys:
             match = False
             if not match:
@@ -8329,7 +8387,7 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"cycleway"
                 # fixRemove:"cycleway:left"
                 # fixRemove:"cycleway:right"
-                set_AllSameCycleway = True
+                sets.add("AllSameCycleway")
                 err.append(
                     {
                         "class": 9001002,
@@ -8345,7 +8403,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[sidewalk:left][sidewalk:right][!sidewalk]["sidewalk:left"=*"sidewalk:right"]
+    # way[sidewalk:left][sidewalk:right][!sidewalk]["sidewalk:left"=*"sidewalk:right"]
+    def _way_rule_46(self, data, tags, nds, keys, sets, err):
         if "sidewalk:left" in keys and "sidewalk:right" in keys:
             match = False
             if not match:
@@ -8391,7 +8450,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[sidewalk:left][sidewalk:right][sidewalk]["sidewalk:left"=*sidewalk]["sidewalk:right"=*sidewalk]
+    # way[sidewalk:left][sidewalk:right][sidewalk]["sidewalk:left"=*sidewalk]["sidewalk:right"=*sidewalk]
+    def _way_rule_47(self, data, tags, nds, keys, sets, err):
         if "sidewalk" in keys and "sidewalk:left" in keys and "sidewalk:right" in keys:
             match = False
             if not match:
@@ -8425,7 +8485,7 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"sidewalk"
                 # fixRemove:"sidewalk:left"
                 # fixRemove:"sidewalk:right"
-                set_AllSameSidewalk = True
+                sets.add("AllSameSidewalk")
                 err.append(
                     {
                         "class": 9001002,
@@ -8441,9 +8501,10 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way["maxspeed:forward"]["maxspeed:backward"][maxspeed]!.AllSameMaxspeed
-        # way["cycleway:left"]["cycleway:right"][cycleway]!.AllSameCycleway
-        # way["sidewalk:left"]["sidewalk:right"][sidewalk]!.AllSameSidewalk
+    # way["maxspeed:forward"]["maxspeed:backward"][maxspeed]!.AllSameMaxspeed
+    # way["cycleway:left"]["cycleway:right"][cycleway]!.AllSameCycleway
+    # way["sidewalk:left"]["sidewalk:right"][sidewalk]!.AllSameSidewalk
+    def _way_rule_48(self, data, tags, nds, keys, sets, err):
         if (
             (
                 "cycleway" in keys
@@ -8466,7 +8527,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_AllSameMaxspeed)
+                        ("AllSameMaxspeed" not in sets)
                         and (
                             mapcss._tag_capture(
                                 capture_tags, 0, tags, "maxspeed:forward"
@@ -8485,7 +8546,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_AllSameCycleway)
+                        ("AllSameCycleway" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "cycleway:left")
                         )
@@ -8500,7 +8561,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_AllSameSidewalk)
+                        ("AllSameSidewalk" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "sidewalk:left")
                         )
@@ -8527,12 +8588,13 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way["maxspeed:forward"][maxspeed][!"maxspeed:backward"]
-        # way["maxspeed:backward"][maxspeed][!"maxspeed:forward"]
-        # way["cycleway:left"][cycleway][!"cycleway:right"]
-        # way["cycleway:right"][cycleway][!"cycleway:left"]
-        # way["sidewalk:left"][sidewalk][!"sidewalk:right"]
-        # way["sidewalk:right"][sidewalk][!"sidewalk:left"]
+    # way["maxspeed:forward"][maxspeed][!"maxspeed:backward"]
+    # way["maxspeed:backward"][maxspeed][!"maxspeed:forward"]
+    # way["cycleway:left"][cycleway][!"cycleway:right"]
+    # way["cycleway:right"][cycleway][!"cycleway:left"]
+    # way["sidewalk:left"][sidewalk][!"sidewalk:right"]
+    # way["sidewalk:right"][sidewalk][!"sidewalk:left"]
+    def _way_rule_49(self, data, tags, nds, keys, sets, err):
         if (
             ("cycleway" in keys and "cycleway:left" in keys)
             or ("cycleway" in keys and "cycleway:right" in keys)
@@ -8645,8 +8707,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[bridge][layer][layer<0][bridge!=no][location!=underground][indoor!=yes][!tunnel]
-        # way[tunnel][layer][layer>0][tunnel!=no][location!=overground][indoor!=yes][!bridge]
+    # way[bridge][layer][layer<0][bridge!=no][location!=underground][indoor!=yes][!tunnel]
+    # way[tunnel][layer][layer>0][tunnel!=no][location!=overground][indoor!=yes][!bridge]
+    def _way_rule_50(self, data, tags, nds, keys, sets, err):
         if ("bridge" in keys and "layer" in keys) or (
             "layer" in keys and "tunnel" in keys
         ):
@@ -8726,11 +8789,12 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[waterway][layer][layer=~/^(-1|-2|-3|-4|-5)$/][!tunnel][culvert!=yes][covered!=yes][pipeline!=yes][location!=underground][eval(waylength())>400]
-        # Part of rule not implemented
+    # way[waterway][layer][layer=~/^(-1|-2|-3|-4|-5)$/][!tunnel][culvert!=yes][covered!=yes][pipeline!=yes][location!=underground][eval(waylength())>400]
+    # Part of rule not implemented
 
-        # way[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]!:closed
-        # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    # way[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]!:closed
+    # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    def _way_rule_51(self, data, tags, nds, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -8816,7 +8880,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # area[golf=bunker][natural=beach]
+    # area[golf=bunker][natural=beach]
+    def _way_rule_52(self, data, tags, nds, keys, sets, err):
         if "golf" in keys and "natural" in keys:
             match = False
             if not match:
@@ -8855,7 +8920,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=~/^(motorway|motorway_link|trunk|trunk_link)$/]
+    # way[highway=~/^(motorway|motorway_link|trunk|trunk_link)$/]
+    def _way_rule_53(self, data, tags, nds, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -8869,15 +8935,16 @@ class Josm_combinations(PluginMapCSS):
                     pass
             if match:
                 # set MotorwayTrunk
-                set_MotorwayTrunk = True
-
-        # way.MotorwayTrunk[lanes][turn:lanes][tag(lanes)!=eval(count(split("|",tag("turn:lanes"))))]
-        # way.MotorwayTrunk[lanes][change:lanes][tag(lanes)!=eval(count(split("|",tag("change:lanes"))))]
-        # way.MotorwayTrunk[lanes][maxspeed:lanes][tag(lanes)!=eval(count(split("|",tag("maxspeed:lanes"))))]
-        # way.MotorwayTrunk[lanes][minspeed:lanes][tag(lanes)!=eval(count(split("|",tag("minspeed:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:lanes][tag(lanes)!=eval(count(split("|",tag("destination:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:ref:lanes][tag(lanes)!=eval(count(split("|",tag("destination:ref:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:symbol:lanes][tag(lanes)!=eval(count(split("|",tag("destination:symbol:lanes"))))]
+                sets.add("MotorwayTrunk")
+
+    # way.MotorwayTrunk[lanes][turn:lanes][tag(lanes)!=eval(count(split("|",tag("turn:lanes"))))]
+    # way.MotorwayTrunk[lanes][change:lanes][tag(lanes)!=eval(count(split("|",tag("change:lanes"))))]
+    # way.MotorwayTrunk[lanes][maxspeed:lanes][tag(lanes)!=eval(count(split("|",tag("maxspeed:lanes"))))]
+    # way.MotorwayTrunk[lanes][minspeed:lanes][tag(lanes)!=eval(count(split("|",tag("minspeed:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:lanes][tag(lanes)!=eval(count(split("|",tag("destination:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:ref:lanes][tag(lanes)!=eval(count(split("|",tag("destination:ref:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:symbol:lanes][tag(lanes)!=eval(count(split("|",tag("destination:symbol:lanes"))))]
+    def _way_rule_54(self, data, tags, nds, keys, sets, err):
         if (
             ("change:lanes" in keys and "lanes" in keys)
             or ("destination:lanes" in keys and "lanes" in keys)
@@ -8892,7 +8959,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (mapcss._tag_capture(capture_tags, 2, tags, "turn:lanes"))
                         and (
@@ -8908,7 +8975,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (mapcss._tag_capture(capture_tags, 2, tags, "change:lanes"))
                         and (
@@ -8924,7 +8991,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (
                             mapcss._tag_capture(capture_tags, 2, tags, "maxspeed:lanes")
@@ -8942,7 +9009,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (
                             mapcss._tag_capture(capture_tags, 2, tags, "minspeed:lanes")
@@ -8960,7 +9027,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (
                             mapcss._tag_capture(
@@ -8980,7 +9047,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (
                             mapcss._tag_capture(
@@ -9002,7 +9069,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (set_MotorwayTrunk)
+                        ("MotorwayTrunk" in sets)
                         and (mapcss._tag_capture(capture_tags, 1, tags, "lanes"))
                         and (
                             mapcss._tag_capture(
@@ -9035,7 +9102,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway][lanes][!lanes:forward][!lanes:backward][oneway!=yes][oneway!=-1][oneway!=reversible][highway!=motorway][junction!=roundabout][lanes>2][mod(tag(lanes),2)=1]
+    # way[highway][lanes][!lanes:forward][!lanes:backward][oneway!=yes][oneway!=-1][oneway!=reversible][highway!=motorway][junction!=roundabout][lanes>2][mod(tag(lanes),2)=1]
+    def _way_rule_55(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "lanes" in keys:
             match = False
             if not match:
@@ -9112,9 +9180,10 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[/^.*:lanes$/][!lanes][highway][!source:lanes]
-        # way[/^.*:lanes:(forward|backward|both_ways)$/][!lanes][highway]
-        # way[/^.*:lanes:both_ways$/][!lanes:both_ways][highway]
+    # way[/^.*:lanes$/][!lanes][highway][!source:lanes]
+    # way[/^.*:lanes:(forward|backward|both_ways)$/][!lanes][highway]
+    # way[/^.*:lanes:both_ways$/][!lanes:both_ways][highway]
+    def _way_rule_56(self, data, tags, nds, keys, sets, err):
         if "highway" in keys:
             match = False
             if not match:
@@ -9174,7 +9243,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # area[boundary=administrative][landuse=residential]
+    # area[boundary=administrative][landuse=residential]
+    def _way_rule_57(self, data, tags, nds, keys, sets, err):
         if "boundary" in keys and "landuse" in keys:
             match = False
             if not match:
@@ -9211,7 +9281,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=pedestrian][width][width<3]
+    # way[highway=pedestrian][width][width<3]
+    def _way_rule_58(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "width" in keys:
             match = False
             if not match:
@@ -9253,7 +9324,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # area[cemetery=sector][landuse=cemetery]
+    # area[cemetery=sector][landuse=cemetery]
+    def _way_rule_59(self, data, tags, nds, keys, sets, err):
         if "cemetery" in keys and "landuse" in keys:
             match = False
             if not match:
@@ -9290,7 +9362,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[highway=cycleway][cycleway=track]
+    # *[highway=cycleway][cycleway=track]
+    def _way_rule_60(self, data, tags, nds, keys, sets, err):
         if "cycleway" in keys and "highway" in keys:
             match = False
             if not match:
@@ -9323,9 +9396,10 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=path][!segregated][foot=designated][bicycle=designated]
-        # way[highway=footway][!segregated][bicycle=designated]
-        # way[highway=cycleway][!segregated][foot=designated]
+    # way[highway=path][!segregated][foot=designated][bicycle=designated]
+    # way[highway=footway][!segregated][bicycle=designated]
+    # way[highway=cycleway][!segregated][foot=designated]
+    def _way_rule_61(self, data, tags, nds, keys, sets, err):
         if (
             ("bicycle" in keys and "foot" in keys and "highway" in keys)
             or ("bicycle" in keys and "highway" in keys)
@@ -9404,10 +9478,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[construction:building][!building][!construction]
-        # *[construction:highway][!highway][!construction]
-        # *[construction:railway][!railway][!construction]
-        # *[construction:landuse][!landuse][!construction]
+    # *[construction:building][!building][!construction]
+    # *[construction:highway][!highway][!construction]
+    # *[construction:railway][!railway][!construction]
+    # *[construction:landuse][!landuse][!construction]
+    def _way_rule_62(self, data, tags, nds, keys, sets, err):
         if (
             ("construction:building" in keys)
             or ("construction:highway" in keys)
@@ -9525,10 +9600,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[building=construction]["construction:building"][!construction]
-        # *[highway=construction]["construction:highway"][!construction]
-        # *[railway=construction]["construction:railway"][!construction]
-        # *[landuse=construction]["construction:landuse"][!construction]
+    # *[building=construction]["construction:building"][!construction]
+    # *[highway=construction]["construction:highway"][!construction]
+    # *[railway=construction]["construction:railway"][!construction]
+    # *[landuse=construction]["construction:landuse"][!construction]
+    def _way_rule_63(self, data, tags, nds, keys, sets, err):
         if (
             ("building" in keys and "construction:building" in keys)
             or ("construction:highway" in keys and "highway" in keys)
@@ -9652,10 +9728,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[building]["construction:building"][!construction][building!=construction]
-        # *[highway]["construction:highway"][!construction][highway!=construction]
-        # *[railway]["construction:railway"][!construction][railway!=construction]
-        # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    # *[building]["construction:building"][!construction][building!=construction]
+    # *[highway]["construction:highway"][!construction][highway!=construction]
+    # *[railway]["construction:railway"][!construction][railway!=construction]
+    # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    def _way_rule_64(self, data, tags, nds, keys, sets, err):
         if (
             ("building" in keys and "construction:building" in keys)
             or ("construction:highway" in keys and "highway" in keys)
@@ -9778,10 +9855,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *["construction:building"][construction][construction:building!=*construction]
-        # *["construction:highway"][construction][construction:highway!=*construction]
-        # *["construction:railway"][construction][construction:railway!=*construction]
-        # *["construction:landuse"][construction][construction:landuse!=*construction]
+    # *["construction:building"][construction][construction:building!=*construction]
+    # *["construction:highway"][construction][construction:highway!=*construction]
+    # *["construction:railway"][construction][construction:railway!=*construction]
+    # *["construction:landuse"][construction][construction:landuse!=*construction]
+    def _way_rule_65(self, data, tags, nds, keys, sets, err):
         if (
             ("construction" in keys and "construction:building" in keys)
             or ("construction" in keys and "construction:highway" in keys)
@@ -9890,10 +9968,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway][construction][construction!~/^(yes|minor|no)$/][highway!=construction]
-        # way[railway][construction][construction!~/^(yes|minor|no)$/][railway!=construction]
-        # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
-        # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    # way[highway][construction][construction!~/^(yes|minor|no)$/][highway!=construction]
+    # way[railway][construction][construction!~/^(yes|minor|no)$/][railway!=construction]
+    # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
+    # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    def _way_rule_66(self, data, tags, nds, keys, sets, err):
         if (
             ("building" in keys and "construction" in keys)
             or ("construction" in keys and "highway" in keys)
@@ -10036,8 +10115,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=recycling][collection_times="24/7"][!opening_hours]
-        # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    # *[amenity=recycling][collection_times="24/7"][!opening_hours]
+    # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    def _way_rule_67(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "collection_times" in keys:
             match = False
             if not match:
@@ -10122,7 +10202,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway][crossing][highway=~/^(motorway|motorway_link|trunk|trunk_link|primary|primary_link|secondary|secondary_link|tertiary|tertiary_link|unclassified|residential|service|living_street)$/]
+    # way[highway][crossing][highway=~/^(motorway|motorway_link|trunk|trunk_link|primary|primary_link|secondary|secondary_link|tertiary|tertiary_link|unclassified|residential|service|living_street)$/]
+    def _way_rule_68(self, data, tags, nds, keys, sets, err):
         if "crossing" in keys and "highway" in keys:
             match = False
             if not match:
@@ -10162,7 +10243,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    def _way_rule_69(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -10202,7 +10284,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[source:addr][!/^addr:/]
+    # *[source:addr][!/^addr:/]
+    def _way_rule_70(self, data, tags, nds, keys, sets, err):
         if "source:addr" in keys:
             match = False
             if not match:
@@ -10230,7 +10313,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[source:maxspeed][!/^maxspeed:?/]
+    # *[source:maxspeed][!/^maxspeed:?/]
+    def _way_rule_71(self, data, tags, nds, keys, sets, err):
         if "source:maxspeed" in keys:
             match = False
             if not match:
@@ -10259,7 +10343,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=communications_tower][height][height=~/^((7[0-4]|[1-6]?[0-9])(\.[0-9]*)?( m)?|(2(4[0-5]|[0-3][0-9])|1?[0-9]?[0-9])((\.[0-9]*)?( ft|\')|\'(11|10|[0-9])(\.[0-9]*)?\"))$/]
+    # *[man_made=communications_tower][height][height=~/^((7[0-4]|[1-6]?[0-9])(\.[0-9]*)?( m)?|(2(4[0-5]|[0-3][0-9])|1?[0-9]?[0-9])((\.[0-9]*)?( ft|\')|\'(11|10|[0-9])(\.[0-9]*)?\"))$/]
+    def _way_rule_72(self, data, tags, nds, keys, sets, err):
         if "height" in keys and "man_made" in keys:
             match = False
             if not match:
@@ -10300,8 +10385,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
-        # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
+    # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    def _way_rule_73(self, data, tags, nds, keys, sets, err):
         if ("FIXME" in keys) or ("fixme" in keys):
             match = False
             if not match:
@@ -10350,8 +10436,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway][placement=transition][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
-        # way[highway][!placement][/^placement:.*$/][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    # way[highway][placement=transition][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    # way[highway][!placement][/^placement:.*$/][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    def _way_rule_74(self, data, tags, nds, keys, sets, err):
         if ("highway" in keys) or ("highway" in keys and "placement" in keys):
             match = False
             if not match:
@@ -10409,7 +10496,7 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way highway=primary placement:backward=transition placement:forward=transition"
                 # assertNoMatch:"way highway=primary placement=middle_of:1 placement:backward=transition placement:forward=transition"
                 # assertMatch:"way highway=primary placement=transition placement:both_ways=transition"
-                set_PlacementTransitionWarning = True
+                sets.add("PlacementTransitionWarning")
                 err.append(
                     {
                         "class": 9001005,
@@ -10431,10 +10518,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[placement][/^placement:.*$/][highway]!.PlacementTransitionWarning
-        # way["placement:forward"]["placement:backward"][highway]!.PlacementTransitionWarning
-        # way["placement:forward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
-        # way["placement:backward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    # way[placement][/^placement:.*$/][highway]!.PlacementTransitionWarning
+    # way["placement:forward"]["placement:backward"][highway]!.PlacementTransitionWarning
+    # way["placement:forward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    # way["placement:backward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    def _way_rule_75(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "placement" in keys)
             or (
@@ -10458,7 +10546,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_PlacementTransitionWarning)
+                        ("PlacementTransitionWarning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "placement"))
                         and (
                             mapcss._tag_capture(capture_tags, 1, tags, self.re_57c5150b)
@@ -10471,7 +10559,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_PlacementTransitionWarning)
+                        ("PlacementTransitionWarning" not in sets)
                         and (
                             mapcss._tag_capture(
                                 capture_tags, 0, tags, "placement:forward"
@@ -10490,7 +10578,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_PlacementTransitionWarning)
+                        ("PlacementTransitionWarning" not in sets)
                         and (
                             mapcss._tag_capture(
                                 capture_tags, 0, tags, "placement:forward"
@@ -10509,7 +10597,7 @@ class Josm_combinations(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_PlacementTransitionWarning)
+                        ("PlacementTransitionWarning" not in sets)
                         and (
                             mapcss._tag_capture(
                                 capture_tags, 0, tags, "placement:backward"
@@ -10542,7 +10630,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[footway][highway][footway=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    # way[footway][highway][footway=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    def _way_rule_76(self, data, tags, nds, keys, sets, err):
         if "footway" in keys and "highway" in keys:
             match = False
             if not match:
@@ -10588,7 +10677,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[footway][highway][footway!=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    # way[footway][highway][footway!=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    def _way_rule_77(self, data, tags, nds, keys, sets, err):
         if "footway" in keys and "highway" in keys:
             match = False
             if not match:
@@ -10632,8 +10722,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[footway][!highway][!/:highway$/]
-        # way[cycleway][!highway][!/:highway$/]
+    # way[footway][!highway][!/:highway$/]
+    # way[cycleway][!highway][!/:highway$/]
+    def _way_rule_78(self, data, tags, nds, keys, sets, err):
         if ("cycleway" in keys) or ("footway" in keys):
             match = False
             if not match:
@@ -10680,7 +10771,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[bicycle][/^cycleway(:|$)/][!/^bicycle:/][bicycle=~/^(no|use_sidepath)$/][/^cycleway(:|$)/!~/^(no|none|separate)$/]
+    # way[bicycle][/^cycleway(:|$)/][!/^bicycle:/][bicycle=~/^(no|use_sidepath)$/][/^cycleway(:|$)/!~/^(no|none|separate)$/]
+    def _way_rule_79(self, data, tags, nds, keys, sets, err):
         if "bicycle" in keys:
             match = False
             if not match:
@@ -10737,8 +10829,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[highway=living_street][maxspeed][maxspeed=~/mph/][get(split(" ",tag(maxspeed)),0)>15]
-        # way[highway=living_street][maxspeed][maxspeed!~/mph/][get(split(" ",tag(maxspeed)),0)>20]
+    # way[highway=living_street][maxspeed][maxspeed=~/mph/][get(split(" ",tag(maxspeed)),0)>15]
+    # way[highway=living_street][maxspeed][maxspeed!~/mph/][get(split(" ",tag(maxspeed)),0)>20]
+    def _way_rule_80(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "maxspeed" in keys:
             match = False
             if not match:
@@ -10814,7 +10907,8 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[piste:type=nordic][!piste:grooming]
+    # way[piste:type=nordic][!piste:grooming]
+    def _way_rule_81(self, data, tags, nds, keys, sets, err):
         if "piste:type" in keys:
             match = False
             if not match:
@@ -10845,10 +10939,11 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # way[piste:type=~/^downhill|nordic|skitour$/][!piste:difficulty][count(parent_tags("piste:difficulty"))==0]
-        # Part of rule not implemented
+    # way[piste:type=~/^downhill|nordic|skitour$/][!piste:difficulty][count(parent_tags("piste:difficulty"))==0]
+    # Part of rule not implemented
 
-        # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    def _way_rule_82(self, data, tags, nds, keys, sets, err):
         if (
             "transformer" in keys
             and "voltage:primary" in keys
@@ -10892,8 +10987,9 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        # area[/^(building|building:part)$/][height=~/^[0-9]+(\.[0-9]+)?( m)?$/][min_height=~/^[0-9]+(\.[0-9]+)?( m)?$/][get(split(" ",tag(height)),0)<=get(split(" ",tag(min_height)),0)]
-        # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    # area[/^(building|building:part)$/][height=~/^[0-9]+(\.[0-9]+)?( m)?$/][min_height=~/^[0-9]+(\.[0-9]+)?( m)?$/][get(split(" ",tag(height)),0)<=get(split(" ",tag(min_height)),0)]
+    # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    def _way_rule_83(self, data, tags, nds, keys, sets, err):
         if ("building:levels" in keys and "building:min_level" in keys) or (
             "height" in keys and "min_height" in keys
         ):
@@ -10976,7 +11072,274 @@ class Josm_combinations(PluginMapCSS):
                     }
                 )
 
-        return err
+    _way_rules = (
+        _way_rule_0,
+        _way_rule_1,
+        _way_rule_2,
+        _way_rule_3,
+        _way_rule_4,
+        _way_rule_5,
+        _way_rule_6,
+        _way_rule_7,
+        _way_rule_8,
+        _way_rule_9,
+        _way_rule_10,
+        _way_rule_11,
+        _way_rule_12,
+        _way_rule_13,
+        _way_rule_14,
+        _way_rule_15,
+        _way_rule_16,
+        _way_rule_17,
+        _way_rule_18,
+        _way_rule_19,
+        _way_rule_20,
+        _way_rule_21,
+        _way_rule_22,
+        _way_rule_23,
+        _way_rule_24,
+        _way_rule_25,
+        _way_rule_26,
+        _way_rule_27,
+        _way_rule_28,
+        _way_rule_29,
+        _way_rule_30,
+        _way_rule_31,
+        _way_rule_32,
+        _way_rule_33,
+        _way_rule_34,
+        _way_rule_35,
+        _way_rule_36,
+        _way_rule_37,
+        _way_rule_38,
+        _way_rule_39,
+        _way_rule_40,
+        _way_rule_41,
+        _way_rule_42,
+        _way_rule_43,
+        _way_rule_44,
+        _way_rule_45,
+        _way_rule_46,
+        _way_rule_47,
+        _way_rule_48,
+        _way_rule_49,
+        _way_rule_50,
+        _way_rule_51,
+        _way_rule_52,
+        _way_rule_53,
+        _way_rule_54,
+        _way_rule_55,
+        _way_rule_56,
+        _way_rule_57,
+        _way_rule_58,
+        _way_rule_59,
+        _way_rule_60,
+        _way_rule_61,
+        _way_rule_62,
+        _way_rule_63,
+        _way_rule_64,
+        _way_rule_65,
+        _way_rule_66,
+        _way_rule_67,
+        _way_rule_68,
+        _way_rule_69,
+        _way_rule_70,
+        _way_rule_71,
+        _way_rule_72,
+        _way_rule_73,
+        _way_rule_74,
+        _way_rule_75,
+        _way_rule_76,
+        _way_rule_77,
+        _way_rule_78,
+        _way_rule_79,
+        _way_rule_80,
+        _way_rule_81,
+        _way_rule_82,
+        _way_rule_83,
+    )
+    _way_rules_dispatch = {
+        "FIXME": (73,),
+        "access": (23,),
+        "actuator": (7,),
+        "addr:housenumber": (16,),
+        "addr:place": (18,),
+        "addr:postcode": (32,),
+        "aeroway": (7,),
+        "alt_name": (40,),
+        "amenity": (7, 11, 16, 69),
+        "archaeological_site": (3,),
+        "area": (23, 24),
+        "artwork_type": (3,),
+        "barrier": (35,),
+        "bicycle": (17, 61, 79),
+        "boat": (13,),
+        "border_type": (2,),
+        "boundary": (7, 27, 57),
+        "bridge": (34,),
+        "bridge:movable": (4,),
+        "bridge:structure": (8,),
+        "building": (7, 35),
+        "building:levels": (38, 83),
+        "building:min_level": (2,),
+        "building:part": (18,),
+        "bunker_type": (3,),
+        "canal": (2,),
+        "castle_type": (3,),
+        "cemetery": (59,),
+        "change:lanes": (54,),
+        "collection_times": (67,),
+        "construction": (17, 65, 66),
+        "construction:building": (62, 63, 64),
+        "construction:highway": (62, 63, 64),
+        "construction:landuse": (62, 63, 64),
+        "construction:railway": (62, 63, 64),
+        "crossing": (68,),
+        "cutline": (3,),
+        "cycleway": (33, 60, 78),
+        "cycleway:left": (44, 45, 48, 49),
+        "cycleway:right": (49,),
+        "destination": (41,),
+        "destination:lanes": (54,),
+        "destination:ref:lanes": (54,),
+        "destination:symbol:lanes": (54,),
+        "detail": (2,),
+        "eddy_current_brake": (2,),
+        "electrified": (2, 20),
+        "etcs": (2,),
+        "fence_type": (3,),
+        "fixme": (73,),
+        "foot": (17, 61),
+        "footway": (76, 77, 78),
+        "frequency": (16,),
+        "gauge": (2,),
+        "generator:method": (3,),
+        "generator:source": (3,),
+        "generator:type": (3,),
+        "golf": (52,),
+        "grade_of_track": (2,),
+        "handle": (16,),
+        "have_riverbank": (2,),
+        "height": (72, 83),
+        "highway": (7, 27, 53, 56, 74),
+        "iata": (5,),
+        "icao": (5,),
+        "incline": (34,),
+        "information": (3,),
+        "intermittent": (13,),
+        "internet_access": (16,),
+        "junction": (2, 17),
+        "kerb": (17,),
+        "kursbuchstrecke": (2,),
+        "landuse": (7,),
+        "lanes": (23, 34, 55),
+        "layer": (23, 50),
+        "leisure": (7, 36),
+        "length_unit": (2,),
+        "level": (23,),
+        "lit": (23,),
+        "living_street": (2,),
+        "lzb": (2,),
+        "maintenance": (2,),
+        "man_made": (7, 17),
+        "maxspeed": (34, 80),
+        "maxspeed:backward": (42, 43, 48, 49),
+        "maxspeed:forward": (49,),
+        "maxspeed:lanes": (54,),
+        "mechanical_driver": (7,),
+        "median": (2,),
+        "min_height": (2,),
+        "minspeed:lanes": (54,),
+        "motorroad": (2,),
+        "name": (23,),
+        "natural": (35,),
+        "noname": (16,),
+        "noref": (16,),
+        "office": (7,),
+        "old_railway_operator": (2,),
+        "oneway": (16, 34),
+        "operating_procedure": (2,),
+        "parking": (3,),
+        "piste:difficulty": (2,),
+        "piste:type": (81,),
+        "place": (2, 27),
+        "placement": (74, 75),
+        "placement:backward": (75,),
+        "placement:both_ways": (75,),
+        "police": (17,),
+        "postal_code": (28, 29, 30, 31),
+        "power": (7, 16),
+        "psv": (34,),
+        "pump_mechanism": (6,),
+        "pzb": (2,),
+        "railway": (7,),
+        "recycling_type": (3,),
+        "ref": (23, 24),
+        "reservoir_type": (4,),
+        "sac_scale": (2,),
+        "segregated": (8, 19),
+        "shelter_type": (3,),
+        "shop": (16,),
+        "sidewalk": (2,),
+        "sidewalk:left": (46, 47, 48, 49),
+        "sidewalk:right": (49,),
+        "smoothness": (12,),
+        "snowplowing": (14,),
+        "source:addr": (70,),
+        "source:addr:housenumber": (2,),
+        "source:addr:postcode": (2,),
+        "source:bicycle": (2,),
+        "source:bridge": (2,),
+        "source:building": (2,),
+        "source:date": (2,),
+        "source:designation": (2,),
+        "source:ele": (2,),
+        "source:height": (2,),
+        "source:hgv": (2,),
+        "source:highway": (2,),
+        "source:housenumber": (2,),
+        "source:lanes": (2,),
+        "source:lit": (2,),
+        "source:maxaxleload": (2,),
+        "source:maxspeed": (71,),
+        "source:maxspeed:backward": (2,),
+        "source:maxspeed:forward": (2,),
+        "source:name": (2,),
+        "source:old_name": (2,),
+        "source:population": (2,),
+        "source:postal_code": (2,),
+        "source:postcode": (2,),
+        "source:ref": (2,),
+        "source:ref:INSEE": (2,),
+        "source:surface": (2,),
+        "sport": (37,),
+        "step_count": (2,),
+        "structure_gauge": (2,),
+        "substation": (4,),
+        "surface": (0, 1, 23),
+        "tilting_technology": (2,),
+        "toll": (15,),
+        "tourism": (7, 25, 26),
+        "track_class": (2,),
+        "tracks": (2,),
+        "tracktype": (2, 17),
+        "traffic_mode": (2,),
+        "trail_visibility": (2,),
+        "transformer": (2,),
+        "trolley_wire": (2,),
+        "tunnel": (9, 34),
+        "turn:lanes": (54,),
+        "usage": (10, 38),
+        "voltage:primary": (82,),
+        "water": (51,),
+        "waterway": (4, 21, 22, 35),
+        "width": (34, 58),
+        "workrules": (2,),
+        "zip_left": (2,),
+        "zip_right": (2,),
+        "zoo": (3,),
+    }
+    _way_rules_fallback = (39,)
 
     def relation(self, data, tags, members):
         capture_tags = {}
@@ -14,6 +14,27 @@ class Josm_de_openrailwaymap(PluginMapCSS):
 
     only_for = ["DE"]
 
+    tags_only = ["node", "way"]
+
+    interest_keys = {
+        "node": [
+            "railway:signal:combined",
+            "railway:signal:distant",
+            "railway:signal:distant:repeated",
+            "railway:signal:distant:shortened",
+            "railway:signal:main",
+            "railway:signal:main:states",
+            "railway:signal:minor",
+            "railway:signal:minor:states",
+            "railway:signal:speed_limit",
+            "railway:signal:speed_limit:speed",
+            "railway:signal:speed_limit_distant",
+            "railway:signal:speed_limit_distant:form",
+            "railway:signal:train_protection",
+        ],
+        "way": ["name", "ref", "workrules"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -235,20 +256,20 @@ class Josm_de_openrailwaymap(PluginMapCSS):
             },
         )
 
-        self.re_057dc3df = re.compile(r"^Kursbuchstrecke [0-9]*.*")
-        self.re_103aec5a = re.compile(r"^DE-ESO:")
-        self.re_12ca7ec2 = re.compile(r"^[0-9]{3}\.[0-9]+$")
-        self.re_27c794aa = re.compile(r"^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$")
-        self.re_36ee52ff = re.compile(r"^[0-9]{4}-[0-9]+")
-        self.re_38b81466 = re.compile(
+        self.re_057dc3df = mapcss.lazy_regex(r"^Kursbuchstrecke [0-9]*.*")
+        self.re_103aec5a = mapcss.lazy_regex(r"^DE-ESO:")
+        self.re_12ca7ec2 = mapcss.lazy_regex(r"^[0-9]{3}\.[0-9]+$")
+        self.re_27c794aa = mapcss.lazy_regex(r"^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$")
+        self.re_36ee52ff = mapcss.lazy_regex(r"^[0-9]{4}-[0-9]+")
+        self.re_38b81466 = mapcss.lazy_regex(
             r"^([1-9]0|1[0-6]0|off|\?)(;([1-9]0|1[0-6]0|off|\?))*$"
         )
-        self.re_480b052a = re.compile(r"^VzG [0-9]*.*")
-        self.re_48fcc4a9 = re.compile(r"^[0-9]{3}$")
-        self.re_4fd6fb40 = re.compile(r"^KBS [0-9]*.*")
-        self.re_555f3b4c = re.compile(r"^[0-9]{4}$")
-        self.re_707f42a1 = re.compile(r"^[1-9][0-9]?[05]$")
-        self.re_77700681 = re.compile(r"^(.*;)?DE-ESO:kennlicht(;.*)?$")
+        self.re_480b052a = mapcss.lazy_regex(r"^VzG [0-9]*.*")
+        self.re_48fcc4a9 = mapcss.lazy_regex(r"^[0-9]{3}$")
+        self.re_4fd6fb40 = mapcss.lazy_regex(r"^KBS [0-9]*.*")
+        self.re_555f3b4c = mapcss.lazy_regex(r"^[0-9]{4}$")
+        self.re_707f42a1 = mapcss.lazy_regex(r"^[1-9][0-9]?[05]$")
+        self.re_77700681 = mapcss.lazy_regex(r"^(.*;)?DE-ESO:kennlicht(;.*)?$")
 
     def node(self, data, tags):
         capture_tags = {}
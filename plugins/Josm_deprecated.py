@@ -10,6 +10,8 @@ class Josm_deprecated(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/deprecated.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -165,53 +167,56 @@ class Josm_deprecated(PluginMapCSS):
             ),
         )
 
-        self.re_01eb1711 = re.compile(r"^(yes|both|no)$")
-        self.re_047d5648 = re.compile(
+        self.re_01eb1711 = mapcss.lazy_regex(r"^(yes|both|no)$")
+        self.re_047d5648 = mapcss.lazy_regex(
             r"^(1|2|3|4|5|grade1|grade2|grade3|grade4|grade5)$"
         )
-        self.re_0c5b5730 = re.compile(r"color:")
-        self.re_0f294fdf = re.compile(r"^[1-9][0-9]*$")
-        self.re_0fbae48f = re.compile(r"^https:\/\/westnordost.de\/p\/")
-        self.re_1f92073a = re.compile(r"^(?i)fixme$")
-        self.re_24dfeb95 = re.compile(r"^(tower|pole|insulator|portal|terminal)$")
-        self.re_27210286 = re.compile(r"^.$")
-        self.re_2f881233 = re.compile(r"^(?i)(bbq)$")
-        self.re_2fd4cdcf = re.compile(r"^(crossover|siding|spur|yard)$")
-        self.re_300dfa36 = re.compile(r"^[^t][^i][^g].+_[0-9]$")
-        self.re_3185ac6d = re.compile(r"^note_[0-9]$")
-        self.re_340a2b31 = re.compile(r"(?i)(;bbq|bbq;)")
-        self.re_34c15d62 = re.compile(r"^..$")
-        self.re_51df498f = re.compile(
+        self.re_0c5b5730 = mapcss.lazy_regex(r"color:")
+        self.re_0f294fdf = mapcss.lazy_regex(r"^[1-9][0-9]*$")
+        self.re_0fbae48f = mapcss.lazy_regex(r"^https:\/\/westnordost.de\/p\/")
+        self.re_1f92073a = mapcss.lazy_regex(r"^(?i)fixme$")
+        self.re_24dfeb95 = mapcss.lazy_regex(
+            r"^(tower|pole|insulator|portal|terminal)$"
+        )
+        self.re_27210286 = mapcss.lazy_regex(r"^.$")
+        self.re_2f881233 = mapcss.lazy_regex(r"^(?i)(bbq)$")
+        self.re_2fd4cdcf = mapcss.lazy_regex(r"^(crossover|siding|spur|yard)$")
+        self.re_300dfa36 = mapcss.lazy_regex(r"^[^t][^i][^g].+_[0-9]$")
+        self.re_3185ac6d = mapcss.lazy_regex(r"^note_[0-9]$")
+        self.re_340a2b31 = mapcss.lazy_regex(r"(?i)(;bbq|bbq;)")
+        self.re_34c15d62 = mapcss.lazy_regex(r"^..$")
+        self.re_51df498f = mapcss.lazy_regex(
             r"^(alley|drive-through|drive_through|driveway|emergency_access|parking_aisle|rest_area|slipway|yes)$"
         )
-        self.re_554de4c7 = re.compile(r":color")
-        self.re_5ee0acf2 = re.compile(r"josm\/ignore")
-        self.re_6029fe03 = re.compile(r"^diaper:")
-        self.re_61b0be1b = re.compile(
+        self.re_554de4c7 = mapcss.lazy_regex(r":color")
+        self.re_5ee0acf2 = mapcss.lazy_regex(r"josm\/ignore")
+        self.re_6029fe03 = mapcss.lazy_regex(r"^diaper:")
+        self.re_61b0be1b = mapcss.lazy_regex(
             r"^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$"
         )
-        self.re_620f4d52 = re.compile(
+        self.re_620f4d52 = mapcss.lazy_regex(
             r"=|\+|\/|&|<|>|;|\'|\"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$"
         )
-        self.re_69ec353a = re.compile(r"^is_in:")
-        self.re_6d27b157 = re.compile(r"^description_[0-9]$")
-        self.re_787405b1 = re.compile(r"^(yes|no|limited)$")
-        self.re_7a045a17 = re.compile(r"^(irrigation|transportation|water_power)$")
-        self.re_7d409ed5 = re.compile(r"(?i)(_bbq)")
+        self.re_69ec353a = mapcss.lazy_regex(r"^is_in:")
+        self.re_6d27b157 = mapcss.lazy_regex(r"^description_[0-9]$")
+        self.re_787405b1 = mapcss.lazy_regex(r"^(yes|no|limited)$")
+        self.re_7a045a17 = mapcss.lazy_regex(
+            r"^(irrigation|transportation|water_power)$"
+        )
+        self.re_7d409ed5 = mapcss.lazy_regex(r"(?i)(_bbq)")
 
     def node(self, data, tags):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = (
-            set_diaper_checked
-        ) = set_generic_power_tower_type_warning = set_levels_building = (
-            set_parcel_fixable
-        ) = set_power_pole_type_warning = set_power_tower_type_warning = (
-            set_pumping_ring_no_mech
-        ) = set_samebuildingcolor = set_sameroofcolor = False
-
-        # *[barrier=wire_fence]
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._node_rules_dispatch, self._node_rules_fallback, keys
+        ):
+            self._node_rules[rule](self, data, tags, keys, sets, err)
+        return err
+
+    # *[barrier=wire_fence]
+    def _node_rule_0(self, data, tags, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -245,7 +250,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _node_rule_1(self, data, tags, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -277,29 +283,30 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[highway=ford]
-        # Rule Blacklisted (id: 1317841090)
+    # node[highway=ford]
+    # Rule Blacklisted (id: 1317841090)
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _node_rule_2(self, data, tags, keys, sets, err):
         if ("landuse" in keys) or ("landuse" in keys and "reservoir_type" in keys):
             match = False
             if not match:
@@ -348,7 +355,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _node_rule_3(self, data, tags, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -386,7 +394,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _node_rule_4(self, data, tags, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -416,7 +425,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _node_rule_5(self, data, tags, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -446,19 +456,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _node_rule_6(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -487,7 +498,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _node_rule_7(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -516,10 +528,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _node_rule_8(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -548,7 +561,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _node_rule_9(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -580,7 +594,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _node_rule_10(self, data, tags, keys, sets, err):
         if "bicycle_parking" in keys:
             match = False
             if not match:
@@ -609,19 +624,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _node_rule_11(self, data, tags, keys, sets, err):
         if "location" in keys:
             match = False
             if not match:
@@ -650,7 +666,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:location]
+    # *[generator:location]
+    def _node_rule_12(self, data, tags, keys, sets, err):
         if "generator:location" in keys:
             match = False
             if not match:
@@ -684,7 +701,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _node_rule_13(self, data, tags, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -713,7 +731,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _node_rule_14(self, data, tags, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -744,7 +763,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _node_rule_15(self, data, tags, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -775,7 +795,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _node_rule_16(self, data, tags, keys, sets, err):
         if "fence_type" in keys:
             match = False
             if not match:
@@ -802,10 +823,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _node_rule_17(self, data, tags, keys, sets, err):
         if "board_type" in keys:
             match = False
             if not match:
@@ -833,7 +855,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _node_rule_18(self, data, tags, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -862,7 +885,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _node_rule_19(self, data, tags, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -895,7 +919,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _node_rule_20(self, data, tags, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -928,7 +953,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _node_rule_21(self, data, tags, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -961,7 +987,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _node_rule_22(self, data, tags, keys, sets, err):
         if "monitoring:river_level" in keys:
             match = False
             if not match:
@@ -1000,7 +1027,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[stay]
+    # *[stay]
+    def _node_rule_23(self, data, tags, keys, sets, err):
         if "stay" in keys:
             match = False
             if not match:
@@ -1030,18 +1058,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _node_rule_24(self, data, tags, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -1066,7 +1095,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=official]
+    # *[access=official]
+    def _node_rule_25(self, data, tags, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -1091,8 +1121,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _node_rule_26(self, data, tags, keys, sets, err):
         if ("FIXME" in keys) or ("fixme" in keys):
             match = False
             if not match:
@@ -1125,7 +1156,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _node_rule_27(self, data, tags, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -1160,7 +1192,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _node_rule_28(self, data, tags, keys, sets, err):
         if "note" in keys:
             match = False
             if not match:
@@ -1187,8 +1220,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _node_rule_29(self, data, tags, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -1229,9 +1263,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _node_rule_30(self, data, tags, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -1280,7 +1315,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _node_rule_31(self, data, tags, keys, sets, err):
         if "wood" in keys:
             match = False
             if not match:
@@ -1310,8 +1346,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _node_rule_32(self, data, tags, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -1352,9 +1389,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _node_rule_33(self, data, tags, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -1403,7 +1441,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[type=palm]
+    # node[type=palm]
+    def _node_rule_34(self, data, tags, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -1431,10 +1470,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _node_rule_35(self, data, tags, keys, sets, err):
         if "bridge" in keys:
             match = False
             if not match:
@@ -1462,18 +1502,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _node_rule_36(self, data, tags, keys, sets, err):
         if ("fee" in keys) or ("lit" in keys) or ("supervised" in keys):
             match = False
             if not match:
@@ -1514,7 +1555,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _node_rule_37(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -1538,10 +1580,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _node_rule_38(self, data, tags, keys, sets, err):
         if "parking" in keys:
             match = False
             if not match:
@@ -1575,24 +1618,25 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _node_rule_39(self, data, tags, keys, sets, err):
         if (
             ("access" in keys)
             or ("aerialway" in keys)
@@ -1778,13 +1822,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _node_rule_40(self, data, tags, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -1816,7 +1861,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _node_rule_41(self, data, tags, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -1848,7 +1894,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _node_rule_42(self, data, tags, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -1878,8 +1925,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _node_rule_43(self, data, tags, keys, sets, err):
         if ("building" in keys and "levels" in keys) or (
             "building:part" in keys and "levels" in keys
         ):
@@ -1906,7 +1954,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add("levels_building")
                 err.append(
                     {
                         "class": 9002001,
@@ -1925,13 +1973,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _node_rule_44(self, data, tags, keys, sets, err):
         if "levels" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_levels_building) and (
+                    match = ("levels_building" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "levels")
                     )
                 except mapcss.RuleAbort:
@@ -1951,7 +2000,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _node_rule_45(self, data, tags, keys, sets, err):
         if "building:level" in keys:
             match = False
             if not match:
@@ -1994,7 +2044,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _node_rule_46(self, data, tags, keys, sets, err):
         if "building:level" in keys and "building:levels" in keys:
             match = False
             if not match:
@@ -2022,7 +2073,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[protected_class]
+    # *[protected_class]
+    def _node_rule_47(self, data, tags, keys, sets, err):
         if "protected_class" in keys:
             match = False
             if not match:
@@ -2056,19 +2108,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
 
-        # *[sport=skiing]
+    # *[sport=skiing]
+    def _node_rule_48(self, data, tags, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -2094,28 +2147,29 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _node_rule_49(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -2152,7 +2206,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/color:/]
+    # *[/color:/]
+    def _node_rule_50(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -2176,7 +2231,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    def _node_rule_51(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -2198,8 +2254,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^.$/]
-        # node[/^..$/][!kp][!pk]
+    # *[/^.$/]
+    # node[/^..$/][!kp][!pk]
+    def _node_rule_52(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -2232,12 +2289,13 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _node_rule_53(self, data, tags, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -2282,10 +2340,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _node_rule_54(self, data, tags, keys, sets, err):
         if (
             ("payment:ep_cash" in keys)
             or ("payment:ep_chipknip" in keys)
@@ -2344,7 +2403,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _node_rule_55(self, data, tags, keys, sets, err):
         if "kp" in keys:
             match = False
             if not match:
@@ -2379,7 +2439,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _node_rule_56(self, data, tags, keys, sets, err):
         if "pk" in keys:
             match = False
             if not match:
@@ -2414,7 +2475,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _node_rule_57(self, data, tags, keys, sets, err):
         if "kp" in keys and "railway" in keys:
             match = False
             if not match:
@@ -2447,7 +2509,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _node_rule_58(self, data, tags, keys, sets, err):
         if "pk" in keys and "railway" in keys:
             match = False
             if not match:
@@ -2480,7 +2543,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _node_rule_59(self, data, tags, keys, sets, err):
         if "distance" in keys and "railway" in keys:
             match = False
             if not match:
@@ -2518,7 +2582,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[postcode]
+    # *[postcode]
+    def _node_rule_60(self, data, tags, keys, sets, err):
         if "postcode" in keys:
             match = False
             if not match:
@@ -2543,7 +2608,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _node_rule_61(self, data, tags, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -2573,13 +2639,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[type][pipeline=marker]
-        # Rule Blacklisted (id: 1878458659)
+    # node[type][pipeline=marker]
+    # Rule Blacklisted (id: 1878458659)
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _node_rule_62(self, data, tags, keys, sets, err):
         if "seamark" in keys and "seamark:type" in keys:
             match = False
             if not match:
@@ -2614,7 +2681,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _node_rule_63(self, data, tags, keys, sets, err):
         if "seamark" in keys:
             match = False
             if not match:
@@ -2651,7 +2719,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _node_rule_64(self, data, tags, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -2684,16 +2753,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _node_rule_65(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -2721,7 +2791,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _node_rule_66(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -2752,10 +2823,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _node_rule_67(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -2788,16 +2860,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _node_rule_68(self, data, tags, keys, sets, err):
         if "amenity" in keys and "type" in keys:
             match = False
             if not match:
@@ -2870,10 +2943,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _node_rule_69(self, data, tags, keys, sets, err):
         if "location" in keys and "power" in keys:
             match = False
             if not match:
@@ -2912,7 +2986,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _node_rule_70(self, data, tags, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -2939,37 +3014,38 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _node_rule_71(self, data, tags, keys, sets, err):
         if ("leisure" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -3007,11 +3083,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _node_rule_72(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -3038,20 +3115,21 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _node_rule_73(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -3085,7 +3163,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _node_rule_74(self, data, tags, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -3112,7 +3191,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _node_rule_75(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -3145,10 +3225,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _node_rule_76(self, data, tags, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -3177,7 +3258,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _node_rule_77(self, data, tags, keys, sets, err):
         if "service" in keys:
             match = False
             if not match:
@@ -3206,7 +3288,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit][noexit!=yes][noexit!=no]
+    # *[noexit][noexit!=yes][noexit!=no]
+    def _node_rule_78(self, data, tags, keys, sets, err):
         if "noexit" in keys:
             match = False
             if not match:
@@ -3240,11 +3323,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # node[pole=air_to_ground]
-        # node[pole=transition]
+    # node[pole=air_to_ground]
+    # node[pole=transition]
+    def _node_rule_79(self, data, tags, keys, sets, err):
         if "pole" in keys:
             match = False
             if not match:
@@ -3285,8 +3369,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[tower=air_to_ground]
-        # node[tower=transition]
+    # node[tower=air_to_ground]
+    # node[tower=transition]
+    def _node_rule_80(self, data, tags, keys, sets, err):
         if "tower" in keys:
             match = False
             if not match:
@@ -3327,9 +3412,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _node_rule_81(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -3374,7 +3460,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _node_rule_82(self, data, tags, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -3403,8 +3490,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[vending=photos][amenity=vending_machine]
-        # node[vending=photo][amenity=vending_machine]
+    # node[vending=photos][amenity=vending_machine]
+    # node[vending=photo][amenity=vending_machine]
+    def _node_rule_83(self, data, tags, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -3453,7 +3541,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[vending=photos][amenity!=vending_machine]
+    # node[vending=photos][amenity!=vending_machine]
+    def _node_rule_84(self, data, tags, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -3485,7 +3574,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[highway=emergency_access_point][phone][!emergency_telephone_code]
+    # node[highway=emergency_access_point][phone][!emergency_telephone_code]
+    def _node_rule_85(self, data, tags, keys, sets, err):
         if "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -3540,7 +3630,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[highway=emergency_access_point][phone=*emergency_telephone_code]
+    # node[highway=emergency_access_point][phone=*emergency_telephone_code]
+    def _node_rule_86(self, data, tags, keys, sets, err):
         if "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -3583,7 +3674,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    # node[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    def _node_rule_87(self, data, tags, keys, sets, err):
         if "emergency_telephone_code" in keys and "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -3632,8 +3724,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _node_rule_88(self, data, tags, keys, sets, err):
         if "amenity" in keys and "lock" in keys:
             match = False
             if not match:
@@ -3682,17 +3775,18 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _node_rule_89(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -3752,16 +3846,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _node_rule_90(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -3858,11 +3953,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _node_rule_91(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -3922,7 +4018,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[power=transformer][location=pole][transformer]
+    # node[power=transformer][location=pole][transformer]
+    def _node_rule_92(self, data, tags, keys, sets, err):
         if "location" in keys and "power" in keys and "transformer" in keys:
             match = False
             if not match:
@@ -3962,7 +4059,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[power=transformer][location=pole][!transformer]
+    # node[power=transformer][location=pole][!transformer]
+    def _node_rule_93(self, data, tags, keys, sets, err):
         if "location" in keys and "power" in keys:
             match = False
             if not match:
@@ -4012,10 +4110,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[tourism=picnic_table]
-        # node[amenity=picnic_table]
-        # node[leisure=picnic]
-        # node[leisure=picnic_site]
+    # node[tourism=picnic_table]
+    # node[amenity=picnic_table]
+    # node[leisure=picnic]
+    # node[leisure=picnic_site]
+    def _node_rule_94(self, data, tags, keys, sets, err):
         if ("amenity" in keys) or ("leisure" in keys) or ("tourism" in keys):
             match = False
             if not match:
@@ -4066,7 +4165,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _node_rule_95(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -4094,11 +4194,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _node_rule_96(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -4130,12 +4231,13 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # node[communication=outdoor_dslam]
-        # node[man_made=outdoor_dslam]
-        # node[street_cabinet=outdoor_dslam]
+    # node[communication=outdoor_dslam]
+    # node[man_made=outdoor_dslam]
+    # node[street_cabinet=outdoor_dslam]
+    def _node_rule_97(self, data, tags, keys, sets, err):
         if (
             ("communication" in keys)
             or ("man_made" in keys)
@@ -4188,8 +4290,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[telecom=dslam]
-        # node[telecom=outdoor_dslam]
+    # node[telecom=dslam]
+    # node[telecom=outdoor_dslam]
+    def _node_rule_98(self, data, tags, keys, sets, err):
         if "telecom" in keys:
             match = False
             if not match:
@@ -4226,10 +4329,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[amenity=fire_hydrant]
-        # Rule Blacklisted (id: 967497433)
+    # node[amenity=fire_hydrant]
+    # Rule Blacklisted (id: 967497433)
 
-        # node[fire_hydrant:type=pond]
+    # node[fire_hydrant:type=pond]
+    def _node_rule_99(self, data, tags, keys, sets, err):
         if "fire_hydrant:type" in keys:
             match = False
             if not match:
@@ -4262,7 +4366,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[fire_hydrant:flow_capacity]
+    # node[fire_hydrant:flow_capacity]
+    def _node_rule_100(self, data, tags, keys, sets, err):
         if "fire_hydrant:flow_capacity" in keys:
             match = False
             if not match:
@@ -4288,7 +4393,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[emergency=fire_hydrant][in_service=no]
+    # node[emergency=fire_hydrant][in_service=no]
+    def _node_rule_101(self, data, tags, keys, sets, err):
         if "emergency" in keys and "in_service" in keys:
             match = False
             if not match:
@@ -4331,7 +4437,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[fire_hydrant:water_source]
+    # node[fire_hydrant:water_source]
+    def _node_rule_102(self, data, tags, keys, sets, err):
         if "fire_hydrant:water_source" in keys:
             match = False
             if not match:
@@ -4370,7 +4477,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _node_rule_103(self, data, tags, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -4402,7 +4510,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _node_rule_104(self, data, tags, keys, sets, err):
         if "religion" in keys:
             match = False
             if not match:
@@ -4431,7 +4540,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _node_rule_105(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -4460,8 +4570,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[is_in]
-        # node[/^is_in:/]
+    # *[is_in]
+    # node[/^is_in:/]
+    def _node_rule_106(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -4495,7 +4606,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=football]
+    # *[sport=football]
+    def _node_rule_107(self, data, tags, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -4527,7 +4639,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _node_rule_108(self, data, tags, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -4555,8 +4668,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _node_rule_109(self, data, tags, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -4591,7 +4705,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _node_rule_110(self, data, tags, keys, sets, err):
         if "kitchen_hours" in keys:
             match = False
             if not match:
@@ -4628,7 +4743,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _node_rule_111(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -4660,7 +4776,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _node_rule_112(self, data, tags, keys, sets, err):
         if "contact:google_plus" in keys:
             match = False
             if not match:
@@ -4688,8 +4805,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _node_rule_113(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -4725,8 +4843,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _node_rule_114(self, data, tags, keys, sets, err):
         if ("amenity" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -4761,7 +4880,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _node_rule_115(self, data, tags, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -4798,8 +4918,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _node_rule_116(self, data, tags, keys, sets, err):
         if ("building" in keys and "building:type" in keys) or (
             "building:type" in keys
         ):
@@ -4846,7 +4967,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _node_rule_117(self, data, tags, keys, sets, err):
         if "building" in keys and "building:type" in keys:
             match = False
             if not match:
@@ -4879,19 +5001,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _node_rule_118(self, data, tags, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -4918,22 +5041,23 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _node_rule_119(self, data, tags, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -4965,16 +5089,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _node_rule_120(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -5001,17 +5126,18 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _node_rule_121(self, data, tags, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -5032,7 +5158,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5057,7 +5183,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _node_rule_122(self, data, tags, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -5074,7 +5201,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5086,10 +5213,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _node_rule_123(self, data, tags, keys, sets, err):
         if "diaper:male" in keys:
             match = False
             if not match:
@@ -5107,7 +5235,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5124,7 +5252,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _node_rule_124(self, data, tags, keys, sets, err):
         if "diaper:female" in keys:
             match = False
             if not match:
@@ -5142,7 +5271,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5159,7 +5288,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _node_rule_125(self, data, tags, keys, sets, err):
         if "diaper:unisex" in keys:
             match = False
             if not match:
@@ -5177,7 +5307,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5194,8 +5324,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _node_rule_126(self, data, tags, keys, sets, err):
         if "diaper:wheelchair" in keys:
             match = False
             if not match:
@@ -5220,7 +5351,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5244,8 +5375,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _node_rule_127(self, data, tags, keys, sets, err):
         if "diaper:fee" in keys:
             match = False
             if not match:
@@ -5270,7 +5402,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -5289,13 +5421,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _node_rule_128(self, data, tags, keys, sets, err):
         if True:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_diaper___checked) and (
+                    match = ("diaper___checked" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)
                     )
                 except mapcss.RuleAbort:
@@ -5312,7 +5445,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _node_rule_129(self, data, tags, keys, sets, err):
         if "changing_table" in keys:
             match = False
             if not match:
@@ -5348,7 +5482,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _node_rule_130(self, data, tags, keys, sets, err):
         if "roof:shape" in keys:
             match = False
             if not match:
@@ -5377,7 +5512,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _node_rule_131(self, data, tags, keys, sets, err):
         if "bridge_name" in keys:
             match = False
             if not match:
@@ -5409,10 +5545,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _node_rule_132(self, data, tags, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -5445,7 +5582,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _node_rule_133(self, data, tags, keys, sets, err):
         if "recycling:metal" in keys:
             match = False
             if not match:
@@ -5484,7 +5622,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _node_rule_134(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -5513,8 +5652,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _node_rule_135(self, data, tags, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -5539,7 +5679,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5558,8 +5698,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _node_rule_136(self, data, tags, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -5594,7 +5735,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5611,8 +5752,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _node_rule_137(self, data, tags, keys, sets, err):
         if ("branch:type" in keys and "tower:type" in keys) or ("tower:type" in keys):
             match = False
             if not match:
@@ -5646,7 +5788,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5663,7 +5805,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _node_rule_138(self, data, tags, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -5686,7 +5829,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5703,7 +5846,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _node_rule_139(self, data, tags, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -5721,7 +5865,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5738,7 +5882,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _node_rule_140(self, data, tags, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -5756,7 +5901,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5773,7 +5918,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _node_rule_141(self, data, tags, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -5791,7 +5937,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5808,7 +5954,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _node_rule_142(self, data, tags, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -5824,7 +5971,7 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5836,14 +5983,15 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _node_rule_143(self, data, tags, keys, sets, err):
         if "power" in keys and "tower:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_tower_type_warning)
+                        ("power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "tower:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -5866,7 +6014,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add("generic_power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5879,8 +6027,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=anchor]
-        # node[pole:type=suspension]
+    # node[pole:type=anchor]
+    # node[pole:type=suspension]
+    def _node_rule_144(self, data, tags, keys, sets, err):
         if "pole:type" in keys:
             match = False
             if not match:
@@ -5905,7 +6054,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"pole:type => line_attachment"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5924,8 +6073,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=branch][branch:type=split]
-        # node[pole:type=branch][branch:type=loop]
+    # node[pole:type=branch][branch:type=split]
+    # node[pole:type=branch][branch:type=loop]
+    def _node_rule_145(self, data, tags, keys, sets, err):
         if "branch:type" in keys and "pole:type" in keys:
             match = False
             if not match:
@@ -5960,7 +6110,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -5977,8 +6127,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=branch][!branch:type]
-        # node[pole:type=branch][branch:type=tap]
+    # node[pole:type=branch][!branch:type]
+    # node[pole:type=branch][branch:type=tap]
+    def _node_rule_146(self, data, tags, keys, sets, err):
         if ("branch:type" in keys and "pole:type" in keys) or ("pole:type" in keys):
             match = False
             if not match:
@@ -6012,7 +6163,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -6029,7 +6180,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=branch][branch:type=cross]
+    # node[pole:type=branch][branch:type=cross]
+    def _node_rule_147(self, data, tags, keys, sets, err):
         if "branch:type" in keys and "pole:type" in keys:
             match = False
             if not match:
@@ -6052,7 +6204,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -6069,7 +6221,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=termination]
+    # node[pole:type=termination]
+    def _node_rule_148(self, data, tags, keys, sets, err):
         if "pole:type" in keys:
             match = False
             if not match:
@@ -6087,7 +6240,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -6104,7 +6257,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[pole:type=transition]
+    # node[pole:type=transition]
+    def _node_rule_149(self, data, tags, keys, sets, err):
         if "pole:type" in keys:
             match = False
             if not match:
@@ -6122,7 +6276,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add("power_pole_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -6139,15 +6293,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _node_rule_150(self, data, tags, keys, sets, err):
         if "pole:type" in keys and "power" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_pole_type_warning)
-                        and (not set_generic_power_tower_type_warning)
+                        ("power_pole_type_warning" not in sets)
+                        and ("generic_power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "pole:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -6179,10 +6334,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[man_made=pipeline_marker]
-        # node[pipeline=marker]
-        # node[power=marker]
-        # node[cable=marker]
+    # node[man_made=pipeline_marker]
+    # node[pipeline=marker]
+    # node[power=marker]
+    # node[cable=marker]
+    def _node_rule_151(self, data, tags, keys, sets, err):
         if (
             ("cable" in keys)
             or ("man_made" in keys)
@@ -6237,8 +6393,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _node_rule_152(self, data, tags, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -6281,7 +6438,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _node_rule_153(self, data, tags, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -6312,8 +6470,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _node_rule_154(self, data, tags, keys, sets, err):
         if ("kerb" in keys and "sloped_curb" in keys) or ("sloped_curb" in keys):
             match = False
             if not match:
@@ -6358,7 +6517,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _node_rule_155(self, data, tags, keys, sets, err):
         if "unnamed" in keys:
             match = False
             if not match:
@@ -6390,7 +6550,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[segregated][segregated!=yes][segregated!=no]
+    # node[segregated][segregated!=yes][segregated!=no]
+    def _node_rule_156(self, data, tags, keys, sets, err):
         if "segregated" in keys:
             match = False
             if not match:
@@ -6424,7 +6585,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:height]
+    # *[building:height]
+    def _node_rule_157(self, data, tags, keys, sets, err):
         if "building:height" in keys:
             match = False
             if not match:
@@ -6458,7 +6620,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _node_rule_158(self, data, tags, keys, sets, err):
         if "building:min_height" in keys:
             match = False
             if not match:
@@ -6497,11 +6660,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _node_rule_159(self, data, tags, keys, sets, err):
         if "navigationaid" in keys:
             match = False
             if not match:
@@ -6540,7 +6704,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[exit_to]
+    # node[exit_to]
+    def _node_rule_160(self, data, tags, keys, sets, err):
         if "exit_to" in keys:
             match = False
             if not match:
@@ -6564,7 +6729,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _node_rule_161(self, data, tags, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -6595,7 +6761,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _node_rule_162(self, data, tags, keys, sets, err):
         if "natural" in keys and "water" in keys:
             match = False
             if not match:
@@ -6622,10 +6789,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _node_rule_163(self, data, tags, keys, sets, err):
         if (
             ("natural" in keys and "water" in keys and "waterway" in keys)
             or ("natural" in keys and "waterway" in keys)
@@ -6720,8 +6888,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _node_rule_164(self, data, tags, keys, sets, err):
         if ("natural" in keys and "waterway" in keys) or (
             "water" in keys and "waterway" in keys
         ):
@@ -6777,7 +6946,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[amenity=bench][capacity][!seats]
+    # node[amenity=bench][capacity][!seats]
+    def _node_rule_165(self, data, tags, keys, sets, err):
         if "amenity" in keys and "capacity" in keys:
             match = False
             if not match:
@@ -6815,7 +6985,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[amenity=bench][capacity][seats]
+    # node[amenity=bench][capacity][seats]
+    def _node_rule_166(self, data, tags, keys, sets, err):
         if "amenity" in keys and "capacity" in keys and "seats" in keys:
             match = False
             if not match:
@@ -6847,7 +7018,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _node_rule_167(self, data, tags, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -6876,7 +7048,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=customer]
+    # *[access=customer]
+    def _node_rule_168(self, data, tags, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -6905,7 +7078,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _node_rule_169(self, data, tags, keys, sets, err):
         if "addr:inclusion" in keys:
             match = False
             if not match:
@@ -6934,7 +7108,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _node_rule_170(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -6963,7 +7138,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[lamp_mount="bent mast"]
+    # node[lamp_mount="bent mast"]
+    def _node_rule_171(self, data, tags, keys, sets, err):
         if "lamp_mount" in keys:
             match = False
             if not match:
@@ -6992,7 +7168,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[lamp_mount="straight mast"]
+    # node[lamp_mount="straight mast"]
+    def _node_rule_172(self, data, tags, keys, sets, err):
         if "lamp_mount" in keys:
             match = False
             if not match:
@@ -7021,7 +7198,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # node[lamp_type=electrical]
+    # node[lamp_type=electrical]
+    def _node_rule_173(self, data, tags, keys, sets, err):
         if "lamp_type" in keys:
             match = False
             if not match:
@@ -7050,7 +7228,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _node_rule_174(self, data, tags, keys, sets, err):
         if "generator:type" in keys:
             match = False
             if not match:
@@ -7083,7 +7262,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=part]
+    # *[building=part]
+    def _node_rule_175(self, data, tags, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -7109,7 +7289,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _node_rule_176(self, data, tags, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -7138,7 +7319,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _node_rule_177(self, data, tags, keys, sets, err):
         if "climbing:grade:UIAA:min" in keys:
             match = False
             if not match:
@@ -7177,7 +7359,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _node_rule_178(self, data, tags, keys, sets, err):
         if "climbing:grade:UIAA:max" in keys:
             match = False
             if not match:
@@ -7216,7 +7399,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _node_rule_179(self, data, tags, keys, sets, err):
         if "climbing:grade:UIAA:mean" in keys:
             match = False
             if not match:
@@ -7255,7 +7439,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _node_rule_180(self, data, tags, keys, sets, err):
         if "climbing:grade:UIAA" in keys:
             match = False
             if not match:
@@ -7294,7 +7479,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _node_rule_181(self, data, tags, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -7316,7 +7502,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"cuisine=barbecue"
                 # fixAdd:"cuisine=barbecue"
-                set_bbq_autofix = True
+                sets.add("bbq_autofix")
                 err.append(
                     {
                         "class": 9002001,
@@ -7330,7 +7516,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _node_rule_182(self, data, tags, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -7363,7 +7550,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[Fixme]
+    # *[Fixme]
+    def _node_rule_183(self, data, tags, keys, sets, err):
         if "Fixme" in keys:
             match = False
             if not match:
@@ -7393,10 +7581,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _node_rule_184(self, data, tags, keys, sets, err):
         if "service:bicycle:chaintool" in keys:
             match = False
             if not match:
@@ -7435,7 +7624,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _node_rule_185(self, data, tags, keys, sets, err):
         if "building:roof:shape" in keys:
             match = False
             if not match:
@@ -7474,7 +7664,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _node_rule_186(self, data, tags, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -7512,7 +7703,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add("pumping_ring_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -7534,13 +7725,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _node_rule_187(self, data, tags, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_pumping_ring_no_mech) and (
+                    match = ("pumping_ring_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "man_made")
                         == mapcss._value_capture(capture_tags, 0, "pumping_rig")
                     )
@@ -7562,7 +7754,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _node_rule_188(self, data, tags, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
@@ -7600,7 +7793,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add("beam_pump_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -7623,13 +7816,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _node_rule_189(self, data, tags, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_beam_pump_no_mech) and (
+                    match = ("beam_pump_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "pump:type")
                     )
                 except mapcss.RuleAbort:
@@ -7649,7 +7843,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _node_rule_190(self, data, tags, keys, sets, err):
         if "substance" in keys:
             match = False
             if not match:
@@ -7676,7 +7871,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _node_rule_191(self, data, tags, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -7705,8 +7901,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    def _node_rule_192(self, data, tags, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -7743,7 +7940,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"{1.value}=yes"
                 # assertMatch:"node amenity=vending_machine vending=parcel_mail_in"
                 # assertMatch:"node amenity=vending_machine vending=parcel_pickup"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -7769,7 +7966,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _node_rule_193(self, data, tags, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -7817,7 +8015,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"vending"
                 # assertMatch:"node amenity=vending_machine vending=parcel_mail_in;parcel_pickup"
                 # assertMatch:"node amenity=vending_machine vending=parcel_pickup;parcel_mail_in"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -7840,15 +8038,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _node_rule_194(self, data, tags, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -7868,7 +8067,7 @@ class Josm_deprecated(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -7898,7 +8097,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _node_rule_195(self, data, tags, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -7927,10 +8127,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _node_rule_196(self, data, tags, keys, sets, err):
         if "school" in keys:
             match = False
             if not match:
@@ -7957,8 +8158,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _node_rule_197(self, data, tags, keys, sets, err):
         if ("voltage-high" in keys) or ("voltage-low" in keys):
             match = False
             if not match:
@@ -7989,7 +8191,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _node_rule_198(self, data, tags, keys, sets, err):
         if "toilet" in keys:
             match = False
             if not match:
@@ -8021,7 +8224,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _node_rule_199(self, data, tags, keys, sets, err):
         if "toilet" in keys and "toilets" in keys:
             match = False
             if not match:
@@ -8047,7 +8251,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _node_rule_200(self, data, tags, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -8073,7 +8278,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _node_rule_201(self, data, tags, keys, sets, err):
         if "image" in keys:
             match = False
             if not match:
@@ -8108,24 +8314,353 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
-
-        return err
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
+
+    _node_rules = (
+        _node_rule_0,
+        _node_rule_1,
+        _node_rule_2,
+        _node_rule_3,
+        _node_rule_4,
+        _node_rule_5,
+        _node_rule_6,
+        _node_rule_7,
+        _node_rule_8,
+        _node_rule_9,
+        _node_rule_10,
+        _node_rule_11,
+        _node_rule_12,
+        _node_rule_13,
+        _node_rule_14,
+        _node_rule_15,
+        _node_rule_16,
+        _node_rule_17,
+        _node_rule_18,
+        _node_rule_19,
+        _node_rule_20,
+        _node_rule_21,
+        _node_rule_22,
+        _node_rule_23,
+        _node_rule_24,
+        _node_rule_25,
+        _node_rule_26,
+        _node_rule_27,
+        _node_rule_28,
+        _node_rule_29,
+        _node_rule_30,
+        _node_rule_31,
+        _node_rule_32,
+        _node_rule_33,
+        _node_rule_34,
+        _node_rule_35,
+        _node_rule_36,
+        _node_rule_37,
+        _node_rule_38,
+        _node_rule_39,
+        _node_rule_40,
+        _node_rule_41,
+        _node_rule_42,
+        _node_rule_43,
+        _node_rule_44,
+        _node_rule_45,
+        _node_rule_46,
+        _node_rule_47,
+        _node_rule_48,
+        _node_rule_49,
+        _node_rule_50,
+        _node_rule_51,
+        _node_rule_52,
+        _node_rule_53,
+        _node_rule_54,
+        _node_rule_55,
+        _node_rule_56,
+        _node_rule_57,
+        _node_rule_58,
+        _node_rule_59,
+        _node_rule_60,
+        _node_rule_61,
+        _node_rule_62,
+        _node_rule_63,
+        _node_rule_64,
+        _node_rule_65,
+        _node_rule_66,
+        _node_rule_67,
+        _node_rule_68,
+        _node_rule_69,
+        _node_rule_70,
+        _node_rule_71,
+        _node_rule_72,
+        _node_rule_73,
+        _node_rule_74,
+        _node_rule_75,
+        _node_rule_76,
+        _node_rule_77,
+        _node_rule_78,
+        _node_rule_79,
+        _node_rule_80,
+        _node_rule_81,
+        _node_rule_82,
+        _node_rule_83,
+        _node_rule_84,
+        _node_rule_85,
+        _node_rule_86,
+        _node_rule_87,
+        _node_rule_88,
+        _node_rule_89,
+        _node_rule_90,
+        _node_rule_91,
+        _node_rule_92,
+        _node_rule_93,
+        _node_rule_94,
+        _node_rule_95,
+        _node_rule_96,
+        _node_rule_97,
+        _node_rule_98,
+        _node_rule_99,
+        _node_rule_100,
+        _node_rule_101,
+        _node_rule_102,
+        _node_rule_103,
+        _node_rule_104,
+        _node_rule_105,
+        _node_rule_106,
+        _node_rule_107,
+        _node_rule_108,
+        _node_rule_109,
+        _node_rule_110,
+        _node_rule_111,
+        _node_rule_112,
+        _node_rule_113,
+        _node_rule_114,
+        _node_rule_115,
+        _node_rule_116,
+        _node_rule_117,
+        _node_rule_118,
+        _node_rule_119,
+        _node_rule_120,
+        _node_rule_121,
+        _node_rule_122,
+        _node_rule_123,
+        _node_rule_124,
+        _node_rule_125,
+        _node_rule_126,
+        _node_rule_127,
+        _node_rule_128,
+        _node_rule_129,
+        _node_rule_130,
+        _node_rule_131,
+        _node_rule_132,
+        _node_rule_133,
+        _node_rule_134,
+        _node_rule_135,
+        _node_rule_136,
+        _node_rule_137,
+        _node_rule_138,
+        _node_rule_139,
+        _node_rule_140,
+        _node_rule_141,
+        _node_rule_142,
+        _node_rule_143,
+        _node_rule_144,
+        _node_rule_145,
+        _node_rule_146,
+        _node_rule_147,
+        _node_rule_148,
+        _node_rule_149,
+        _node_rule_150,
+        _node_rule_151,
+        _node_rule_152,
+        _node_rule_153,
+        _node_rule_154,
+        _node_rule_155,
+        _node_rule_156,
+        _node_rule_157,
+        _node_rule_158,
+        _node_rule_159,
+        _node_rule_160,
+        _node_rule_161,
+        _node_rule_162,
+        _node_rule_163,
+        _node_rule_164,
+        _node_rule_165,
+        _node_rule_166,
+        _node_rule_167,
+        _node_rule_168,
+        _node_rule_169,
+        _node_rule_170,
+        _node_rule_171,
+        _node_rule_172,
+        _node_rule_173,
+        _node_rule_174,
+        _node_rule_175,
+        _node_rule_176,
+        _node_rule_177,
+        _node_rule_178,
+        _node_rule_179,
+        _node_rule_180,
+        _node_rule_181,
+        _node_rule_182,
+        _node_rule_183,
+        _node_rule_184,
+        _node_rule_185,
+        _node_rule_186,
+        _node_rule_187,
+        _node_rule_188,
+        _node_rule_189,
+        _node_rule_190,
+        _node_rule_191,
+        _node_rule_192,
+        _node_rule_193,
+        _node_rule_194,
+        _node_rule_195,
+        _node_rule_196,
+        _node_rule_197,
+        _node_rule_198,
+        _node_rule_199,
+        _node_rule_200,
+        _node_rule_201,
+    )
+    _node_rules_dispatch = {
+        "FIXME": (26,),
+        "Fixme": (183,),
+        "access": (24, 25, 39, 168),
+        "addr:inclusion": (169,),
+        "aerialway": (39,),
+        "amenity": (39, 67, 75, 94, 95, 113, 114, 115),
+        "barrier": (0, 1, 39),
+        "bicycle_parking": (10,),
+        "board_type": (17,),
+        "branch:type": (136, 137, 138, 145, 146, 147),
+        "bridge": (35,),
+        "bridge_name": (131,),
+        "building": (89, 90, 91, 96, 170, 175),
+        "building:height": (157,),
+        "building:level": (45,),
+        "building:levels": (46,),
+        "building:min_height": (158,),
+        "building:part": (43,),
+        "building:roof:shape": (185,),
+        "building:type": (116, 117),
+        "cable": (151,),
+        "capacity": (165,),
+        "changing_table": (129,),
+        "climbing:grade:UIAA": (180,),
+        "climbing:grade:UIAA:max": (178,),
+        "climbing:grade:UIAA:mean": (179,),
+        "climbing:grade:UIAA:min": (177,),
+        "communication": (97,),
+        "contact:google_plus": (112,),
+        "craft": (39,),
+        "crossing": (132,),
+        "cuisine": (109, 181, 182),
+        "diaper": (121, 122),
+        "diaper:fee": (127,),
+        "diaper:female": (124,),
+        "diaper:male": (123,),
+        "diaper:unisex": (125,),
+        "diaper:wheelchair": (126,),
+        "distance": (59,),
+        "emergency": (101,),
+        "emergency_telephone_code": (87,),
+        "exit_to": (160,),
+        "fee": (36,),
+        "fence_type": (16,),
+        "fire_hydrant:flow_capacity": (100,),
+        "fire_hydrant:type": (99,),
+        "fire_hydrant:water_source": (102,),
+        "fixme": (26,),
+        "generator:location": (12,),
+        "generator:method": (13, 14, 15),
+        "generator:type": (174,),
+        "highway": (85, 86),
+        "image": (201,),
+        "kerb": (154,),
+        "kitchen_hours": (110,),
+        "kp": (55, 57),
+        "lamp_mount": (171, 172),
+        "lamp_type": (173,),
+        "landuse": (2, 39, 64, 191),
+        "leisure": (39, 71, 94, 108, 118),
+        "levels": (43, 44),
+        "lit": (36,),
+        "location": (11, 69, 93),
+        "lock": (88,),
+        "man_made": (18, 70, 97, 151, 186, 187),
+        "manhole": (39,),
+        "measurement": (19, 20, 21),
+        "monitoring:river_level": (22,),
+        "name": (27,),
+        "natural": (103, 119, 176),
+        "navigationaid": (159,),
+        "noexit": (78,),
+        "note": (28,),
+        "parking": (38, 39),
+        "payment:ep_cash": (54,),
+        "payment:ep_chipknip": (54,),
+        "payment:ep_proton": (54,),
+        "payment:ep_quick": (54,),
+        "pipeline": (151,),
+        "pk": (56, 58),
+        "place": (39,),
+        "playground": (39,),
+        "pole": (79,),
+        "pole:type": (144, 146, 148, 149),
+        "police": (39,),
+        "postcode": (60,),
+        "power": (143, 150, 151),
+        "protected_class": (47,),
+        "pump:type": (188, 189),
+        "recycling:metal": (133,),
+        "religion": (104,),
+        "reservoir_type": (2, 3, 4, 5),
+        "roof:shape": (130,),
+        "school": (196,),
+        "seamark": (63,),
+        "seamark:type": (62,),
+        "seats": (166,),
+        "segregated": (156,),
+        "service": (39, 77),
+        "service:bicycle:chaintool": (184,),
+        "shop": (6, 7, 8, 9, 39, 65, 66, 71, 72, 81, 105, 111, 114, 120, 134, 167),
+        "sloped_curb": (152, 153, 154),
+        "sport": (48, 53, 74, 107),
+        "stay": (23,),
+        "street_cabinet": (97,),
+        "substance": (190,),
+        "supervised": (36,),
+        "surface": (195,),
+        "telecom": (98,),
+        "toilet": (198,),
+        "toilets": (199,),
+        "tourism": (94,),
+        "tower": (80,),
+        "tower:type": (135, 137, 139, 140, 141, 142),
+        "traffic_calming": (39,),
+        "transformer": (92,),
+        "type": (29, 30, 32, 33, 34, 68, 200),
+        "unnamed": (155,),
+        "vending": (76, 82, 83, 84, 192, 193, 194),
+        "voltage-high": (197,),
+        "voltage-low": (197,),
+        "water": (61, 161, 162, 163, 164),
+        "waterway": (40, 41, 42, 163, 164),
+        "wood": (30, 31, 32, 33),
+    }
+    _node_rules_fallback = (37, 49, 50, 51, 52, 73, 106, 128)
 
     def way(self, data, tags, nds):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = (
-            set_diaper_checked
-        ) = set_generic_power_tower_type_warning = set_levels_building = (
-            set_parcel_fixable
-        ) = set_power_pole_type_warning = set_power_tower_type_warning = (
-            set_pumping_ring_no_mech
-        ) = set_samebuildingcolor = set_sameroofcolor = False
-
-        # *[barrier=wire_fence]
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._way_rules_dispatch, self._way_rules_fallback, keys
+        ):
+            self._way_rules[rule](self, data, tags, nds, keys, sets, err)
+        return err
+
+    # *[barrier=wire_fence]
+    def _way_rule_0(self, data, tags, nds, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -8161,7 +8696,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _way_rule_1(self, data, tags, nds, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -8193,32 +8729,33 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[highway=ford]
-        # Rule Blacklisted (id: 591931361)
+    # way[highway=ford]
+    # Rule Blacklisted (id: 591931361)
 
-        # way[class]
-        # Rule Blacklisted (id: 905310794)
+    # way[class]
+    # Rule Blacklisted (id: 905310794)
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _way_rule_2(self, data, tags, nds, keys, sets, err):
         if ("landuse" in keys) or ("landuse" in keys and "reservoir_type" in keys):
             match = False
             if not match:
@@ -8267,7 +8804,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _way_rule_3(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -8305,7 +8843,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _way_rule_4(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -8335,7 +8874,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _way_rule_5(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -8365,19 +8905,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _way_rule_6(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -8406,7 +8947,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _way_rule_7(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -8435,10 +8977,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _way_rule_8(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -8467,7 +9010,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _way_rule_9(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -8499,7 +9043,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _way_rule_10(self, data, tags, nds, keys, sets, err):
         if "bicycle_parking" in keys:
             match = False
             if not match:
@@ -8528,19 +9073,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _way_rule_11(self, data, tags, nds, keys, sets, err):
         if "location" in keys:
             match = False
             if not match:
@@ -8569,7 +9115,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:location]
+    # *[generator:location]
+    def _way_rule_12(self, data, tags, nds, keys, sets, err):
         if "generator:location" in keys:
             match = False
             if not match:
@@ -8603,7 +9150,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _way_rule_13(self, data, tags, nds, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -8632,7 +9180,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _way_rule_14(self, data, tags, nds, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -8663,7 +9212,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _way_rule_15(self, data, tags, nds, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -8694,7 +9244,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _way_rule_16(self, data, tags, nds, keys, sets, err):
         if "fence_type" in keys:
             match = False
             if not match:
@@ -8721,10 +9272,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _way_rule_17(self, data, tags, nds, keys, sets, err):
         if "board_type" in keys:
             match = False
             if not match:
@@ -8752,7 +9304,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _way_rule_18(self, data, tags, nds, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -8781,7 +9334,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _way_rule_19(self, data, tags, nds, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -8814,7 +9368,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _way_rule_20(self, data, tags, nds, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -8847,7 +9402,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _way_rule_21(self, data, tags, nds, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -8880,7 +9436,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _way_rule_22(self, data, tags, nds, keys, sets, err):
         if "monitoring:river_level" in keys:
             match = False
             if not match:
@@ -8919,7 +9476,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[stay]
+    # *[stay]
+    def _way_rule_23(self, data, tags, nds, keys, sets, err):
         if "stay" in keys:
             match = False
             if not match:
@@ -8949,18 +9507,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _way_rule_24(self, data, tags, nds, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -8986,7 +9545,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=official]
+    # *[access=official]
+    def _way_rule_25(self, data, tags, nds, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -9012,8 +9572,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _way_rule_26(self, data, tags, nds, keys, sets, err):
         if ("FIXME" in keys) or ("fixme" in keys):
             match = False
             if not match:
@@ -9047,7 +9608,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _way_rule_27(self, data, tags, nds, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -9078,7 +9640,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _way_rule_28(self, data, tags, nds, keys, sets, err):
         if "note" in keys:
             match = False
             if not match:
@@ -9105,8 +9668,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _way_rule_29(self, data, tags, nds, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -9147,9 +9711,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _way_rule_30(self, data, tags, nds, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -9198,7 +9763,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _way_rule_31(self, data, tags, nds, keys, sets, err):
         if "wood" in keys:
             match = False
             if not match:
@@ -9228,8 +9794,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _way_rule_32(self, data, tags, nds, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -9270,9 +9837,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _way_rule_33(self, data, tags, nds, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -9321,7 +9889,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[type=palm]
+    # way[type=palm]
+    def _way_rule_34(self, data, tags, nds, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -9349,10 +9918,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _way_rule_35(self, data, tags, nds, keys, sets, err):
         if "bridge" in keys:
             match = False
             if not match:
@@ -9380,18 +9950,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _way_rule_36(self, data, tags, nds, keys, sets, err):
         if ("fee" in keys) or ("lit" in keys) or ("supervised" in keys):
             match = False
             if not match:
@@ -9432,7 +10003,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _way_rule_37(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -9456,10 +10028,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _way_rule_38(self, data, tags, nds, keys, sets, err):
         if "parking" in keys:
             match = False
             if not match:
@@ -9493,24 +10066,25 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _way_rule_39(self, data, tags, nds, keys, sets, err):
         if (
             ("access" in keys)
             or ("aerialway" in keys)
@@ -9696,13 +10270,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # way[sidewalk=yes]
+    # way[sidewalk=yes]
+    def _way_rule_40(self, data, tags, nds, keys, sets, err):
         if "sidewalk" in keys:
             match = False
             if not match:
@@ -9730,7 +10305,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _way_rule_41(self, data, tags, nds, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -9762,7 +10338,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _way_rule_42(self, data, tags, nds, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -9794,7 +10371,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _way_rule_43(self, data, tags, nds, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -9824,8 +10402,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _way_rule_44(self, data, tags, nds, keys, sets, err):
         if ("building" in keys and "levels" in keys) or (
             "building:part" in keys and "levels" in keys
         ):
@@ -9852,7 +10431,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add("levels_building")
                 err.append(
                     {
                         "class": 9002001,
@@ -9871,13 +10450,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _way_rule_45(self, data, tags, nds, keys, sets, err):
         if "levels" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_levels_building) and (
+                    match = ("levels_building" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "levels")
                     )
                 except mapcss.RuleAbort:
@@ -9897,7 +10477,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _way_rule_46(self, data, tags, nds, keys, sets, err):
         if "building:level" in keys:
             match = False
             if not match:
@@ -9940,7 +10521,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _way_rule_47(self, data, tags, nds, keys, sets, err):
         if "building:level" in keys and "building:levels" in keys:
             match = False
             if not match:
@@ -9968,7 +10550,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[protected_class]
+    # *[protected_class]
+    def _way_rule_48(self, data, tags, nds, keys, sets, err):
         if "protected_class" in keys:
             match = False
             if not match:
@@ -10002,19 +10585,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
 
-        # *[sport=skiing]
+    # *[sport=skiing]
+    def _way_rule_49(self, data, tags, nds, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -10040,10 +10624,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # way[oneway=1]
+    # way[oneway=1]
+    def _way_rule_50(self, data, tags, nds, keys, sets, err):
         if "oneway" in keys:
             match = False
             if not match:
@@ -10072,7 +10657,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[oneway=-1]
+    # way[oneway=-1]
+    def _way_rule_51(self, data, tags, nds, keys, sets, err):
         if "oneway" in keys:
             match = False
             if not match:
@@ -10096,13 +10682,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # area[building:color][!building:colour]
+    # area[building:color][!building:colour]
+    def _way_rule_52(self, data, tags, nds, keys, sets, err):
         if "building:color" in keys:
             match = False
             if not match:
@@ -10152,7 +10739,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[roof:color][!roof:colour]
+    # area[roof:color][!roof:colour]
+    def _way_rule_53(self, data, tags, nds, keys, sets, err):
         if "roof:color" in keys:
             match = False
             if not match:
@@ -10197,10 +10785,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # area[building:color][building:colour]["building:color"=*"building:colour"]
+    # area[building:color][building:colour]["building:color"=*"building:colour"]
+    def _way_rule_54(self, data, tags, nds, keys, sets, err):
         if "building:color" in keys and "building:colour" in keys:
             match = False
             if not match:
@@ -10234,7 +10823,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"building:color"
                 # assertNoMatch:"way building:color=red building:colour=green"
                 # assertMatch:"way building:color=red building:colour=red"
-                set_samebuildingcolor = True
+                sets.add("samebuildingcolor")
                 err.append(
                     {
                         "class": 9002001,
@@ -10249,7 +10838,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    def _way_rule_55(self, data, tags, nds, keys, sets, err):
         if "roof:color" in keys and "roof:colour" in keys:
             match = False
             if not match:
@@ -10279,7 +10869,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"roof:color"
                 # assertNoMatch:"way roof:color=red roof:colour=green"
                 # assertMatch:"way roof:color=red roof:colour=red"
-                set_sameroofcolor = True
+                sets.add("sameroofcolor")
                 err.append(
                     {
                         "class": 9002001,
@@ -10294,16 +10884,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _way_rule_56(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -10343,7 +10934,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/color:/]
+    # *[/color:/]
+    def _way_rule_57(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -10369,7 +10961,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    def _way_rule_58(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -10391,9 +10984,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^.$/]
-        # way[/^..$/][route=ferry][!to]
-        # way[/^..$/][route!=ferry]
+    # *[/^.$/]
+    # way[/^..$/][route=ferry][!to]
+    # way[/^..$/][route!=ferry]
+    def _way_rule_59(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -10440,12 +11034,13 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _way_rule_60(self, data, tags, nds, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -10490,10 +11085,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _way_rule_61(self, data, tags, nds, keys, sets, err):
         if (
             ("payment:ep_cash" in keys)
             or ("payment:ep_chipknip" in keys)
@@ -10552,7 +11148,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _way_rule_62(self, data, tags, nds, keys, sets, err):
         if "kp" in keys:
             match = False
             if not match:
@@ -10587,7 +11184,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _way_rule_63(self, data, tags, nds, keys, sets, err):
         if "pk" in keys:
             match = False
             if not match:
@@ -10622,7 +11220,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _way_rule_64(self, data, tags, nds, keys, sets, err):
         if "kp" in keys and "railway" in keys:
             match = False
             if not match:
@@ -10655,7 +11254,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _way_rule_65(self, data, tags, nds, keys, sets, err):
         if "pk" in keys and "railway" in keys:
             match = False
             if not match:
@@ -10688,7 +11288,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _way_rule_66(self, data, tags, nds, keys, sets, err):
         if "distance" in keys and "railway" in keys:
             match = False
             if not match:
@@ -10726,7 +11327,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[postcode]
+    # *[postcode]
+    def _way_rule_67(self, data, tags, nds, keys, sets, err):
         if "postcode" in keys:
             match = False
             if not match:
@@ -10751,7 +11353,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _way_rule_68(self, data, tags, nds, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -10781,7 +11384,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[type][type!=waterway][man_made=pipeline]
+    # way[type][type!=waterway][man_made=pipeline]
+    def _way_rule_69(self, data, tags, nds, keys, sets, err):
         if "man_made" in keys and "type" in keys:
             match = False
             if not match:
@@ -10823,10 +11427,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _way_rule_70(self, data, tags, nds, keys, sets, err):
         if "seamark" in keys and "seamark:type" in keys:
             match = False
             if not match:
@@ -10861,7 +11466,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _way_rule_71(self, data, tags, nds, keys, sets, err):
         if "seamark" in keys:
             match = False
             if not match:
@@ -10898,7 +11504,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _way_rule_72(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -10931,16 +11538,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _way_rule_73(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -10968,7 +11576,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _way_rule_74(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -10999,10 +11608,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _way_rule_75(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -11035,16 +11645,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _way_rule_76(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "type" in keys:
             match = False
             if not match:
@@ -11117,10 +11728,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _way_rule_77(self, data, tags, nds, keys, sets, err):
         if "location" in keys and "power" in keys:
             match = False
             if not match:
@@ -11159,7 +11771,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _way_rule_78(self, data, tags, nds, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -11186,37 +11799,38 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _way_rule_79(self, data, tags, nds, keys, sets, err):
         if ("leisure" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -11254,11 +11868,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _way_rule_80(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -11285,20 +11900,21 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _way_rule_81(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -11336,7 +11952,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _way_rule_82(self, data, tags, nds, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -11363,8 +11980,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[barrier=wall][type=noise_barrier][!wall]
-        # way[barrier=wall][type=noise_barrier][wall=noise_barrier]
+    # way[barrier=wall][type=noise_barrier][!wall]
+    # way[barrier=wall][type=noise_barrier][wall=noise_barrier]
+    def _way_rule_83(self, data, tags, nds, keys, sets, err):
         if ("barrier" in keys and "type" in keys) or (
             "barrier" in keys and "type" in keys and "wall" in keys
         ):
@@ -11425,7 +12043,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[barrier=wall][type=noise_barrier][wall][wall!=noise_barrier]
+    # way[barrier=wall][type=noise_barrier][wall][wall!=noise_barrier]
+    def _way_rule_84(self, data, tags, nds, keys, sets, err):
         if "barrier" in keys and "type" in keys and "wall" in keys:
             match = False
             if not match:
@@ -11465,7 +12084,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _way_rule_85(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -11498,10 +12118,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _way_rule_86(self, data, tags, nds, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -11530,7 +12151,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _way_rule_87(self, data, tags, nds, keys, sets, err):
         if "service" in keys:
             match = False
             if not match:
@@ -11559,10 +12181,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit][noexit!=yes][noexit!=no]
-        # way[highway=service][service][service!~/^(alley|drive-through|drive_through|driveway|emergency_access|parking_aisle|rest_area|slipway|yes)$/]
-        # way[railway=rail][service][service!~/^(crossover|siding|spur|yard)$/]
-        # way[waterway=canal][service][service!~/^(irrigation|transportation|water_power)$/]
+    # *[noexit][noexit!=yes][noexit!=no]
+    # way[highway=service][service][service!~/^(alley|drive-through|drive_through|driveway|emergency_access|parking_aisle|rest_area|slipway|yes)$/]
+    # way[railway=rail][service][service!~/^(crossover|siding|spur|yard)$/]
+    # way[waterway=canal][service][service!~/^(irrigation|transportation|water_power)$/]
+    def _way_rule_88(self, data, tags, nds, keys, sets, err):
         if (
             ("highway" in keys and "service" in keys)
             or ("noexit" in keys)
@@ -11670,10 +12293,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # area[landuse=pond]
+    # area[landuse=pond]
+    def _way_rule_89(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -11711,9 +12335,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _way_rule_90(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -11758,7 +12383,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _way_rule_91(self, data, tags, nds, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -11787,7 +12413,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[highway=emergency_access_point][phone][!emergency_telephone_code]
+    # way[highway=emergency_access_point][phone][!emergency_telephone_code]
+    def _way_rule_92(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -11838,7 +12465,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[highway=emergency_access_point][phone=*emergency_telephone_code]
+    # way[highway=emergency_access_point][phone=*emergency_telephone_code]
+    def _way_rule_93(self, data, tags, nds, keys, sets, err):
         if "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -11878,7 +12506,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    # way[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    def _way_rule_94(self, data, tags, nds, keys, sets, err):
         if "emergency_telephone_code" in keys and "highway" in keys and "phone" in keys:
             match = False
             if not match:
@@ -11924,7 +12553,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype=1]
+    # way[tracktype=1]
+    def _way_rule_95(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -11952,7 +12582,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype=2]
+    # way[tracktype=2]
+    def _way_rule_96(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -11980,7 +12611,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype=3]
+    # way[tracktype=3]
+    def _way_rule_97(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -12008,7 +12640,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype=4]
+    # way[tracktype=4]
+    def _way_rule_98(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -12036,7 +12669,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype=5]
+    # way[tracktype=5]
+    def _way_rule_99(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -12064,7 +12698,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[tracktype][tracktype!~/^(1|2|3|4|5|grade1|grade2|grade3|grade4|grade5)$/]
+    # way[tracktype][tracktype!~/^(1|2|3|4|5|grade1|grade2|grade3|grade4|grade5)$/]
+    def _way_rule_100(self, data, tags, nds, keys, sets, err):
         if "tracktype" in keys:
             match = False
             if not match:
@@ -12103,7 +12738,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[area][area!=yes][area!=no]
+    # area[area][area!=yes][area!=no]
+    def _way_rule_101(self, data, tags, nds, keys, sets, err):
         if "area" in keys:
             match = False
             if not match:
@@ -12143,8 +12779,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _way_rule_102(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "lock" in keys:
             match = False
             if not match:
@@ -12193,16 +12830,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # way[direction=up][incline=up]
-        # way[direction=down][incline=down]
-        # way[direction=up][!incline]
-        # way[direction=down][!incline]
+    # way[direction=up][incline=up]
+    # way[direction=down][incline=down]
+    # way[direction=up][!incline]
+    # way[direction=down][!incline]
+    def _way_rule_103(self, data, tags, nds, keys, sets, err):
         if ("direction" in keys) or ("direction" in keys and "incline" in keys):
             match = False
             if not match:
@@ -12268,8 +12906,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[direction=up][incline][incline!=up]
-        # way[direction=down][incline][incline!=down]
+    # way[direction=up][incline][incline!=up]
+    # way[direction=down][incline][incline!=down]
+    def _way_rule_104(self, data, tags, nds, keys, sets, err):
         if "direction" in keys and "incline" in keys:
             match = False
             if not match:
@@ -12321,11 +12960,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _way_rule_105(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -12385,16 +13025,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _way_rule_106(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -12491,11 +13132,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _way_rule_107(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -12555,10 +13197,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[water=salt]
-        # way[water=salt_pool]
-        # way[water=salt_panne]
-        # way[water=salt_pond]
+    # way[water=salt]
+    # way[water=salt_pool]
+    # way[water=salt_panne]
+    # way[water=salt_pond]
+    def _way_rule_108(self, data, tags, nds, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -12609,7 +13252,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[water=tidal]
+    # way[water=tidal]
+    def _way_rule_109(self, data, tags, nds, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -12639,7 +13283,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _way_rule_110(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -12667,7 +13312,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[power=busbar]
+    # way[power=busbar]
+    def _way_rule_111(self, data, tags, nds, keys, sets, err):
         if "power" in keys:
             match = False
             if not match:
@@ -12697,11 +13343,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _way_rule_112(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -12733,10 +13380,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _way_rule_113(self, data, tags, nds, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -12768,7 +13416,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _way_rule_114(self, data, tags, nds, keys, sets, err):
         if "religion" in keys:
             match = False
             if not match:
@@ -12797,7 +13446,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _way_rule_115(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -12826,8 +13476,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[is_in]
-        # way[/^is_in:/]
+    # *[is_in]
+    # way[/^is_in:/]
+    def _way_rule_116(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -12861,7 +13512,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=football]
+    # *[sport=football]
+    def _way_rule_117(self, data, tags, nds, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -12893,7 +13545,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _way_rule_118(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -12921,8 +13574,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _way_rule_119(self, data, tags, nds, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -12957,7 +13611,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _way_rule_120(self, data, tags, nds, keys, sets, err):
         if "kitchen_hours" in keys:
             match = False
             if not match:
@@ -12994,7 +13649,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _way_rule_121(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -13026,7 +13682,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _way_rule_122(self, data, tags, nds, keys, sets, err):
         if "contact:google_plus" in keys:
             match = False
             if not match:
@@ -13054,8 +13711,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _way_rule_123(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -13091,8 +13749,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _way_rule_124(self, data, tags, nds, keys, sets, err):
         if ("amenity" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -13127,7 +13786,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _way_rule_125(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -13164,8 +13824,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _way_rule_126(self, data, tags, nds, keys, sets, err):
         if ("building" in keys and "building:type" in keys) or (
             "building:type" in keys
         ):
@@ -13215,7 +13876,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _way_rule_127(self, data, tags, nds, keys, sets, err):
         if "building" in keys and "building:type" in keys:
             match = False
             if not match:
@@ -13251,19 +13913,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _way_rule_128(self, data, tags, nds, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -13290,22 +13953,23 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _way_rule_129(self, data, tags, nds, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -13337,16 +14001,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _way_rule_130(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -13373,17 +14038,18 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _way_rule_131(self, data, tags, nds, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -13404,7 +14070,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13429,7 +14095,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _way_rule_132(self, data, tags, nds, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -13446,7 +14113,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13458,10 +14125,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _way_rule_133(self, data, tags, nds, keys, sets, err):
         if "diaper:male" in keys:
             match = False
             if not match:
@@ -13479,7 +14147,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13496,7 +14164,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _way_rule_134(self, data, tags, nds, keys, sets, err):
         if "diaper:female" in keys:
             match = False
             if not match:
@@ -13514,7 +14183,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13531,7 +14200,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _way_rule_135(self, data, tags, nds, keys, sets, err):
         if "diaper:unisex" in keys:
             match = False
             if not match:
@@ -13549,7 +14219,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13566,8 +14236,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _way_rule_136(self, data, tags, nds, keys, sets, err):
         if "diaper:wheelchair" in keys:
             match = False
             if not match:
@@ -13592,7 +14263,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13616,8 +14287,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _way_rule_137(self, data, tags, nds, keys, sets, err):
         if "diaper:fee" in keys:
             match = False
             if not match:
@@ -13642,7 +14314,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -13661,13 +14333,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _way_rule_138(self, data, tags, nds, keys, sets, err):
         if True:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_diaper___checked) and (
+                    match = ("diaper___checked" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)
                     )
                 except mapcss.RuleAbort:
@@ -13684,7 +14357,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _way_rule_139(self, data, tags, nds, keys, sets, err):
         if "changing_table" in keys:
             match = False
             if not match:
@@ -13720,7 +14394,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _way_rule_140(self, data, tags, nds, keys, sets, err):
         if "roof:shape" in keys:
             match = False
             if not match:
@@ -13749,7 +14424,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _way_rule_141(self, data, tags, nds, keys, sets, err):
         if "bridge_name" in keys:
             match = False
             if not match:
@@ -13781,10 +14457,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _way_rule_142(self, data, tags, nds, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -13817,7 +14494,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _way_rule_143(self, data, tags, nds, keys, sets, err):
         if "recycling:metal" in keys:
             match = False
             if not match:
@@ -13856,7 +14534,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _way_rule_144(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -13885,8 +14564,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _way_rule_145(self, data, tags, nds, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -13911,7 +14591,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -13930,8 +14610,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _way_rule_146(self, data, tags, nds, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -13966,7 +14647,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -13983,8 +14664,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _way_rule_147(self, data, tags, nds, keys, sets, err):
         if ("branch:type" in keys and "tower:type" in keys) or ("tower:type" in keys):
             match = False
             if not match:
@@ -14018,7 +14700,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14035,7 +14717,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _way_rule_148(self, data, tags, nds, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -14058,7 +14741,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14075,7 +14758,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _way_rule_149(self, data, tags, nds, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -14093,7 +14777,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14110,7 +14794,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _way_rule_150(self, data, tags, nds, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -14128,7 +14813,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14145,7 +14830,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _way_rule_151(self, data, tags, nds, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -14163,7 +14849,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14180,7 +14866,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _way_rule_152(self, data, tags, nds, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -14196,7 +14883,7 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14208,14 +14895,15 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _way_rule_153(self, data, tags, nds, keys, sets, err):
         if "power" in keys and "tower:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_tower_type_warning)
+                        ("power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "tower:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -14238,7 +14926,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add("generic_power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -14251,15 +14939,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _way_rule_154(self, data, tags, nds, keys, sets, err):
         if "pole:type" in keys and "power" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_pole_type_warning)
-                        and (not set_generic_power_tower_type_warning)
+                        ("power_pole_type_warning" not in sets)
+                        and ("generic_power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "pole:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -14291,7 +14980,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[barrier=embankment]
+    # way[barrier=embankment]
+    def _way_rule_155(self, data, tags, nds, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -14318,7 +15008,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[landuse=churchyard]
+    # way[landuse=churchyard]
+    def _way_rule_156(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -14345,8 +15036,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _way_rule_157(self, data, tags, nds, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -14389,7 +15081,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _way_rule_158(self, data, tags, nds, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -14420,8 +15113,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _way_rule_159(self, data, tags, nds, keys, sets, err):
         if ("kerb" in keys and "sloped_curb" in keys) or ("sloped_curb" in keys):
             match = False
             if not match:
@@ -14466,7 +15160,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _way_rule_160(self, data, tags, nds, keys, sets, err):
         if "unnamed" in keys:
             match = False
             if not match:
@@ -14498,7 +15193,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[segregated][segregated!=yes][segregated!=no]
+    # way[segregated][segregated!=yes][segregated!=no]
+    def _way_rule_161(self, data, tags, nds, keys, sets, err):
         if "segregated" in keys:
             match = False
             if not match:
@@ -14532,7 +15228,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[bicycle:oneway]
+    # way[bicycle:oneway]
+    def _way_rule_162(self, data, tags, nds, keys, sets, err):
         if "bicycle:oneway" in keys:
             match = False
             if not match:
@@ -14564,7 +15261,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:height]
+    # *[building:height]
+    def _way_rule_163(self, data, tags, nds, keys, sets, err):
         if "building:height" in keys:
             match = False
             if not match:
@@ -14598,7 +15296,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _way_rule_164(self, data, tags, nds, keys, sets, err):
         if "building:min_height" in keys:
             match = False
             if not match:
@@ -14637,7 +15336,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[highway][construction=yes][highway!=construction]
+    # way[highway][construction=yes][highway!=construction]
+    def _way_rule_165(self, data, tags, nds, keys, sets, err):
         if "construction" in keys and "highway" in keys:
             match = False
             if not match:
@@ -14674,11 +15374,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _way_rule_166(self, data, tags, nds, keys, sets, err):
         if "navigationaid" in keys:
             match = False
             if not match:
@@ -14717,7 +15418,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _way_rule_167(self, data, tags, nds, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -14748,7 +15450,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _way_rule_168(self, data, tags, nds, keys, sets, err):
         if "natural" in keys and "water" in keys:
             match = False
             if not match:
@@ -14775,10 +15478,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _way_rule_169(self, data, tags, nds, keys, sets, err):
         if (
             ("natural" in keys and "water" in keys and "waterway" in keys)
             or ("natural" in keys and "waterway" in keys)
@@ -14881,8 +15585,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _way_rule_170(self, data, tags, nds, keys, sets, err):
         if ("natural" in keys and "waterway" in keys) or (
             "water" in keys and "waterway" in keys
         ):
@@ -14944,7 +15649,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[amenity=bench][capacity][!seats]
+    # way[amenity=bench][capacity][!seats]
+    def _way_rule_171(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "capacity" in keys:
             match = False
             if not match:
@@ -14982,7 +15688,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[amenity=bench][capacity][seats]
+    # way[amenity=bench][capacity][seats]
+    def _way_rule_172(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "capacity" in keys and "seats" in keys:
             match = False
             if not match:
@@ -15014,7 +15721,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[stream=intermittent]
+    # way[stream=intermittent]
+    def _way_rule_173(self, data, tags, nds, keys, sets, err):
         if "stream" in keys:
             match = False
             if not match:
@@ -15041,7 +15749,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _way_rule_174(self, data, tags, nds, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -15070,7 +15779,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=customer]
+    # *[access=customer]
+    def _way_rule_175(self, data, tags, nds, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -15099,7 +15809,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _way_rule_176(self, data, tags, nds, keys, sets, err):
         if "addr:inclusion" in keys:
             match = False
             if not match:
@@ -15128,7 +15839,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _way_rule_177(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -15157,7 +15869,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _way_rule_178(self, data, tags, nds, keys, sets, err):
         if "generator:type" in keys:
             match = False
             if not match:
@@ -15190,7 +15903,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=part]
+    # *[building=part]
+    def _way_rule_179(self, data, tags, nds, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -15216,7 +15930,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _way_rule_180(self, data, tags, nds, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -15245,7 +15960,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _way_rule_181(self, data, tags, nds, keys, sets, err):
         if "climbing:grade:UIAA:min" in keys:
             match = False
             if not match:
@@ -15284,7 +16000,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _way_rule_182(self, data, tags, nds, keys, sets, err):
         if "climbing:grade:UIAA:max" in keys:
             match = False
             if not match:
@@ -15323,7 +16040,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _way_rule_183(self, data, tags, nds, keys, sets, err):
         if "climbing:grade:UIAA:mean" in keys:
             match = False
             if not match:
@@ -15362,7 +16080,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _way_rule_184(self, data, tags, nds, keys, sets, err):
         if "climbing:grade:UIAA" in keys:
             match = False
             if not match:
@@ -15401,7 +16120,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _way_rule_185(self, data, tags, nds, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -15431,7 +16151,7 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way cuisine=pasta;bbq;pizza"
                 # assertNoMatch:"way cuisine=pizza;Bbq"
                 # assertNoMatch:"way cuisine=pizza;bbq"
-                set_bbq_autofix = True
+                sets.add("bbq_autofix")
                 err.append(
                     {
                         "class": 9002001,
@@ -15445,7 +16165,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _way_rule_186(self, data, tags, nds, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -15486,10 +16207,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # way[cycleway=none]
-        # way[cycleway:left=none]
-        # way[cycleway:right=none]
-        # way[shoulder=none]
+    # way[cycleway=none]
+    # way[cycleway:left=none]
+    # way[cycleway:right=none]
+    # way[shoulder=none]
+    def _way_rule_187(self, data, tags, nds, keys, sets, err):
         if (
             ("cycleway" in keys)
             or ("cycleway:left" in keys)
@@ -15560,7 +16282,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[Fixme]
+    # *[Fixme]
+    def _way_rule_188(self, data, tags, nds, keys, sets, err):
         if "Fixme" in keys:
             match = False
             if not match:
@@ -15593,10 +16316,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _way_rule_189(self, data, tags, nds, keys, sets, err):
         if "service:bicycle:chaintool" in keys:
             match = False
             if not match:
@@ -15635,7 +16359,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _way_rule_190(self, data, tags, nds, keys, sets, err):
         if "building:roof:shape" in keys:
             match = False
             if not match:
@@ -15674,7 +16399,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _way_rule_191(self, data, tags, nds, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -15712,7 +16438,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add("pumping_ring_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -15734,13 +16460,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _way_rule_192(self, data, tags, nds, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_pumping_ring_no_mech) and (
+                    match = ("pumping_ring_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "man_made")
                         == mapcss._value_capture(capture_tags, 0, "pumping_rig")
                     )
@@ -15762,7 +16489,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _way_rule_193(self, data, tags, nds, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
@@ -15800,7 +16528,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add("beam_pump_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -15823,13 +16551,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _way_rule_194(self, data, tags, nds, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_beam_pump_no_mech) and (
+                    match = ("beam_pump_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "pump:type")
                     )
                 except mapcss.RuleAbort:
@@ -15849,7 +16578,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _way_rule_195(self, data, tags, nds, keys, sets, err):
         if "substance" in keys:
             match = False
             if not match:
@@ -15876,7 +16606,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _way_rule_196(self, data, tags, nds, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -15905,8 +16636,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    def _way_rule_197(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -15941,7 +16673,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"amenity=parcel_locker"
                 # fixRemove:"vending"
                 # fixAdd:"{1.value}=yes"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -15967,7 +16699,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _way_rule_198(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -16013,7 +16746,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"parcel_mail_in=yes"
                 # fixAdd:"parcel_pickup=yes"
                 # fixRemove:"vending"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -16036,15 +16769,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _way_rule_199(self, data, tags, nds, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -16064,7 +16798,7 @@ class Josm_deprecated(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -16093,7 +16827,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _way_rule_200(self, data, tags, nds, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -16122,10 +16857,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _way_rule_201(self, data, tags, nds, keys, sets, err):
         if "school" in keys:
             match = False
             if not match:
@@ -16152,8 +16888,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _way_rule_202(self, data, tags, nds, keys, sets, err):
         if ("voltage-high" in keys) or ("voltage-low" in keys):
             match = False
             if not match:
@@ -16184,7 +16921,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _way_rule_203(self, data, tags, nds, keys, sets, err):
         if "toilet" in keys:
             match = False
             if not match:
@@ -16216,7 +16954,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _way_rule_204(self, data, tags, nds, keys, sets, err):
         if "toilet" in keys and "toilets" in keys:
             match = False
             if not match:
@@ -16242,7 +16981,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _way_rule_205(self, data, tags, nds, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -16268,7 +17008,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _way_rule_206(self, data, tags, nds, keys, sets, err):
         if "image" in keys:
             match = False
             if not match:
@@ -16300,10 +17041,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
 
-        # area[parking:orientation][!orientation]
+    # area[parking:orientation][!orientation]
+    def _way_rule_207(self, data, tags, nds, keys, sets, err):
         if "parking:orientation" in keys:
             match = False
             if not match:
@@ -16380,7 +17122,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    def _way_rule_208(self, data, tags, nds, keys, sets, err):
         if "orientation" in keys and "parking:orientation" in keys:
             match = False
             if not match:
@@ -16427,7 +17170,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    def _way_rule_209(self, data, tags, nds, keys, sets, err):
         if "orientation" in keys and "parking:orientation" in keys:
             match = False
             if not match:
@@ -16471,21 +17215,361 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        return err
+    _way_rules = (
+        _way_rule_0,
+        _way_rule_1,
+        _way_rule_2,
+        _way_rule_3,
+        _way_rule_4,
+        _way_rule_5,
+        _way_rule_6,
+        _way_rule_7,
+        _way_rule_8,
+        _way_rule_9,
+        _way_rule_10,
+        _way_rule_11,
+        _way_rule_12,
+        _way_rule_13,
+        _way_rule_14,
+        _way_rule_15,
+        _way_rule_16,
+        _way_rule_17,
+        _way_rule_18,
+        _way_rule_19,
+        _way_rule_20,
+        _way_rule_21,
+        _way_rule_22,
+        _way_rule_23,
+        _way_rule_24,
+        _way_rule_25,
+        _way_rule_26,
+        _way_rule_27,
+        _way_rule_28,
+        _way_rule_29,
+        _way_rule_30,
+        _way_rule_31,
+        _way_rule_32,
+        _way_rule_33,
+        _way_rule_34,
+        _way_rule_35,
+        _way_rule_36,
+        _way_rule_37,
+        _way_rule_38,
+        _way_rule_39,
+        _way_rule_40,
+        _way_rule_41,
+        _way_rule_42,
+        _way_rule_43,
+        _way_rule_44,
+        _way_rule_45,
+        _way_rule_46,
+        _way_rule_47,
+        _way_rule_48,
+        _way_rule_49,
+        _way_rule_50,
+        _way_rule_51,
+        _way_rule_52,
+        _way_rule_53,
+        _way_rule_54,
+        _way_rule_55,
+        _way_rule_56,
+        _way_rule_57,
+        _way_rule_58,
+        _way_rule_59,
+        _way_rule_60,
+        _way_rule_61,
+        _way_rule_62,
+        _way_rule_63,
+        _way_rule_64,
+        _way_rule_65,
+        _way_rule_66,
+        _way_rule_67,
+        _way_rule_68,
+        _way_rule_69,
+        _way_rule_70,
+        _way_rule_71,
+        _way_rule_72,
+        _way_rule_73,
+        _way_rule_74,
+        _way_rule_75,
+        _way_rule_76,
+        _way_rule_77,
+        _way_rule_78,
+        _way_rule_79,
+        _way_rule_80,
+        _way_rule_81,
+        _way_rule_82,
+        _way_rule_83,
+        _way_rule_84,
+        _way_rule_85,
+        _way_rule_86,
+        _way_rule_87,
+        _way_rule_88,
+        _way_rule_89,
+        _way_rule_90,
+        _way_rule_91,
+        _way_rule_92,
+        _way_rule_93,
+        _way_rule_94,
+        _way_rule_95,
+        _way_rule_96,
+        _way_rule_97,
+        _way_rule_98,
+        _way_rule_99,
+        _way_rule_100,
+        _way_rule_101,
+        _way_rule_102,
+        _way_rule_103,
+        _way_rule_104,
+        _way_rule_105,
+        _way_rule_106,
+        _way_rule_107,
+        _way_rule_108,
+        _way_rule_109,
+        _way_rule_110,
+        _way_rule_111,
+        _way_rule_112,
+        _way_rule_113,
+        _way_rule_114,
+        _way_rule_115,
+        _way_rule_116,
+        _way_rule_117,
+        _way_rule_118,
+        _way_rule_119,
+        _way_rule_120,
+        _way_rule_121,
+        _way_rule_122,
+        _way_rule_123,
+        _way_rule_124,
+        _way_rule_125,
+        _way_rule_126,
+        _way_rule_127,
+        _way_rule_128,
+        _way_rule_129,
+        _way_rule_130,
+        _way_rule_131,
+        _way_rule_132,
+        _way_rule_133,
+        _way_rule_134,
+        _way_rule_135,
+        _way_rule_136,
+        _way_rule_137,
+        _way_rule_138,
+        _way_rule_139,
+        _way_rule_140,
+        _way_rule_141,
+        _way_rule_142,
+        _way_rule_143,
+        _way_rule_144,
+        _way_rule_145,
+        _way_rule_146,
+        _way_rule_147,
+        _way_rule_148,
+        _way_rule_149,
+        _way_rule_150,
+        _way_rule_151,
+        _way_rule_152,
+        _way_rule_153,
+        _way_rule_154,
+        _way_rule_155,
+        _way_rule_156,
+        _way_rule_157,
+        _way_rule_158,
+        _way_rule_159,
+        _way_rule_160,
+        _way_rule_161,
+        _way_rule_162,
+        _way_rule_163,
+        _way_rule_164,
+        _way_rule_165,
+        _way_rule_166,
+        _way_rule_167,
+        _way_rule_168,
+        _way_rule_169,
+        _way_rule_170,
+        _way_rule_171,
+        _way_rule_172,
+        _way_rule_173,
+        _way_rule_174,
+        _way_rule_175,
+        _way_rule_176,
+        _way_rule_177,
+        _way_rule_178,
+        _way_rule_179,
+        _way_rule_180,
+        _way_rule_181,
+        _way_rule_182,
+        _way_rule_183,
+        _way_rule_184,
+        _way_rule_185,
+        _way_rule_186,
+        _way_rule_187,
+        _way_rule_188,
+        _way_rule_189,
+        _way_rule_190,
+        _way_rule_191,
+        _way_rule_192,
+        _way_rule_193,
+        _way_rule_194,
+        _way_rule_195,
+        _way_rule_196,
+        _way_rule_197,
+        _way_rule_198,
+        _way_rule_199,
+        _way_rule_200,
+        _way_rule_201,
+        _way_rule_202,
+        _way_rule_203,
+        _way_rule_204,
+        _way_rule_205,
+        _way_rule_206,
+        _way_rule_207,
+        _way_rule_208,
+        _way_rule_209,
+    )
+    _way_rules_dispatch = {
+        "FIXME": (26,),
+        "Fixme": (188,),
+        "access": (24, 25, 39, 175),
+        "addr:inclusion": (176,),
+        "aerialway": (39,),
+        "amenity": (39, 75, 85, 110, 123, 124, 125),
+        "area": (101,),
+        "barrier": (0, 1, 39, 83, 155),
+        "bicycle:oneway": (162,),
+        "bicycle_parking": (10,),
+        "board_type": (17,),
+        "branch:type": (146, 147, 148),
+        "bridge": (35,),
+        "bridge_name": (141,),
+        "building": (105, 106, 107, 112, 177, 179),
+        "building:color": (52,),
+        "building:colour": (54,),
+        "building:height": (163,),
+        "building:level": (46,),
+        "building:levels": (47,),
+        "building:min_height": (164,),
+        "building:part": (44,),
+        "building:roof:shape": (190,),
+        "building:type": (126, 127),
+        "capacity": (171,),
+        "changing_table": (139,),
+        "climbing:grade:UIAA": (184,),
+        "climbing:grade:UIAA:max": (182,),
+        "climbing:grade:UIAA:mean": (183,),
+        "climbing:grade:UIAA:min": (181,),
+        "construction": (165,),
+        "contact:google_plus": (122,),
+        "craft": (39,),
+        "crossing": (142,),
+        "cuisine": (119, 185, 186),
+        "cycleway": (187,),
+        "cycleway:left": (187,),
+        "cycleway:right": (187,),
+        "diaper": (131, 132),
+        "diaper:fee": (137,),
+        "diaper:female": (134,),
+        "diaper:male": (133,),
+        "diaper:unisex": (135,),
+        "diaper:wheelchair": (136,),
+        "direction": (103, 104),
+        "distance": (66,),
+        "emergency_telephone_code": (94,),
+        "fee": (36,),
+        "fence_type": (16,),
+        "fixme": (26,),
+        "generator:location": (12,),
+        "generator:method": (13, 14, 15),
+        "generator:type": (178,),
+        "image": (206,),
+        "kerb": (159,),
+        "kitchen_hours": (120,),
+        "kp": (62, 64),
+        "landuse": (2, 39, 72, 89, 156, 196),
+        "leisure": (39, 79, 118, 128),
+        "levels": (44, 45),
+        "lit": (36,),
+        "location": (11, 77),
+        "lock": (102,),
+        "man_made": (18, 69, 78, 191, 192),
+        "manhole": (39,),
+        "measurement": (19, 20, 21),
+        "monitoring:river_level": (22,),
+        "name": (27,),
+        "natural": (113, 129, 168, 169, 170, 180),
+        "navigationaid": (166,),
+        "noexit": (88,),
+        "note": (28,),
+        "oneway": (50, 51),
+        "orientation": (208, 209),
+        "parking": (38, 39),
+        "parking:orientation": (207,),
+        "payment:ep_cash": (61,),
+        "payment:ep_chipknip": (61,),
+        "payment:ep_proton": (61,),
+        "payment:ep_quick": (61,),
+        "phone": (92, 93),
+        "pk": (63, 65),
+        "place": (39,),
+        "playground": (39,),
+        "pole:type": (154,),
+        "police": (39,),
+        "postcode": (67,),
+        "power": (111, 153),
+        "protected_class": (48,),
+        "pump:type": (193, 194),
+        "recycling:metal": (143,),
+        "religion": (114,),
+        "reservoir_type": (2, 3, 4, 5),
+        "roof:color": (53,),
+        "roof:colour": (55,),
+        "roof:shape": (140,),
+        "school": (201,),
+        "seamark": (71,),
+        "seamark:type": (70,),
+        "seats": (172,),
+        "segregated": (161,),
+        "service": (39, 87, 88),
+        "service:bicycle:chaintool": (189,),
+        "shop": (6, 7, 8, 9, 39, 73, 74, 79, 80, 90, 115, 121, 124, 130, 144, 174),
+        "shoulder": (187,),
+        "sidewalk": (40,),
+        "sloped_curb": (157, 158, 159),
+        "sport": (49, 60, 82, 117),
+        "stay": (23,),
+        "stream": (173,),
+        "substance": (195,),
+        "supervised": (36,),
+        "surface": (200,),
+        "toilet": (203,),
+        "toilets": (204,),
+        "tower:type": (145, 147, 149, 150, 151, 152),
+        "tracktype": (95, 96, 97, 98, 99, 100),
+        "traffic_calming": (39,),
+        "type": (29, 30, 32, 33, 34, 76, 205),
+        "unnamed": (160,),
+        "vending": (86, 91, 197, 198, 199),
+        "voltage-high": (202,),
+        "voltage-low": (202,),
+        "wall": (83, 84),
+        "water": (68, 108, 109, 167),
+        "waterway": (41, 42, 43, 169, 170),
+        "wood": (30, 31, 32, 33),
+    }
+    _way_rules_fallback = (37, 56, 57, 58, 59, 81, 116, 138)
 
     def relation(self, data, tags, members):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = (
-            set_diaper_checked
-        ) = set_generic_power_tower_type_warning = set_levels_building = (
-            set_parcel_fixable
-        ) = set_power_pole_type_warning = set_power_tower_type_warning = (
-            set_pumping_ring_no_mech
-        ) = set_samebuildingcolor = set_sameroofcolor = False
-
-        # *[barrier=wire_fence]
+        sets = set()
+        for rule in mapcss._dispatch_rules(
+            self._relation_rules_dispatch, self._relation_rules_fallback, keys
+        ):
+            self._relation_rules[rule](self, data, tags, members, keys, sets, err)
+        return err
+
+    # *[barrier=wire_fence]
+    def _relation_rule_0(self, data, tags, members, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -16519,7 +17603,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _relation_rule_1(self, data, tags, members, keys, sets, err):
         if "barrier" in keys:
             match = False
             if not match:
@@ -16551,26 +17636,27 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _relation_rule_2(self, data, tags, members, keys, sets, err):
         if ("landuse" in keys) or ("landuse" in keys and "reservoir_type" in keys):
             match = False
             if not match:
@@ -16619,7 +17705,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _relation_rule_3(self, data, tags, members, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -16657,7 +17744,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _relation_rule_4(self, data, tags, members, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -16687,7 +17775,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _relation_rule_5(self, data, tags, members, keys, sets, err):
         if "landuse" in keys and "reservoir_type" in keys:
             match = False
             if not match:
@@ -16717,19 +17806,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _relation_rule_6(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -16758,7 +17848,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _relation_rule_7(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -16787,10 +17878,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _relation_rule_8(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -16819,7 +17911,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _relation_rule_9(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -16851,7 +17944,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _relation_rule_10(self, data, tags, members, keys, sets, err):
         if "bicycle_parking" in keys:
             match = False
             if not match:
@@ -16880,19 +17974,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _relation_rule_11(self, data, tags, members, keys, sets, err):
         if "location" in keys:
             match = False
             if not match:
@@ -16921,7 +18016,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:location]
+    # *[generator:location]
+    def _relation_rule_12(self, data, tags, members, keys, sets, err):
         if "generator:location" in keys:
             match = False
             if not match:
@@ -16955,7 +18051,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _relation_rule_13(self, data, tags, members, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -16984,7 +18081,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _relation_rule_14(self, data, tags, members, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -17015,7 +18113,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _relation_rule_15(self, data, tags, members, keys, sets, err):
         if "generator:method" in keys:
             match = False
             if not match:
@@ -17046,7 +18145,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _relation_rule_16(self, data, tags, members, keys, sets, err):
         if "fence_type" in keys:
             match = False
             if not match:
@@ -17073,10 +18173,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _relation_rule_17(self, data, tags, members, keys, sets, err):
         if "board_type" in keys:
             match = False
             if not match:
@@ -17104,7 +18205,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _relation_rule_18(self, data, tags, members, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -17133,7 +18235,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _relation_rule_19(self, data, tags, members, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -17166,7 +18269,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _relation_rule_20(self, data, tags, members, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -17199,7 +18303,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _relation_rule_21(self, data, tags, members, keys, sets, err):
         if "measurement" in keys:
             match = False
             if not match:
@@ -17232,7 +18337,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _relation_rule_22(self, data, tags, members, keys, sets, err):
         if "monitoring:river_level" in keys:
             match = False
             if not match:
@@ -17271,7 +18377,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[stay]
+    # *[stay]
+    def _relation_rule_23(self, data, tags, members, keys, sets, err):
         if "stay" in keys:
             match = False
             if not match:
@@ -17301,18 +18408,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _relation_rule_24(self, data, tags, members, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -17337,7 +18445,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=official]
+    # *[access=official]
+    def _relation_rule_25(self, data, tags, members, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -17362,8 +18471,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _relation_rule_26(self, data, tags, members, keys, sets, err):
         if ("FIXME" in keys) or ("fixme" in keys):
             match = False
             if not match:
@@ -17396,7 +18506,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _relation_rule_27(self, data, tags, members, keys, sets, err):
         if "name" in keys:
             match = False
             if not match:
@@ -17427,7 +18538,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _relation_rule_28(self, data, tags, members, keys, sets, err):
         if "note" in keys:
             match = False
             if not match:
@@ -17454,8 +18566,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _relation_rule_29(self, data, tags, members, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -17496,9 +18609,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _relation_rule_30(self, data, tags, members, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -17547,7 +18661,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _relation_rule_31(self, data, tags, members, keys, sets, err):
         if "wood" in keys:
             match = False
             if not match:
@@ -17577,8 +18692,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _relation_rule_32(self, data, tags, members, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -17619,9 +18735,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _relation_rule_33(self, data, tags, members, keys, sets, err):
         if ("type" in keys) or ("wood" in keys):
             match = False
             if not match:
@@ -17670,10 +18787,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _relation_rule_34(self, data, tags, members, keys, sets, err):
         if "bridge" in keys:
             match = False
             if not match:
@@ -17701,18 +18819,19 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _relation_rule_35(self, data, tags, members, keys, sets, err):
         if ("fee" in keys) or ("lit" in keys) or ("supervised" in keys):
             match = False
             if not match:
@@ -17753,7 +18872,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _relation_rule_36(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -17777,10 +18897,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _relation_rule_37(self, data, tags, members, keys, sets, err):
         if "parking" in keys:
             match = False
             if not match:
@@ -17814,24 +18935,25 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _relation_rule_38(self, data, tags, members, keys, sets, err):
         if (
             ("access" in keys)
             or ("aerialway" in keys)
@@ -18017,13 +19139,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _relation_rule_39(self, data, tags, members, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -18055,7 +19178,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _relation_rule_40(self, data, tags, members, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -18087,7 +19211,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _relation_rule_41(self, data, tags, members, keys, sets, err):
         if "waterway" in keys:
             match = False
             if not match:
@@ -18117,8 +19242,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _relation_rule_42(self, data, tags, members, keys, sets, err):
         if ("building" in keys and "levels" in keys) or (
             "building:part" in keys and "levels" in keys
         ):
@@ -18145,7 +19271,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add("levels_building")
                 err.append(
                     {
                         "class": 9002001,
@@ -18164,13 +19290,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _relation_rule_43(self, data, tags, members, keys, sets, err):
         if "levels" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_levels_building) and (
+                    match = ("levels_building" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "levels")
                     )
                 except mapcss.RuleAbort:
@@ -18190,7 +19317,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _relation_rule_44(self, data, tags, members, keys, sets, err):
         if "building:level" in keys:
             match = False
             if not match:
@@ -18233,7 +19361,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _relation_rule_45(self, data, tags, members, keys, sets, err):
         if "building:level" in keys and "building:levels" in keys:
             match = False
             if not match:
@@ -18261,7 +19390,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[protected_class]
+    # *[protected_class]
+    def _relation_rule_46(self, data, tags, members, keys, sets, err):
         if "protected_class" in keys:
             match = False
             if not match:
@@ -18295,19 +19425,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
 
-        # *[sport=skiing]
+    # *[sport=skiing]
+    def _relation_rule_47(self, data, tags, members, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -18333,16 +19464,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # area[building:color][!building:colour]
+    # area[building:color][!building:colour]
+    def _relation_rule_48(self, data, tags, members, keys, sets, err):
         if "building:color" in keys and "type" in keys:
             match = False
             if not match:
@@ -18390,7 +19522,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[roof:color][!roof:colour]
+    # area[roof:color][!roof:colour]
+    def _relation_rule_49(self, data, tags, members, keys, sets, err):
         if "roof:color" in keys and "type" in keys:
             match = False
             if not match:
@@ -18433,10 +19566,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # area[building:color][building:colour]["building:color"=*"building:colour"]
+    # area[building:color][building:colour]["building:color"=*"building:colour"]
+    def _relation_rule_50(self, data, tags, members, keys, sets, err):
         if "building:color" in keys and "building:colour" in keys and "type" in keys:
             match = False
             if not match:
@@ -18468,7 +19602,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 # suggestAlternative:"building:colour"
                 # fixRemove:"building:color"
-                set_samebuildingcolor = True
+                sets.add("samebuildingcolor")
                 err.append(
                     {
                         "class": 9002001,
@@ -18483,7 +19617,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    def _relation_rule_51(self, data, tags, members, keys, sets, err):
         if "roof:color" in keys and "roof:colour" in keys and "type" in keys:
             match = False
             if not match:
@@ -18511,7 +19646,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 # suggestAlternative:"roof:colour"
                 # fixRemove:"roof:color"
-                set_sameroofcolor = True
+                sets.add("sameroofcolor")
                 err.append(
                     {
                         "class": 9002001,
@@ -18526,16 +19661,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _relation_rule_52(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -18572,7 +19708,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/color:/]
+    # *[/color:/]
+    def _relation_rule_53(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -18596,7 +19733,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    def _relation_rule_54(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -18618,8 +19756,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^.$/]
-        # relation[/^..$/][!to]
+    # *[/^.$/]
+    # relation[/^..$/][!to]
+    def _relation_rule_55(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -18648,12 +19787,13 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _relation_rule_56(self, data, tags, members, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -18698,10 +19838,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _relation_rule_57(self, data, tags, members, keys, sets, err):
         if (
             ("payment:ep_cash" in keys)
             or ("payment:ep_chipknip" in keys)
@@ -18760,7 +19901,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _relation_rule_58(self, data, tags, members, keys, sets, err):
         if "kp" in keys:
             match = False
             if not match:
@@ -18795,7 +19937,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _relation_rule_59(self, data, tags, members, keys, sets, err):
         if "pk" in keys:
             match = False
             if not match:
@@ -18830,7 +19973,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _relation_rule_60(self, data, tags, members, keys, sets, err):
         if "kp" in keys and "railway" in keys:
             match = False
             if not match:
@@ -18863,7 +20007,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _relation_rule_61(self, data, tags, members, keys, sets, err):
         if "pk" in keys and "railway" in keys:
             match = False
             if not match:
@@ -18896,7 +20041,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _relation_rule_62(self, data, tags, members, keys, sets, err):
         if "distance" in keys and "railway" in keys:
             match = False
             if not match:
@@ -18934,7 +20080,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[postcode]
+    # *[postcode]
+    def _relation_rule_63(self, data, tags, members, keys, sets, err):
         if "postcode" in keys:
             match = False
             if not match:
@@ -18959,7 +20106,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _relation_rule_64(self, data, tags, members, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -18989,10 +20137,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _relation_rule_65(self, data, tags, members, keys, sets, err):
         if "seamark" in keys and "seamark:type" in keys:
             match = False
             if not match:
@@ -19027,7 +20176,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _relation_rule_66(self, data, tags, members, keys, sets, err):
         if "seamark" in keys:
             match = False
             if not match:
@@ -19064,7 +20214,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _relation_rule_67(self, data, tags, members, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -19097,16 +20248,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _relation_rule_68(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -19134,7 +20286,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _relation_rule_69(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -19165,10 +20318,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _relation_rule_70(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -19201,16 +20355,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _relation_rule_71(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "type" in keys:
             match = False
             if not match:
@@ -19283,10 +20438,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _relation_rule_72(self, data, tags, members, keys, sets, err):
         if "location" in keys and "power" in keys:
             match = False
             if not match:
@@ -19325,7 +20481,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _relation_rule_73(self, data, tags, members, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -19352,37 +20509,38 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _relation_rule_74(self, data, tags, members, keys, sets, err):
         if ("leisure" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -19420,11 +20578,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _relation_rule_75(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -19451,20 +20610,21 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _relation_rule_76(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
@@ -19498,7 +20658,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _relation_rule_77(self, data, tags, members, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -19525,7 +20686,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _relation_rule_78(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -19558,10 +20720,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _relation_rule_79(self, data, tags, members, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -19590,7 +20753,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _relation_rule_80(self, data, tags, members, keys, sets, err):
         if "service" in keys:
             match = False
             if not match:
@@ -19619,7 +20783,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit][noexit!=yes][noexit!=no]
+    # *[noexit][noexit!=yes][noexit!=no]
+    def _relation_rule_81(self, data, tags, members, keys, sets, err):
         if "noexit" in keys:
             match = False
             if not match:
@@ -19653,10 +20818,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # area[landuse=pond]
+    # area[landuse=pond]
+    def _relation_rule_82(self, data, tags, members, keys, sets, err):
         if "landuse" in keys and "type" in keys:
             match = False
             if not match:
@@ -19694,9 +20860,10 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _relation_rule_83(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -19741,7 +20908,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _relation_rule_84(self, data, tags, members, keys, sets, err):
         if "vending" in keys:
             match = False
             if not match:
@@ -19770,7 +20938,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[area][area!=yes][area!=no]
+    # area[area][area!=yes][area!=no]
+    def _relation_rule_85(self, data, tags, members, keys, sets, err):
         if "area" in keys and "type" in keys:
             match = False
             if not match:
@@ -19810,8 +20979,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _relation_rule_86(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "lock" in keys:
             match = False
             if not match:
@@ -19860,17 +21030,18 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _relation_rule_87(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -19930,16 +21101,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _relation_rule_88(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -20036,11 +21208,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _relation_rule_89(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -20100,7 +21273,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # relation[water=salt]
+    # relation[water=salt]
+    def _relation_rule_90(self, data, tags, members, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -20127,7 +21301,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _relation_rule_91(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -20155,11 +21330,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _relation_rule_92(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -20191,10 +21367,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _relation_rule_93(self, data, tags, members, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -20226,7 +21403,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _relation_rule_94(self, data, tags, members, keys, sets, err):
         if "religion" in keys:
             match = False
             if not match:
@@ -20255,7 +21433,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _relation_rule_95(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -20284,7 +21463,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[is_in]
+    # *[is_in]
+    def _relation_rule_96(self, data, tags, members, keys, sets, err):
         if "is_in" in keys:
             match = False
             if not match:
@@ -20312,7 +21492,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=football]
+    # *[sport=football]
+    def _relation_rule_97(self, data, tags, members, keys, sets, err):
         if "sport" in keys:
             match = False
             if not match:
@@ -20344,7 +21525,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _relation_rule_98(self, data, tags, members, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -20372,8 +21554,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _relation_rule_99(self, data, tags, members, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -20408,7 +21591,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _relation_rule_100(self, data, tags, members, keys, sets, err):
         if "kitchen_hours" in keys:
             match = False
             if not match:
@@ -20445,7 +21629,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _relation_rule_101(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -20477,7 +21662,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _relation_rule_102(self, data, tags, members, keys, sets, err):
         if "contact:google_plus" in keys:
             match = False
             if not match:
@@ -20505,8 +21691,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _relation_rule_103(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -20542,8 +21729,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _relation_rule_104(self, data, tags, members, keys, sets, err):
         if ("amenity" in keys) or ("shop" in keys):
             match = False
             if not match:
@@ -20578,7 +21766,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _relation_rule_105(self, data, tags, members, keys, sets, err):
         if "amenity" in keys:
             match = False
             if not match:
@@ -20615,8 +21804,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _relation_rule_106(self, data, tags, members, keys, sets, err):
         if ("building" in keys and "building:type" in keys) or (
             "building:type" in keys
         ):
@@ -20663,7 +21853,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _relation_rule_107(self, data, tags, members, keys, sets, err):
         if "building" in keys and "building:type" in keys:
             match = False
             if not match:
@@ -20696,19 +21887,20 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _relation_rule_108(self, data, tags, members, keys, sets, err):
         if "leisure" in keys:
             match = False
             if not match:
@@ -20735,22 +21927,23 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _relation_rule_109(self, data, tags, members, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -20782,16 +21975,17 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _relation_rule_110(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -20818,17 +22012,18 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _relation_rule_111(self, data, tags, members, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -20849,7 +22044,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -20874,7 +22069,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _relation_rule_112(self, data, tags, members, keys, sets, err):
         if "diaper" in keys:
             match = False
             if not match:
@@ -20891,7 +22087,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add("diaper_checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -20903,10 +22099,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _relation_rule_113(self, data, tags, members, keys, sets, err):
         if "diaper:male" in keys:
             match = False
             if not match:
@@ -20924,7 +22121,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -20941,7 +22138,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _relation_rule_114(self, data, tags, members, keys, sets, err):
         if "diaper:female" in keys:
             match = False
             if not match:
@@ -20959,7 +22157,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -20976,7 +22174,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _relation_rule_115(self, data, tags, members, keys, sets, err):
         if "diaper:unisex" in keys:
             match = False
             if not match:
@@ -20994,7 +22193,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -21011,8 +22210,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _relation_rule_116(self, data, tags, members, keys, sets, err):
         if "diaper:wheelchair" in keys:
             match = False
             if not match:
@@ -21037,7 +22237,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -21061,8 +22261,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _relation_rule_117(self, data, tags, members, keys, sets, err):
         if "diaper:fee" in keys:
             match = False
             if not match:
@@ -21087,7 +22288,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add("diaper___checked")
                 err.append(
                     {
                         "class": 9002001,
@@ -21106,13 +22307,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _relation_rule_118(self, data, tags, members, keys, sets, err):
         if True:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_diaper___checked) and (
+                    match = ("diaper___checked" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)
                     )
                 except mapcss.RuleAbort:
@@ -21129,7 +22331,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _relation_rule_119(self, data, tags, members, keys, sets, err):
         if "changing_table" in keys:
             match = False
             if not match:
@@ -21165,7 +22368,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _relation_rule_120(self, data, tags, members, keys, sets, err):
         if "roof:shape" in keys:
             match = False
             if not match:
@@ -21194,7 +22398,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _relation_rule_121(self, data, tags, members, keys, sets, err):
         if "bridge_name" in keys:
             match = False
             if not match:
@@ -21226,10 +22431,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _relation_rule_122(self, data, tags, members, keys, sets, err):
         if "crossing" in keys:
             match = False
             if not match:
@@ -21262,7 +22468,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _relation_rule_123(self, data, tags, members, keys, sets, err):
         if "recycling:metal" in keys:
             match = False
             if not match:
@@ -21301,7 +22508,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _relation_rule_124(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -21330,8 +22538,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _relation_rule_125(self, data, tags, members, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -21356,7 +22565,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21375,8 +22584,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _relation_rule_126(self, data, tags, members, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -21411,7 +22621,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21428,8 +22638,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _relation_rule_127(self, data, tags, members, keys, sets, err):
         if ("branch:type" in keys and "tower:type" in keys) or ("tower:type" in keys):
             match = False
             if not match:
@@ -21463,7 +22674,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21480,7 +22691,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _relation_rule_128(self, data, tags, members, keys, sets, err):
         if "branch:type" in keys and "tower:type" in keys:
             match = False
             if not match:
@@ -21503,7 +22715,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21520,7 +22732,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _relation_rule_129(self, data, tags, members, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -21538,7 +22751,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21555,7 +22768,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _relation_rule_130(self, data, tags, members, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -21573,7 +22787,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21590,7 +22804,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _relation_rule_131(self, data, tags, members, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -21608,7 +22823,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21625,7 +22840,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _relation_rule_132(self, data, tags, members, keys, sets, err):
         if "tower:type" in keys:
             match = False
             if not match:
@@ -21641,7 +22857,7 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add("power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21653,14 +22869,15 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _relation_rule_133(self, data, tags, members, keys, sets, err):
         if "power" in keys and "tower:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_tower_type_warning)
+                        ("power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "tower:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -21683,7 +22900,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add("generic_power_tower_type_warning")
                 err.append(
                     {
                         "class": 9002001,
@@ -21696,15 +22913,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _relation_rule_134(self, data, tags, members, keys, sets, err):
         if "pole:type" in keys and "power" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_power_pole_type_warning)
-                        and (not set_generic_power_tower_type_warning)
+                        ("power_pole_type_warning" not in sets)
+                        and ("generic_power_tower_type_warning" not in sets)
                         and (mapcss._tag_capture(capture_tags, 0, tags, "pole:type"))
                         and (mapcss._tag_capture(capture_tags, 1, tags, "power"))
                         and (
@@ -21736,8 +22954,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _relation_rule_135(self, data, tags, members, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -21780,7 +22999,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _relation_rule_136(self, data, tags, members, keys, sets, err):
         if "sloped_curb" in keys:
             match = False
             if not match:
@@ -21811,8 +23031,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _relation_rule_137(self, data, tags, members, keys, sets, err):
         if ("kerb" in keys and "sloped_curb" in keys) or ("sloped_curb" in keys):
             match = False
             if not match:
@@ -21857,7 +23078,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _relation_rule_138(self, data, tags, members, keys, sets, err):
         if "unnamed" in keys:
             match = False
             if not match:
@@ -21889,7 +23111,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:height]
+    # *[building:height]
+    def _relation_rule_139(self, data, tags, members, keys, sets, err):
         if "building:height" in keys:
             match = False
             if not match:
@@ -21923,7 +23146,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _relation_rule_140(self, data, tags, members, keys, sets, err):
         if "building:min_height" in keys:
             match = False
             if not match:
@@ -21962,11 +23186,12 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _relation_rule_141(self, data, tags, members, keys, sets, err):
         if "navigationaid" in keys:
             match = False
             if not match:
@@ -22005,7 +23230,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _relation_rule_142(self, data, tags, members, keys, sets, err):
         if "water" in keys:
             match = False
             if not match:
@@ -22036,7 +23262,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _relation_rule_143(self, data, tags, members, keys, sets, err):
         if "natural" in keys and "water" in keys:
             match = False
             if not match:
@@ -22063,10 +23290,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _relation_rule_144(self, data, tags, members, keys, sets, err):
         if (
             ("natural" in keys and "water" in keys and "waterway" in keys)
             or ("natural" in keys and "waterway" in keys)
@@ -22161,8 +23389,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _relation_rule_145(self, data, tags, members, keys, sets, err):
         if ("natural" in keys and "waterway" in keys) or (
             "water" in keys and "waterway" in keys
         ):
@@ -22218,7 +23447,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _relation_rule_146(self, data, tags, members, keys, sets, err):
         if "shop" in keys:
             match = False
             if not match:
@@ -22247,7 +23477,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[access=customer]
+    # *[access=customer]
+    def _relation_rule_147(self, data, tags, members, keys, sets, err):
         if "access" in keys:
             match = False
             if not match:
@@ -22276,7 +23507,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _relation_rule_148(self, data, tags, members, keys, sets, err):
         if "addr:inclusion" in keys:
             match = False
             if not match:
@@ -22305,7 +23537,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _relation_rule_149(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -22334,7 +23567,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _relation_rule_150(self, data, tags, members, keys, sets, err):
         if "generator:type" in keys:
             match = False
             if not match:
@@ -22367,7 +23601,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building=part]
+    # *[building=part]
+    def _relation_rule_151(self, data, tags, members, keys, sets, err):
         if "building" in keys:
             match = False
             if not match:
@@ -22393,7 +23628,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _relation_rule_152(self, data, tags, members, keys, sets, err):
         if "natural" in keys:
             match = False
             if not match:
@@ -22422,7 +23658,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _relation_rule_153(self, data, tags, members, keys, sets, err):
         if "climbing:grade:UIAA:min" in keys:
             match = False
             if not match:
@@ -22461,7 +23698,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _relation_rule_154(self, data, tags, members, keys, sets, err):
         if "climbing:grade:UIAA:max" in keys:
             match = False
             if not match:
@@ -22500,7 +23738,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _relation_rule_155(self, data, tags, members, keys, sets, err):
         if "climbing:grade:UIAA:mean" in keys:
             match = False
             if not match:
@@ -22539,7 +23778,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _relation_rule_156(self, data, tags, members, keys, sets, err):
         if "climbing:grade:UIAA" in keys:
             match = False
             if not match:
@@ -22578,7 +23818,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _relation_rule_157(self, data, tags, members, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -22600,7 +23841,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"cuisine=barbecue"
                 # fixAdd:"cuisine=barbecue"
-                set_bbq_autofix = True
+                sets.add("bbq_autofix")
                 err.append(
                     {
                         "class": 9002001,
@@ -22614,7 +23855,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _relation_rule_158(self, data, tags, members, keys, sets, err):
         if "cuisine" in keys:
             match = False
             if not match:
@@ -22647,7 +23889,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[Fixme]
+    # *[Fixme]
+    def _relation_rule_159(self, data, tags, members, keys, sets, err):
         if "Fixme" in keys:
             match = False
             if not match:
@@ -22677,10 +23920,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _relation_rule_160(self, data, tags, members, keys, sets, err):
         if "service:bicycle:chaintool" in keys:
             match = False
             if not match:
@@ -22719,7 +23963,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _relation_rule_161(self, data, tags, members, keys, sets, err):
         if "building:roof:shape" in keys:
             match = False
             if not match:
@@ -22758,7 +24003,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _relation_rule_162(self, data, tags, members, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
@@ -22796,7 +24042,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add("pumping_ring_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -22818,13 +24064,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _relation_rule_163(self, data, tags, members, keys, sets, err):
         if "man_made" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_pumping_ring_no_mech) and (
+                    match = ("pumping_ring_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "man_made")
                         == mapcss._value_capture(capture_tags, 0, "pumping_rig")
                     )
@@ -22846,7 +24093,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _relation_rule_164(self, data, tags, members, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
@@ -22884,7 +24132,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add("beam_pump_no_mech")
                 err.append(
                     {
                         "class": 9002001,
@@ -22907,13 +24155,14 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _relation_rule_165(self, data, tags, members, keys, sets, err):
         if "pump:type" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
-                    match = (not set_beam_pump_no_mech) and (
+                    match = ("beam_pump_no_mech" not in sets) and (
                         mapcss._tag_capture(capture_tags, 0, tags, "pump:type")
                     )
                 except mapcss.RuleAbort:
@@ -22933,7 +24182,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _relation_rule_166(self, data, tags, members, keys, sets, err):
         if "substance" in keys:
             match = False
             if not match:
@@ -22960,7 +24210,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _relation_rule_167(self, data, tags, members, keys, sets, err):
         if "landuse" in keys:
             match = False
             if not match:
@@ -22989,8 +24240,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    def _relation_rule_168(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -23025,7 +24277,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"amenity=parcel_locker"
                 # fixRemove:"vending"
                 # fixAdd:"{1.value}=yes"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -23051,7 +24303,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _relation_rule_169(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
@@ -23097,7 +24350,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"parcel_mail_in=yes"
                 # fixAdd:"parcel_pickup=yes"
                 # fixRemove:"vending"
-                set_parcel_fixable = True
+                sets.add("parcel_fixable")
                 err.append(
                     {
                         "class": 9002001,
@@ -23120,15 +24373,16 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _relation_rule_170(self, data, tags, members, keys, sets, err):
         if "amenity" in keys and "vending" in keys:
             match = False
             if not match:
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -23148,7 +24402,7 @@ class Josm_deprecated(PluginMapCSS):
                 capture_tags = {}
                 try:
                     match = (
-                        (not set_parcel_fixable)
+                        ("parcel_fixable" not in sets)
                         and (
                             mapcss._tag_capture(capture_tags, 0, tags, "amenity")
                             == mapcss._value_capture(capture_tags, 0, "vending_machine")
@@ -23177,7 +24431,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _relation_rule_171(self, data, tags, members, keys, sets, err):
         if "surface" in keys:
             match = False
             if not match:
@@ -23206,10 +24461,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _relation_rule_172(self, data, tags, members, keys, sets, err):
         if "school" in keys:
             match = False
             if not match:
@@ -23236,8 +24492,9 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _relation_rule_173(self, data, tags, members, keys, sets, err):
         if ("voltage-high" in keys) or ("voltage-low" in keys):
             match = False
             if not match:
@@ -23268,7 +24525,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _relation_rule_174(self, data, tags, members, keys, sets, err):
         if "toilet" in keys:
             match = False
             if not match:
@@ -23300,7 +24558,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _relation_rule_175(self, data, tags, members, keys, sets, err):
         if "toilet" in keys and "toilets" in keys:
             match = False
             if not match:
@@ -23326,7 +24585,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _relation_rule_176(self, data, tags, members, keys, sets, err):
         if "type" in keys:
             match = False
             if not match:
@@ -23352,7 +24612,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _relation_rule_177(self, data, tags, members, keys, sets, err):
         if "image" in keys:
             match = False
             if not match:
@@ -23384,10 +24645,11 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
 
-        # area[parking:orientation][!orientation]
+    # area[parking:orientation][!orientation]
+    def _relation_rule_178(self, data, tags, members, keys, sets, err):
         if "parking:orientation" in keys and "type" in keys:
             match = False
             if not match:
@@ -23464,7 +24726,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    def _relation_rule_179(self, data, tags, members, keys, sets, err):
         if "orientation" in keys and "parking:orientation" in keys and "type" in keys:
             match = False
             if not match:
@@ -23511,7 +24774,8 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    def _relation_rule_180(self, data, tags, members, keys, sets, err):
         if "orientation" in keys and "parking:orientation" in keys and "type" in keys:
             match = False
             if not match:
@@ -23555,7 +24819,303 @@ class Josm_deprecated(PluginMapCSS):
                     }
                 )
 
-        return err
+    _relation_rules = (
+        _relation_rule_0,
+        _relation_rule_1,
+        _relation_rule_2,
+        _relation_rule_3,
+        _relation_rule_4,
+        _relation_rule_5,
+        _relation_rule_6,
+        _relation_rule_7,
+        _relation_rule_8,
+        _relation_rule_9,
+        _relation_rule_10,
+        _relation_rule_11,
+        _relation_rule_12,
+        _relation_rule_13,
+        _relation_rule_14,
+        _relation_rule_15,
+        _relation_rule_16,
+        _relation_rule_17,
+        _relation_rule_18,
+        _relation_rule_19,
+        _relation_rule_20,
+        _relation_rule_21,
+        _relation_rule_22,
+        _relation_rule_23,
+        _relation_rule_24,
+        _relation_rule_25,
+        _relation_rule_26,
+        _relation_rule_27,
+        _relation_rule_28,
+        _relation_rule_29,
+        _relation_rule_30,
+        _relation_rule_31,
+        _relation_rule_32,
+        _relation_rule_33,
+        _relation_rule_34,
+        _relation_rule_35,
+        _relation_rule_36,
+        _relation_rule_37,
+        _relation_rule_38,
+        _relation_rule_39,
+        _relation_rule_40,
+        _relation_rule_41,
+        _relation_rule_42,
+        _relation_rule_43,
+        _relation_rule_44,
+        _relation_rule_45,
+        _relation_rule_46,
+        _relation_rule_47,
+        _relation_rule_48,
+        _relation_rule_49,
+        _relation_rule_50,
+        _relation_rule_51,
+        _relation_rule_52,
+        _relation_rule_53,
+        _relation_rule_54,
+        _relation_rule_55,
+        _relation_rule_56,
+        _relation_rule_57,
+        _relation_rule_58,
+        _relation_rule_59,
+        _relation_rule_60,
+        _relation_rule_61,
+        _relation_rule_62,
+        _relation_rule_63,
+        _relation_rule_64,
+        _relation_rule_65,
+        _relation_rule_66,
+        _relation_rule_67,
+        _relation_rule_68,
+        _relation_rule_69,
+        _relation_rule_70,
+        _relation_rule_71,
+        _relation_rule_72,
+        _relation_rule_73,
+        _relation_rule_74,
+        _relation_rule_75,
+        _relation_rule_76,
+        _relation_rule_77,
+        _relation_rule_78,
+        _relation_rule_79,
+        _relation_rule_80,
+        _relation_rule_81,
+        _relation_rule_82,
+        _relation_rule_83,
+        _relation_rule_84,
+        _relation_rule_85,
+        _relation_rule_86,
+        _relation_rule_87,
+        _relation_rule_88,
+        _relation_rule_89,
+        _relation_rule_90,
+        _relation_rule_91,
+        _relation_rule_92,
+        _relation_rule_93,
+        _relation_rule_94,
+        _relation_rule_95,
+        _relation_rule_96,
+        _relation_rule_97,
+        _relation_rule_98,
+        _relation_rule_99,
+        _relation_rule_100,
+        _relation_rule_101,
+        _relation_rule_102,
+        _relation_rule_103,
+        _relation_rule_104,
+        _relation_rule_105,
+        _relation_rule_106,
+        _relation_rule_107,
+        _relation_rule_108,
+        _relation_rule_109,
+        _relation_rule_110,
+        _relation_rule_111,
+        _relation_rule_112,
+        _relation_rule_113,
+        _relation_rule_114,
+        _relation_rule_115,
+        _relation_rule_116,
+        _relation_rule_117,
+        _relation_rule_118,
+        _relation_rule_119,
+        _relation_rule_120,
+        _relation_rule_121,
+        _relation_rule_122,
+        _relation_rule_123,
+        _relation_rule_124,
+        _relation_rule_125,
+        _relation_rule_126,
+        _relation_rule_127,
+        _relation_rule_128,
+        _relation_rule_129,
+        _relation_rule_130,
+        _relation_rule_131,
+        _relation_rule_132,
+        _relation_rule_133,
+        _relation_rule_134,
+        _relation_rule_135,
+        _relation_rule_136,
+        _relation_rule_137,
+        _relation_rule_138,
+        _relation_rule_139,
+        _relation_rule_140,
+        _relation_rule_141,
+        _relation_rule_142,
+        _relation_rule_143,
+        _relation_rule_144,
+        _relation_rule_145,
+        _relation_rule_146,
+        _relation_rule_147,
+        _relation_rule_148,
+        _relation_rule_149,
+        _relation_rule_150,
+        _relation_rule_151,
+        _relation_rule_152,
+        _relation_rule_153,
+        _relation_rule_154,
+        _relation_rule_155,
+        _relation_rule_156,
+        _relation_rule_157,
+        _relation_rule_158,
+        _relation_rule_159,
+        _relation_rule_160,
+        _relation_rule_161,
+        _relation_rule_162,
+        _relation_rule_163,
+        _relation_rule_164,
+        _relation_rule_165,
+        _relation_rule_166,
+        _relation_rule_167,
+        _relation_rule_168,
+        _relation_rule_169,
+        _relation_rule_170,
+        _relation_rule_171,
+        _relation_rule_172,
+        _relation_rule_173,
+        _relation_rule_174,
+        _relation_rule_175,
+        _relation_rule_176,
+        _relation_rule_177,
+        _relation_rule_178,
+        _relation_rule_179,
+        _relation_rule_180,
+    )
+    _relation_rules_dispatch = {
+        "FIXME": (26,),
+        "Fixme": (159,),
+        "access": (24, 25, 38, 147),
+        "addr:inclusion": (148,),
+        "aerialway": (38,),
+        "amenity": (38, 70, 71, 78, 91, 103, 104, 105),
+        "area": (85,),
+        "barrier": (0, 1, 38),
+        "bicycle_parking": (10,),
+        "board_type": (17,),
+        "branch:type": (126, 127, 128),
+        "bridge": (34,),
+        "bridge_name": (121,),
+        "building": (87, 88, 89, 92, 149, 151),
+        "building:color": (48,),
+        "building:colour": (50,),
+        "building:height": (139,),
+        "building:level": (44,),
+        "building:levels": (45,),
+        "building:min_height": (140,),
+        "building:part": (42,),
+        "building:roof:shape": (161,),
+        "building:type": (106, 107),
+        "changing_table": (119,),
+        "climbing:grade:UIAA": (156,),
+        "climbing:grade:UIAA:max": (154,),
+        "climbing:grade:UIAA:mean": (155,),
+        "climbing:grade:UIAA:min": (153,),
+        "contact:google_plus": (102,),
+        "craft": (38,),
+        "crossing": (122,),
+        "cuisine": (99, 157, 158),
+        "diaper": (111, 112),
+        "diaper:fee": (117,),
+        "diaper:female": (114,),
+        "diaper:male": (113,),
+        "diaper:unisex": (115,),
+        "diaper:wheelchair": (116,),
+        "distance": (62,),
+        "fee": (35,),
+        "fence_type": (16,),
+        "fixme": (26,),
+        "generator:location": (12,),
+        "generator:method": (13, 14, 15),
+        "generator:type": (150,),
+        "image": (177,),
+        "is_in": (96,),
+        "kerb": (137,),
+        "kitchen_hours": (100,),
+        "kp": (58, 60),
+        "landuse": (2, 38, 67, 82, 167),
+        "leisure": (38, 74, 98, 108),
+        "levels": (42, 43),
+        "lit": (35,),
+        "location": (11, 72),
+        "lock": (86,),
+        "man_made": (18, 73, 162, 163),
+        "manhole": (38,),
+        "measurement": (19, 20, 21),
+        "monitoring:river_level": (22,),
+        "name": (27,),
+        "natural": (93, 109, 143, 152),
+        "navigationaid": (141,),
+        "noexit": (81,),
+        "note": (28,),
+        "orientation": (179, 180),
+        "parking": (37, 38),
+        "parking:orientation": (178,),
+        "payment:ep_cash": (57,),
+        "payment:ep_chipknip": (57,),
+        "payment:ep_proton": (57,),
+        "payment:ep_quick": (57,),
+        "pk": (59, 61),
+        "place": (38,),
+        "playground": (38,),
+        "pole:type": (134,),
+        "police": (38,),
+        "postcode": (63,),
+        "power": (133,),
+        "protected_class": (46,),
+        "pump:type": (164, 165),
+        "recycling:metal": (123,),
+        "religion": (94,),
+        "reservoir_type": (2, 3, 4, 5),
+        "roof:color": (49,),
+        "roof:colour": (51,),
+        "roof:shape": (120,),
+        "school": (172,),
+        "seamark": (66,),
+        "seamark:type": (65,),
+        "service": (38, 80),
+        "service:bicycle:chaintool": (160,),
+        "shop": (6, 7, 8, 9, 38, 68, 69, 74, 75, 83, 95, 101, 104, 110, 124, 146),
+        "sloped_curb": (135, 136, 137),
+        "sport": (47, 56, 77, 97),
+        "stay": (23,),
+        "substance": (166,),
+        "supervised": (35,),
+        "surface": (171,),
+        "toilet": (174,),
+        "toilets": (175,),
+        "tower:type": (125, 127, 129, 130, 131, 132),
+        "traffic_calming": (38,),
+        "type": (29, 30, 32, 33, 176),
+        "unnamed": (138,),
+        "vending": (79, 84, 168, 169, 170),
+        "voltage-high": (173,),
+        "voltage-low": (173,),
+        "water": (64, 90, 142),
+        "waterway": (39, 40, 41, 144, 145),
+        "wood": (30, 31, 32, 33),
+    }
+    _relation_rules_fallback = (36, 52, 53, 54, 55, 76, 118)
 
 
 from plugins.PluginMapCSS import TestPluginMapcss
@@ -10,6 +10,36 @@ class Josm_geometry(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/geometry.mapcss"
 
+    tags_only = ["relation"]
+
+    interest_keys = {
+        "way": [
+            "amenity",
+            "door",
+            "emergency",
+            "entrance",
+            "highway",
+            "interval",
+            "landuse",
+            "line_arrangement",
+            "line_attachment",
+            "line_management",
+            "man_made",
+            "natural",
+            "power",
+            "railway",
+            "restriction",
+            "route",
+            "transformer",
+            "type",
+            "voltage:primary",
+            "voltage:secondary",
+            "voltage:tertiary",
+            "waterway",
+        ],
+        "relation": ["area", "landuse", "natural", "type"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -112,10 +142,10 @@ class Josm_geometry(PluginMapCSS):
             ),
         )
 
-        self.re_22f56734 = re.compile(
+        self.re_22f56734 = mapcss.lazy_regex(
             r"^(no_right_turn|no_left_turn|no_u_turn|no_straight_on|only_right_turn|only_left_turn|only_straight_on|no_entry|no_exit)$"
         )
-        self.re_76b0146b = re.compile(r"^(water|wetland)$")
+        self.re_76b0146b = mapcss.lazy_regex(r"^(water|wetland)$")
 
     def node(self, data, tags):
         capture_tags = {}
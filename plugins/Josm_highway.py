@@ -10,6 +10,36 @@ class Josm_highway(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/highway.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "way": [
+            "area",
+            "bicycle",
+            "cycleway",
+            "foot",
+            "footway",
+            "highway",
+            "maxspeed",
+            "name",
+            "railway",
+            "surface",
+            "turn",
+            "turn:backward",
+            "turn:both_ways",
+            "turn:both_ways:backward",
+            "turn:both_ways:forward",
+            "turn:forward",
+            "turn:lanes",
+            "turn:lanes:backward",
+            "turn:lanes:both_ways",
+            "turn:lanes:both_ways:backward",
+            "turn:lanes:both_ways:forward",
+            "turn:lanes:forward",
+        ],
+        "relation": ["highway", "surface"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -85,26 +115,28 @@ class Josm_highway(PluginMapCSS):
             ),
         )
 
-        self.re_015aabd5 = re.compile(
+        self.re_015aabd5 = mapcss.lazy_regex(
             r"^(unclassified|residential|living_street|service)$"
         )
-        self.re_23c50386 = re.compile(
+        self.re_23c50386 = mapcss.lazy_regex(
             r"^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$"
         )
-        self.re_3092b7ac = re.compile(r"^.*_link$")
-        self.re_33052a50 = re.compile(
+        self.re_3092b7ac = mapcss.lazy_regex(r"^.*_link$")
+        self.re_33052a50 = mapcss.lazy_regex(
             r"^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$"
         )
-        self.re_4186cb68 = re.compile(
+        self.re_4186cb68 = mapcss.lazy_regex(
             r"(?i).* (Ave|Blvd|Bnd|Br|Brg|Cct|Cir|Cl|Cr|Crct|Cres|Crt|Ct|Cv|Dr|Drv|Esp|Espl|Hwy|Ln|Mw|Mwy|Pky|Pkwy|Pl|Rd|Qy|Qys|Sq|St|Str|Ter|Tce|Tr|Trl|Vw|Wy|Xing)[.]?$"
         )
-        self.re_447f4d65 = re.compile(
+        self.re_447f4d65 = mapcss.lazy_regex(
             r"motorway|trunk|primary|secondary|tertiary|unclassified|residential|service|living_street|pedestrian|track|path|footway|cycleway|busway|bus_guideway|bridleway"
         )
-        self.re_4dcdb354 = re.compile(r"^footway:")
-        self.re_55b03910 = re.compile(r"^paving_stones:(\d+)$")
-        self.re_55ee32ac = re.compile(r"^(motorway|trunk|primary|secondary|tertiary)$")
-        self.re_5757d731 = re.compile(
+        self.re_4dcdb354 = mapcss.lazy_regex(r"^footway:")
+        self.re_55b03910 = mapcss.lazy_regex(r"^paving_stones:(\d+)$")
+        self.re_55ee32ac = mapcss.lazy_regex(
+            r"^(motorway|trunk|primary|secondary|tertiary)$"
+        )
+        self.re_5757d731 = mapcss.lazy_regex(
             r"^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$"
         )
 
@@ -10,6 +10,110 @@ class Josm_multiple(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/multiple.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "addr:housenumber",
+            "addr:street",
+            "alt_name",
+            "attribution",
+            "building:use",
+            "cuisine",
+            "destination",
+            "exit_to",
+            "fixme",
+            "highway",
+            "int_ref",
+            "lanes",
+            "maxspeed",
+            "name",
+            "note",
+            "old_ref",
+            "ref",
+            "route_ref",
+            "source",
+            "source:addr",
+            "source:maxspeed",
+            "source:name",
+            "source:position",
+            "source:postcode",
+            "source_ref",
+            "sport",
+            "surface",
+            "telecom:medium",
+            "traffic_sign",
+            "voltage",
+            "water",
+        ],
+        "way": [
+            "addr:housenumber",
+            "addr:street",
+            "alt_name",
+            "attribution",
+            "building:use",
+            "cuisine",
+            "destination",
+            "exit_to",
+            "fixme",
+            "highway",
+            "int_ref",
+            "lanes",
+            "maxspeed",
+            "name",
+            "note",
+            "old_ref",
+            "ref",
+            "route_ref",
+            "source",
+            "source:addr",
+            "source:maxspeed",
+            "source:name",
+            "source:position",
+            "source:postcode",
+            "source_ref",
+            "sport",
+            "surface",
+            "telecom:medium",
+            "traffic_sign",
+            "voltage",
+            "water",
+        ],
+        "relation": [
+            "addr:housenumber",
+            "addr:street",
+            "alt_name",
+            "attribution",
+            "building:use",
+            "cuisine",
+            "destination",
+            "exit_to",
+            "fixme",
+            "highway",
+            "int_ref",
+            "lanes",
+            "maxspeed",
+            "name",
+            "note",
+            "old_ref",
+            "ref",
+            "route_ref",
+            "source",
+            "source:addr",
+            "source:maxspeed",
+            "source:name",
+            "source:position",
+            "source:postcode",
+            "source_ref",
+            "sport",
+            "surface",
+            "telecom:medium",
+            "traffic_sign",
+            "voltage",
+            "water",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -32,8 +136,8 @@ class Josm_multiple(PluginMapCSS):
             ),
         )
 
-        self.re_53db61ac = re.compile(r".+;(.+)?")
-        self.re_579c7c6a = re.compile(r"^(;.*|.*;;.*|.*;)$")
+        self.re_53db61ac = mapcss.lazy_regex(r".+;(.+)?")
+        self.re_579c7c6a = mapcss.lazy_regex(r"^(;.*|.*;;.*|.*;)$")
 
     def node(self, data, tags):
         capture_tags = {}
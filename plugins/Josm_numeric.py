@@ -10,6 +10,8 @@ class Josm_numeric(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/numeric.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -192,85 +194,89 @@ class Josm_numeric(PluginMapCSS):
             ),
         )
 
-        self.re_066203d3 = re.compile(r"^[0-9]+$")
-        self.re_09e9525d = re.compile(r"^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$")
-        self.re_0ae2edfd = re.compile(
+        self.re_066203d3 = mapcss.lazy_regex(r"^[0-9]+$")
+        self.re_09e9525d = mapcss.lazy_regex(r"^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$")
+        self.re_0ae2edfd = mapcss.lazy_regex(
             r"^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$"
         )
-        self.re_0b0f0f56 = re.compile(r"^0$|^(-|\+)?[1-5]$")
-        self.re_0f74b227 = re.compile(r"^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$")
-        self.re_12c23878 = re.compile(
+        self.re_0b0f0f56 = mapcss.lazy_regex(r"^0$|^(-|\+)?[1-5]$")
+        self.re_0f74b227 = mapcss.lazy_regex(
+            r"^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$"
+        )
+        self.re_12c23878 = mapcss.lazy_regex(
             r"^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$"
         )
-        self.re_17733c6c = re.compile(
+        self.re_17733c6c = mapcss.lazy_regex(
             r"^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$"
         )
-        self.re_19ef4172 = re.compile(r"^([1-9][0-9]*(\.[0-9]+)? h)$")
-        self.re_1b78ea82 = re.compile(r"^([1-9][0-9]*(\.[0-9]+)? min)$")
-        self.re_21cf6a81 = re.compile(r"^-?[0-9]+,[0-9][0-9]?( m|\')?$")
-        self.re_23eb7c0d = re.compile(
+        self.re_19ef4172 = mapcss.lazy_regex(r"^([1-9][0-9]*(\.[0-9]+)? h)$")
+        self.re_1b78ea82 = mapcss.lazy_regex(r"^([1-9][0-9]*(\.[0-9]+)? min)$")
+        self.re_21cf6a81 = mapcss.lazy_regex(r"^-?[0-9]+,[0-9][0-9]?( m|\')?$")
+        self.re_23eb7c0d = mapcss.lazy_regex(
             r"^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$"
         )
-        self.re_270eb4ce = re.compile(
+        self.re_270eb4ce = mapcss.lazy_regex(
             r"^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$"
         )
-        self.re_288e587a = re.compile(r"^\+\d")
-        self.re_2a784076 = re.compile(r"^(([0-9]|[1-9][0-9]*)(\.5)?)$")
-        self.re_2b4f97f5 = re.compile(r"^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$")
-        self.re_2b84c9ab = re.compile(r"^[0-9]+,[0-9][0-9]?$")
-        self.re_330da7b0 = re.compile(r"^([1-9][0-9]*(\.[0-9]+)? hr)$")
-        self.re_33ecb9da = re.compile(
+        self.re_288e587a = mapcss.lazy_regex(r"^\+\d")
+        self.re_2a784076 = mapcss.lazy_regex(r"^(([0-9]|[1-9][0-9]*)(\.5)?)$")
+        self.re_2b4f97f5 = mapcss.lazy_regex(r"^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$")
+        self.re_2b84c9ab = mapcss.lazy_regex(r"^[0-9]+,[0-9][0-9]?$")
+        self.re_330da7b0 = mapcss.lazy_regex(r"^([1-9][0-9]*(\.[0-9]+)? hr)$")
+        self.re_33ecb9da = mapcss.lazy_regex(
             r"^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$"
         )
-        self.re_3c02ab12 = re.compile(r"^0*(\.0*)?( (m|ft))?$")
-        self.re_40277cab = re.compile(
+        self.re_3c02ab12 = mapcss.lazy_regex(r"^0*(\.0*)?( (m|ft))?$")
+        self.re_40277cab = mapcss.lazy_regex(
             r"^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$"
         )
-        self.re_41726192 = re.compile(
+        self.re_41726192 = mapcss.lazy_regex(
             r"^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$"
         )
-        self.re_43c55ce5 = re.compile(r"(.*[A-Za-z].*)|.*,.*|.*( ).*")
-        self.re_45b46d60 = re.compile(r"^-?[0-9]+(\.[0-9]+)?$")
-        self.re_45e73e1b = re.compile(r"^(up|down|-?([0-9]+?(\.[1-9]%)?|100)[%°]?)$")
-        self.re_470ea515 = re.compile(
+        self.re_43c55ce5 = mapcss.lazy_regex(r"(.*[A-Za-z].*)|.*,.*|.*( ).*")
+        self.re_45b46d60 = mapcss.lazy_regex(r"^-?[0-9]+(\.[0-9]+)?$")
+        self.re_45e73e1b = mapcss.lazy_regex(
+            r"^(up|down|-?([0-9]+?(\.[1-9]%)?|100)[%°]?)$"
+        )
+        self.re_470ea515 = mapcss.lazy_regex(
             r"^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$"
         )
-        self.re_4a678586 = re.compile(
+        self.re_4a678586 = mapcss.lazy_regex(
             r"^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$"
         )
-        self.re_4d44d8e0 = re.compile(
+        self.re_4d44d8e0 = mapcss.lazy_regex(
             r"^(0|[1-9][0-9]*(\.[0-9]+)?)( (kHz|MHz|GHz|THz))?$"
         )
-        self.re_52f27115 = re.compile(r"^([1-9][0-9]*(\.[0-9]+)?h)$")
-        self.re_5478d8af = re.compile(r"^[1-9]([0-9]*)$")
-        self.re_549d66c4 = re.compile(
+        self.re_52f27115 = mapcss.lazy_regex(r"^([1-9][0-9]*(\.[0-9]+)?h)$")
+        self.re_5478d8af = mapcss.lazy_regex(r"^[1-9]([0-9]*)$")
+        self.re_549d66c4 = mapcss.lazy_regex(
             r"^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$"
         )
-        self.re_55d147d6 = re.compile(r"^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$")
-        self.re_58d78904 = re.compile(r"^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$")
-        self.re_5a7f47b9 = re.compile(r"^-?[0-9]+\.[0-9][0-9][0-9]+$")
-        self.re_5a9b9c26 = re.compile(r"^(broad|standard|narrow)$")
-        self.re_5dbcb7bc = re.compile(
+        self.re_55d147d6 = mapcss.lazy_regex(r"^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$")
+        self.re_58d78904 = mapcss.lazy_regex(r"^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$")
+        self.re_5a7f47b9 = mapcss.lazy_regex(r"^-?[0-9]+\.[0-9][0-9][0-9]+$")
+        self.re_5a9b9c26 = mapcss.lazy_regex(r"^(broad|standard|narrow)$")
+        self.re_5dbcb7bc = mapcss.lazy_regex(
             r"^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$"
         )
-        self.re_5f1f731d = re.compile(
+        self.re_5f1f731d = mapcss.lazy_regex(
             r"^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$"
         )
-        self.re_6a0eca39 = re.compile(r"^[0-9]+,[0-9][0-9]?( m|\')?$")
-        self.re_6aa93c30 = re.compile(r"^[A-Z]{3}$")
-        self.re_6ae26377 = re.compile(r"([0-9.,]+) *.+")
-        self.re_70dc3282 = re.compile(r"^narrow_gauge$")
-        self.re_762a1d1d = re.compile(r"^-?[0-9]+(\.[0-9]+)? ?m$")
-        self.re_76fe90df = re.compile(
+        self.re_6a0eca39 = mapcss.lazy_regex(r"^[0-9]+,[0-9][0-9]?( m|\')?$")
+        self.re_6aa93c30 = mapcss.lazy_regex(r"^[A-Z]{3}$")
+        self.re_6ae26377 = mapcss.lazy_regex(r"([0-9.,]+) *.+")
+        self.re_70dc3282 = mapcss.lazy_regex(r"^narrow_gauge$")
+        self.re_762a1d1d = mapcss.lazy_regex(r"^-?[0-9]+(\.[0-9]+)? ?m$")
+        self.re_76fe90df = mapcss.lazy_regex(
             r"^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$"
         )
-        self.re_7afc6883 = re.compile(r"^[A-Z]{4}$")
-        self.re_7b1365b7 = re.compile(
+        self.re_7afc6883 = mapcss.lazy_regex(r"^[A-Z]{4}$")
+        self.re_7b1365b7 = mapcss.lazy_regex(
             r"^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)"
         )
-        self.re_7e626945 = re.compile(r"railway$")
-        self.re_7f163374 = re.compile(r"^(1|2|3|4|5|6|7|8|9|10|11|12)$")
-        self.re_7f19b94b = re.compile(
+        self.re_7e626945 = mapcss.lazy_regex(r"railway$")
+        self.re_7f163374 = mapcss.lazy_regex(r"^(1|2|3|4|5|6|7|8|9|10|11|12)$")
+        self.re_7f19b94b = mapcss.lazy_regex(
             r"^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$"
         )
 
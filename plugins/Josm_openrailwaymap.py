@@ -12,6 +12,40 @@ class Josm_openrailwaymap(PluginMapCSS):
         "https://www.openrailwaymap.org/validator/openrailwaymap.validator.mapcss"
     )
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "way": [
+            "bridge:name",
+            "bridge:wikipedia",
+            "building",
+            "description",
+            "detail",
+            "electrified",
+            "lanes",
+            "maxspeed",
+            "mph:maxspeed",
+            "name",
+            "name:de",
+            "name:fr",
+            "power:type",
+            "priority",
+            "radio",
+            "railway",
+            "railway:track_ref",
+            "railway:traffic_mode",
+            "ref",
+            "service",
+            "tracks",
+            "traffic_mode",
+            "tunnel:name",
+            "tunnel:wikipedia",
+            "usage",
+            "wikipedia",
+        ],
+        "relation": ["building", "railway", "type"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -317,20 +351,20 @@ class Josm_openrailwaymap(PluginMapCSS):
             title={"en": "Wrong tag for railway station building"},
         )
 
-        self.re_066203d3 = re.compile(r"^[0-9]+$")
-        self.re_0e3375d5 = re.compile(r"[Vv]iadu[ck]t")
-        self.re_14388f34 = re.compile(r"^[0-9]+[a-z]*.*")
-        self.re_18e8cc14 = re.compile(r"[Bb]rücke")
-        self.re_25833d04 = re.compile(r"[Bb]ridge")
-        self.re_32cef8e4 = re.compile(r".+:.+")
-        self.re_3d75a7eb = re.compile(r"^[Vv]oie [0-9]+[a-z]*.*")
-        self.re_4399527a = re.compile(r";")
-        self.re_473b08ca = re.compile(r"^railway:signal:")
-        self.re_4b2a9052 = re.compile(r"^[Tt]rack [0-9]+[a-z]*.*")
-        self.re_5bca804b = re.compile(r"[Tt]unnel")
-        self.re_61639c68 = re.compile(r"^(passenger|mixed)$")
-        self.re_63c39ff3 = re.compile(r"^[0-9]+ mph$")
-        self.re_7cf15856 = re.compile(r"^[Gg]leis [0-9]+[a-z]*.*")
+        self.re_066203d3 = mapcss.lazy_regex(r"^[0-9]+$")
+        self.re_0e3375d5 = mapcss.lazy_regex(r"[Vv]iadu[ck]t")
+        self.re_14388f34 = mapcss.lazy_regex(r"^[0-9]+[a-z]*.*")
+        self.re_18e8cc14 = mapcss.lazy_regex(r"[Bb]rücke")
+        self.re_25833d04 = mapcss.lazy_regex(r"[Bb]ridge")
+        self.re_32cef8e4 = mapcss.lazy_regex(r".+:.+")
+        self.re_3d75a7eb = mapcss.lazy_regex(r"^[Vv]oie [0-9]+[a-z]*.*")
+        self.re_4399527a = mapcss.lazy_regex(r";")
+        self.re_473b08ca = mapcss.lazy_regex(r"^railway:signal:")
+        self.re_4b2a9052 = mapcss.lazy_regex(r"^[Tt]rack [0-9]+[a-z]*.*")
+        self.re_5bca804b = mapcss.lazy_regex(r"[Tt]unnel")
+        self.re_61639c68 = mapcss.lazy_regex(r"^(passenger|mixed)$")
+        self.re_63c39ff3 = mapcss.lazy_regex(r"^[0-9]+ mph$")
+        self.re_7cf15856 = mapcss.lazy_regex(r"^[Gg]leis [0-9]+[a-z]*.*")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -10,6 +10,10 @@ class Josm_relation(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/relation.mapcss"
 
+    tags_only = ["relation"]
+
+    interest_keys = {"relation": ["type"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -17,7 +21,7 @@ class Josm_relation(PluginMapCSS):
             item=9007, level=3, tags=["tag", "relation"], title=mapcss.tr("missing tag")
         )
 
-        self.re_67b11051 = re.compile(r"^restriction")
+        self.re_67b11051 = mapcss.lazy_regex(r"^restriction")
 
     def relation(self, data, tags, members):
         capture_tags = {}
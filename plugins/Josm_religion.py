@@ -10,6 +10,14 @@ class Josm_religion(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/religion.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["religion"],
+        "way": ["religion"],
+        "relation": ["religion"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
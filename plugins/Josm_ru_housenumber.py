@@ -12,6 +12,14 @@ class Josm_ru_housenumber(PluginMapCSS):
 
     only_for = ["RU"]
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["addr:housenumber"],
+        "way": ["addr:housenumber"],
+        "relation": ["addr:housenumber"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -22,7 +30,7 @@ class Josm_ru_housenumber(PluginMapCSS):
             title=mapcss.tr("Номера домов не соответствующие принятому соглашению"),
         )
 
-        self.re_62d22c1b = re.compile(
+        self.re_62d22c1b = mapcss.lazy_regex(
             r"^((?:вл)?[0-9]+[А-Я]?(?:\/[0-9]+[А-Я]?)?(?: к[0-9А-Я]+)?(?: с[0-9А-Я]+)?(?: соор[0-9А-Я]+)?(?: лит[0-9А-Я]+)?(?: фл[0-9А-Я]+)?|[0-9]+-[0-9]+|[0-9]+[А-Я]?[\/-][0-9]+[А-Я]?[\/-][0-9]+[А-Я]?|(([0-9]+[А-Я]?[IXV]*)|[IXV]*)[\/-]([0-9]+[А-Я]?|[IXV]*)|ЗЯБ-[0-9]+|С-([0-9]+[А-Я]?(?:\/[0-9]+[А-Я]?)?|[IXV]*)|к[0-9А-Я]+)$"
         )
 
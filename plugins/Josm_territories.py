@@ -10,6 +10,14 @@ class Josm_territories(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/territories.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["addr:street", "name"],
+        "way": ["addr:street", "name"],
+        "relation": ["addr:street", "name", "type"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -23,10 +31,10 @@ class Josm_territories(PluginMapCSS):
             item=9009, level=2, tags=["tag"], title=mapcss.tr("street name contains ß")
         )
 
-        self.re_1596ad87 = re.compile(r"(?i).*spannungstrasse.*")
-        self.re_3d3faeb5 = re.compile(r"(?i).*Straße.*")
-        self.re_559797c8 = re.compile(r"(?i).*Strasser.*")
-        self.re_5b84a257 = re.compile(r"(?i).*Strasse.*")
+        self.re_1596ad87 = mapcss.lazy_regex(r"(?i).*spannungstrasse.*")
+        self.re_3d3faeb5 = mapcss.lazy_regex(r"(?i).*Straße.*")
+        self.re_559797c8 = mapcss.lazy_regex(r"(?i).*Strasser.*")
+        self.re_5b84a257 = mapcss.lazy_regex(r"(?i).*Strasse.*")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -10,6 +10,23 @@ class Josm_transport(PluginMapCSS):
 
     MAPCSS_URL = "https://github.com/Jungle-Bus/transport_mapcss/blob/master/transport.validator.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "amenity",
+            "bus",
+            "highway",
+            "network",
+            "note",
+            "note:fr",
+            "operator",
+            "public_transport",
+            "railway",
+        ],
+        "way": ["highway", "railway"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -164,11 +181,11 @@ class Josm_transport(PluginMapCSS):
             ),
         )
 
-        self.re_25554804 = re.compile(r"STIF|Kéolis|Véolia")
-        self.re_2fe0817d = re.compile(
+        self.re_25554804 = mapcss.lazy_regex(r"STIF|Kéolis|Véolia")
+        self.re_2fe0817d = mapcss.lazy_regex(
             r"^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$"
         )
-        self.re_6194d2a4 = re.compile(
+        self.re_6194d2a4 = mapcss.lazy_regex(
             r"^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$"
         )
 
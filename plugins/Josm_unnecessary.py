@@ -10,6 +10,8 @@ class Josm_unnecessary(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/unnecessary.mapcss"
 
+    tags_only = ["node", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -28,44 +30,46 @@ class Josm_unnecessary(PluginMapCSS):
             item=9010, level=3, tags=["tag"], title=mapcss.tr("descriptive name")
         )
 
-        self.re_003d7c7f = re.compile(r"^gpxx:")
-        self.re_017d2728 = re.compile(r"^(?i)(restaurant)$")
-        self.re_07d0fe8d = re.compile(
+        self.re_003d7c7f = mapcss.lazy_regex(r"^gpxx:")
+        self.re_017d2728 = mapcss.lazy_regex(r"^(?i)(restaurant)$")
+        self.re_07d0fe8d = mapcss.lazy_regex(
             r"^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$"
         )
-        self.re_0a40c79a = re.compile(r"^(?i)(Аптека|farmacia|pharmacy|pharmacie)$")
-        self.re_106eed50 = re.compile(r"^(?i)(shop|boutique)$")
-        self.re_10870b34 = re.compile(r"^(?i)(parc|park)$")
-        self.re_14b2be23 = re.compile(r"^(?i)(lycée)$")
-        self.re_1b9641aa = re.compile(r"^(?i)(post office)$")
-        self.re_1ba0f749 = re.compile(r"^(?i)(pond)$")
-        self.re_251cae80 = re.compile(r"^(?i)(parking|parkplatz)$")
-        self.re_29150b73 = re.compile(r"^(?i)(casa)$")
-        self.re_2b5b04af = re.compile(
+        self.re_0a40c79a = mapcss.lazy_regex(
+            r"^(?i)(Аптека|farmacia|pharmacy|pharmacie)$"
+        )
+        self.re_106eed50 = mapcss.lazy_regex(r"^(?i)(shop|boutique)$")
+        self.re_10870b34 = mapcss.lazy_regex(r"^(?i)(parc|park)$")
+        self.re_14b2be23 = mapcss.lazy_regex(r"^(?i)(lycée)$")
+        self.re_1b9641aa = mapcss.lazy_regex(r"^(?i)(post office)$")
+        self.re_1ba0f749 = mapcss.lazy_regex(r"^(?i)(pond)$")
+        self.re_251cae80 = mapcss.lazy_regex(r"^(?i)(parking|parkplatz)$")
+        self.re_29150b73 = mapcss.lazy_regex(r"^(?i)(casa)$")
+        self.re_2b5b04af = mapcss.lazy_regex(
             r"^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$"
         )
-        self.re_337f006b = re.compile(r"^(?i)(school|école|Школа)$")
-        self.re_33dfa05b = re.compile(r"^(?i)(church|église|biserica)$")
-        self.re_3ad2c525 = re.compile(r"^(?i)(école primaire)$")
-        self.re_3b098aea = re.compile(r"^gpx:")
-        self.re_480c7ba6 = re.compile(r"^(?i)(building|bangunan)$")
-        self.re_480ecdbb = re.compile(r"^(?i)(école élémentaire)$")
-        self.re_519078ac = re.compile(r"^(?i)(collège)$")
-        self.re_5276c7e0 = re.compile(r"^(?i)(house|maison|rumah|vivienda)$")
-        self.re_56dafa68 = re.compile(r"^(?i)(hydrant)$")
-        self.re_577104db = re.compile(r"^(?i)(kiosk)$")
-        self.re_58f52447 = re.compile(r"^(?i)(house|rumah|vivienda)$")
-        self.re_5b729ae4 = re.compile(r"^(?i)(toilets?)$")
-        self.re_644827a8 = re.compile(r"^(?i)(jalan)$")
-        self.re_6aa1e101 = re.compile(r"^gpxd:")
-        self.re_6d34128b = re.compile(r"^(?i)(АГЗС|АЗС)$")
-        self.re_702b1034 = re.compile(r"^(?i)(path)$")
-        self.re_73411d88 = re.compile(r"^(?i)(mosque|cami|masjid|مسجد)$")
-        self.re_740e0d70 = re.compile(r"^(?i)(école maternelle)$")
-        self.re_76c4f24d = re.compile(r"^(?i)(silo)$")
-        self.re_76f94888 = re.compile(r"^(?i)(monument aux morts|war memorial)$")
-        self.re_7c3e64db = re.compile(r"^(?i)(chapel|chapelle|kapelle)$")
-        self.re_7dc8f17a = re.compile(r"^(?i)(playground|spielplatz)$")
+        self.re_337f006b = mapcss.lazy_regex(r"^(?i)(school|école|Школа)$")
+        self.re_33dfa05b = mapcss.lazy_regex(r"^(?i)(church|église|biserica)$")
+        self.re_3ad2c525 = mapcss.lazy_regex(r"^(?i)(école primaire)$")
+        self.re_3b098aea = mapcss.lazy_regex(r"^gpx:")
+        self.re_480c7ba6 = mapcss.lazy_regex(r"^(?i)(building|bangunan)$")
+        self.re_480ecdbb = mapcss.lazy_regex(r"^(?i)(école élémentaire)$")
+        self.re_519078ac = mapcss.lazy_regex(r"^(?i)(collège)$")
+        self.re_5276c7e0 = mapcss.lazy_regex(r"^(?i)(house|maison|rumah|vivienda)$")
+        self.re_56dafa68 = mapcss.lazy_regex(r"^(?i)(hydrant)$")
+        self.re_577104db = mapcss.lazy_regex(r"^(?i)(kiosk)$")
+        self.re_58f52447 = mapcss.lazy_regex(r"^(?i)(house|rumah|vivienda)$")
+        self.re_5b729ae4 = mapcss.lazy_regex(r"^(?i)(toilets?)$")
+        self.re_644827a8 = mapcss.lazy_regex(r"^(?i)(jalan)$")
+        self.re_6aa1e101 = mapcss.lazy_regex(r"^gpxd:")
+        self.re_6d34128b = mapcss.lazy_regex(r"^(?i)(АГЗС|АЗС)$")
+        self.re_702b1034 = mapcss.lazy_regex(r"^(?i)(path)$")
+        self.re_73411d88 = mapcss.lazy_regex(r"^(?i)(mosque|cami|masjid|مسجد)$")
+        self.re_740e0d70 = mapcss.lazy_regex(r"^(?i)(école maternelle)$")
+        self.re_76c4f24d = mapcss.lazy_regex(r"^(?i)(silo)$")
+        self.re_76f94888 = mapcss.lazy_regex(r"^(?i)(monument aux morts|war memorial)$")
+        self.re_7c3e64db = mapcss.lazy_regex(r"^(?i)(chapel|chapelle|kapelle)$")
+        self.re_7dc8f17a = mapcss.lazy_regex(r"^(?i)(playground|spielplatz)$")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -10,6 +10,8 @@ class Josm_wikipedia(PluginMapCSS):
 
     MAPCSS_URL = "https://josm.openstreetmap.de/browser/josm/trunk/resources/data/validator/wikipedia.mapcss"
 
+    tags_only = ["node", "way", "relation"]
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -125,36 +127,36 @@ class Josm_wikipedia(PluginMapCSS):
             ),
         )
 
-        self.re_034ab801 = re.compile(r"^cz:")
-        self.re_04adb5d2 = re.compile(r"(?i).*%[0-9A-F][0-9A-F]")
-        self.re_07f8e639 = re.compile(r"(?i)^[-a-z]{2,12}:")
-        self.re_08b52119 = re.compile(r"(?i)^[-a-z]{2,12}:.*_")
-        self.re_091c4afa = re.compile(r"(?i)^[-a-z]{2,12}:https?:\/\/")
-        self.re_09a81144 = re.compile(r"(?i)^([-a-z]+:)?(.*)$")
-        self.re_1559839b = re.compile(r"(?i)^([-a-z]+:)(.+)$")
-        self.re_19995c46 = re.compile(r"(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]")
-        self.re_1ac7f364 = re.compile(r"^jbo:")
-        self.re_1f90813f = re.compile(r"^https?:\/\/")
-        self.re_210c6ccc = re.compile(r"%[0-9A-F][0-9A-F]")
-        self.re_2a71e33b = re.compile(r"(?i)^([-a-z]+:)wiki/(.*)$")
-        self.re_2d3d5d3d = re.compile(r"(?i)^[-a-z]{2,12}:https?:")
-        self.re_2dd1bee3 = re.compile(r"^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$")
-        self.re_4b567f18 = re.compile(r"^Q[1-9][0-9]{0,8}$")
-        self.re_536e5b67 = re.compile(r"(?i)^[-a-z]{2,12}: ")
-        self.re_53b6f173 = re.compile(r"^be-x-old:")
-        self.re_577ca7fb = re.compile(r"^cz:(.+)$")
-        self.re_5940ff7c = re.compile(r"^[-a-zA-Z]{2,12}:\p{Ll}")
-        self.re_62d51e93 = re.compile(r"(?i)^([-a-z]+:)([-a-z]+:)(.*)$")
-        self.re_644be9e0 = re.compile(r"(?i)^([-a-z]+:)?(.+)$")
-        self.re_676bdf5d = re.compile(r"(?i)^([-a-z]+:)(.*)$")
-        self.re_67a81e56 = re.compile(
+        self.re_034ab801 = mapcss.lazy_regex(r"^cz:")
+        self.re_04adb5d2 = mapcss.lazy_regex(r"(?i).*%[0-9A-F][0-9A-F]")
+        self.re_07f8e639 = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:")
+        self.re_08b52119 = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:.*_")
+        self.re_091c4afa = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:https?:\/\/")
+        self.re_09a81144 = mapcss.lazy_regex(r"(?i)^([-a-z]+:)?(.*)$")
+        self.re_1559839b = mapcss.lazy_regex(r"(?i)^([-a-z]+:)(.+)$")
+        self.re_19995c46 = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]")
+        self.re_1ac7f364 = mapcss.lazy_regex(r"^jbo:")
+        self.re_1f90813f = mapcss.lazy_regex(r"^https?:\/\/")
+        self.re_210c6ccc = mapcss.lazy_regex(r"%[0-9A-F][0-9A-F]")
+        self.re_2a71e33b = mapcss.lazy_regex(r"(?i)^([-a-z]+:)wiki/(.*)$")
+        self.re_2d3d5d3d = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:https?:")
+        self.re_2dd1bee3 = mapcss.lazy_regex(r"^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$")
+        self.re_4b567f18 = mapcss.lazy_regex(r"^Q[1-9][0-9]{0,8}$")
+        self.re_536e5b67 = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}: ")
+        self.re_53b6f173 = mapcss.lazy_regex(r"^be-x-old:")
+        self.re_577ca7fb = mapcss.lazy_regex(r"^cz:(.+)$")
+        self.re_5940ff7c = mapcss.lazy_regex(r"^[-a-zA-Z]{2,12}:\p{Ll}")
+        self.re_62d51e93 = mapcss.lazy_regex(r"(?i)^([-a-z]+:)([-a-z]+:)(.*)$")
+        self.re_644be9e0 = mapcss.lazy_regex(r"(?i)^([-a-z]+:)?(.+)$")
+        self.re_676bdf5d = mapcss.lazy_regex(r"(?i)^([-a-z]+:)(.*)$")
+        self.re_67a81e56 = mapcss.lazy_regex(
             r"^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):"
         )
-        self.re_67c3b565 = re.compile(r"(?i)^[-a-z]{2,12}:wiki\/")
-        self.re_6a4abd53 = re.compile(r"^be-x-old:(.+)$")
-        self.re_6a7e1973 = re.compile(r"(?i)^([-a-z]+:)(.)(.*)$")
-        self.re_79319bf9 = re.compile(r"^wikipedia:")
-        self.re_79a96753 = re.compile(r"^wikipedia:[-a-z]{2,12}$")
+        self.re_67c3b565 = mapcss.lazy_regex(r"(?i)^[-a-z]{2,12}:wiki\/")
+        self.re_6a4abd53 = mapcss.lazy_regex(r"^be-x-old:(.+)$")
+        self.re_6a7e1973 = mapcss.lazy_regex(r"(?i)^([-a-z]+:)(.)(.*)$")
+        self.re_79319bf9 = mapcss.lazy_regex(r"^wikipedia:")
+        self.re_79a96753 = mapcss.lazy_regex(r"^wikipedia:[-a-z]{2,12}$")
 
     def node(self, data, tags):
         capture_tags = {}
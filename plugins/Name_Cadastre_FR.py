@@ -8,6 +8,10 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Name_Cadastre_FR(PluginMapCSS):
 
+    tags_only = ["node", "way"]
+
+    interest_keys = {"node": ["name"], "way": ["name"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -20,7 +24,7 @@ class Name_Cadastre_FR(PluginMapCSS):
             ),
         )
 
-        self.re_5d724bf1 = re.compile(
+        self.re_5d724bf1 = mapcss.lazy_regex(
             r".+([- ]([Nn]ord|[Ss]ud$|[Ee]st|[Oo]uest|[Cc]entre))$"
         )
 
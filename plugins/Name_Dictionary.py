@@ -19,15 +19,59 @@
 #                                                                       ##
 ###########################################################################
 
+import inspect
+import os
+import pickle
 import re
+import unicodedata
 
+from modules import config
 from modules.OsmoseTranslation import T_
 from modules.Stablehash import stablehash64
 from plugins.Plugin import Plugin
 
+# Bump when the content of the compiled dictionaries changes
+dictionary_version = 1
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _fold(word):
+    # Without case nor accents
+    return "".join(
+        filter(
+            lambda c: not unicodedata.combining(c),
+            unicodedata.normalize("NFKD", word.casefold()),
+        )
+    )
+
+
+def _edits1(word, alphabet):
+    # Words at one deletion, transposition, substitution or insertion
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    for a, b in splits:
+        if b:
+            yield a + b[1:]
+            for c in alphabet:
+                if c != b[0]:
+                    yield a + c + b[1:]
+        if len(b) > 1:
+            yield a + b[1] + b[0] + b[2:]
+        for c in alphabet:
+            yield a + c + b
+
 
 class P_Name_Dictionary(Plugin):
 
+    # Shorter unknown words are too close to many others to be corrected
+    near_match_min_length = 6
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[703] = self.def_class(
@@ -44,12 +88,19 @@ class P_Name_Dictionary(Plugin):
             title=T_("Encoding problem"),
         )
 
+        self.DictUnknownWords = set()
+        self._folded = None
+        self._folded_common = None
+        self._near_matches = {}
+        if self.load_compiled_dictionaries():
+            return
+
         self.DictKnownWords = [""]
         self.DictCorrections = {}
-        self.DictUnknownWords = []
         self.DictCommonWords = [""]
         self.DictEncoding = {}
         self.apostrophe = None
+        self._dictionary_files = []
 
         self.init_dictionaries()
 
@@ -70,10 +121,125 @@ class P_Name_Dictionary(Plugin):
         #            self.DictCorrections.pop(k)
         #            break
 
-        self.DictKnownWords = set(self.DictKnownWords)
-        self.DictUnknownWords = set(self.DictUnknownWords)
+        self.DictKnownWords = frozenset(self.DictKnownWords)
+        self.DictCommonWords = frozenset(self.DictCommonWords)
+        self.save_compiled_dictionaries()
+
+    def _compiled_path(self):
+        return os.path.join(
+            config.dir_cache, "dictionary-{0}.pickle".format(self.__class__.__name__)
+        )
+
+    def _compiled_sources(self):
+        # Dictionary files and the plugin code building the dictionaries
+        sources = list(self._dictionary_files) + list(
+            map(
+                inspect.getsourcefile,
+                filter(
+                    lambda c: issubclass(c, P_Name_Dictionary),
+                    self.__class__.__mro__,
+                ),
+            )
+        )
+        return dict(map(lambda path: (path, _signature(path)), sources))
+
+    def load_compiled_dictionaries(self):
+        """
+        Load the dictionaries compiled by a previous run, if their sources did
+        not change.
+        """
+        try:
+            with open(self._compiled_path(), "rb") as f:
+                compiled = pickle.load(f)
+            if compiled["version"] != dictionary_version or any(
+                map(
+                    lambda source: _signature(source[0]) != source[1],
+                    compiled["sources"].items(),
+                )
+            ):
+                return False
+
+            self.DictKnownWords = compiled["known"]
+            self.DictCorrections = compiled["corrections"]
+            self.DictCommonWords = compiled["common"]
+            self.DictEncoding = compiled["encoding"]
+            self.apostrophe = compiled["apostrophe"]
+        except Exception:
+            # Missing, truncated or from another version: built again
+            return False
+        return True
+
+    def save_compiled_dictionaries(self):
+        path = self._compiled_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".{0}.tmp".format(os.getpid())
+            with open(tmp, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": dictionary_version,
+                        "sources": self._compiled_sources(),
+                        "known": self.DictKnownWords,
+                        "corrections": self.DictCorrections,
+                        "common": self.DictCommonWords,
+                        "encoding": self.DictEncoding,
+                        "apostrophe": self.apostrophe,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def suggest(self, word):
+        """
+        The known word only differing from word by case or accents, if there
+        is only one.
+        """
+        if self._folded is None:
+            self._folded = {}
+            for known in self.DictKnownWords:
+                self._folded.setdefault(_fold(known), []).append(known)
+        candidates = self._folded.get(_fold(word), [])
+        return candidates[0] if len(candidates) == 1 else None
+
+    def near_match(self, word):
+        """
+        Suggestion for an unknown word: the known word only adding accents to
+        it, else the common word at one edit, without case nor accents, if
+        there is only one.
+        """
+        if word in self._near_matches:
+            return self._near_matches[word]
+
+        suggestion = None
+        if _fold(word) == word.casefold():
+            # Without accents
+            suggestion = self.suggest(word)
+        if suggestion is None and len(word) >= self.near_match_min_length:
+            if self._folded_common is None:
+                self._folded_common = {}
+                for common in self.DictCommonWords:
+                    if common:
+                        self._folded_common.setdefault(_fold(common), []).append(common)
+                self._alphabet = sorted(set("".join(self._folded_common.keys())))
+            candidates = set()
+            for edit in _edits1(_fold(word), self._alphabet):
+                candidates.update(self._folded_common.get(edit, ()))
+            if len(candidates) == 1:
+                suggestion = candidates.pop()
+
+        if len(self._near_matches) >= 100000:
+            self._near_matches.clear()
+        self._near_matches[word] = suggestion
+        return suggestion
 
     def load_external_dictionaries(self, lang):
+        self._dictionary_files.append(
+            self.father.ToolsGetFilePath("dictionaries/{0}".format(lang))
+        )
+
         # Dictionaries
         for d in self.father.ToolsListDir("dictionaries/{0}".format(lang)):
             if d[-1] == "~":
@@ -83,6 +249,9 @@ class P_Name_Dictionary(Plugin):
             self.DictKnownWords += self.father.ToolsReadList(
                 "dictionaries/{0}/{1}".format(lang, d)
             )
+            self._dictionary_files.append(
+                self.father.ToolsGetFilePath("dictionaries/{0}/{1}".format(lang, d))
+            )
 
         # Corrections
         for d in self.father.ToolsListDir("dictionaries/{0}".format(lang)):
@@ -93,15 +262,24 @@ class P_Name_Dictionary(Plugin):
             self.DictCorrections.update(
                 self.father.ToolsReadDict("dictionaries/{0}/{1}".format(lang, d), ":")
             )
+            self._dictionary_files.append(
+                self.father.ToolsGetFilePath("dictionaries/{0}/{1}".format(lang, d))
+            )
 
         # Common words
+        known = set(self.DictKnownWords)
         self.DictCommonWords += [
             x
             for x in self.father.ToolsReadList(
                 "dictionaries/{0}/ResultCommonWords".format(lang)
             )
-            if x in self.DictKnownWords
+            if x in known
         ]
+        self._dictionary_files.append(
+            self.father.ToolsGetFilePath(
+                "dictionaries/{0}/ResultCommonWords".format(lang)
+            )
+        )
 
     def laod_numbering(self):
         # 1a 1b 1c
@@ -195,22 +373,25 @@ class P_Name_Dictionary(Plugin):
         if self.apostrophe:
             name = self.apostrophe.sub(" ", name)
 
-        for WordComplet in name.split(" "):
-            if WordComplet in self.DictCommonWords:
-                continue
-            elif WordComplet in self.DictKnownWords:
+        words = name.split(" ")
+        # All the words of the name at once, most names only have known words
+        unknown = set(words).difference(self.DictKnownWords, self.DictCommonWords)
+        if not unknown:
+            return
+
+        for WordComplet in words:
+            if WordComplet not in unknown:
                 continue
             elif WordComplet in self.DictCorrections:
-                if self.DictCorrections[WordComplet]:
+                correction = self.DictCorrections[WordComplet] or self.suggest(
+                    WordComplet
+                )
+                if correction:
                     return {
                         "class": 703,
                         "subclass": stablehash64(tag),
                         "text": {"en": WordComplet},
-                        "fix": {
-                            "name": initialName.replace(
-                                WordComplet, self.DictCorrections[WordComplet]
-                            )
-                        },
+                        "fix": {"name": initialName.replace(WordComplet, correction)},
                     }
                 else:
                     raise Exception(
@@ -248,6 +429,16 @@ class P_Name_Dictionary(Plugin):
                     continue
                 if "9" in WordComplet:
                     continue
+
+                # Case only changes are left to the other plugins
+                correction = self.near_match(WordComplet)
+                if correction and correction.casefold() != WordComplet.casefold():
+                    return {
+                        "class": 703,
+                        "subclass": stablehash64(tag),
+                        "text": {"en": WordComplet},
+                        "fix": {"name": initialName.replace(WordComplet, correction)},
+                    }
                 self.DictUnknownWords.add(WordComplet)
 
     def node(self, data, tags):
@@ -104,6 +104,9 @@ class Test(TestPluginCommon):
             ("199ème Avenue", None),
             ("\u00c3\u0087a", "Ça"),
             ("Ça", None),
+            ("Boulevrd Voltaire", "Boulevard Voltaire"),
+            ("Avneue des Lilas", "Avenue des Lilas"),
+            ("Etang Bleu", "Étang Bleu"),
         ]
         for n, f in name:
             rdp = a.node(None, {"name": n})
@@ -131,3 +134,59 @@ class Test(TestPluginCommon):
         a.DictCorrections["buebdgxrtsuei"] = None
         with pytest.raises(Exception):
             a.node({"name": "ceci est buebdgxrtsuei"})
+
+    def test_compiled(self):
+        import os
+        import pickle
+        import shutil
+        import tempfile
+
+        from analysers.analyser_sax import Analyser_Sax
+
+        class _config:
+            options = {"language": "fr"}
+
+        class father(Analyser_Sax):
+            config = _config()
+
+            def __init__(self):
+                pass
+
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        path = os.path.join(dirname, "dictionary.pickle")
+
+        def plugin():
+            p = Name_Dictionary_Lang_fr(father())
+            p._compiled_path = lambda: path
+            return p
+
+        a = plugin()
+        a.init(None)
+        self.assertTrue(os.path.exists(path))
+
+        # Loaded from the compiled dictionaries
+        b = plugin()
+        self.assertTrue(b.load_compiled_dictionaries())
+        b.init(None)
+        self.assertEqual(a.DictKnownWords, b.DictKnownWords)
+        self.assertEqual(a.DictCorrections, b.DictCorrections)
+        self.assertEqual(a.DictCommonWords, b.DictCommonWords)
+        self.assertEqual(a.DictEncoding, b.DictEncoding)
+        self.assertEqual(a.apostrophe.pattern, b.apostrophe.pattern)
+
+        # Near match as correction
+        self.assertEqual(b.suggest("FNAC"), "Fnac")
+        b.DictCorrections["FNAC"] = ""
+        fix = b.node(None, {"name": "Magasin FNAC"})[0]["fix"]["name"]
+        self.assertEqual(fix, "Magasin Fnac")
+
+        # Built again from a truncated or older compiled file
+        for content in (b"\x80\x05", pickle.dumps({"version": 1})):
+            with open(path, "wb") as f:
+                f.write(content)
+            c = plugin()
+            self.assertFalse(c.load_compiled_dictionaries())
+            c.init(None)
+            self.assertEqual(a.DictKnownWords, c.DictKnownWords)
+        self.assertTrue(plugin().load_compiled_dictionaries())
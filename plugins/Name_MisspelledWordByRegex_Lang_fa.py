@@ -8,6 +8,14 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["name", "name:fa"],
+        "way": ["name", "name:fa"],
+        "relation": ["name", "name:fa"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -18,8 +26,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
             title=mapcss.tr("Arabic letter detected in Farsi name"),
         )
 
-        self.re_4234bf3b = re.compile(r"ك")
-        self.re_5eeade1c = re.compile(r"ي")
+        self.re_4234bf3b = mapcss.lazy_regex(r"ك")
+        self.re_5eeade1c = mapcss.lazy_regex(r"ي")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -29,6 +29,7 @@ from plugins.Plugin import Plugin
 class Name_Multiple(Plugin):
 
     not_for = ["ES-O", "ES-NA", "ES-BI", "ES-SS", "ES-VI"]
+    interest_keys = {"way": ["name"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Name_Quotation(Plugin):
+    interest_keys = {"node": ["name"], "way": ["name"], "relation": ["name"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -33,6 +33,7 @@ from plugins.Plugin import Plugin
 
 
 class Name_Script(Plugin):
+    tags_only = ["node", "way", "relation"]
 
     def init(self, logger):
         Plugin.init(self, logger)
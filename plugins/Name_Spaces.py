@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 
 
 class Name_Spaces(Plugin):
+    interest_keys = {"node": ["name"], "way": ["name"], "relation": ["name"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
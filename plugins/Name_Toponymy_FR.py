@@ -28,6 +28,7 @@ class Name_Toponymy_FR(Plugin):
 
     only_for = ["FR", "NC"]
     not_for = ["FR-PF"]
+    interest_keys = {"node": ["name"], "way": ["name"], "relation": ["name"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
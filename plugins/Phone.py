@@ -27,6 +27,7 @@ from plugins.Plugin import Plugin
 
 
 class Phone(Plugin):
+    tags_only = ["node", "way", "relation"]
 
     PHONE_TAGS = set(("contact:fax", "contact:phone", "fax", "phone"))
 
@@ -8,6 +8,19 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Phone2(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": ["contact:email", "contact:fax", "contact:phone", "contact:website"],
+        "way": ["contact:email", "contact:fax", "contact:phone", "contact:website"],
+        "relation": [
+            "contact:email",
+            "contact:fax",
+            "contact:phone",
+            "contact:website",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
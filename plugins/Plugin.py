@@ -28,6 +28,14 @@ from modules.Stablehash import stablehash
 
 
 class Plugin(object):
+    # Methods with a result depending only on the tags of the object and on
+    # the options: the analyser can reuse it for the objects with the same
+    # tags. A subclass overriding one of them has to declare it again.
+    tags_only: List[str] = []
+    # Tag keys by method: without one of them in its tags, the method never
+    # reports an issue on an object. A subclass overriding the method has to
+    # declare it again.
+    interest_keys: Dict[str, List[str]] = {}
 
     def __init__(self, father):
         self.father = father
@@ -55,6 +63,46 @@ class Plugin(object):
             capabilities.append("relation")
         return capabilities
 
+    def _declaredMethodes(self, attribute):
+        """
+        Get the available methods not overridden since the class declaring
+        attribute.
+        """
+        currentClass = self.__class__
+        declaringClass = next(
+            filter(lambda c: attribute in c.__dict__, currentClass.__mro__)
+        )
+        return list(
+            filter(
+                lambda m: getattr(currentClass, m) is getattr(declaringClass, m),
+                self.availableMethodes(),
+            )
+        )
+
+    def tagsOnlyMethodes(self):
+        """
+        Get the available methods declared in tags_only, and not overridden
+        since.
+        """
+        return list(
+            filter(lambda m: m in self.tags_only, self._declaredMethodes("tags_only"))
+        )
+
+    def interestKeys(self):
+        """
+        Get the tag keys of the available methods declared in interest_keys,
+        and not overridden since.
+        """
+        return dict(
+            map(
+                lambda m: (m, frozenset(self.interest_keys[m])),
+                filter(
+                    lambda m: m in self.interest_keys,
+                    self._declaredMethodes("interest_keys"),
+                ),
+            )
+        )
+
     def node(self, node: Dict[str, Union[str, int]], tags: Dict[str, str]):
         """
         Called each time a node is found on data source.
@@ -343,3 +391,47 @@ class Test(TestPluginCommon):
 
         a = Plugin_with_all(None)
         self.assertEqual(a.availableMethodes(), ["node", "way", "relation"])
+
+    def test_tagsOnlyMethodes(self):
+        class Plugin_tags_only(Plugin):
+            tags_only = ["node", "way"]
+
+            def node(self, node, tags):
+                pass  # pragma: no cover
+
+            def relation(self, relation, tags, members):
+                pass  # pragma: no cover
+
+        a = Plugin_tags_only(None)
+        self.assertEqual(a.tagsOnlyMethodes(), ["node"])
+
+        class Plugin_tags_only_override(Plugin_tags_only):
+            def node(self, node, tags):
+                pass  # pragma: no cover
+
+        a = Plugin_tags_only_override(None)
+        self.assertEqual(a.tagsOnlyMethodes(), [])
+
+        self.assertEqual(Plugin(None).tagsOnlyMethodes(), [])
+
+    def test_interestKeys(self):
+        class Plugin_interest_keys(Plugin):
+            interest_keys = {"node": ["amenity", "shop"], "way": ["highway"]}
+
+            def node(self, node, tags):
+                pass  # pragma: no cover
+
+            def relation(self, relation, tags, members):
+                pass  # pragma: no cover
+
+        a = Plugin_interest_keys(None)
+        self.assertEqual(a.interestKeys(), {"node": frozenset(["amenity", "shop"])})
+
+        class Plugin_interest_keys_override(Plugin_interest_keys):
+            def node(self, node, tags):
+                pass  # pragma: no cover
+
+        a = Plugin_interest_keys_override(None)
+        self.assertEqual(a.interestKeys(), {})
+
+        self.assertEqual(Plugin(None).interestKeys(), {})
@@ -8,6 +8,10 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class Power(PluginMapCSS):
 
+    tags_only = ["node", "relation"]
+
+    interest_keys = {"node": ["power", "voltage"], "relation": ["power"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
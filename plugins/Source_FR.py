@@ -29,6 +29,11 @@ from plugins.Plugin import Plugin
 class Source_FR(Plugin):
 
     only_for = ["FR"]
+    interest_keys = {
+        "node": ["source"],
+        "way": ["source", "boundary"],
+        "relation": ["source"],
+    }
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Structural_Multipolygon(Plugin):
+    interest_keys = {"relation": ["type"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Structural_UnclosedArea(Plugin):
+    interest_keys = {"way": ["area"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
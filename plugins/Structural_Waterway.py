@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class Structural_Waterway(Plugin):
+    interest_keys = {"way": ["waterway"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
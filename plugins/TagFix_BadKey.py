@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 
 
 class TagFix_BadKey(Plugin):
+    tags_only = ["node", "way", "relation"]
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -20,7 +20,7 @@
 ###########################################################################
 
 from modules.OsmoseTranslation import T_
-from plugins.modules.name_suggestion_index import download_nsi
+from plugins.modules.name_suggestion_index import nsi_for_country
 from plugins.Plugin import Plugin, TestPluginCommon
 
 
@@ -66,7 +66,7 @@ If not, see if you can improve the [name-suggestion-index project](https://githu
             self.father.config.options.get("country").split("-")[0].lower()
         )
 
-        nsi = download_nsi()
+        nsi = nsi_for_country(self.country_code)
         self.brands_from_nsi = self._parse_category_from_nsi(nsi, "brands/", "brand")
         self.operators_from_nsi = self._parse_category_from_nsi(
             nsi, "operators/", "operator"
@@ -77,20 +77,8 @@ If not, see if you can improve the [name-suggestion-index project](https://githu
         for tag, details in nsi.items():
             if tag.startswith(nsiprefix) and "items" in details:
                 nsi_name = tag[len(nsiprefix) :]
+                # Only the presets of the country, from nsi_for_country()
                 for preset in details["items"]:
-                    if "locationSet" in preset:
-                        if (
-                            "include" in preset["locationSet"]
-                            and self.country_code
-                            not in preset["locationSet"]["include"]
-                            and "001" not in preset["locationSet"]["include"]
-                        ):
-                            continue
-                        if (
-                            "exclude" in preset["locationSet"]
-                            and self.country_code in preset["locationSet"]["exclude"]
-                        ):
-                            continue
                     if "matchTags" in preset:
                         for additional_tag in preset["matchTags"]:
                             nsi_key = "{}|{}".format(
@@ -8,6 +8,10 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class TagFix_Destination(PluginMapCSS):
 
+    tags_only = ["way"]
+
+    interest_keys = {"way": ["destination", "highway", "waterway"]}
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -20,10 +24,10 @@ class TagFix_Destination(PluginMapCSS):
             ),
         )
 
-        self.re_262d3d80 = re.compile(r"\|")
-        self.re_49b44b3d = re.compile(r"^destination:lanes")
-        self.re_53d7e349 = re.compile(r"^destination:")
-        self.re_60b51c01 = re.compile(r"^destination:.*:lanes")
+        self.re_262d3d80 = mapcss.lazy_regex(r"\|")
+        self.re_49b44b3d = mapcss.lazy_regex(r"^destination:lanes")
+        self.re_53d7e349 = mapcss.lazy_regex(r"^destination:")
+        self.re_60b51c01 = mapcss.lazy_regex(r"^destination:.*:lanes")
 
     def way(self, data, tags, nds):
         capture_tags = {}
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class TagFix_Maxspeed(Plugin):
+    interest_keys = {"way": ["maxspeed"]}
 
     maxspeed_table_default = {
         "urban": ["50"],
@@ -8,6 +8,40 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class TagFix_MultipleTag2(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "barrier",
+            "bridge",
+            "building",
+            "crossing",
+            "highway",
+            "leisure",
+            "name",
+            "natural",
+            "recycling:glass",
+            "tunnel",
+        ],
+        "way": [
+            "area",
+            "attraction",
+            "barrier",
+            "bridge",
+            "building",
+            "covered",
+            "fee",
+            "highway",
+            "junction",
+            "leisure",
+            "level",
+            "name",
+            "oneway",
+            "recycling:glass",
+            "tunnel",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -152,11 +186,11 @@ class TagFix_MultipleTag2(PluginMapCSS):
             title=mapcss.tr("suspicious tag combination"),
         )
 
-        self.re_066203d3 = re.compile(r"^[0-9]+$")
-        self.re_2ae49e65 = re.compile(
+        self.re_066203d3 = mapcss.lazy_regex(r"^[0-9]+$")
+        self.re_2ae49e65 = mapcss.lazy_regex(
             r"^(motorway_link|trunk_link|primary|primary_link|secondary|secondary_link)$"
         )
-        self.re_5955bda1 = re.compile(r"^(no|informal)$")
+        self.re_5955bda1 = mapcss.lazy_regex(r"^(no|informal)$")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -29,6 +29,11 @@ from plugins.Plugin import Plugin
 class TagFix_Note_Lang_fr(Plugin):
 
     only_for = ["fr"]
+    interest_keys = {
+        "node": ["note", "comment"],
+        "way": ["note", "comment"],
+        "relation": ["note", "comment"],
+    }
 
     def normalize(self, s):
         return "".join(
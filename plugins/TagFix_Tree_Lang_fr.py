@@ -30,6 +30,7 @@ from plugins.Plugin import Plugin
 class TagFix_Tree_Lang_fr(Plugin):
 
     only_for = ["fr"]
+    interest_keys = {"node": ["natural"], "way": ["natural"], "relation": ["natural"]}
 
     def strip_accents(self, s):
         return "".join(
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class TagRemove_Layer(Plugin):
+    interest_keys = {"way": ["layer"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
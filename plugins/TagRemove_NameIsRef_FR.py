@@ -28,6 +28,7 @@ from plugins.Plugin import Plugin
 class TagRemove_NameIsRef_FR(Plugin):
 
     only_for = ["FR"]
+    interest_keys = {"way": ["name"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
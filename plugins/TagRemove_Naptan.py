@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 class TagRemove_Naptan(Plugin):
 
     only_for = ["GB"]
+    interest_keys = {"node": ["naptan:verified"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class TagRemove_OpenSeaMap(Plugin):
+    interest_keys = {"node": ["seamark:fixme"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -24,6 +24,7 @@ from plugins.Plugin import Plugin
 
 
 class TagRemove_Roundabout(Plugin):
+    interest_keys = {"way": ["junction"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
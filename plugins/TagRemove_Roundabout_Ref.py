@@ -26,6 +26,7 @@ from plugins.Plugin import Plugin
 class TagRemove_Roundabout_Ref(Plugin):
 
     only_for = ["FR", "NC"]
+    interest_keys = {"way": ["junction"]}
 
     def init(self, logger):
         Plugin.init(self, logger)
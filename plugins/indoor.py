@@ -8,6 +8,14 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class indoor(PluginMapCSS):
 
+    tags_only = ["node", "relation"]
+
+    interest_keys = {
+        "node": ["indoor", "room"],
+        "way": ["indoor", "room", "shop"],
+        "relation": ["indoor", "room", "type"],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
@@ -57,7 +65,7 @@ class indoor(PluginMapCSS):
             ),
         )
 
-        self.re_2a047336 = re.compile(r"room|corridor|area|level")
+        self.re_2a047336 = mapcss.lazy_regex(r"room|corridor|area|level")
 
     def node(self, data, tags):
         capture_tags = {}
@@ -24,41 +24,141 @@
 # This module file contains functions to read out the data from the
 # name suggestion index (NSI) for Osmose - https://nsi.guide/
 
+import functools
 import json
 
-from modules.downloader import urlread
+from modules import downloader
+
+nsi_url = (
+    "https://raw.githubusercontent.com/osmlab/name-suggestion-index/main/dist/nsi.json"
+)
 
 
 # Downloads and returns the parsed NSI database
 def download_nsi():
-    nsi_url = "https://raw.githubusercontent.com/osmlab/name-suggestion-index/main/dist/nsi.json"
-    json_str = urlread(nsi_url, 30)
+    json_str = downloader.urlread(nsi_url, 30)
     results = json.loads(json_str)
     return results["nsi"]
 
 
+# Returns the NSI database with only the presets of a country, in the same
+# format as download_nsi(). Built once by NSI download and country, then
+# shared by the plugins and the runs.
+# country: the lowercase 2-letter country code of the country of interest
+@functools.lru_cache(maxsize=None)
+def nsi_for_country(country):
+    return downloader.derived(
+        nsi_url,
+        30,
+        "country-" + country,
+        lambda path: _filter_country(_load_nsi(path), country),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_nsi(path):
+    # Only parsed once by process, for all the countries built
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["nsi"]
+
+
+def _filter_country(nsi, country):
+    filtered = {}
+    for tag, details in nsi.items():
+        if "items" not in details:
+            continue
+        items = list(
+            filter(lambda preset: _in_country(preset, country), details["items"])
+        )
+        if items:
+            filtered[tag] = {"items": items}
+    return filtered
+
+
+def _in_country(preset, country):
+    if "locationSet" in preset:
+        if (
+            "include" in preset["locationSet"]
+            and country not in preset["locationSet"]["include"]
+            and "001" not in preset["locationSet"]["include"]
+        ):  # 001 = worldwide
+            return False
+        if (
+            "exclude" in preset["locationSet"]
+            and country in preset["locationSet"]["exclude"]
+        ):
+            return False
+    return True
+
+
 # Gets all valid (shop, amenity, ...) names that exist within a certain country
 # country: the lowercase 2-letter country code of the country of interest
-# nsi: the parsed NSI database obtained from download_nsi()
+# nsi: the parsed NSI database obtained from download_nsi(), by default the
+# one of the country from nsi_for_country()
 # nsiprefix: 'brands/', 'operators/', 'flags/' or 'transit/'
-def whitelist_from_nsi(country, nsi=download_nsi(), nsiprefix="brands/"):
+def whitelist_from_nsi(country, nsi=None, nsiprefix="brands/"):
+    if nsi is None:
+        nsi = nsi_for_country(country)
+    else:
+        nsi = _filter_country(nsi, country)
     whitelist = set()
     for tag, details in nsi.items():
-        if tag.startswith(nsiprefix) and "items" in details:
+        if tag.startswith(nsiprefix):
             for preset in details["items"]:
-                if "locationSet" in preset:
-                    if (
-                        "include" in preset["locationSet"]
-                        and country not in preset["locationSet"]["include"]
-                        and "001" not in preset["locationSet"]["include"]
-                    ):  # 001 = worldwide
-                        continue
-                    if (
-                        "exclude" in preset["locationSet"]
-                        and country in preset["locationSet"]["exclude"]
-                    ):
-                        continue
                 if "name" in preset["tags"]:
                     whitelist.add(preset["tags"]["name"])
                 whitelist.add(preset["displayName"])
     return whitelist
+
+
+###########################################################################
+import unittest
+
+
+class Test(unittest.TestCase):
+    nsi = {
+        "brands/shop/supermarket": {
+            "items": [
+                {
+                    "displayName": "Everywhere",
+                    "locationSet": {"include": ["001"]},
+                    "tags": {"name": "Everywhere"},
+                },
+                {
+                    "displayName": "French",
+                    "locationSet": {"include": ["fr"]},
+                    "tags": {},
+                },
+                {
+                    "displayName": "Not French",
+                    "locationSet": {"include": ["001"], "exclude": ["fr"]},
+                    "tags": {"name": "Not French name"},
+                },
+            ]
+        },
+        "operators/amenity/bank": {
+            "items": [
+                {
+                    "displayName": "German",
+                    "locationSet": {"include": ["de"]},
+                    "tags": {},
+                },
+            ]
+        },
+    }
+
+    def test_filter_country(self):
+        fr = _filter_country(self.nsi, "fr")
+        self.assertEqual(list(fr.keys()), ["brands/shop/supermarket"])
+        self.assertEqual(
+            whitelist_from_nsi("fr", fr), whitelist_from_nsi("fr", self.nsi)
+        )
+        self.assertEqual(whitelist_from_nsi("fr", fr), set(["Everywhere", "French"]))
+        self.assertEqual(
+            whitelist_from_nsi("de", self.nsi),
+            set(["Everywhere", "Not French", "Not French name"]),
+        )
+        self.assertEqual(
+            whitelist_from_nsi("de", _filter_country(self.nsi, "de"), "operators/"),
+            set(["German"]),
+        )
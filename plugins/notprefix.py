@@ -8,6 +8,41 @@ from plugins.PluginMapCSS import PluginMapCSS
 
 class notprefix(PluginMapCSS):
 
+    tags_only = ["node", "way", "relation"]
+
+    interest_keys = {
+        "node": [
+            "addr:postcode",
+            "brand:wikidata",
+            "designation",
+            "highway",
+            "name",
+            "network",
+            "network:wikidata",
+            "not:operator:wikidata",
+        ],
+        "way": [
+            "addr:postcode",
+            "brand:wikidata",
+            "designation",
+            "highway",
+            "name",
+            "network",
+            "network:wikidata",
+            "not:operator:wikidata",
+        ],
+        "relation": [
+            "addr:postcode",
+            "brand:wikidata",
+            "designation",
+            "highway",
+            "name",
+            "network",
+            "network:wikidata",
+            "not:operator:wikidata",
+        ],
+    }
+
     def init(self, logger):
         super().init(logger)
         tags = capture_tags = {}  # noqa
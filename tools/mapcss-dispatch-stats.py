@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Compile a MapCSS validator file once as a flat sequence of rules and once
+# with the rules dispatched on the object keys, then run both plugins on OSM
+# PBF files. Report the number of rules evaluated per object and the time
+# spent by each version, and check they report the same issues.
+#
+# Usage, from the root of the repository:
+#   PYTHONPATH=. tools/mapcss-dispatch-stats.py plugins/Colour.validator.mapcss tests/*.osm.pbf
+
+import argparse
+import importlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import modules.mapcss_lib as mapcss
+from mapcss import mapcss2osmose
+from modules.OsmPbf import OsmPbfReader
+from modules.OsmReader import dummylog
+
+
+class _config:
+    options = {"country": None, "language": None}
+
+
+class father:
+    config = _config()
+
+
+def load_plugin(mapcss_file, path, dispatch_min_rules):
+    # Reset the compiler global state, as mapcss/update.py does
+    importlib.reload(mapcss2osmose)
+    mapcss2osmose.mapcss2osmose(
+        mapcss=mapcss_file, output_path=path, dispatch_min_rules=dispatch_min_rules
+    )
+    class_name = os.path.basename(mapcss_file).split(".")[0]
+    spec = importlib.util.spec_from_file_location(
+        class_name + str(dispatch_min_rules), path + "/" + class_name + ".py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    plugin = getattr(module, class_name)(father())
+    plugin.father = father()
+    plugin.init(None)
+    return plugin
+
+
+class Objects:
+    def __init__(self):
+        self.objects = []
+
+    def NodeCreate(self, data):
+        self.objects.append(("node", (data, data["tag"])))
+
+    def WayCreate(self, data):
+        self.objects.append(("way", (data, data["tag"], data["nd"])))
+
+    def RelationCreate(self, data):
+        self.objects.append(("relation", (data, data["tag"], data["member"])))
+
+
+def run(plugin, objects):
+    errors = []
+    start = time.perf_counter()
+    for t, args in objects:
+        if hasattr(plugin, t):
+            errors.append(getattr(plugin, t)(*args))
+    return time.perf_counter() - start, errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare MapCSS plugins compiled with and without key dispatch"
+    )
+    parser.add_argument("mapcss", help="MapCSS validator file")
+    parser.add_argument("pbf", nargs="+", help="OSM PBF files to read")
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp()
+    try:
+        # Compile under a name not in mapcss/item_map.py, to leave it untouched
+        mapcss_file = path + "/Dispatch_Stats.validator.mapcss"
+        shutil.copy(args.mapcss, mapcss_file)
+        flat = load_plugin(mapcss_file, path, sys.maxsize)
+        dispatch = load_plugin(mapcss_file, path, 0)
+    finally:
+        shutil.rmtree(path)
+
+    objects = Objects()
+    for pbf in args.pbf:
+        OsmPbfReader(pbf, dummylog()).CopyTo(objects)
+    objects = objects.objects
+
+    print(
+        "{0:<10} {1:>10} {2:>16} {3:>16}".format(
+            "type", "objects", "flat rules/obj", "dispatch rules/obj"
+        )
+    )
+    for t in ("node", "way", "relation"):
+        if not hasattr(dispatch, t):
+            continue
+        keys = list(map(lambda o: o[1][1].keys(), filter(lambda o: o[0] == t, objects)))
+        evaluated = sum(
+            map(
+                lambda k: len(
+                    mapcss._dispatch_rules(
+                        getattr(dispatch, "_" + t + "_rules_dispatch"),
+                        getattr(dispatch, "_" + t + "_rules_fallback"),
+                        k,
+                    )
+                ),
+                keys,
+            )
+        )
+        print(
+            "{0:<10} {1:>10} {2:>16.2f} {3:>16.2f}".format(
+                t,
+                len(keys),
+                len(getattr(dispatch, "_" + t + "_rules")),
+                evaluated / max(1, len(keys)),
+            )
+        )
+
+    flat_time, flat_errors = min(
+        map(lambda _: run(flat, objects), range(3)), key=lambda r: r[0]
+    )
+    dispatch_time, dispatch_errors = min(
+        map(lambda _: run(dispatch, objects), range(3)), key=lambda r: r[0]
+    )
+    print("flat     {0:.3f}s".format(flat_time))
+    print("dispatch {0:.3f}s".format(dispatch_time))
+    if repr(flat_errors) != repr(dispatch_errors):
+        print("E: flat and dispatch plugins report different issues")
+        sys.exit(1)
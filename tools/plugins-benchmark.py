@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Measure the throughput of the SAX plugins, in objects per second, on the
+# objects of OSM PBF files and on a larger synthetic corpus made from their
+# tags. Each method of each plugin is run alone, then all the plugins through
+# Analyser_Sax, with and without the tags cache. Results can be saved as a JSON baseline, and compared to it:
+# the exit code is 1 when a throughput drops by more than --max-regression
+# percent. Baselines are only comparable on the same machine.
+#
+# Usage, from the root of the repository:
+#   PYTHONPATH=. tools/plugins-benchmark.py --save benchmark.json
+#   PYTHONPATH=. tools/plugins-benchmark.py --baseline benchmark.json
+#   PYTHONPATH=. tools/plugins-benchmark.py --country FR --language fr Josm_deprecated Colour
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import time
+
+from analysers.analyser_sax import Analyser_Sax, _TagsMemo
+from modules import OsmoseLog, PluginManifest, config
+from modules.OsmPbf import OsmPbfReader
+from modules.OsmReader import dummylog
+
+METHODS = ("node", "way", "relation")
+
+
+class NullIssues:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class MockupReader:
+    def NodeGet(self, id):
+        return None
+
+    def WayGet(self, id, dump_sub_elements=False):
+        return None
+
+    def RelationGet(self, id, dump_sub_elements=False):
+        return None
+
+    def UserGet(self, id):
+        return None
+
+
+class Objects:
+    def __init__(self):
+        self.objects = {"node": [], "way": [], "relation": []}
+
+    def NodeCreate(self, data):
+        self.objects["node"].append(data)
+
+    def WayCreate(self, data):
+        self.objects["way"].append(data)
+
+    def RelationCreate(self, data):
+        self.objects["relation"].append(data)
+
+
+def synthetic(objects, size, seed=0):
+    """
+    size objects made from the tags of objects: the tags of a random object
+    of the same type, with some values from other objects and an extra tag.
+    """
+    rng = random.Random(seed)
+    values = {}
+    for t in METHODS:
+        for o in objects[t]:
+            for k, v in o["tag"].items():
+                values.setdefault(k, []).append(v)
+    keys = sorted(values.keys())
+
+    total = sum(map(lambda t: len(objects[t]), METHODS))
+    result = {}
+    id = 0
+    for t in METHODS:
+        tagged = list(filter(lambda o: o["tag"], objects[t]))
+        result[t] = []
+        if not tagged:
+            continue
+        for _ in range(size * len(objects[t]) // total):
+            id += 1
+            o = dict(rng.choice(tagged))
+            tags = dict(o["tag"])
+            for k in list(tags.keys()):
+                if rng.random() < 0.3:
+                    tags[k] = rng.choice(values[k])
+            k = rng.choice(keys)
+            tags[k] = rng.choice(values[k])
+            o["id"] = id
+            o["tag"] = tags
+            result[t].append(o)
+    return result
+
+
+def make_config(plugins, options, tags_cache_size=0):
+    class _config:
+        pass
+
+    c = _config()
+    c.options = options
+    c.plugins = plugins
+    c.sax_tags_cache_size = tags_cache_size
+    c.error_file = NullIssues()
+    c.reader = MockupReader()
+    c.source_url = "http://example.com"
+    c.src = None
+    return c
+
+
+def load_plugins(names, options, logger):
+    plugins = {}
+    for name in names:
+        try:
+            analyser = Analyser_Sax(make_config([name], options), logger)
+        except Exception as e:
+            print("skip {0}: {1}".format(name, repr(e)[:100]), file=sys.stderr)
+            continue
+        analyser._load_reader()
+        if name in analyser.plugins:
+            plugins[name] = analyser.plugins[name]
+    return plugins
+
+
+def args_of(t, o):
+    if t == "node":
+        return (o, o["tag"])
+    elif t == "way":
+        return (o, o["tag"], o["nd"])
+    else:
+        return (o, o["tag"], o["member"])
+
+
+def throughput(f, objects, repeat):
+    # Best of repeat runs
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f(objects)
+        t = time.perf_counter() - start
+        best = t if best is None else min(best, t)
+    return len(objects) / best if best else float("inf")
+
+
+def bench_plugin(plugin, t, objects, repeat):
+    method = getattr(plugin, t)
+    args = list(map(lambda o: args_of(t, o), objects))
+
+    def run(args):
+        for a in args:
+            method(*a)
+
+    return throughput(run, args, repeat)
+
+
+def bench_analyser(plugins, options, logger, objects, repeat, tags_cache_size=0):
+    all_objects = sum(
+        map(lambda t: list(map(lambda o: (t, o), objects[t])), METHODS), []
+    )
+
+    # A new analyser by run, the tags cache must not be warm from the previous
+    # one
+    best = None
+    for _ in range(repeat):
+        analyser = Analyser_Sax(make_config(plugins, options, tags_cache_size), logger)
+        analyser._load_reader()
+        creates = {
+            "node": analyser.NodeCreate,
+            "way": analyser.WayCreate,
+            "relation": analyser.RelationCreate,
+        }
+        start = time.perf_counter()
+        for t, o in all_objects:
+            creates[t](o)
+        t = time.perf_counter() - start
+        best = t if best is None else min(best, t)
+    return len(all_objects) / best if best else float("inf")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the SAX plugins, and compare to a baseline"
+    )
+    parser.add_argument(
+        "plugins", nargs="*", help="Plugins to run, default all the ones of the country"
+    )
+    parser.add_argument(
+        "--pbf",
+        nargs="+",
+        default=sorted(glob.glob(os.path.join(config.dir_osmose, "tests/*.osm.pbf"))),
+        help="OSM PBF files to read, default the test ones",
+    )
+    parser.add_argument("--country", help="Country option of the plugins")
+    parser.add_argument("--language", help="Language option of the plugins")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=100000,
+        help="Number of objects of the synthetic corpus, 0 to disable",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs, keep the best")
+    parser.add_argument(
+        "--tags-cache-size",
+        type=int,
+        default=_TagsMemo.maxsize,
+        help="Size of the tags cache of the Analyser_Sax run with cache",
+    )
+    parser.add_argument("--baseline", help="JSON baseline to compare to")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=20,
+        help="Maximum throughput loss from the baseline, in percent",
+    )
+    parser.add_argument("--save", help="Save the results as a JSON baseline")
+    args = parser.parse_args()
+
+    options = {"project": "openstreetmap"}
+    conf_limit = set()
+    if args.country:
+        options["country"] = args.country
+        conf_limit.add(args.country)
+    if args.language:
+        options["language"] = args.language
+        conf_limit.add(args.language)
+
+    names = args.plugins or PluginManifest.for_country(
+        PluginManifest.load(
+            os.path.join(config.dir_osmose, "plugins"), PluginManifest.cache
+        ),
+        conf_limit,
+    )
+    logger = OsmoseLog.logger(open(os.devnull, "w"))
+    plugins = load_plugins(names, options, logger)
+
+    corpora = {}
+    objects = Objects()
+    for pbf in args.pbf:
+        OsmPbfReader(pbf, dummylog()).CopyTo(objects)
+    corpora["pbf"] = objects.objects
+    if args.synthetic:
+        corpora["synthetic"] = synthetic(objects.objects, args.synthetic)
+
+    results = {}
+    for corpus, objects in sorted(corpora.items()):
+        for name, plugin in sorted(plugins.items()):
+            for t in plugin.availableMethodes():
+                if objects[t]:
+                    results["{0}.{1} {2}".format(name, t, corpus)] = bench_plugin(
+                        plugin, t, objects[t], args.repeat
+                    )
+
+        results["Analyser_Sax {0}".format(corpus)] = bench_analyser(
+            list(plugins.keys()), options, logger, objects, args.repeat
+        )
+        results["Analyser_Sax tags cache {0}".format(corpus)] = bench_analyser(
+            list(plugins.keys()),
+            options,
+            logger,
+            objects,
+            args.repeat,
+            args.tags_cache_size,
+        )
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    regressions = []
+    print(
+        "{0:<60} {1:>14} {2:>14} {3:>8}".format("", "objects/s", "baseline", "change")
+    )
+    for key, value in sorted(results.items()):
+        if key in baseline and baseline[key]:
+            change = (value - baseline[key]) / baseline[key] * 100
+            print(
+                "{0:<60} {1:>14.0f} {2:>14.0f} {3:>7.1f}%".format(
+                    key, value, baseline[key], change
+                )
+            )
+            if change < -args.max_regression:
+                regressions.append(key)
+        else:
+            print("{0:<60} {1:>14.0f}".format(key, value))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "country": args.country,
+                    "language": args.language,
+                    "pbf": list(map(os.path.basename, args.pbf)),
+                    "synthetic": args.synthetic,
+                    "results": results,
+                },
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+
+    if regressions:
+        print(
+            "E: {0} throughputs dropped by more than {1}%: {2}".format(
+                len(regressions), args.max_regression, ", ".join(regressions)
+            )
+        )
+        sys.exit(1)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Compare the throughput of the point in polygon tests used by the issues
+# polygon filter, on random points in the bbox of the polygon: the exact test
+# on the interval tree, the test using the grid of cells, and the vectorised
+# one.
+#
+# Usage, from the root of the repository:
+#   PYTHONPATH=. tools/polygon-filter-benchmark.py --polygon-id 1403916
+#   PYTHONPATH=. tools/polygon-filter-benchmark.py --wkt polygon.wkt
+
+import argparse
+import time
+
+import numpy
+from shapely.wkt import loads
+
+from modules.PointInPolygon import PointInPolygon
+from modules.Polygon import Polygon
+
+
+class WKTPolygon(Polygon):
+    def __init__(self, wkt):
+        if wkt.startswith("SRID="):
+            wkt = wkt.split(";", 1)[1]
+        self.polygon = loads(wkt)
+
+
+class WKTPointInPolygon(PointInPolygon):
+    def __init__(self, wkt, grid_size):
+        self.polygon = WKTPolygon(wkt)
+        self.build(grid_size)
+
+
+def bench(name, n, f):
+    start = time.perf_counter()
+    result = f()
+    t = time.perf_counter() - start
+    print(
+        "{0:<10} {1:>10} points {2:>8.2f}s {3:>12.0f} points/s".format(
+            name, n, t, n / t
+        )
+    )
+    return numpy.asarray(result, dtype=bool)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the point in polygon tests of the issues filter"
+    )
+    parser.add_argument(
+        "--polygon-id",
+        type=int,
+        default=1403916,
+        help="OSM relation id of the polygon, default France",
+    )
+    parser.add_argument(
+        "--wkt", help="Read the polygon from a WKT file instead of downloading it"
+    )
+    parser.add_argument(
+        "--points", type=int, default=1000000, help="Number of random points"
+    )
+    parser.add_argument(
+        "--exact-points",
+        type=int,
+        default=100000,
+        help="Number of points for the slow exact test",
+    )
+    parser.add_argument(
+        "--grid-size", type=int, default=512, help="Number of grid cells by side"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.wkt:
+        pip = WKTPointInPolygon(open(args.wkt).read(), args.grid_size)
+    else:
+        pip = PointInPolygon(args.polygon_id)
+        if args.grid_size != 512:
+            pip.build(args.grid_size)
+    print("build {0:.2f}s".format(time.perf_counter() - start))
+
+    grid = numpy.frombuffer(pip.grid, dtype=numpy.uint8)
+    print(
+        "cells: {0} inside, {1} outside, {2} boundary".format(
+            (grid == 1).sum(), (grid == 0).sum(), (grid == 2).sum()
+        )
+    )
+
+    rng = numpy.random.default_rng(0)
+    minx, miny, maxx, maxy = pip.polygon.polygon.bounds
+    x = rng.uniform(minx, maxx, args.points)
+    y = rng.uniform(miny, maxy, args.points)
+    ne = min(args.exact_points, args.points)
+
+    exact = bench(
+        "exact", ne, lambda: list(map(pip.point_inside_polygon_exact, x[:ne], y[:ne]))
+    )
+    scalar = bench(
+        "grid", args.points, lambda: list(map(pip.point_inside_polygon, x, y))
+    )
+    vector = bench("vectorised", args.points, lambda: pip.points_inside_polygon(x, y))
+
+    print("inside: {0:.1%}".format(vector.mean()))
+    if (exact != scalar[:ne]).any() or (scalar != vector).any():
+        print("E: tests do not agree")
+        exit(1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+###########################################################################
+#                                                                       ##
+# This program is free software: you can redistribute it and/or modify  ##
+# it under the terms of the GNU General Public License as published by  ##
+# the Free Software Foundation, either version 3 of the License, or     ##
+# (at your option) any later version.                                   ##
+#                                                                       ##
+# This program is distributed in the hope that it will be useful,       ##
+# but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+# GNU General Public License for more details.                          ##
+#                                                                       ##
+# You should have received a copy of the GNU General Public License     ##
+# along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+#                                                                       ##
+###########################################################################
+
+# Rank the slowest SQL queries of the osmosis analysers, from the JSON files
+# written by `osmose_run.py --profile-sql` over a run of many countries.
+#
+# Usage:
+#   tools/sql-profile-summary.py /data/work/osmose/results/
+#   tools/sql-profile-summary.py --by shared_read_blocks --top 50 *.sql-profile.json
+
+import argparse
+import glob
+import json
+import os
+from collections import defaultdict
+
+SUFFIX = ".sql-profile.json"
+
+
+def load(paths):
+    queries = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(glob.glob(os.path.join(path, "*" + SUFFIX)))
+        else:
+            files = [path]
+        for file in files:
+            with open(file, encoding="utf-8") as f:
+                profile = json.load(f)
+            # Files are named <analyser class>-<country>
+            country = os.path.basename(file)[: -len(SUFFIX)].split("-", 1)[-1]
+            for query in profile["queries"]:
+                query["analyser"] = profile["analyser"]
+                query["country"] = country
+                queries.append(query)
+    return queries
+
+
+def summary(queries, by, top):
+    # Same query of an analyser over all the countries
+    groups = defaultdict(list)
+    for query in queries:
+        groups[(query["analyser"], query["location"])].append(query)
+
+    rows = []
+    for (analyser, location), group in groups.items():
+        values = list(filter(lambda v: v is not None, map(lambda q: q[by], group)))
+        slowest = max(group, key=lambda q: q["time"])
+        rows.append(
+            (
+                sum(values),
+                analyser,
+                location,
+                len(group),
+                max(values) if values else 0,
+                slowest["country"],
+                slowest["sql"],
+            )
+        )
+    rows.sort(key=lambda r: -r[0])
+    return rows[:top]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rank the slowest SQL of the osmosis analysers from --profile-sql files"
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Profile JSON files, or directories containing them"
+    )
+    parser.add_argument(
+        "--by",
+        default="time",
+        choices=[
+            "time",
+            "execution_time",
+            "rows",
+            "shared_hit_blocks",
+            "shared_read_blocks",
+        ],
+        help="Value to rank on, summed over the countries",
+    )
+    parser.add_argument("--top", type=int, default=20, help="Number of queries shown")
+    parser.add_argument(
+        "--sql", action="store_true", help="Also print the SQL of the slowest run"
+    )
+    args = parser.parse_args()
+
+    queries = load(args.paths)
+    print("{0} queries".format(len(queries)))
+    print(
+        "{0:>24} {1:>6} {2:>14}  {3:<40} {4:<30} {5}".format(
+            "total " + args.by, "runs", "max", "analyser", "location", "slowest country"
+        )
+    )
+    for total, analyser, location, runs, maximum, country, sql in summary(
+        queries, args.by, args.top
+    ):
+        print(
+            "{0:>24.1f} {1:>6} {2:>14.1f}  {3:<40} {4:<30} {5}".format(
+                total, runs, maximum, analyser, location, country
+            )
+        )
+        if args.sql:
+            print(sql)
+            print()